@@ -0,0 +1,93 @@
+"""
+benchmarks/tool_call_parsing_benchmark.py - Tool Call Parsing Benchmark
+
+Measures parsing long LLM responses with many candidate TOOL_CALL lines,
+comparing validating each candidate with a database lookup (as before tool
+names were resolved once per execution) with checking it against the set of
+registered tool names.
+
+Usage:
+    python benchmarks/tool_call_parsing_benchmark.py [--lines 500] [--rounds 20]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from managers.agent_manager import AgentManager
+from managers.memory_manager import MemoryManager
+
+TOOLS = ["http_client", "website_monitor", "file_writer", "rss_reader", "email_sender"]
+
+
+class PerMatchLookup:
+    """Tool name container that queries the database on every membership check"""
+
+    def __init__(self, memory_manager):
+        self.memory_manager = memory_manager
+
+    def __contains__(self, name):
+        return bool(self.memory_manager.get_tool(name))
+
+
+def build_response(lines: int) -> str:
+    """Build a response mixing prose, valid calls, calls to unknown tools and repeats"""
+    parts = []
+    for i in range(lines):
+        if i % 4 == 0:
+            parts.append(f"Let me think about item {i} before calling a tool.")
+        elif i % 4 == 1:
+            parts.append(f"TOOL_CALL: unknown_tool_{i % 50}(value={i})")
+        else:
+            tool = TOOLS[i % len(TOOLS)]
+            parts.append(f"TOOL_CALL: {tool}(url=https://example.com/{i % 100}, method=GET, retries=3)")
+    return "\n".join(parts)
+
+
+def run(label: str, rounds: int, parse) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        parse()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed / rounds * 1000:10.2f} ms/response")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as directory:
+        memory_manager = MemoryManager(os.path.join(directory, "benchmark.db"))
+        memory_manager.initialize_database()
+        for tool in TOOLS:
+            memory_manager.register_tool(tool, tool, {}, tool)
+
+        config = SimpleNamespace(max_agent_memory_entries=5, max_agent_iterations=3, default_model="benchmark")
+        agent_manager = AgentManager(None, memory_manager, None, config)
+        response = build_response(args.lines)
+        print(f"Parsing a {len(response)} character response with {args.lines} lines, {args.rounds} rounds\n")
+
+        per_match = PerMatchLookup(memory_manager)
+        before = run("database lookup per candidate", args.rounds,
+                     lambda: agent_manager._parse_tool_calls_aggressive(response, per_match))
+        after = run("tool names resolved once", args.rounds,
+                    lambda: agent_manager._parse_tool_calls_aggressive(
+                        response, memory_manager.get_tool_availability()
+                    ))
+        print(f"\nSpeedup: {before / after:.1f}x")
+        memory_manager.close()
+
+
+if __name__ == "__main__":
+    main()
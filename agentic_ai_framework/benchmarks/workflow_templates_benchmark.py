@@ -0,0 +1,94 @@
+"""
+benchmarks/workflow_templates_benchmark.py - Workflow Variable Resolution Benchmark
+
+Measures the cost of resolving workflow step definitions against large
+contexts, comparing compiling the steps on every resolution with reusing the
+steps compiled once per workflow version.
+
+Usage:
+    python benchmarks/workflow_templates_benchmark.py [--steps 200] [--context-keys 5000] [--rounds 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from managers.workflow_templates import CompiledStep, compile_template
+
+
+def build_context(keys: int) -> dict:
+    """Build a context with many entries, each holding nested lists and dicts"""
+    return {
+        f"step_{i}": {
+            "status": 200,
+            "items": [{"id": j, "title": f"item {j}", "tags": ["a", "b"]} for j in range(10)],
+            "meta": {"source": f"https://example.com/{i}", "count": 10},
+        }
+        for i in range(keys)
+    }
+
+
+def build_steps(count: int, context_keys: int) -> list:
+    """Build tool steps that reference nested paths in earlier results"""
+    steps = []
+    for i in range(count):
+        ref = f"step_{i % context_keys}"
+        steps.append({
+            "type": "tool",
+            "name": "http_client",
+            "parameters": {
+                "url": f"{{{{{ref}.meta.source}}}}/details?item={{{{{ref}.items[3].id}}}}",
+                "body": {
+                    "title": f"{{{{{ref}.items[7].title}}}}",
+                    "tags": f"{{{{{ref}.items[0].tags}}}}",
+                    "static": ["x", "y", {"z": 1}],
+                },
+                "method": "POST",
+            },
+            "context_key": f"result_{i}",
+            "preserve_objects": i % 2 == 0,
+        })
+    return steps
+
+
+def run(label: str, rounds: int, resolve) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        resolve()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed / rounds * 1000:10.2f} ms/round")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--context-keys", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    context = build_context(args.context_keys)
+    steps = build_steps(args.steps, args.context_keys)
+    print(f"Resolving {args.steps} steps against {args.context_keys} context entries, {args.rounds} rounds\n")
+
+    def compile_every_time():
+        compile_template.cache_clear()
+        for step in steps:
+            CompiledStep(step).render(context)
+
+    compiled_steps = [CompiledStep(step) for step in steps]
+
+    def precompiled():
+        for compiled_step in compiled_steps:
+            compiled_step.render(context)
+
+    cold = run("compile on every resolution", args.rounds, compile_every_time)
+    warm = run("compiled once per workflow version", args.rounds, precompiled)
+    print(f"\nSpeedup: {cold / warm:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,16 +14,68 @@ class Config:
         self.api_port = int(os.getenv("API_PORT", "8000"))
         self.database_path = os.getenv("DATABASE_PATH", "data/agentic_ai.db")
         
+        # SQLite Engine Configuration (pragmas applied to every connection)
+        self.database_options = {
+            "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+            "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+            "busy_timeout_ms": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+            "cache_size_kb": int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536")),
+            "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", "268435456")),
+            "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+            "max_overflow": int(os.getenv("DB_POOL_MAX_OVERFLOW", "10")),
+            "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30"))
+        }
+        self.definition_cache_ttl = float(os.getenv("DEFINITION_CACHE_TTL", "300"))  # Seconds definitions are cached (0 disables)
+        
         # Agent Configuration
         self.max_agent_iterations = int(os.getenv("MAX_AGENT_ITERATIONS", "10"))
-        self.scheduler_interval = int(os.getenv("SCHEDULER_INTERVAL", "60"))
+        self.scheduler_interval = int(os.getenv("SCHEDULER_INTERVAL", "60"))  # Retry delay after scheduler errors
         self.tools_directory = os.getenv("TOOLS_DIRECTORY", "tools")
+        self.agent_tool_concurrency = int(os.getenv("AGENT_TOOL_CONCURRENCY", "4"))  # Tool calls of one agent running at once
+        self.tool_call_timeout = float(os.getenv("TOOL_CALL_TIMEOUT", "0"))  # Seconds per agent tool call (0 disables)
+        self.native_tool_calling = os.getenv("NATIVE_TOOL_CALLING", "true").lower() == "true"  # Structured tool calls for models that support them
+        self.tool_result_cache_max_entries = int(os.getenv("TOOL_RESULT_CACHE_MAX_ENTRIES", "1000"))  # Cached results of cacheable tools (0 disables)
+        self.tool_result_cache_max_bytes = int(os.getenv("TOOL_RESULT_CACHE_MAX_BYTES", "16777216"))  # Total size of cached results
+        
+        # Shared HTTP connection pool for HTTP-based tools
+        self.tool_http_pool = {
+            "limit": int(os.getenv("TOOL_HTTP_POOL_LIMIT", "100")),
+            "limit_per_host": int(os.getenv("TOOL_HTTP_POOL_LIMIT_PER_HOST", "10")),
+            "keepalive_timeout": int(os.getenv("TOOL_HTTP_POOL_KEEPALIVE_TIMEOUT", "30")),
+            "dns_cache_ttl": int(os.getenv("TOOL_HTTP_POOL_DNS_CACHE_TTL", "300"))
+        }
+        
+        # Shared IMAP/SMTP connection pool for email tools
+        self.tool_mail_pool = {
+            "max_per_account": int(os.getenv("TOOL_MAIL_POOL_MAX_PER_ACCOUNT", "4")),
+            "idle_timeout": int(os.getenv("TOOL_MAIL_POOL_IDLE_TIMEOUT", "300")),
+            "keepalive_interval": int(os.getenv("TOOL_MAIL_POOL_KEEPALIVE_INTERVAL", "30"))
+        }
+        
+        self.feed_seen_items_max_per_feed = int(os.getenv("FEED_SEEN_ITEMS_MAX_PER_FEED", "1000"))  # Item hashes remembered per feed for only_new
+        self.feed_seen_items_ttl_days = int(os.getenv("FEED_SEEN_ITEMS_TTL_DAYS", "30"))  # Days an item hash is kept after the item left the feed
+        
+        # Scheduler Concurrency Configuration (0 disables per-target caps and the timeout)
+        self.scheduler_max_concurrent_tasks = int(os.getenv("SCHEDULER_MAX_CONCURRENT_TASKS", "4"))
+        self.scheduler_max_tasks_per_agent = int(os.getenv("SCHEDULER_MAX_TASKS_PER_AGENT", "0"))
+        self.scheduler_max_tasks_per_workflow = int(os.getenv("SCHEDULER_MAX_TASKS_PER_WORKFLOW", "0"))
+        self.scheduler_task_timeout = int(os.getenv("SCHEDULER_TASK_TIMEOUT", "3600"))
+        
+        # Workflow Configuration
+        self.workflow_max_concurrency = int(os.getenv("WORKFLOW_MAX_CONCURRENCY", "4"))  # DAG mode default
+        
+        # Job Queue Configuration (asynchronous agent/workflow jobs)
+        self.job_workers = int(os.getenv("JOB_WORKERS", "4"))  # Jobs running at once
+        self.job_queue_max_size = int(os.getenv("JOB_QUEUE_MAX_SIZE", "100"))  # Waiting jobs before submissions are rejected
+        self.job_result_ttl = int(os.getenv("JOB_RESULT_TTL", "3600"))  # Seconds finished jobs stay retrievable
         
         # Memory Management Configuration
         self.max_agent_memory_entries = int(os.getenv("MAX_AGENT_MEMORY_ENTRIES", "20"))
         self.clear_memory_on_startup = os.getenv("CLEAR_MEMORY_ON_STARTUP", "false").lower() == "true"
         self.memory_cleanup_interval = int(os.getenv("MEMORY_CLEANUP_INTERVAL", "3600"))  # 1 hour
         self.memory_retention_days = int(os.getenv("MEMORY_RETENTION_DAYS", "7"))
+        self.memory_write_batch_size = int(os.getenv("MEMORY_WRITE_BATCH_SIZE", "50"))  # Buffered entries per write (0 writes each entry directly)
+        self.memory_write_flush_interval = float(os.getenv("MEMORY_WRITE_FLUSH_INTERVAL", "0.5"))  # Max seconds an entry stays buffered
         
         # Model Warmup Configuration
         self.model_warmup_timeout = int(os.getenv("MODEL_WARMUP_TIMEOUT", "60"))
@@ -41,6 +93,8 @@ class Config:
         # Logging Configuration
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
         self.log_format = os.getenv("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        # Maximum characters of a step, context or tool payload rendered into a log line (0 = no limit)
+        self.log_payload_max_chars = int(os.getenv("LOG_PAYLOAD_MAX_CHARS", "1000"))
         
         # Backward compatibility properties
         # Handle missing Ollama provider gracefully
@@ -59,6 +113,14 @@ class Config:
         default_model = os.getenv("DEFAULT_MODEL", "granite3.2:2b")
         fallback_enabled = os.getenv("LLM_FALLBACK_ENABLED", "true").lower() == "true"
         
+        # Shared HTTP connection pool settings for HTTP-based providers
+        connection_pool = {
+            "limit": int(os.getenv("LLM_POOL_LIMIT", "100")),
+            "limit_per_host": int(os.getenv("LLM_POOL_LIMIT_PER_HOST", "10")),
+            "keepalive_timeout": int(os.getenv("LLM_POOL_KEEPALIVE_TIMEOUT", "30")),
+            "dns_cache_ttl": int(os.getenv("LLM_POOL_DNS_CACHE_TTL", "300"))
+        }
+        
         # Provider configurations
         providers = {}
         
@@ -72,7 +134,9 @@ class Config:
                 "enabled": True,
                 "url": os.getenv("OLLAMA_URL", "http://localhost:11434"),
                 "timeout": int(os.getenv("OLLAMA_TIMEOUT", "300")),
-                "default_model": os.getenv("OLLAMA_DEFAULT_MODEL", "granite3.2:2b")
+                "default_model": os.getenv("OLLAMA_DEFAULT_MODEL", "granite3.2:2b"),
+                "native_tools": os.getenv("OLLAMA_NATIVE_TOOLS", "false").lower() == "true",
+                "connection_pool": dict(connection_pool)
             }
         
         # OpenAI Provider Configuration
@@ -86,7 +150,8 @@ class Config:
                 "base_url": os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1"),
                 "organization": os.getenv("OPENAI_ORGANIZATION"),
                 "timeout": int(os.getenv("OPENAI_TIMEOUT", "300")),
-                "default_model": os.getenv("OPENAI_DEFAULT_MODEL", "gpt-3.5-turbo")
+                "default_model": os.getenv("OPENAI_DEFAULT_MODEL", "gpt-3.5-turbo"),
+                "connection_pool": dict(connection_pool)
             }
         
         # OpenRouter Provider Configuration (for future implementation)
@@ -99,7 +164,8 @@ class Config:
                 "api_key": openrouter_api_key,
                 "base_url": os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1"),
                 "timeout": int(os.getenv("OPENROUTER_TIMEOUT", "300")),
-                "default_model": os.getenv("OPENROUTER_DEFAULT_MODEL", "openai/gpt-3.5-turbo")
+                "default_model": os.getenv("OPENROUTER_DEFAULT_MODEL", "openai/gpt-3.5-turbo"),
+                "connection_pool": dict(connection_pool)
             }
         
         # Bedrock Provider Configuration
@@ -114,6 +180,7 @@ class Config:
                 "aws_access_key_id": bedrock_access_key,
                 "aws_secret_access_key": bedrock_secret_key,
                 "timeout": int(os.getenv("BEDROCK_TIMEOUT", "300")),
+                "max_workers": int(os.getenv("BEDROCK_MAX_WORKERS", "8")),
                 "default_model": os.getenv("BEDROCK_DEFAULT_MODEL", "anthropic.claude-3-sonnet-20240229-v1:0")
             }
         
@@ -157,17 +224,44 @@ class Config:
             "api_host": self.api_host,
             "api_port": self.api_port,
             "database_path": self.database_path,
+            "database_options": self.database_options,
+            "definition_cache_ttl": self.definition_cache_ttl,
             
             # Agent settings
             "max_agent_iterations": self.max_agent_iterations,
             "scheduler_interval": self.scheduler_interval,
+            "agent_tool_concurrency": self.agent_tool_concurrency,
+            "tool_call_timeout": self.tool_call_timeout,
+            "native_tool_calling": self.native_tool_calling,
+            "tool_result_cache_max_entries": self.tool_result_cache_max_entries,
+            "tool_result_cache_max_bytes": self.tool_result_cache_max_bytes,
+            "tool_http_pool": self.tool_http_pool,
+            "tool_mail_pool": self.tool_mail_pool,
+            "feed_seen_items_max_per_feed": self.feed_seen_items_max_per_feed,
+            "feed_seen_items_ttl_days": self.feed_seen_items_ttl_days,
             "tools_directory": self.tools_directory,
             
+            # Scheduler concurrency settings
+            "scheduler_max_concurrent_tasks": self.scheduler_max_concurrent_tasks,
+            "scheduler_max_tasks_per_agent": self.scheduler_max_tasks_per_agent,
+            "scheduler_max_tasks_per_workflow": self.scheduler_max_tasks_per_workflow,
+            "scheduler_task_timeout": self.scheduler_task_timeout,
+            
+            # Workflow settings
+            "workflow_max_concurrency": self.workflow_max_concurrency,
+            
+            # Job queue settings
+            "job_workers": self.job_workers,
+            "job_queue_max_size": self.job_queue_max_size,
+            "job_result_ttl": self.job_result_ttl,
+            
             # Memory management settings
             "max_agent_memory_entries": self.max_agent_memory_entries,
             "clear_memory_on_startup": self.clear_memory_on_startup,
             "memory_cleanup_interval": self.memory_cleanup_interval,
             "memory_retention_days": self.memory_retention_days,
+            "memory_write_batch_size": self.memory_write_batch_size,
+            "memory_write_flush_interval": self.memory_write_flush_interval,
             
             # Model warmup settings
             "model_warmup_timeout": self.model_warmup_timeout,
@@ -188,7 +282,8 @@ class Config:
             
             # Logging settings
             "log_level": self.log_level,
-            "log_format": self.log_format
+            "log_format": self.log_format,
+            "log_payload_max_chars": self.log_payload_max_chars
         }
     
     def update(self, updates: Dict[str, Any]):
@@ -214,6 +309,22 @@ class Config:
         if not (1 <= self.api_port <= 65535):
             errors.append(f"Invalid API port: {self.api_port}")
         
+        # Validate database settings
+        if self.database_options["journal_mode"].upper() not in ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"):
+            errors.append(f"Invalid SQLite journal mode: {self.database_options['journal_mode']}")
+        
+        if self.database_options["synchronous"].upper() not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            errors.append(f"Invalid SQLite synchronous mode: {self.database_options['synchronous']}")
+        
+        if self.database_options["busy_timeout_ms"] < 0:
+            errors.append(f"SQLite busy timeout must be >= 0, got {self.database_options['busy_timeout_ms']}")
+        
+        if self.database_options["pool_size"] < 1:
+            errors.append(f"Database pool size must be >= 1, got {self.database_options['pool_size']}")
+        
+        if self.definition_cache_ttl < 0:
+            errors.append(f"definition_cache_ttl must be >= 0, got {self.definition_cache_ttl}")
+        
         # Validate timeouts and intervals
         if self.max_agent_iterations < 1:
             errors.append(f"max_agent_iterations must be >= 1, got {self.max_agent_iterations}")
@@ -221,14 +332,65 @@ class Config:
         if self.scheduler_interval < 30:
             errors.append(f"scheduler_interval must be >= 30, got {self.scheduler_interval}")
         
+        if self.scheduler_max_concurrent_tasks < 1:
+            errors.append(f"scheduler_max_concurrent_tasks must be >= 1, got {self.scheduler_max_concurrent_tasks}")
+        
+        if self.scheduler_task_timeout < 0:
+            errors.append(f"scheduler_task_timeout must be >= 0, got {self.scheduler_task_timeout}")
+        
+        if self.agent_tool_concurrency < 1:
+            errors.append(f"agent_tool_concurrency must be >= 1, got {self.agent_tool_concurrency}")
+        
+        if self.tool_call_timeout < 0:
+            errors.append(f"tool_call_timeout must be >= 0, got {self.tool_call_timeout}")
+        
+        if self.tool_result_cache_max_entries < 0:
+            errors.append(f"tool_result_cache_max_entries must be >= 0, got {self.tool_result_cache_max_entries}")
+        
+        if self.tool_result_cache_max_bytes < 0:
+            errors.append(f"tool_result_cache_max_bytes must be >= 0, got {self.tool_result_cache_max_bytes}")
+        
+        if self.tool_http_pool["limit"] < 0 or self.tool_http_pool["limit_per_host"] < 0:
+            errors.append(f"Tool HTTP pool limits must be >= 0 (0 = unlimited), got {self.tool_http_pool}")
+        
+        if self.tool_mail_pool["max_per_account"] < 1:
+            errors.append(f"Tool mail pool max_per_account must be >= 1, got {self.tool_mail_pool['max_per_account']}")
+        
+        if self.feed_seen_items_max_per_feed < 1:
+            errors.append(f"feed_seen_items_max_per_feed must be >= 1, got {self.feed_seen_items_max_per_feed}")
+        
+        if self.feed_seen_items_ttl_days < 1:
+            errors.append(f"feed_seen_items_ttl_days must be >= 1, got {self.feed_seen_items_ttl_days}")
+        
+        if self.workflow_max_concurrency < 1:
+            errors.append(f"workflow_max_concurrency must be >= 1, got {self.workflow_max_concurrency}")
+        
+        if self.job_workers < 1:
+            errors.append(f"job_workers must be >= 1, got {self.job_workers}")
+        
+        if self.job_queue_max_size < 1:
+            errors.append(f"job_queue_max_size must be >= 1, got {self.job_queue_max_size}")
+        
+        if self.job_result_ttl < 0:
+            errors.append(f"job_result_ttl must be >= 0, got {self.job_result_ttl}")
+        
         if self.memory_cleanup_interval < 300:
             errors.append(f"memory_cleanup_interval must be >= 300, got {self.memory_cleanup_interval}")
         
+        if self.memory_write_batch_size < 0:
+            errors.append(f"memory_write_batch_size must be >= 0, got {self.memory_write_batch_size}")
+        
+        if self.memory_write_flush_interval <= 0:
+            errors.append(f"memory_write_flush_interval must be > 0, got {self.memory_write_flush_interval}")
+        
         if self.model_warmup_timeout < 10:
             errors.append(f"model_warmup_timeout must be >= 10, got {self.model_warmup_timeout}")
         
         if self.max_concurrent_warmups < 1:
             errors.append(f"max_concurrent_warmups must be >= 1, got {self.max_concurrent_warmups}")
         
+        if self.log_payload_max_chars < 0:
+            errors.append(f"log_payload_max_chars must be >= 0, got {self.log_payload_max_chars}")
+        
         # Validate log level
         valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
\ No newline at end of file
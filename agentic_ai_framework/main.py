@@ -5,21 +5,25 @@ main.py - FastAPI Application Entry Point (Enhanced with Multi-Provider LLM Supp
 from fastapi import FastAPI, HTTPException, BackgroundTasks, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse, FileResponse
+from fastapi.responses import RedirectResponse, FileResponse, StreamingResponse
 import uvicorn
 import asyncio
+import contextlib
+import heapq
 import logging
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from config import Config
 from models import *
 from managers.llm_provider_manager import LLMProviderManager
-from managers.memory_manager import MemoryManager
+from managers.memory_manager import AsyncMemoryManager, MemoryManager
 from managers.tool_manager import ToolManager
 from managers.agent_manager import AgentManager
 from managers.workflow_manager import WorkflowManager
 from managers.model_warmup_manager import ModelWarmupManager, ModelWarmupStatus
+from managers.log_utils import log_verbosity, set_payload_max_chars
+from managers.job_manager import JobManager, JobManagerNotRunningError, JobQueueFullError
 from pydantic import BaseModel, Field
 from models import ScheduledTaskDefinition, ScheduledTaskUpdate, TaskExecutionInfo, RecurrenceType
 import os
@@ -58,14 +62,22 @@ else:
 
 # Global configuration
 config = Config()
+set_payload_max_chars(config.log_payload_max_chars)
 
 # Initialize managers
 llm_manager = LLMProviderManager(config.llm_config)
-memory_manager = MemoryManager(config.database_path)
+memory_manager = MemoryManager(
+    config.database_path,
+    config.database_options,
+    write_batch_size=config.memory_write_batch_size,
+    write_flush_interval=config.memory_write_flush_interval,
+    definition_cache_ttl=config.definition_cache_ttl
+)
 tool_manager = ToolManager(memory_manager, config.tools_directory, config)
 agent_manager = AgentManager(llm_manager, memory_manager, tool_manager, config)
-workflow_manager = WorkflowManager(agent_manager, tool_manager, memory_manager)
+workflow_manager = WorkflowManager(agent_manager, tool_manager, memory_manager, config)
 warmup_manager = ModelWarmupManager(llm_manager, memory_manager, config)
+job_manager = JobManager(agent_manager, workflow_manager, config)
 
 # Enhanced Background scheduler with memory cleanup
 class BackgroundScheduler:
@@ -73,6 +85,7 @@ class BackgroundScheduler:
     
     def __init__(self, memory_manager, agent_manager, workflow_manager, config, interval=60):
         self.memory_manager = memory_manager
+        self.async_memory = AsyncMemoryManager(memory_manager)
         self.agent_manager = agent_manager
         self.workflow_manager = workflow_manager
         self.config = config
@@ -80,18 +93,36 @@ class BackgroundScheduler:
         self.running = False
         self._last_memory_cleanup = time.time()
         self._last_stats_log = time.time()
+        
+        # Concurrency limits for scheduled task execution (0 disables a per-target cap / the timeout)
+        self.max_concurrent_tasks = config.scheduler_max_concurrent_tasks
+        self.max_tasks_per_agent = config.scheduler_max_tasks_per_agent
+        self.max_tasks_per_workflow = config.scheduler_max_tasks_per_workflow
+        self.task_timeout = config.scheduler_task_timeout
+        self._task_semaphore = asyncio.Semaphore(self.max_concurrent_tasks)
+        self._target_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._target_users: Dict[str, int] = {}  # Tasks holding or waiting for each target semaphore
+        self._running_tasks: Dict[int, asyncio.Task] = {}
+        
+        # Min-heap of (due_time, task_id); _due_times holds the current due time per task,
+        # so heap entries that no longer match it are stale and skipped
+        self._due_heap: List[tuple] = []
+        self._due_times: Dict[int, datetime] = {}
+        self._wakeup = asyncio.Event()
     
     async def start(self):
         """Start the background scheduler with recurring task support"""
         self.running = True
-        logger.info("Enhanced background scheduler started with recurring task support")
+        self.reload_schedule()
+        logger.info("Enhanced background scheduler started with recurring task support "
+                   f"(max {self.max_concurrent_tasks} concurrent tasks)")
         
         while self.running:
             try:
                 await self._process_pending_tasks()
                 await self._check_memory_cleanup()
                 await self._log_periodic_stats()
-                await asyncio.sleep(self.interval)
+                await self._wait_for_next_event()
             except Exception as e:
                 logger.error(f"Scheduler error: {e}")
                 await asyncio.sleep(self.interval)
@@ -99,69 +130,213 @@ class BackgroundScheduler:
     def stop(self):
         """Stop the background scheduler"""
         self.running = False
+        self._wakeup.set()
+        
+        # Interrupted tasks keep their pending status and run again on next start
+        for running_task in self._running_tasks.values():
+            running_task.cancel()
+        
         logger.info("Background scheduler stopped")
     
+    def reload_schedule(self):
+        """Rebuild the due-time heap from the database"""
+        self._due_times = self.memory_manager.get_scheduled_task_due_times()
+        self._due_heap = [(due_time, task_id) for task_id, due_time in self._due_times.items()]
+        heapq.heapify(self._due_heap)
+        self._wakeup.set()
+        logger.info(f"Scheduler loaded {len(self._due_times)} upcoming tasks")
+    
+    def notify_task_changed(self, task_id: int):
+        """Refresh the due time of a task after it was created, updated, enabled, disabled or deleted"""
+        due_time = self.memory_manager.get_scheduled_task_due_times([task_id]).get(task_id)
+        self._set_due_time(task_id, due_time)
+        self._wakeup.set()
+    
+    async def _reschedule_task(self, task_id: int):
+        """Refresh the due time of a task after it ran"""
+        due_times = await self.async_memory.get_scheduled_task_due_times([task_id])
+        self._set_due_time(task_id, due_times.get(task_id))
+        self._wakeup.set()
+    
+    def _set_due_time(self, task_id: int, due_time: Optional[datetime]):
+        """Record the next due time of a task (None removes it from the schedule)"""
+        if due_time is None:
+            self._due_times.pop(task_id, None)
+        elif self._due_times.get(task_id) != due_time:
+            self._due_times[task_id] = due_time
+            heapq.heappush(self._due_heap, (due_time, task_id))
+    
+    def _next_due_time(self) -> Optional[datetime]:
+        """Get the earliest due time, discarding stale heap entries"""
+        while self._due_heap:
+            due_time, task_id = self._due_heap[0]
+            if self._due_times.get(task_id) == due_time:
+                return due_time
+            heapq.heappop(self._due_heap)
+        return None
+    
+    def _pop_due_task_ids(self) -> List[int]:
+        """Remove and return the IDs of all tasks that are due now"""
+        now = datetime.utcnow()
+        due_ids = []
+        while True:
+            due_time = self._next_due_time()
+            if due_time is None or due_time > now:
+                break
+            _, task_id = heapq.heappop(self._due_heap)
+            del self._due_times[task_id]
+            due_ids.append(task_id)
+        return due_ids
+    
+    async def _wait_for_next_event(self):
+        """Sleep until the next task is due, maintenance is needed or the schedule changes"""
+        self._wakeup.clear()
+        
+        now = time.time()
+        timeout = min(
+            self._last_memory_cleanup + self.config.memory_cleanup_interval - now,
+            self._last_stats_log + 3600 - now
+        )
+        next_due = self._next_due_time()
+        if next_due is not None:
+            timeout = min(timeout, (next_due - datetime.utcnow()).total_seconds())
+        
+        if timeout <= 0:
+            return
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+    
     async def _process_pending_tasks(self):
-        """Process pending scheduled tasks including recurring ones"""
-        pending_tasks = self.memory_manager.get_pending_scheduled_tasks()
+        """Dispatch due scheduled tasks (including recurring ones) to the worker pool"""
+        # Running tasks are rescheduled when they finish
+        due_ids = [task_id for task_id in self._pop_due_task_ids() if task_id not in self._running_tasks]
+        if not due_ids:
+            return
+        
+        pending_tasks = await self.async_memory.get_pending_scheduled_tasks(task_ids=due_ids)
         
         if not pending_tasks:
             return
         
-        logger.info(f"Processing {len(pending_tasks)} pending tasks")
+        logger.info(f"Dispatching {len(pending_tasks)} pending tasks "
+                   f"({len(self._running_tasks)} already running)")
         
         for task in pending_tasks:
-            try:
-                task_id = task['id']
-                task_type = task['task_type']
-                is_recurring = task.get('is_recurring', False)
-                execution_count = task.get('execution_count', 0)
-                
-                logger.info(f"Executing task {task_id} ({task_type})" + 
-                          (f" - execution #{execution_count + 1}" if is_recurring else ""))
-                
-                start_time = time.time()
-                
-                if task_type == "agent":
-                    result = await self.agent_manager.execute_agent(
-                        task['agent_name'], 
-                        task['task_description'],
-                        context=task['context'] or {}
-                    )
-                elif task_type == "workflow":
-                    result = await self.workflow_manager.execute_workflow(
-                        task['workflow_name'],
-                        context=task['context'] or {}
-                    )
-                else:
-                    raise ValueError(f"Unknown task type: {task_type}")
-                
-                execution_time = time.time() - start_time
-                
-                # Update task as completed
-                self.memory_manager.update_scheduled_task_status(
-                    task_id, "completed", str(result)
-                )
+            self._running_tasks[task['id']] = asyncio.create_task(
+                self._run_task(task, time.monotonic())
+            )
+    
+    @contextlib.asynccontextmanager
+    async def _target_limit(self, task: Dict[str, Any]):
+        """Hold the per-agent or per-workflow slot of a task, if a cap is configured"""
+        if task['task_type'] == "agent" and self.max_tasks_per_agent > 0:
+            key, limit = f"agent:{task['agent_name']}", self.max_tasks_per_agent
+        elif task['task_type'] == "workflow" and self.max_tasks_per_workflow > 0:
+            key, limit = f"workflow:{task['workflow_name']}", self.max_tasks_per_workflow
+        else:
+            yield
+            return
+        
+        if key not in self._target_semaphores:
+            self._target_semaphores[key] = asyncio.Semaphore(limit)
+        semaphore = self._target_semaphores[key]
+        self._target_users[key] = self._target_users.get(key, 0) + 1
+        try:
+            async with semaphore:
+                yield
+        finally:
+            # Drop the semaphore once no task holds or waits for it
+            self._target_users[key] -= 1
+            if self._target_users[key] == 0:
+                del self._target_users[key]
+                del self._target_semaphores[key]
+    
+    async def _run_task(self, task: Dict[str, Any], queued_at: float):
+        """Run a single scheduled task within the concurrency limits and record its execution"""
+        task_id = task['id']
+        is_recurring = task.get('is_recurring', False)
+        execution_count = task.get('execution_count', 0)
+        execution_label = f" (execution #{execution_count + 1})" if is_recurring else ""
+        recorded = False
+        
+        try:
+            # Take the per-target slot first so a capped agent/workflow does not hold global slots
+            async with self._target_limit(task), self._task_semaphore:
+                queue_wait = time.monotonic() - queued_at
+                logger.info(f"Executing task {task_id} ({task['task_type']}){execution_label} "
+                           f"after {queue_wait:.2f}s in queue")
                 
-                log_msg = f"Completed task {task_id} in {execution_time:.2f}s"
-                if is_recurring:
-                    log_msg += f" (execution #{execution_count + 1})"
-                logger.info(log_msg)
+                start_time = time.monotonic()
+                timed_out = False
+                try:
+                    if self.task_timeout > 0:
+                        result = await asyncio.wait_for(self._execute_task(task), timeout=self.task_timeout)
+                    else:
+                        result = await self._execute_task(task)
+                    status, result_text = "completed", str(result)
+                except asyncio.TimeoutError:
+                    timed_out = True
+                    status, result_text = "failed", f"Task timed out after {self.task_timeout}s"
+                except Exception as e:
+                    status, result_text = "failed", str(e)
                 
-            except Exception as e:
-                error_msg = str(e)
-                execution_count = task.get('execution_count', 0)
-                is_recurring = task.get('is_recurring', False)
+                execution_time = time.monotonic() - start_time
                 
-                # Update task as failed
-                self.memory_manager.update_scheduled_task_status(
-                    task_id, "failed", error_msg
+                await self.async_memory.update_scheduled_task_status(
+                    task_id,
+                    status,
+                    result_text,
+                    duration_seconds=execution_time,
+                    metadata={
+                        "queue_wait_seconds": round(queue_wait, 3),
+                        "duration_seconds": round(execution_time, 3),
+                        "timed_out": timed_out
+                    }
                 )
+                recorded = True
                 
-                log_msg = f"Failed task {task_id}: {error_msg}"
-                if is_recurring:
-                    log_msg += f" (execution #{execution_count + 1})"
-                logger.error(log_msg)
+                if status == "completed":
+                    logger.info(f"Completed task {task_id} in {execution_time:.2f}s{execution_label}")
+                else:
+                    logger.error(f"Failed task {task_id}: {result_text}{execution_label}")
+        except Exception as e:
+            logger.error(f"Error recording execution of task {task_id}: {e}")
+        finally:
+            self._running_tasks.pop(task_id, None)
+            if self.running:
+                rescheduled = False
+                if recorded:
+                    try:
+                        await self._reschedule_task(task_id)
+                        rescheduled = True
+                    except Exception as e:
+                        logger.error(f"Error rescheduling task {task_id}: {e}")
+                if not rescheduled:
+                    # The stored due time may still be in the past; retry after the
+                    # scheduler interval instead of dispatching the task again at once
+                    logger.warning(f"Retrying task {task_id} in {self.interval}s")
+                    self._set_due_time(task_id, datetime.utcnow() + timedelta(seconds=self.interval))
+                    self._wakeup.set()
+    
+    async def _execute_task(self, task: Dict[str, Any]):
+        """Execute the agent or workflow behind a scheduled task"""
+        task_type = task['task_type']
+        
+        if task_type == "agent":
+            return await self.agent_manager.execute_agent(
+                task['agent_name'], 
+                task['task_description'],
+                context=task['context'] or {}
+            )
+        elif task_type == "workflow":
+            return await self.workflow_manager.execute_workflow(
+                task['workflow_name'],
+                context=task['context'] or {}
+            )
+        else:
+            raise ValueError(f"Unknown task type: {task_type}")
     
     async def _check_memory_cleanup(self):
         """Check if periodic memory cleanup is needed"""
@@ -175,15 +350,15 @@ class BackgroundScheduler:
         """Periodic memory cleanup for all agents"""
         try:
             logger.info("Starting periodic memory cleanup...")
-            agents = self.memory_manager.get_all_agents()
+            deleted_count = await self.async_memory.cleanup_all_agents_memory(
+                keep_last=self.config.max_agent_memory_entries
+            )
             
-            for agent in agents:
-                self.memory_manager.cleanup_agent_memory(
-                    agent["name"], 
-                    keep_last=self.config.max_agent_memory_entries
-                )
+            logger.info(f"Completed periodic memory cleanup, removed {deleted_count} entries")
             
-            logger.info(f"Completed periodic memory cleanup for {len(agents)} agents")
+            await self.async_memory.cleanup_workflow_executions(
+                days_to_keep=self.config.memory_retention_days
+            )
         except Exception as e:
             logger.error(f"Error during periodic memory cleanup: {e}")
     
@@ -195,7 +370,7 @@ class BackgroundScheduler:
         if current_time - self._last_stats_log >= 3600:
             try:
                 # Get task statistics
-                all_tasks = self.memory_manager.get_all_scheduled_tasks()
+                all_tasks = await self.async_memory.get_all_scheduled_tasks()
                 
                 recurring_count = sum(1 for task in all_tasks if task.get('is_recurring', False))
                 active_recurring = sum(1 for task in all_tasks 
@@ -207,7 +382,7 @@ class BackgroundScheduler:
                           f"{total_executions} total executions")
                 
                 # Get memory statistics
-                memory_stats = self.memory_manager.get_memory_stats()
+                memory_stats = await self.async_memory.get_memory_stats()
                 logger.info(f"Memory Statistics: {memory_stats['total_memory_entries']} entries, "
                           f"{memory_stats['agents_with_memory']} agents with memory")
                 
@@ -228,6 +403,9 @@ async def startup_event():
         # Initialize database tables
         memory_manager.initialize_database()
         
+        # Workflow runs cut short by a restart can be resumed from their checkpoints
+        memory_manager.mark_interrupted_workflow_executions()
+        
         # Clear all agent memory on startup if configured
         if config.clear_memory_on_startup:
             logger.info("Clearing all agent memory on startup...")
@@ -245,6 +423,9 @@ async def startup_event():
         # Start background scheduler
         asyncio.create_task(background_scheduler.start())
         
+        # Start asynchronous job workers
+        await job_manager.start()
+        
         logger.info("Open Agentic Framework started successfully with enhanced memory management")
         
         # Start model warmup manager
@@ -259,7 +440,11 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown"""
     background_scheduler.stop()
+    await job_manager.stop()
     await warmup_manager.stop()
+    await llm_manager.close()
+    await tool_manager.close()
+    memory_manager.close()
     logger.info("Open Agentic Framework shutdown complete")
 
 # Root endpoints
@@ -417,7 +602,7 @@ async def configure_provider(provider_name: str, config_update: ProviderConfigUp
         # If disabling, remove from active providers
         elif update_dict.get("enabled") is False:
             if provider_name in llm_manager.providers:
-                del llm_manager.providers[provider_name]
+                await llm_manager.close_provider(provider_name)
                 logger.info(f"Disabled provider: {provider_name}")
         
         return {
@@ -441,7 +626,8 @@ async def _reinitialize_provider(provider_name: str, provider_config: Dict[str,
         
         # Initialize the provider
         if await provider.initialize():
-            # Add to active providers
+            # Replace the active provider, closing the old connection pool
+            await llm_manager.close_provider(provider_name)
             llm_manager.providers[provider_name] = provider
             
             # Load models for this provider
@@ -450,6 +636,7 @@ async def _reinitialize_provider(provider_name: str, provider_config: Dict[str,
             logger.info(f"Successfully reinitialized provider: {provider_name}")
             return True
         else:
+            await provider.close()
             logger.error(f"Failed to initialize provider: {provider_name}")
             return False
             
@@ -779,9 +966,10 @@ async def execute_agent(agent_name: str, request: AgentExecutionRequest):
             model_name = agent.get('ollama_model', config.default_model)
             await warmup_manager.mark_model_used(model_name)
         
-        result = await agent_manager.execute_agent(
-            agent_name, request.task, request.context or {}
-        )
+        with log_verbosity(request.log_verbosity):
+            result = await agent_manager.execute_agent(
+                agent_name, request.task, request.context or {}
+            )
         return AgentExecutionResponse(
             agent_name=agent_name,
             task=request.task,
@@ -791,6 +979,38 @@ async def execute_agent(agent_name: str, request: AgentExecutionRequest):
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@app.post("/agents/{agent_name}/execute/stream")
+async def execute_agent_stream(agent_name: str, request: AgentExecutionRequest):
+    """
+    Execute an agent task, streaming progress as server-sent events
+    
+    Emits "token" events with generated text, "tool_call" and "tool_result"
+    events as tools run, then a "final" event with the result or an "error" event.
+    """
+    agent = memory_manager.get_agent(agent_name)
+    if not agent:
+        raise HTTPException(status_code=404, detail=f"Agent {agent_name} not found")
+    if not agent.get("enabled", True):
+        raise HTTPException(status_code=400, detail=f"Agent {agent_name} is disabled")
+    
+    await warmup_manager.mark_model_used(agent.get('ollama_model', config.default_model))
+    
+    async def event_stream():
+        events = agent_manager.stream_agent_events(agent_name, request.task, request.context or {})
+        with log_verbosity(request.log_verbosity):
+            try:
+                async for event in events:
+                    yield f"event: {event['event']}\ndata: {json.dumps(event['data'], default=str)}\n\n"
+            finally:
+                # Cancels the agent run if the client disconnected
+                await events.aclose()
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.get("/agents/{agent_name}/memory", response_model=List[MemoryEntryResponse])
 async def get_agent_memory(agent_name: str, limit: int = 5):
     """Get agent's memory/conversation history (limited)"""
@@ -835,6 +1055,14 @@ async def get_memory_stats():
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/cache/stats")
+async def get_cache_stats():
+    """Get hit and miss statistics of the in-process caches"""
+    return {
+        "definitions": memory_manager.definition_cache.get_stats(),
+        "tool_results": tool_manager.result_cache.get_stats()
+    }
+
 @app.delete("/memory/clear-all")
 async def clear_all_memory():
     """Clear memory for all agents"""
@@ -848,16 +1076,13 @@ async def clear_all_memory():
 async def cleanup_all_agent_memory():
     """Cleanup old memory entries for all agents, keeping only last entries"""
     try:
-        agents = memory_manager.get_all_agents()
-        cleaned_agents = 0
-        
-        for agent in agents:
-            memory_manager.cleanup_agent_memory(agent["name"], keep_last=config.max_agent_memory_entries)
-            cleaned_agents += 1
+        cleaned_agents = len(memory_manager.get_all_agents())
+        deleted_count = memory_manager.cleanup_all_agents_memory(keep_last=config.max_agent_memory_entries)
         
         return {
             "message": f"Memory cleanup completed for {cleaned_agents} agents",
             "agents_processed": cleaned_agents,
+            "entries_deleted": deleted_count,
             "kept_entries_per_agent": config.max_agent_memory_entries
         }
     except Exception as e:
@@ -875,13 +1100,23 @@ async def get_tool(tool_name: str):
     tool = memory_manager.get_tool(tool_name)
     if not tool:
         raise HTTPException(status_code=404, detail="Tool not found")
+    
+    tool_instance = tool_manager.get_tool_instance(tool_name)
+    if tool_instance is not None:
+        tool["cache"] = {
+            "cacheable": tool_instance.cacheable,
+            "ttl": tool_instance.cache_ttl,
+            "key_fields": tool_instance.cache_key_fields,
+            **tool_manager.result_cache.get_stats(tool_name)
+        }
     return tool
 
 @app.post("/tools/{tool_name}/execute", response_model=ToolExecutionResponse)
 async def execute_tool(tool_name: str, request: ToolExecutionRequest):
     """Execute a specific tool with parameters"""
     try:
-        result = await tool_manager.execute_tool(tool_name, request.parameters, request.agent_name)
+        with log_verbosity(request.log_verbosity):
+            result = await tool_manager.execute_tool(tool_name, request.parameters, request.agent_name)
         return ToolExecutionResponse(
             tool_name=tool_name,
             parameters=request.parameters,
@@ -944,8 +1179,18 @@ async def create_workflow(workflow_def: WorkflowDefinition):
                 "parameters": step.parameters or {},
                 "context_key": step.context_key,
                 "use_previous_output": getattr(step, 'use_previous_output', False),
-                "preserve_objects": getattr(step, 'preserve_objects', False)
+                "preserve_objects": getattr(step, 'preserve_objects', False),
+                "depends_on": step.depends_on
             }
+            if step.type == "map":
+                step_dict.update({
+                    "items": step.items,
+                    "item_key": step.item_key,
+                    "step": step.step,
+                    "reduce": step.reduce,
+                    "max_concurrency": step.max_concurrency,
+                    "continue_on_error": step.continue_on_error
+                })
             steps_dict.append(step_dict)
         
         workflow_id = memory_manager.register_workflow(
@@ -954,7 +1199,9 @@ async def create_workflow(workflow_def: WorkflowDefinition):
             steps=steps_dict,
             enabled=workflow_def.enabled,
             input_schema=workflow_def.input_schema,
-            output_spec=workflow_def.output_spec
+            output_spec=workflow_def.output_spec,
+            execution_mode=workflow_def.execution_mode,
+            max_concurrency=workflow_def.max_concurrency
         )
         return WorkflowResponse(id=workflow_id, name=workflow_def.name, message="Workflow created successfully")
     except Exception as e:
@@ -996,32 +1243,14 @@ async def delete_workflow(workflow_name: str):
 async def execute_workflow(workflow_name: str, request: WorkflowExecutionRequest):
     """Execute a workflow with input validation"""
     try:
-        # Get workflow to check input schema
-        workflow = memory_manager.get_workflow(workflow_name)
-        if not workflow:
-            raise HTTPException(status_code=404, detail=f"Workflow {workflow_name} not found")
-        
-        if not workflow.get("enabled", True):
-            raise HTTPException(status_code=400, detail=f"Workflow {workflow_name} is disabled")
-        
-        # Validate input against schema if present
-        input_context = request.context or {}
-        if workflow.get("input_schema"):
-            validation_error = validate_workflow_input(workflow["input_schema"], input_context)
-            if validation_error:
-                raise HTTPException(status_code=400, detail=f"Input validation failed: {validation_error}")
-        
-        # Get agent name from agent_id if provided
-        agent_name = None
-        if request.agent_id:
-            agent = memory_manager.get_agent_by_id(request.agent_id)
-            if agent:
-                agent_name = agent.get("name")
-                logger.info(f"Workflow execution with agent: {agent_name}")
-        
-        result = await workflow_manager.execute_workflow(
-            workflow_name, input_context, agent_name
-        )
+        input_context, agent_name = prepare_workflow_execution(workflow_name, request)
+        
+        with log_verbosity(request.log_verbosity):
+            result = await workflow_manager.execute_workflow(
+                workflow_name, input_context, agent_name,
+                execution_mode=request.execution_mode,
+                max_concurrency=request.max_concurrency
+            )
         return WorkflowExecutionResponse(
             workflow_name=workflow_name,
             context=input_context,
@@ -1034,6 +1263,137 @@ async def execute_workflow(workflow_name: str, request: WorkflowExecutionRequest
         logger.error(f"Error executing workflow {workflow_name}: {e}")
         raise HTTPException(status_code=400, detail=str(e))
 
+def prepare_workflow_execution(workflow_name: str, request: WorkflowExecutionRequest):
+    """
+    Check that a workflow can run with the request's input
+    
+    Returns:
+        Tuple of (input context, agent name resolved from the request's agent_id)
+    """
+    # Get workflow to check input schema
+    workflow = memory_manager.get_workflow(workflow_name)
+    if not workflow:
+        raise HTTPException(status_code=404, detail=f"Workflow {workflow_name} not found")
+    
+    if not workflow.get("enabled", True):
+        raise HTTPException(status_code=400, detail=f"Workflow {workflow_name} is disabled")
+    
+    # Validate input against schema if present
+    input_context = request.context or {}
+    if workflow.get("input_schema"):
+        validation_error = validate_workflow_input(workflow["input_schema"], input_context)
+        if validation_error:
+            raise HTTPException(status_code=400, detail=f"Input validation failed: {validation_error}")
+    
+    # Get agent name from agent_id if provided
+    agent_name = None
+    if request.agent_id:
+        agent = memory_manager.get_agent_by_id(request.agent_id)
+        if agent:
+            agent_name = agent.get("name")
+            logger.info(f"Workflow execution with agent: {agent_name}")
+    
+    return input_context, agent_name
+
+# Job endpoints - submit agent/workflow runs and poll for the result
+def queue_full_error(e: JobQueueFullError) -> HTTPException:
+    return HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
+
+def not_running_error(e: JobManagerNotRunningError) -> HTTPException:
+    return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+
+@app.post("/agents/{agent_name}/jobs", response_model=JobInfo, status_code=202)
+async def submit_agent_job(agent_name: str, request: AgentExecutionRequest):
+    """Queue an agent task and return a job id to poll"""
+    agent = memory_manager.get_agent(agent_name)
+    if not agent:
+        raise HTTPException(status_code=404, detail=f"Agent {agent_name} not found")
+    
+    if not agent.get("enabled", True):
+        raise HTTPException(status_code=400, detail=f"Agent {agent_name} is disabled")
+    
+    try:
+        job = job_manager.submit_agent_job(
+            agent_name, request.task, request.context or {}, request.log_verbosity
+        )
+    except JobQueueFullError as e:
+        raise queue_full_error(e)
+    except JobManagerNotRunningError as e:
+        raise not_running_error(e)
+    
+    await warmup_manager.mark_model_used(agent.get('ollama_model', config.default_model))
+    return job
+
+@app.post("/workflows/{workflow_name}/jobs", response_model=JobInfo, status_code=202)
+async def submit_workflow_job(workflow_name: str, request: WorkflowExecutionRequest):
+    """Queue a workflow execution and return a job id to poll"""
+    input_context, agent_name = prepare_workflow_execution(workflow_name, request)
+    
+    try:
+        return job_manager.submit_workflow_job(
+            workflow_name, input_context, agent_name,
+            execution_mode=request.execution_mode,
+            max_concurrency=request.max_concurrency,
+            verbosity=request.log_verbosity
+        )
+    except JobQueueFullError as e:
+        raise queue_full_error(e)
+    except JobManagerNotRunningError as e:
+        raise not_running_error(e)
+
+@app.get("/jobs", response_model=List[JobInfo])
+async def list_jobs(status: Optional[str] = None, limit: int = 50):
+    """List recent jobs, optionally filtered by status"""
+    return job_manager.list_jobs(status, limit)
+
+@app.get("/jobs/stats")
+async def get_job_stats():
+    """Get job queue statistics"""
+    return job_manager.get_stats()
+
+@app.get("/jobs/{job_id}", response_model=JobInfo)
+async def get_job(job_id: str):
+    """Get a job's status, and its result or error once finished"""
+    job = job_manager.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+@app.post("/jobs/{job_id}/cancel", response_model=JobInfo)
+async def cancel_job(job_id: str):
+    """Cancel a queued or running job"""
+    job = job_manager.cancel_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+@app.get("/workflows/{workflow_name}/executions/{execution_id}", response_model=WorkflowExecutionInfo)
+async def get_workflow_execution(workflow_name: str, execution_id: str):
+    """Get the status and checkpointed steps of a workflow execution"""
+    execution = memory_manager.get_workflow_execution(execution_id)
+    if not execution or execution["workflow_name"] != workflow_name:
+        raise HTTPException(status_code=404, detail=f"Execution {execution_id} of workflow {workflow_name} not found")
+    return execution
+
+@app.post("/workflows/{workflow_name}/executions/{execution_id}/resume", response_model=WorkflowExecutionResponse)
+async def resume_workflow_execution(workflow_name: str, execution_id: str):
+    """Resume a failed or interrupted workflow execution from its last checkpointed steps"""
+    execution = memory_manager.get_workflow_execution(execution_id)
+    if not execution or execution["workflow_name"] != workflow_name:
+        raise HTTPException(status_code=404, detail=f"Execution {execution_id} of workflow {workflow_name} not found")
+    
+    try:
+        result = await workflow_manager.resume_workflow(workflow_name, execution_id)
+        return WorkflowExecutionResponse(
+            workflow_name=workflow_name,
+            context=execution["context"],
+            result=result,
+            timestamp=datetime.utcnow()
+        )
+    except Exception as e:
+        logger.error(f"Error resuming workflow {workflow_name} execution {execution_id}: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+
 def validate_workflow_input(input_schema: Dict[str, Any], input_data: Dict[str, Any]) -> Optional[str]:
     """
     Validate workflow input against schema
@@ -1140,6 +1500,7 @@ async def schedule_task(task: ScheduledTaskDefinition):
             except Exception as e:
                 logger.warning(f"Could not calculate next execution: {e}")
         
+        background_scheduler.notify_task_changed(task_id)
         logger.info(f"Successfully created task {task_id} - recurring: {task.is_recurring}")
         
         return ScheduleResponse(
@@ -1165,6 +1526,7 @@ async def delete_scheduled_task(task_id: int):
     """Delete a scheduled task"""
     try:
         memory_manager.delete_scheduled_task(task_id)
+        background_scheduler.notify_task_changed(task_id)
         return {"message": "Scheduled task deleted successfully"}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -1214,6 +1576,7 @@ async def enable_scheduled_task(task_id: int):
     """Enable a scheduled task"""
     try:
         memory_manager.enable_scheduled_task(task_id)
+        background_scheduler.notify_task_changed(task_id)
         return {"message": f"Task {task_id} enabled successfully"}
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -1225,6 +1588,7 @@ async def disable_scheduled_task(task_id: int):
     """Disable a scheduled task"""
     try:
         memory_manager.disable_scheduled_task(task_id)
+        background_scheduler.notify_task_changed(task_id)
         return {"message": f"Task {task_id} disabled successfully"}
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -1274,6 +1638,7 @@ async def update_scheduled_task(task_id: int, task_update: ScheduledTaskUpdate):
         
         # Update the task using the enhanced method
         memory_manager.update_scheduled_task_fields(task_id, update_dict)
+        background_scheduler.notify_task_changed(task_id)
         
         logger.info(f"Successfully updated task {task_id}")
         
@@ -1617,7 +1982,9 @@ async def import_backup(
                             steps=workflow.get("steps", []),
                             enabled=workflow.get("enabled", True),
                             input_schema=workflow.get("input_schema", {}),
-                            output_spec=workflow.get("output_spec", {})
+                            output_spec=workflow.get("output_spec", {}),
+                            execution_mode=workflow.get("execution_mode", "sequential"),
+                            max_concurrency=workflow.get("max_concurrency")
                         )
                         imported_workflows += 1
                         logger.info(f"Imported workflow: {workflow['name']}")
@@ -1671,6 +2038,8 @@ async def import_backup(
                         logger.info(f"Imported scheduled task: {task.get('agent_name', task.get('workflow_name', 'Unknown'))}")
                     except Exception as e:
                         logger.error(f"Failed to import scheduled task {task.get('agent_name', task.get('workflow_name', 'Unknown'))}: {e}")
+                if imported_tasks:
+                    background_scheduler.reload_schedule()
             
             # Import memory if requested
             imported_memory = 0
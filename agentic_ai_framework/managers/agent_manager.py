@@ -2,15 +2,36 @@
 managers/agent_manager.py - FIXED: Enhanced Agent Manager with Context Filtering
 """
 
+import asyncio
+import contextlib
 import json
 import re
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, AsyncGenerator, AsyncIterator, Callable, Container, Mapping
 from datetime import datetime
 
+from managers.log_utils import get_payload_logger
+from managers.memory_manager import AsyncMemoryManager
 from providers.base_llm_provider import Message, GenerationConfig
 
 logger = logging.getLogger(__name__)
+payload_logger = get_payload_logger(__name__)
+
+# Callback receiving (event name, event data) while an agent runs
+EventCallback = Callable[[str, Dict[str, Any]], None]
+
+_STREAM_DONE = object()
+
+# Tool call formats recognized in LLM responses; the fallbacks are tried only
+# when the primary format yields no valid call
+TOOL_CALL_PATTERN = re.compile(r'TOOL_CALL:\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*\((.*?)\)', re.IGNORECASE | re.DOTALL)
+FALLBACK_TOOL_CALL_PATTERNS = (
+    re.compile(r'TOOL_CALL\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\((.*?)\)', re.IGNORECASE | re.DOTALL),
+    re.compile(r'tool_call:\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*\((.*?)\)', re.IGNORECASE | re.DOTALL),
+)
+# Placeholder names copied from the tool call instructions
+PLACEHOLDER_TOOL_NAMES = {'tool_name', 'tool', 'name'}
+URL_PATTERN = re.compile(r'https?://[^\s]+')
 
 class AgentManager:
     """Enhanced agent execution manager with context filtering"""
@@ -18,152 +39,185 @@ class AgentManager:
     def __init__(self, llm_manager, memory_manager, tool_manager, config):
         self.llm_manager = llm_manager
         self.memory_manager = memory_manager
+        self.async_memory = AsyncMemoryManager(memory_manager)
         self.tool_manager = tool_manager
         self.config = config
+        self.tool_concurrency = getattr(config, "agent_tool_concurrency", 4)
+        self.tool_call_timeout = getattr(config, "tool_call_timeout", 0)
+        self.native_tool_calling = getattr(config, "native_tool_calling", True)
+        # agent name -> semaphore bounding its concurrent tool calls, and the
+        # number of tool call batches using it
+        self._tool_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._tool_semaphore_users: Dict[str, int] = {}
         logger.info("Initialized enhanced agent manager with context filtering")
     
     async def execute_agent(
         self, 
         agent_name: str, 
         task: str, 
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        on_event: Optional[EventCallback] = None
     ) -> str:
-        """Execute agent with filtered context to prevent data overload"""
+        """
+        Execute agent with filtered context to prevent data overload
+        
+        Args:
+            agent_name: Name of the agent to run
+            task: Task for the agent
+            context: Execution context
+            on_event: Optional callback for progress events. When set, LLM output
+                is streamed and reported as "token" events, and tool calls as
+                "tool_call" and "tool_result" events.
+        """
         context = context or {}
         
         # Get agent definition
-        agent = self.memory_manager.get_agent(agent_name)
+        agent = await self.async_memory.get_agent(agent_name)
         if not agent:
             raise ValueError(f"Agent {agent_name} not found")
         
         if not agent.get("enabled", True):
             raise ValueError(f"Agent {agent_name} is disabled")
         
-        logger.info(f"Starting execution for agent {agent_name}: {task}")
+        logger.info(f"Starting execution for agent {agent_name}")
+        payload_logger.debug("Agent task", task=task)
+        
+        # Registered tools, resolved once for prompt building and tool call parsing
+        available_tools = await self.async_memory.get_tool_availability()
         
         # CRITICAL FIX: Filter context for this specific agent
         filtered_context = self._filter_context_for_agent(agent_name, task, context)
         logger.info(f"Filtered context for {agent_name}: {list(filtered_context.keys())}")
         
         # Log task start
-        self.memory_manager.add_memory_entry(
+        await self.async_memory.add_memory_entry(
             agent_name, "user", task, {"context": filtered_context}
         )
         
         # Get recent conversation history (LIMITED to max entries)
         memory_limit = self.config.max_agent_memory_entries
-        memory_entries = self.memory_manager.get_agent_memory(agent_name, limit=memory_limit)
+        memory_entries = await self.async_memory.get_agent_memory(agent_name, limit=memory_limit)
         chat_history = self._build_chat_history(memory_entries)
         
+        # Tool schemas for models with structured tool calling; None uses the TOOL_CALL: text format
+        tool_schemas = self._get_native_tool_schemas(agent, available_tools)
+        
         # Build comprehensive system prompt with FILTERED agent context
-        system_prompt = self._build_comprehensive_system_prompt(agent, task, filtered_context)
+        system_prompt = self._build_comprehensive_system_prompt(
+            agent, task, filtered_context, available_tools, native_tools=bool(tool_schemas)
+        )
         
         iteration = 0
         max_iterations = min(self.config.max_agent_iterations, 3)
         
         try:
-            while iteration < max_iterations:
-                iteration += 1
-                logger.debug(f"Agent {agent_name} iteration {iteration}")
-                
-                # Generate response using the LLM manager
-                response = await self._generate_simple_response(
-                    system_prompt, agent, task, chat_history, iteration
+            if tool_schemas:
+                response = await self._run_native_tool_loop(
+                    agent, task, chat_history, system_prompt, tool_schemas, max_iterations, on_event
                 )
-                
-                # Log agent's response
-                self.memory_manager.add_memory_entry(
-                    agent_name, "assistant", response, 
-                    {"iteration": iteration, "task": task}
-                )
-                
-                # Parse response for tool calls
-                tool_calls = self._parse_tool_calls_aggressive(response)
-                
-                if not tool_calls:
-                    # If no tools are available, this is likely the final answer
-                    if not agent.get("tools"):
-                        logger.info(f"Agent {agent_name} completed without tools (no tools available)")
-                        break
+            else:
+                while iteration < max_iterations:
+                    iteration += 1
+                    logger.debug(f"Agent {agent_name} iteration {iteration}")
+                    
+                    # Generate response using the LLM manager
+                    response = await self._generate_simple_response(
+                        system_prompt, agent, task, chat_history, iteration, on_event
+                    )
                     
-                    # Try to force tool usage if iteration 1 and tools available
-                    if iteration == 1 and agent.get("tools"):
-                        logger.info(f"No tool calls found, re-prompting LLM with explicit instructions")
+                    # Log agent's response
+                    await self.async_memory.add_memory_entry(
+                        agent_name, "assistant", response, 
+                        {"iteration": iteration, "task": task}
+                    )
+                    
+                    # Parse response for tool calls
+                    tool_calls = self._parse_tool_calls_aggressive(response, available_tools)
+                    
+                    if not tool_calls:
+                        # If no tools are available, this is likely the final answer
+                        if not agent.get("tools"):
+                            logger.info(f"Agent {agent_name} completed without tools (no tools available)")
+                            break
+                    
+                        # Try to force tool usage if iteration 1 and tools available
+                        if iteration == 1 and agent.get("tools"):
+                            logger.info(f"No tool calls found, re-prompting LLM with explicit instructions")
                         
-                        # Add explicit tool instruction to chat history
-                        tool_instruction = self._create_explicit_tool_instruction(agent, task)
-                        chat_history.append({"role": "assistant", "content": response})
-                        chat_history.append({"role": "user", "content": tool_instruction})
+                            # Add explicit tool instruction to chat history
+                            tool_instruction = self._create_explicit_tool_instruction(agent, task)
+                            chat_history.append({"role": "assistant", "content": response})
+                            chat_history.append({"role": "user", "content": tool_instruction})
                         
-                        # Generate new response with explicit tool instruction
-                        forced_response = await self._generate_with_messages(
-                            agent, chat_history, system_prompt
-                        )
+                            # Generate new response with explicit tool instruction
+                            forced_response = await self._generate_with_messages(
+                                agent, chat_history, system_prompt, on_event, iteration
+                            )
                         
-                        logger.info(f"LLM response to explicit instruction: {forced_response[:100]}...")
+                            logger.info(f"LLM response to explicit instruction: {forced_response[:100]}...")
                         
-                        # Try to parse tool calls from the forced response
-                        tool_calls = self._parse_tool_calls_aggressive(forced_response)
+                            # Try to parse tool calls from the forced response
+                            tool_calls = self._parse_tool_calls_aggressive(forced_response, available_tools)
                         
-                        # If still no tool calls, create a minimal one as last resort
-                        if not tool_calls:
-                            logger.warning("LLM still didn't use tools after explicit instruction, creating minimal tool call")
-                            minimal_tool_call = self._create_minimal_tool_call(agent, task)
-                            if minimal_tool_call:
-                                tool_calls = [minimal_tool_call]
+                            # If still no tool calls, create a minimal one as last resort
+                            if not tool_calls:
+                                logger.warning("LLM still didn't use tools after explicit instruction, creating minimal tool call")
+                                minimal_tool_call = self._create_minimal_tool_call(agent, task)
+                                if minimal_tool_call:
+                                    tool_calls = [minimal_tool_call]
                         
-                        # Update response to the forced response
-                        response = forced_response
+                            # Update response to the forced response
+                            response = forced_response
                         
-                        # Log the forced response
-                        self.memory_manager.add_memory_entry(
-                            agent_name, "assistant", forced_response, 
-                            {"iteration": f"{iteration}-forced", "task": task, "forced": True}
-                        )
-                    
-                    if not tool_calls:
-                        # No tools available or couldn't force usage, treat as final answer
-                        logger.info(f"Agent {agent_name} completed without tools")
-                        break
-                
-                # Execute tool calls
-                tool_results = await self._execute_tool_calls(
-                    tool_calls, agent_name, iteration
-                )
-                
-                # Update chat history with results
-                chat_history.append({"role": "assistant", "content": response})
-                
-                # Add tool results to chat history
-                for result in tool_results:
-                    if "error" in result:
-                        result_msg = f"Tool {result['tool']} failed: {result['error']}"
-                    else:
-                        result_msg = f"Tool {result['tool']} result: {result['result']}"
+                            # Log the forced response
+                            await self.async_memory.add_memory_entry(
+                                agent_name, "assistant", forced_response, 
+                                {"iteration": f"{iteration}-forced", "task": task, "forced": True}
+                            )
                     
-                    chat_history.append({"role": "user", "content": result_msg})
-                
-                # For small models, ask for final answer after tool execution
-                if iteration >= 1:
-                    completion_prompt = "Based on the tool results above, provide your final answer to the original task."
-                    chat_history.append({"role": "user", "content": completion_prompt})
+                        if not tool_calls:
+                            # No tools available or couldn't force usage, treat as final answer
+                            logger.info(f"Agent {agent_name} completed without tools")
+                            break
                     
-                    # Generate final response
-                    final_response = await self._generate_with_messages(
-                        agent, chat_history, system_prompt
+                    # Execute tool calls
+                    tool_results = await self._execute_tool_calls(
+                        tool_calls, agent_name, iteration, on_event
                     )
                     
-                    # Log final response
-                    self.memory_manager.add_memory_entry(
-                        agent_name, "assistant", final_response, 
-                        {"iteration": f"{iteration}-final", "task": task}
-                    )
+                    # Update chat history with results
+                    chat_history.append({"role": "assistant", "content": response})
                     
-                    response = final_response
-                    break
+                    # Add tool results to chat history
+                    for result in tool_results:
+                        if "error" in result:
+                            result_msg = f"Tool {result['tool']} failed: {result['error']}"
+                        else:
+                            result_msg = f"Tool {result['tool']} result: {result['result']}"
+                    
+                        chat_history.append({"role": "user", "content": result_msg})
+                    
+                    # For small models, ask for final answer after tool execution
+                    if iteration >= 1:
+                        completion_prompt = "Based on the tool results above, provide your final answer to the original task."
+                        chat_history.append({"role": "user", "content": completion_prompt})
+                    
+                        # Generate final response
+                        final_response = await self._generate_with_messages(
+                            agent, chat_history, system_prompt, on_event, iteration
+                        )
+                    
+                        # Log final response
+                        await self.async_memory.add_memory_entry(
+                            agent_name, "assistant", final_response, 
+                            {"iteration": f"{iteration}-final", "task": task}
+                        )
+                    
+                        response = final_response
+                        break
             
             # ENHANCED: Cleanup old memory entries after execution
-            self.memory_manager.cleanup_agent_memory(
+            await self.async_memory.cleanup_agent_memory(
                 agent_name, 
                 keep_last=self.config.max_agent_memory_entries
             )
@@ -173,14 +227,14 @@ class AgentManager:
         except Exception as e:
             error_msg = f"Error in agent execution: {e}"
             logger.error(error_msg)
-            self.memory_manager.add_memory_entry(
+            await self.async_memory.add_memory_entry(
                 agent_name, "thought", error_msg,
                 {"error": str(e), "task": task}
             )
             
             # Still cleanup memory even on error
             try:
-                self.memory_manager.cleanup_agent_memory(
+                await self.async_memory.cleanup_agent_memory(
                     agent_name, 
                     keep_last=self.config.max_agent_memory_entries
                 )
@@ -189,6 +243,45 @@ class AgentManager:
             
             raise
     
+    async def stream_agent_events(
+        self,
+        agent_name: str,
+        task: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Execute an agent and yield its progress events as they happen
+        
+        Yields dicts with "event" and "data" keys: "token", "tool_call" and
+        "tool_result" events while the agent runs, then a single "final" event
+        with the result or an "error" event. Closing the generator early
+        cancels the execution.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        
+        def on_event(event: str, data: Dict[str, Any]):
+            queue.put_nowait({"event": event, "data": data})
+        
+        execution = asyncio.create_task(self.execute_agent(agent_name, task, context, on_event))
+        execution.add_done_callback(lambda _: queue.put_nowait(_STREAM_DONE))
+        
+        try:
+            while True:
+                item = await queue.get()
+                if item is _STREAM_DONE:
+                    break
+                yield item
+            
+            if execution.exception():
+                yield {"event": "error", "data": {"error": str(execution.exception())}}
+            else:
+                yield {"event": "final", "data": {"result": execution.result()}}
+        finally:
+            if not execution.done():
+                # The consumer went away before the agent finished
+                logger.info(f"Cancelling streamed execution of agent {agent_name}")
+                execution.cancel()
+    
     def _filter_context_for_agent(
         self, 
         agent_name: str, 
@@ -318,10 +411,17 @@ class AgentManager:
         self, 
         agent: Dict[str, Any], 
         task: str, 
-        context: Dict[str, Any]
+        context: Dict[str, Any],
+        available_tools: Optional[Mapping[str, bool]] = None,
+        native_tools: bool = False
     ) -> str:
-        """Build comprehensive system prompt with FILTERED agent context"""
-        tools_list = self._get_simple_tool_list(agent["tools"])
+        """
+        Build comprehensive system prompt with FILTERED agent context
+        
+        With native_tools the tools are passed to the provider as schemas, so
+        the TOOL_CALL: format instructions are left out.
+        """
+        tools_list = self._get_simple_tool_list(agent["tools"], available_tools)
         
         # Start with agent identity and role
         prompt_parts = [
@@ -383,7 +483,10 @@ class AgentManager:
                 prompt_parts.append(f"\nExecution Context:{context_str}")
         
         # Add tool information if tools are available
-        if agent.get("tools"):
+        if agent.get("tools") and native_tools:
+            prompt_parts.append(f"\nAvailable Tools: {tools_list}")
+            prompt_parts.append("Call these tools through the function calling interface whenever the task needs them.")
+        elif agent.get("tools"):
             prompt_parts.append(f"\nAvailable Tools: {tools_list}")
             prompt_parts.append("""
 IMPORTANT: To use a tool, use this exact format:
@@ -420,7 +523,7 @@ If you need to return structured data (like JSON), format it correctly.""")
         if any(keyword in task.lower() for keyword in ["check", "http", "url", "website", "status"]):
             if "website_monitor" in available_tools:
                 # Extract URL from task if possible
-                url_match = re.search(r'https?://[^\s]+', task)
+                url_match = URL_PATTERN.search(task)
                 if url_match:
                     url = url_match.group(0)
                 elif "google.com" in task.lower():
@@ -435,7 +538,7 @@ TOOL_CALL: website_monitor(url={url}, expected_status=200)"""
         
         elif any(keyword in task.lower() for keyword in ["api", "request", "get", "post"]):
             if "http_client" in available_tools:
-                url_match = re.search(r'https?://[^\s]+', task)
+                url_match = URL_PATTERN.search(task)
                 url = url_match.group(0) if url_match else "https://httpbin.org/get"
                 
                 return f"""You MUST use the http_client tool to complete this task.
@@ -464,7 +567,7 @@ Use the appropriate tool for: "{task}" """
         # URL checking tasks
         if any(keyword in task.lower() for keyword in ["check", "http", "url", "website", "status"]):
             if "website_monitor" in available_tools:
-                url_match = re.search(r'https?://[^\s]+', task)
+                url_match = URL_PATTERN.search(task)
                 if url_match:
                     url = url_match.group(0)
                 elif "google.com" in task.lower():
@@ -480,7 +583,7 @@ Use the appropriate tool for: "{task}" """
         # API/HTTP tasks
         if any(keyword in task.lower() for keyword in ["api", "request", "get", "post"]):
             if "http_client" in available_tools:
-                url_match = re.search(r'https?://[^\s]+', task)
+                url_match = URL_PATTERN.search(task)
                 url = url_match.group(0) if url_match else "https://httpbin.org/get"
                 
                 return {
@@ -501,26 +604,147 @@ Use the appropriate tool for: "{task}" """
         logger.warning("Using deprecated _build_simple_system_prompt. Please use _build_comprehensive_system_prompt")
         return self._build_comprehensive_system_prompt(agent, task, context)
     
-    def _get_simple_tool_list(self, tool_names: List[str]) -> str:
-        """Get simple list of available tools"""
+    def _get_simple_tool_list(
+        self,
+        tool_names: List[str],
+        available_tools: Optional[Mapping[str, bool]] = None
+    ) -> str:
+        """
+        Get simple list of available tools
+        
+        Args:
+            tool_names: The agent's tools
+            available_tools: Registered tool names mapped to whether they are enabled;
+                read from the memory manager when not given
+        """
         if not tool_names:
             return "None"
         
+        if available_tools is None:
+            available_tools = self.memory_manager.get_tool_availability()
+        
         tool_info = []
         for tool_name in tool_names:
-            tool = self.memory_manager.get_tool(tool_name)
-            if tool and tool.get("enabled", True):
+            if available_tools.get(tool_name):
                 tool_info.append(f"{tool_name}")
         
         return ", ".join(tool_info) if tool_info else "None"
     
+    def _get_native_tool_schemas(
+        self,
+        agent: Dict[str, Any],
+        available_tools: Mapping[str, bool]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Build function schemas for the agent's tools from their BaseTool.parameters
+        
+        Returns:
+            Schemas in the OpenAI tools format, or None when native tool calling
+            is disabled, the agent has no usable tools or its model does not
+            support structured tool calls
+        """
+        if not self.native_tool_calling or not agent.get("tools"):
+            return None
+        
+        model_name = agent.get("ollama_model", self.config.default_model)
+        if not self.llm_manager.supports_tool_calling(model_name):
+            return None
+        
+        schemas = []
+        for tool_name in agent["tools"]:
+            tool_instance = self.tool_manager.get_tool_instance(tool_name)
+            if tool_instance is None or not available_tools.get(tool_name):
+                continue
+            schemas.append({
+                "type": "function",
+                "function": {
+                    "name": tool_instance.name,
+                    "description": tool_instance.description,
+                    "parameters": tool_instance.parameters
+                }
+            })
+        return schemas or None
+    
+    async def _run_native_tool_loop(
+        self,
+        agent: Dict[str, Any],
+        task: str,
+        chat_history: List[Dict[str, str]],
+        system_prompt: str,
+        tool_schemas: List[Dict[str, Any]],
+        max_iterations: int,
+        on_event: Optional[EventCallback] = None
+    ) -> str:
+        """
+        Run the agent with the provider's structured tool calling
+        
+        Each LLM call either answers or returns tool calls, whose results are
+        sent back as tool messages for the next call. This needs no re-prompt
+        for the TOOL_CALL: format and no separate request for the final
+        answer; the last iteration is sent without tools so it has to answer.
+        Responses are not streamed token by token here: with on_event set,
+        each response is reported as a single "token" event.
+        
+        Returns:
+            The final response text
+        """
+        agent_name = agent["name"]
+        model_name = agent.get("ollama_model", self.config.default_model)
+        provider_name, resolved_model = self.llm_manager._resolve_model(model_name)
+        provider = self.llm_manager.get_provider(provider_name)
+        
+        messages = [Message(role="system", content=system_prompt)]
+        messages.extend(Message(role=msg["role"], content=msg["content"]) for msg in chat_history)
+        # The task was logged before the history was read, but may have been trimmed away
+        if not chat_history or chat_history[-1] != {"role": "user", "content": task}:
+            messages.append(Message(role="user", content=task))
+        
+        response = ""
+        for iteration in range(1, max_iterations + 1):
+            logger.debug(f"Agent {agent_name} iteration {iteration} (native tool calling)")
+            config = GenerationConfig(
+                temperature=0.7,
+                tools=tool_schemas if iteration < max_iterations else None
+            )
+            generation = await provider.generate_response(messages, resolved_model, config)
+            response = generation.content
+            if response and on_event is not None:
+                on_event("token", {"text": response, "iteration": iteration})
+            
+            tool_calls = [
+                {"tool_name": call.name, "parameters": call.arguments}
+                for call in generation.tool_calls or []
+            ]
+            metadata = {"iteration": iteration, "task": task}
+            if tool_calls:
+                metadata["tool_calls"] = tool_calls
+            await self.async_memory.add_memory_entry(agent_name, "assistant", response, metadata)
+            
+            if not tool_calls:
+                break
+            
+            tool_results = await self._execute_tool_calls(tool_calls, agent_name, iteration, on_event)
+            
+            messages.append(Message(role="assistant", content=response, tool_calls=generation.tool_calls))
+            for tool_call, result in zip(generation.tool_calls, tool_results):
+                if "error" in result:
+                    content = f"Tool {result['tool']} failed: {result['error']}"
+                elif isinstance(result["result"], str):
+                    content = result["result"]
+                else:
+                    content = json.dumps(result["result"], default=str)
+                messages.append(Message(role="tool", content=content, tool_call_id=tool_call.id))
+        
+        return response
+    
     async def _generate_simple_response(
         self, 
         system_prompt: str, 
         agent: Dict[str, Any], 
         task: str, 
         chat_history: List[Dict[str, str]], 
-        iteration: int
+        iteration: int,
+        on_event: Optional[EventCallback] = None
     ) -> str:
         """Generate response with explicit task instruction using LLM manager"""
         model_name = agent.get("ollama_model", self.config.default_model)
@@ -533,16 +757,35 @@ Use the appropriate tool for: "{task}" """
         response = await self.llm_manager.generate_response(
             prompt=system_prompt,
             model=model_name,
-            chat_history=chat_history
+            chat_history=chat_history,
+            stream=on_event is not None
         )
         
+        if on_event is not None:
+            return await self._collect_stream(response, on_event, iteration)
         return response
     
+    async def _collect_stream(
+        self,
+        chunks: AsyncIterator[str],
+        on_event: EventCallback,
+        iteration: int
+    ) -> str:
+        """Report streamed text chunks as token events and return the full text"""
+        parts = []
+        async for chunk in chunks:
+            if chunk:
+                parts.append(chunk)
+                on_event("token", {"text": chunk, "iteration": iteration})
+        return "".join(parts)
+    
     async def _generate_with_messages(
         self, 
         agent: Dict[str, Any], 
         chat_history: List[Dict[str, str]], 
-        system_prompt: str
+        system_prompt: str,
+        on_event: Optional[EventCallback] = None,
+        iteration: Optional[int] = None
     ) -> str:
         """Generate response using chat history and system prompt"""
         model_name = agent.get("ollama_model", self.config.default_model)
@@ -562,7 +805,7 @@ Use the appropriate tool for: "{task}" """
         config = GenerationConfig(
             temperature=0.7,
             max_tokens=None,
-            stream=False
+            stream=on_event is not None
         )
         
         # Generate using the provider directly for more control
@@ -570,37 +813,58 @@ Use the appropriate tool for: "{task}" """
         provider = self.llm_manager.get_provider(provider_name)
         
         if provider:
+            if on_event is not None:
+                return await self._collect_stream(
+                    provider.generate_response_stream(messages, resolved_model, config), on_event, iteration
+                )
             response_obj = await provider.generate_response(messages, resolved_model, config)
             return response_obj.content
         else:
             # Fallback to the simpler interface
-            return await self.llm_manager.generate_response(
+            response = await self.llm_manager.generate_response(
                 prompt=chat_history[-1]["content"] if chat_history else "",
                 model=model_name,
-                chat_history=chat_history[:-1] if chat_history else []
+                chat_history=chat_history[:-1] if chat_history else [],
+                stream=on_event is not None
             )
+            if on_event is not None:
+                return await self._collect_stream(response, on_event, iteration)
+            return response
     
-    def _parse_tool_calls_aggressive(self, response: str) -> List[Dict[str, Any]]:
-        """Aggressive tool call parsing with multiple patterns and duplicate prevention"""
+    def _parse_tool_calls_aggressive(
+        self,
+        response: str,
+        known_tools: Optional[Container[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggressive tool call parsing with multiple patterns and duplicate prevention
+        
+        Args:
+            response: LLM response text
+            known_tools: Names of registered tools; calls to other names are skipped.
+                Read from the memory manager when not given.
+        """
+        if known_tools is None:
+            known_tools = self.memory_manager.get_tool_availability()
+        
         tool_calls = []
+        # (tool name, canonical parameters) of the calls parsed so far
+        seen_calls = set()
         
         logger.debug(f"Parsing response for tool calls: {response[:200]}...")
         
         # Primary pattern - most reliable
-        primary_pattern = r'TOOL_CALL:\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*\((.*?)\)'
-        matches = re.findall(primary_pattern, response, re.IGNORECASE | re.DOTALL)
-        
-        for match in matches:
+        for match in TOOL_CALL_PATTERN.findall(response):
             try:
                 tool_name, params_str = match
                 tool_name = tool_name.strip()
                 
                 # Skip if tool name is invalid
-                if tool_name.lower() in ['tool_name', 'tool', 'name']:
+                if tool_name.lower() in PLACEHOLDER_TOOL_NAMES:
                     continue
                 
                 # Validate tool exists
-                if not self.memory_manager.get_tool(tool_name):
+                if tool_name not in known_tools:
                     logger.warning(f"Tool {tool_name} not found, skipping")
                     continue
                 
@@ -624,24 +888,19 @@ Use the appropriate tool for: "{task}" """
                     
                     parameters["url"] = url
                 
-                # Create tool call
-                tool_call = {
-                    "tool_name": tool_name,
-                    "parameters": parameters
-                }
-                
                 # Strict duplicate checking - exact match on tool name and parameters
-                is_duplicate = False
-                for existing_call in tool_calls:
-                    if (existing_call["tool_name"] == tool_name and 
-                        existing_call["parameters"] == parameters):
-                        is_duplicate = True
-                        logger.debug(f"Skipping duplicate tool call: {tool_name}")
-                        break
+                call_key = self._tool_call_key(tool_name, parameters)
+                if call_key in seen_calls:
+                    logger.debug(f"Skipping duplicate tool call: {tool_name}")
+                    continue
                 
-                if not is_duplicate:
-                    tool_calls.append(tool_call)
-                    logger.info(f"Parsed tool call: {tool_name} with {parameters}")
+                seen_calls.add(call_key)
+                tool_calls.append({
+                    "tool_name": tool_name,
+                    "parameters": parameters
+                })
+                logger.info(f"Parsed tool call: {tool_name}")
+                payload_logger.debug("Tool call parameters", parameters=parameters)
             
             except Exception as e:
                 logger.error(f"Failed to parse tool call from match {match}: {e}")
@@ -651,19 +910,13 @@ Use the appropriate tool for: "{task}" """
         if not tool_calls:
             logger.debug("No matches with primary pattern, trying fallback patterns")
             
-            fallback_patterns = [
-                r'TOOL_CALL\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\((.*?)\)',
-                r'tool_call:\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*\((.*?)\)',
-            ]
-            
-            for pattern in fallback_patterns:
-                matches = re.findall(pattern, response, re.IGNORECASE | re.DOTALL)
-                for match in matches:
+            for pattern in FALLBACK_TOOL_CALL_PATTERNS:
+                for match in pattern.findall(response):
                     try:
                         tool_name, params_str = match
                         tool_name = tool_name.strip()
                         
-                        if not self.memory_manager.get_tool(tool_name):
+                        if tool_name not in known_tools:
                             continue
                         
                         parameters = self._parse_parameters_simple(params_str)
@@ -681,23 +934,13 @@ Use the appropriate tool for: "{task}" """
                                     url = f"https://{url}"
                             parameters["url"] = url
                         
-                        tool_call = {
+                        tool_calls.append({
                             "tool_name": tool_name,
                             "parameters": parameters
-                        }
-                        
-                        # Check for duplicates
-                        is_duplicate = False
-                        for existing_call in tool_calls:
-                            if (existing_call["tool_name"] == tool_name and 
-                                existing_call["parameters"] == parameters):
-                                is_duplicate = True
-                                break
-                        
-                        if not is_duplicate:
-                            tool_calls.append(tool_call)
-                            logger.info(f"Parsed tool call (fallback): {tool_name} with {parameters}")
-                            break  # Stop at first successful fallback parse
+                        })
+                        logger.info(f"Parsed tool call (fallback): {tool_name}")
+                        payload_logger.debug("Tool call parameters", parameters=parameters)
+                        break  # Stop at first successful fallback parse
                     
                     except Exception as e:
                         logger.error(f"Failed to parse fallback tool call: {e}")
@@ -709,6 +952,10 @@ Use the appropriate tool for: "{task}" """
         logger.info(f"Total tool calls parsed: {len(tool_calls)}")
         return tool_calls
     
+    def _tool_call_key(self, tool_name: str, parameters: Dict[str, Any]) -> tuple:
+        """Hashable identity of a tool call for duplicate detection"""
+        return tool_name, json.dumps(parameters, sort_keys=True, default=str)
+    
     def _parse_parameters_simple(self, params_str: str) -> Dict[str, Any]:
         """Simplified parameter parsing with JSON support and parameter mapping"""
         parameters = {}
@@ -786,48 +1033,107 @@ Use the appropriate tool for: "{task}" """
         self, 
         tool_calls: List[Dict[str, Any]], 
         agent_name: str, 
-        iteration: int
+        iteration: int,
+        on_event: Optional[EventCallback] = None
     ) -> List[Dict[str, Any]]:
-        """Execute tool calls"""
-        tool_results = []
-        
-        for tool_call in tool_calls:
-            try:
-                logger.debug(f"Executing tool {tool_call['tool_name']} for agent {agent_name}")
-                
-                result = await self.tool_manager.execute_tool(
-                    tool_call["tool_name"],
-                    tool_call["parameters"],
-                    agent_name
-                )
-                
-                tool_results.append({
-                    "tool": tool_call["tool_name"],
-                    "result": result
-                })
-                
-                # Log tool execution
-                self.memory_manager.add_memory_entry(
-                    agent_name, "tool_output", 
-                    f"Tool: {tool_call['tool_name']}\nResult: {result}",
-                    {
-                        "tool_name": tool_call["tool_name"],
+        """
+        Execute tool calls
+        
+        Calls run concurrently, at most agent_tool_concurrency at a time per
+        agent. A call to a tool that is not parallel_safe waits for the calls
+        before it and runs alone. Results and memory entries keep the order of
+        the calls; events are emitted as calls start and finish and carry the
+        call's index.
+        """
+        async with self._tool_limit(agent_name) as semaphore:
+            return await self._run_tool_calls(tool_calls, agent_name, iteration, semaphore, on_event)
+    
+    @contextlib.asynccontextmanager
+    async def _tool_limit(self, agent_name: str):
+        """Share the agent's tool call semaphore, dropping it once no batch of the agent uses it"""
+        if agent_name not in self._tool_semaphores:
+            self._tool_semaphores[agent_name] = asyncio.Semaphore(self.tool_concurrency)
+        self._tool_semaphore_users[agent_name] = self._tool_semaphore_users.get(agent_name, 0) + 1
+        try:
+            yield self._tool_semaphores[agent_name]
+        finally:
+            self._tool_semaphore_users[agent_name] -= 1
+            if self._tool_semaphore_users[agent_name] == 0:
+                del self._tool_semaphore_users[agent_name]
+                del self._tool_semaphores[agent_name]
+    
+    async def _run_tool_calls(
+        self,
+        tool_calls: List[Dict[str, Any]],
+        agent_name: str,
+        iteration: int,
+        semaphore: asyncio.Semaphore,
+        on_event: Optional[EventCallback] = None
+    ) -> List[Dict[str, Any]]:
+        tool_results: List[Optional[Dict[str, Any]]] = [None] * len(tool_calls)
+        
+        async def run_tool_call(index: int):
+            tool_call = tool_calls[index]
+            tool_name = tool_call["tool_name"]
+            async with semaphore:
+                if on_event is not None:
+                    on_event("tool_call", {
+                        "tool": tool_name,
                         "parameters": tool_call["parameters"],
-                        "iteration": iteration
-                    }
-                )
-                
-            except Exception as e:
-                error_msg = f"Error executing tool {tool_call['tool_name']}: {e}"
-                logger.warning(error_msg)
+                        "iteration": iteration,
+                        "index": index
+                    })
+                timeout = self._get_tool_attribute(tool_name, "timeout") or self.tool_call_timeout
+                try:
+                    logger.debug(f"Executing tool {tool_name} for agent {agent_name}")
+                    execution = self.tool_manager.execute_tool(tool_name, tool_call["parameters"], agent_name)
+                    result = await asyncio.wait_for(execution, timeout) if timeout else await execution
+                    tool_results[index] = {"tool": tool_name, "result": result}
+                except asyncio.TimeoutError:
+                    logger.warning(f"Tool {tool_name} timed out after {timeout}s for agent {agent_name}")
+                    tool_results[index] = {"tool": tool_name, "error": f"Timed out after {timeout}s"}
+                except Exception as e:
+                    logger.warning(f"Error executing tool {tool_name}: {e}")
+                    tool_results[index] = {"tool": tool_name, "error": str(e)}
                 
-                tool_results.append({
-                    "tool": tool_call["tool_name"],
-                    "error": str(e)
-                })
+                if on_event is not None:
+                    on_event("tool_result", {**tool_results[index], "iteration": iteration, "index": index})
+        
+        async def run_batch(indexes: List[int]):
+            if indexes:
+                await asyncio.gather(*(run_tool_call(index) for index in indexes))
+        
+        batch: List[int] = []
+        for index, tool_call in enumerate(tool_calls):
+            if self._get_tool_attribute(tool_call["tool_name"], "parallel_safe", True):
+                batch.append(index)
+                continue
+            await run_batch(batch)
+            batch = []
+            await run_batch([index])
+        await run_batch(batch)
+        
+        # Log tool executions in call order
+        for tool_call, tool_result in zip(tool_calls, tool_results):
+            if "error" in tool_result:
+                continue
+            await self.async_memory.add_memory_entry(
+                agent_name, "tool_output", 
+                f"Tool: {tool_call['tool_name']}\nResult: {tool_result['result']}",
+                {
+                    "tool_name": tool_call["tool_name"],
+                    "parameters": tool_call["parameters"],
+                    "iteration": iteration
+                }
+            )
         
         return tool_results
     
+    def _get_tool_attribute(self, tool_name: str, attribute: str, default: Any = None) -> Any:
+        """Read a BaseTool class setting such as parallel_safe or timeout from the loaded tool"""
+        tool_instance = self.tool_manager.get_tool_instance(tool_name)
+        return getattr(tool_instance, attribute, default)
+    
     def _build_chat_history(self, memory_entries: List[Dict[str, Any]]) -> List[Dict[str, str]]:
         """Build chat history from memory entries"""
         chat_history = []
@@ -0,0 +1,108 @@
+"""
+managers/definition_cache.py - Read-Through Cache for Stored Definitions
+"""
+
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class DefinitionCache:
+    """
+    Versioned read-through cache of agent, tool and workflow definitions
+
+    Values are cached per (kind, name), including lookups that found nothing,
+    and every read returns a copy so callers can modify what they get. Writes
+    invalidate a whole kind by bumping its version; a lookup that was loading
+    while its kind changed returns its result without caching it. Entries also
+    expire after the TTL, which bounds staleness when another process writes
+    to the same database. Expired entries are dropped when next looked up,
+    and the least recently used entries are evicted past max_entries.
+    """
+
+    def __init__(self, ttl: float = 300, max_entries: int = 1000):
+        """
+        Initialize the cache
+
+        Args:
+            ttl: Seconds a cached definition stays valid (0 disables caching)
+            max_entries: Maximum number of cached definitions across all kinds
+        """
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        # Least recently used first
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get(self, kind: str, name: str, load: Callable[[], Any]) -> Any:
+        """
+        Get a definition, loading and caching it on a miss
+
+        Args:
+            kind: Definition kind, such as "agent" or "tool"
+            name: Definition name
+            load: Callable reading the definition from the database
+        """
+        if not self.enabled:
+            return load()
+
+        key = (kind, name)
+        with self._lock:
+            stats = self._kind_stats(kind)
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    stats["hits"] += 1
+                    return copy.deepcopy(entry[1])
+                del self._entries[key]
+            stats["misses"] += 1
+            version = self._versions.get(kind, 0)
+
+        value = load()
+
+        with self._lock:
+            if self._versions.get(kind, 0) == version:
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return copy.deepcopy(value)
+
+    def invalidate(self, *kinds: str):
+        """Drop all cached definitions of the given kinds"""
+        with self._lock:
+            for kind in kinds:
+                self._versions[kind] = self._versions.get(kind, 0) + 1
+                self._kind_stats(kind)["invalidations"] += 1
+                for key in [key for key in self._entries if key[0] == kind]:
+                    del self._entries[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit, miss and invalidation counts per kind"""
+        with self._lock:
+            kinds = {}
+            for kind, stats in self._stats.items():
+                lookups = stats["hits"] + stats["misses"]
+                kinds[kind] = {
+                    **stats,
+                    "entries": sum(1 for key in self._entries if key[0] == kind),
+                    "hit_rate": round(stats["hits"] / lookups, 3) if lookups else None
+                }
+            return {"enabled": self.enabled, "ttl": self.ttl, "max_entries": self.max_entries, "kinds": kinds}
+
+    def _kind_stats(self, kind: str) -> Dict[str, int]:
+        if kind not in self._stats:
+            self._stats[kind] = {"hits": 0, "misses": 0, "invalidations": 0}
+        return self._stats[kind]
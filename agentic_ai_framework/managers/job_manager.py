@@ -0,0 +1,270 @@
+"""
+managers/job_manager.py - Asynchronous Agent and Workflow Jobs
+"""
+
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from managers.log_utils import log_verbosity
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueueFullError(Exception):
+    """Raised when a job is submitted while the job queue is full"""
+
+
+class JobManagerNotRunningError(Exception):
+    """Raised when a job is submitted before the job manager is started or after it stops"""
+
+
+@dataclass
+class Job:
+    """A queued agent or workflow execution"""
+    id: str
+    job_type: str  # agent or workflow
+    target: str  # agent or workflow name
+    params: Dict[str, Any]
+    status: str = "queued"  # queued, running, completed, failed, cancelled
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Any = None
+    error: Optional[str] = None
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("completed", "failed", "cancelled")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "job_type": self.job_type,
+            "target": self.target,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            "error": self.error
+        }
+
+
+class JobManager:
+    """Runs submitted agent and workflow executions from a bounded in-process queue"""
+
+    def __init__(self, agent_manager, workflow_manager, config=None):
+        """
+        Initialize job manager
+
+        Args:
+            agent_manager: Agent manager used to run agent jobs
+            workflow_manager: Workflow manager used to run workflow jobs
+            config: Configuration object with job queue settings
+        """
+        self.agent_manager = agent_manager
+        self.workflow_manager = workflow_manager
+        self.max_queue_size = getattr(config, "job_queue_max_size", 100)
+        self.worker_count = getattr(config, "job_workers", 4)
+        self.result_ttl = getattr(config, "job_result_ttl", 3600)
+
+        self.jobs: Dict[str, Job] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        # Jobs still waiting to run; cancelled jobs stay in the queue until a
+        # worker skips them, so capacity is checked against this count instead
+        self._queued = 0
+        self._workers: List[asyncio.Task] = []
+        self._stopping = False
+        logger.info(f"Initialized job manager ({self.worker_count} workers, queue size {self.max_queue_size})")
+
+    async def start(self):
+        """Start the job workers"""
+        if self._workers:
+            return
+        self._stopping = False
+        self._queue = asyncio.Queue()
+        self._queued = 0
+        self._workers = [
+            asyncio.create_task(self._worker(i), name=f"job-worker-{i}")
+            for i in range(self.worker_count)
+        ]
+        logger.info(f"Started {self.worker_count} job workers")
+
+    async def stop(self):
+        """Stop the workers and cancel queued and running jobs"""
+        self._stopping = True
+        for job in self.jobs.values():
+            if job.status == "queued":
+                self._dequeue(job)
+                self._finish(job, "cancelled", error="Server shutting down")
+            elif job.task:
+                job.task.cancel()
+        for worker in self._workers:
+            worker.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        logger.info("Job manager stopped")
+
+    def submit_agent_job(
+        self,
+        agent_name: str,
+        task: str,
+        context: Optional[Dict[str, Any]] = None,
+        verbosity: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Queue an agent execution and return the job"""
+        return self._submit("agent", agent_name, {
+            "task": task,
+            "context": context or {},
+            "log_verbosity": verbosity
+        })
+
+    def submit_workflow_job(
+        self,
+        workflow_name: str,
+        context: Optional[Dict[str, Any]] = None,
+        agent_name: Optional[str] = None,
+        execution_mode: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        verbosity: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Queue a workflow execution and return the job"""
+        return self._submit("workflow", workflow_name, {
+            "context": context or {},
+            "agent_name": agent_name,
+            "execution_mode": execution_mode,
+            "max_concurrency": max_concurrency,
+            "log_verbosity": verbosity
+        })
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job's status and, once finished, its result or error"""
+        self._prune_finished_jobs()
+        job = self.jobs.get(job_id)
+        return job.to_dict() if job else None
+
+    def list_jobs(self, status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """List the most recent jobs, optionally filtered by status"""
+        self._prune_finished_jobs()
+        jobs = [job for job in self.jobs.values() if status is None or job.status == status]
+        jobs.sort(key=lambda job: job.created_at, reverse=True)
+        return [job.to_dict() for job in jobs[:limit]]
+
+    def cancel_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Cancel a queued or running job
+
+        Returns:
+            The job, or None if it does not exist. Finished jobs are returned unchanged.
+        """
+        job = self.jobs.get(job_id)
+        if not job:
+            return None
+        if job.status == "queued":
+            # The worker skips it when it reaches the front of the queue
+            self._dequeue(job)
+            self._finish(job, "cancelled", error="Cancelled by request")
+        elif job.status == "running" and job.task:
+            job.task.cancel()
+        return job.to_dict()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue and job counts"""
+        counts: Dict[str, int] = {}
+        for job in self.jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {
+            "workers": len(self._workers),
+            "queue_size": self._queued,
+            "max_queue_size": self.max_queue_size,
+            "jobs": counts
+        }
+
+    def _submit(self, job_type: str, target: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        if self._queue is None or self._stopping:
+            raise JobManagerNotRunningError("Job manager is not running")
+
+        if self._queued >= self.max_queue_size:
+            raise JobQueueFullError(f"Job queue is full ({self.max_queue_size} jobs waiting)")
+
+        self._prune_finished_jobs()
+        job = Job(id=uuid.uuid4().hex, job_type=job_type, target=target, params=params)
+        self._queue.put_nowait(job)
+        self._queued += 1
+        self.jobs[job.id] = job
+        logger.info(f"Queued {job_type} job {job.id} for {target}")
+        return job.to_dict()
+
+    async def _worker(self, worker_id: int):
+        while True:
+            job = await self._queue.get()
+            try:
+                if job.status != "queued":
+                    continue
+                await self._run_job(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run_job(self, job: Job):
+        self._dequeue(job)
+        job.status = "running"
+        job.started_at = datetime.utcnow()
+        logger.info(f"Running {job.job_type} job {job.id} for {job.target}")
+
+        job.task = asyncio.create_task(self._execute(job))
+        try:
+            result = await job.task
+        except asyncio.CancelledError:
+            if self._stopping:
+                job.task.cancel()
+                self._finish(job, "cancelled", error="Server shutting down")
+                raise
+            self._finish(job, "cancelled", error="Cancelled by request")
+        except Exception as e:
+            logger.error(f"{job.job_type.capitalize()} job {job.id} for {job.target} failed: {e}")
+            self._finish(job, "failed", error=str(e))
+        else:
+            self._finish(job, "completed", result=result)
+        finally:
+            job.task = None
+
+    async def _execute(self, job: Job) -> Any:
+        params = job.params
+        with log_verbosity(params.get("log_verbosity")):
+            if job.job_type == "agent":
+                return await self.agent_manager.execute_agent(job.target, params["task"], params["context"])
+            return await self.workflow_manager.execute_workflow(
+                job.target, params["context"], params["agent_name"],
+                execution_mode=params["execution_mode"],
+                max_concurrency=params["max_concurrency"]
+            )
+
+    def _dequeue(self, job: Job):
+        """Stop counting a queued job toward the queue size as it starts or is cancelled"""
+        if job.status == "queued":
+            self._queued -= 1
+
+    def _finish(self, job: Job, status: str, result: Any = None, error: Optional[str] = None):
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished_at = datetime.utcnow()
+        if job.started_at:
+            duration = (job.finished_at - job.started_at).total_seconds()
+            logger.info(f"{job.job_type.capitalize()} job {job.id} {status} after {duration:.1f}s")
+
+    def _prune_finished_jobs(self):
+        """Forget finished jobs older than the result TTL"""
+        cutoff = datetime.utcnow() - timedelta(seconds=self.result_ttl)
+        expired = [
+            job_id for job_id, job in self.jobs.items()
+            if job.finished and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self.jobs[job_id]
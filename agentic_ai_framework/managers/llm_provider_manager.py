@@ -64,6 +64,7 @@ class LLMProviderManager:
             try:
                 provider = self._create_provider(provider_name, provider_config)
                 if provider:
+                    await self.close_provider(provider_name)
                     self.providers[provider_name] = provider
                     
                     # Initialize the provider
@@ -406,6 +407,15 @@ class LLMProviderManager:
         
         return False
     
+    def supports_tool_calling(self, model: Optional[str] = None) -> bool:
+        """Check if the given model/provider supports native tool calling"""
+        provider_name, model_name = self._resolve_model(model)
+        
+        if provider_name in self.providers:
+            return self.providers[provider_name].supports_tool_calling(model_name)
+        
+        return False
+    
     def get_available_providers(self) -> List[str]:
         """Get list of available provider names"""
         return list(self.providers.keys())
@@ -416,4 +426,19 @@ class LLMProviderManager:
             self.default_provider = provider_name
             logger.info(f"Default provider set to: {provider_name}")
         else:
-            raise ValueError(f"Provider {provider_name} not found")
\ No newline at end of file
+            raise ValueError(f"Provider {provider_name} not found")
+    
+    async def close_provider(self, provider_name: str):
+        """Remove a provider and release its pooled connections"""
+        provider = self.providers.pop(provider_name, None)
+        if provider:
+            try:
+                await provider.close()
+            except Exception as e:
+                logger.warning(f"Error closing {provider_name} provider: {e}")
+    
+    async def close(self):
+        """Close all providers and their HTTP connection pools"""
+        for provider_name in list(self.providers.keys()):
+            await self.close_provider(provider_name)
+        logger.info("LLM providers closed")
@@ -0,0 +1,184 @@
+"""
+managers/log_utils.py - Size-Bounded Payload Logging
+"""
+
+import logging
+from collections.abc import KeysView
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Union
+
+# Default maximum characters rendered per logged payload (0 disables truncation)
+DEFAULT_PAYLOAD_MAX_CHARS = 1000
+
+_payload_max_chars = DEFAULT_PAYLOAD_MAX_CHARS
+
+# Characters kept from a single value once the payload budget is nearly spent
+MIN_VALUE_CHARS = 20
+
+# Per-request log level override for payload logging
+_verbosity: ContextVar[Optional[int]] = ContextVar("log_verbosity", default=None)
+
+VERBOSITY_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+def set_payload_max_chars(max_chars: int):
+    """Set the default maximum characters rendered per logged payload"""
+    global _payload_max_chars
+    _payload_max_chars = max(0, int(max_chars))
+
+
+def parse_level(verbosity: Union[int, str, None]) -> Optional[int]:
+    """
+    Convert a log verbosity name such as "debug" to its logging level
+
+    Integers and None are returned unchanged.
+
+    Raises:
+        ValueError: If the name is not one of VERBOSITY_LEVELS
+    """
+    if verbosity is None or isinstance(verbosity, int):
+        return verbosity
+    name = str(verbosity).upper()
+    if name not in VERBOSITY_LEVELS:
+        raise ValueError(f"Invalid log verbosity '{verbosity}'. Must be one of: {list(VERBOSITY_LEVELS)}")
+    return logging.getLevelName(name)
+
+
+@contextmanager
+def log_verbosity(verbosity: Union[int, str, None]):
+    """
+    Override the payload log level for the current request
+
+    Applies to everything running in the current context, including tasks
+    created from it. None leaves the configured logger levels in effect.
+    """
+    token = _verbosity.set(parse_level(verbosity))
+    try:
+        yield
+    finally:
+        _verbosity.reset(token)
+
+
+def summarize(value: Any, max_chars: Optional[int] = None) -> str:
+    """
+    Render a value for logging within a character budget
+
+    Long strings are cut and annotated with their length; dicts and lists
+    stop rendering once the budget is spent and report how many entries
+    were left out, so large payloads are never stringified in full.
+    """
+    limit = _payload_max_chars if max_chars is None else max_chars
+    if limit <= 0:
+        return value if isinstance(value, str) else str(value)
+    if isinstance(value, str):
+        return _truncate(value, limit)
+
+    parts = []
+    _render(value, parts, [limit])
+    return "".join(parts)
+
+
+def _truncate(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}... [{len(text)} chars]"
+
+
+def _render(value: Any, parts: list, budget: list):
+    """Append a repr-like rendering of value to parts, spending budget[0] characters"""
+    if isinstance(value, dict):
+        _render_items(value.items(), len(value), "{", "}", "keys", parts, budget, keyed=True)
+    elif isinstance(value, (list, tuple, set, KeysView)):
+        _render_items(value, len(value), "[", "]", "items", parts, budget, keyed=False)
+    else:
+        text = repr(value) if isinstance(value, str) else str(value)
+        # Keep a short prefix even when the budget is nearly spent
+        keep = max(budget[0], MIN_VALUE_CHARS)
+        if len(text) > keep:
+            text = f"{text[:keep]}... [{len(text)} chars]"
+        parts.append(text)
+        budget[0] -= len(text)
+
+
+def _render_items(items, count: int, open_char: str, close_char: str, noun: str, parts: list,
+                  budget: list, keyed: bool):
+    parts.append(open_char)
+    budget[0] -= 1
+    for rendered, item in enumerate(items):
+        if budget[0] <= 0:
+            parts.append(f"... (+{count - rendered} more {noun})")
+            break
+        if rendered:
+            parts.append(", ")
+            budget[0] -= 2
+        if keyed:
+            key, item = item
+            key_text = f"{key!r}: "
+            parts.append(key_text)
+            budget[0] -= len(key_text)
+        _render(item, parts, budget)
+    parts.append(close_char)
+    budget[0] -= 1
+
+
+class Preview:
+    """Lazily summarized payload, rendered only when a log record is formatted"""
+
+    __slots__ = ("value", "max_chars")
+
+    def __init__(self, value: Any, max_chars: Optional[int] = None):
+        self.value = value
+        self.max_chars = max_chars
+
+    def __str__(self) -> str:
+        return summarize(self.value, self.max_chars)
+
+    __repr__ = __str__
+
+
+class PayloadLogger:
+    """
+    Logger wrapper for messages that carry large payloads
+
+    Payloads are passed as keyword fields, kept unrendered on the log record
+    as ``payload`` and summarized into the message only when the record is
+    actually emitted. The per-request verbosity set with log_verbosity takes
+    precedence over the wrapped logger's level.
+    """
+
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+
+    def is_enabled_for(self, level: int) -> bool:
+        override = _verbosity.get()
+        if override is not None:
+            return level >= override and not self.logger.disabled
+        return self.logger.isEnabledFor(level)
+
+    def log(self, level: int, message: str, **payload: Any):
+        self._emit(level, message, payload)
+
+    def debug(self, message: str, **payload: Any):
+        self._emit(logging.DEBUG, message, payload)
+
+    def info(self, message: str, **payload: Any):
+        self._emit(logging.INFO, message, payload)
+
+    def _emit(self, level: int, message: str, payload: Dict[str, Any]):
+        if not self.is_enabled_for(level):
+            return
+        if payload:
+            message = message + ": " + ", ".join(f"{key}=%s" for key in payload)
+        args = tuple(Preview(value) for value in payload.values())
+        fn, lno, func, sinfo = self.logger.findCaller(stacklevel=3)
+        record = self.logger.makeRecord(
+            self.logger.name, level, fn, lno, message, args, None, func, {"payload": payload}, sinfo
+        )
+        # handle() skips the logger level check, so a request override can lower it
+        self.logger.handle(record)
+
+
+def get_payload_logger(name: str) -> PayloadLogger:
+    """Get a PayloadLogger for the named logger"""
+    return PayloadLogger(logging.getLogger(name))
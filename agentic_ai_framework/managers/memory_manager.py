@@ -2,19 +2,45 @@
 managers/memory_manager.py - Enhanced Database Management with Recurring Tasks
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, JSON, func
+from sqlalchemy import (
+    create_engine, event, Column, Integer, String, Text, DateTime, Boolean, JSON, Index, UniqueConstraint,
+    func, and_, or_, inspect, text
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
+import asyncio
+import contextvars
+import functools
 import json
 import logging
+import os
+import socket
+import threading
 from croniter import croniter
 
+from managers.definition_cache import DefinitionCache
+
 logger = logging.getLogger(__name__)
 
 Base = declarative_base()
 
+# SQLite engine settings used when not overridden by configuration
+DEFAULT_DATABASE_OPTIONS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout_ms": 5000,
+    "cache_size_kb": 65536,
+    "mmap_size": 268435456,
+    "pool_size": 10,
+    "max_overflow": 10,
+    "pool_timeout": 30
+}
+
 class Agent(Base):
     """SQLAlchemy model for agents"""
     __tablename__ = "agents"
@@ -57,6 +83,8 @@ class Workflow(Base):
     enabled = Column(Boolean, default=True)
     input_schema = Column(JSON, default=None)
     output_spec = Column(JSON, default=None)
+    execution_mode = Column(String, default="sequential")
+    max_concurrency = Column(Integer, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -70,6 +98,11 @@ class MemoryEntry(Base):
     content = Column(Text, nullable=False)
     entry_metadata = Column(JSON, default={})  # Fixed: renamed from 'metadata'
     timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    
+    # Serves the per-agent newest-first reads and trimming
+    __table_args__ = (
+        Index("ix_memory_entries_agent_name_timestamp", "agent_name", "timestamp"),
+    )
 
 class ScheduledTask(Base):
     """SQLAlchemy model for scheduled tasks with recurring support"""
@@ -111,26 +144,202 @@ class TaskExecution(Base):
     duration_seconds = Column(Integer, nullable=True)
     execution_metadata = Column(JSON, default={})
 
+class WorkflowExecution(Base):
+    """SQLAlchemy model for resumable workflow executions"""
+    __tablename__ = "workflow_executions"
+    
+    id = Column(String, primary_key=True)
+    workflow_name = Column(String, index=True, nullable=False)
+    workflow_version = Column(String, nullable=True)  # workflow updated_at when the run started
+    status = Column(String, default="running")  # running, completed, failed, interrupted
+    context = Column(JSON, default={})
+    agent_name = Column(String, nullable=True)
+    execution_mode = Column(String, nullable=True)
+    max_concurrency = Column(Integer, nullable=True)
+    error_message = Column(Text, nullable=True)
+    owner = Column(String, nullable=True)  # "host:pid" of the process running the execution
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class WorkflowStepCheckpoint(Base):
+    """SQLAlchemy model for the stored output of a completed workflow step"""
+    __tablename__ = "workflow_step_checkpoints"
+    __table_args__ = (UniqueConstraint("execution_id", "step_index"),)
+    
+    id = Column(Integer, primary_key=True, index=True)
+    execution_id = Column(String, index=True, nullable=False)
+    step_index = Column(Integer, nullable=False)
+    step_type = Column(String, nullable=False)
+    step_name = Column(String, nullable=False)
+    context_key = Column(String, nullable=True)
+    result = Column(JSON, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class FeedState(Base):
+    """SQLAlchemy model for the last full fetch of an RSS/Atom feed, used for conditional requests"""
+    __tablename__ = "feed_states"
+    
+    feed_url = Column(String, primary_key=True)
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
+    feed_info = Column(JSON, default={})
+    items = Column(JSON, default=[])
+    fetched_at = Column(DateTime, default=datetime.utcnow)
+
+class FeedSeenItem(Base):
+    """SQLAlchemy model for the hash of a feed item already returned in "new items only" mode"""
+    __tablename__ = "feed_seen_items"
+    __table_args__ = (
+        UniqueConstraint("feed_url", "scope", "item_hash"),
+        Index("ix_feed_seen_items_feed_url_scope_id", "feed_url", "scope", "id"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    feed_url = Column(String, nullable=False)
+    scope = Column(String, nullable=False, default="")  # Separates consumers of the same feed
+    item_hash = Column(String(16), nullable=False)
+    first_seen = Column(DateTime, default=datetime.utcnow)
+    last_seen = Column(DateTime, default=datetime.utcnow)  # Last fetch that still had the item in the feed
+
+def _process_owner() -> str:
+    """Identify the current process as "host:pid" for workflow execution ownership"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+def _process_alive(pid: int) -> bool:
+    """Check whether a process with the given ID exists on this host"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
 class MemoryManager:
     """Enhanced memory manager with recurring task support"""
     
-    def __init__(self, database_path: str):
+    def __init__(
+        self,
+        database_path: str,
+        database_options: Optional[Dict[str, Any]] = None,
+        write_batch_size: int = 0,
+        write_flush_interval: float = 0.5,
+        definition_cache_ttl: float = 0
+    ):
         """
         Initialize memory manager
         
         Args:
             database_path: Path to SQLite database file
+            database_options: SQLite pragma and connection pool settings
+                (see DEFAULT_DATABASE_OPTIONS; a None pragma value leaves the SQLite default)
+            write_batch_size: Buffer up to this many memory entries and write them in a
+                single transaction (0 writes every entry directly)
+            write_flush_interval: Maximum seconds a buffered memory entry waits to be written
+            definition_cache_ttl: Seconds agent, tool and workflow definitions are served
+                from memory before being read again (0 disables the cache)
         """
         self.database_path = database_path
-        self.engine = create_engine(f"sqlite:///{database_path}")
+        self.database_options = {**DEFAULT_DATABASE_OPTIONS, **(database_options or {})}
+        self.engine = self._create_engine()
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        # Threads for AsyncMemoryManager calls, one per pooled connection
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.database_options["pool_size"] + self.database_options["max_overflow"],
+            thread_name_prefix="memory-db"
+        )
+        
+        # Write-behind buffer for memory entries
+        self.write_batch_size = write_batch_size
+        self.write_flush_interval = write_flush_interval
+        self._pending_entries: List[Dict[str, Any]] = []
+        self._pending_lock = threading.Lock()
+        # Held while writing a batch so batches reach the database in buffering order
+        self._flush_lock = threading.Lock()
+        self._flush_wakeup = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._closing = False
+        
+        self.definition_cache = DefinitionCache(definition_cache_ttl)
         logger.info(f"Initialized enhanced memory manager with recurring tasks: {database_path}")
     
+    def _create_engine(self):
+        """Create the SQLite engine with a connection pool and per-connection pragmas"""
+        options = self.database_options
+        engine = create_engine(
+            f"sqlite:///{self.database_path}",
+            poolclass=QueuePool,
+            pool_size=options["pool_size"],
+            max_overflow=options["max_overflow"],
+            pool_timeout=options["pool_timeout"],
+            connect_args={
+                # Sessions may be used from worker threads
+                "check_same_thread": False,
+                "timeout": (options["busy_timeout_ms"] or 0) / 1000
+            }
+        )
+        
+        pragmas = []
+        if options.get("journal_mode"):
+            pragmas.append(f"PRAGMA journal_mode={options['journal_mode']}")
+        if options.get("synchronous"):
+            pragmas.append(f"PRAGMA synchronous={options['synchronous']}")
+        if options.get("busy_timeout_ms") is not None:
+            pragmas.append(f"PRAGMA busy_timeout={int(options['busy_timeout_ms'])}")
+        if options.get("cache_size_kb"):
+            # Negative cache_size is a size in KiB rather than pages
+            pragmas.append(f"PRAGMA cache_size=-{int(options['cache_size_kb'])}")
+        if options.get("mmap_size") is not None:
+            pragmas.append(f"PRAGMA mmap_size={int(options['mmap_size'])}")
+        
+        @event.listens_for(engine, "connect")
+        def apply_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for pragma in pragmas:
+                    cursor.execute(pragma)
+            finally:
+                cursor.close()
+        
+        return engine
+    
     def initialize_database(self):
         """Create all database tables"""
         Base.metadata.create_all(bind=self.engine)
+        self._upgrade_schema()
         logger.info("Database tables created successfully with recurring task support")
     
+    def _upgrade_schema(self):
+        """Add columns and indexes introduced after a database was first created"""
+        inspector = inspect(self.engine)
+        with self.engine.begin() as connection:
+            for table in Base.metadata.sorted_tables:
+                existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name not in existing_columns:
+                        column_type = column.type.compile(dialect=self.engine.dialect)
+                        connection.execute(text(
+                            f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"
+                        ))
+                        logger.info(f"Added column {table.name}.{column.name}")
+                
+                existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+                for index in table.indexes:
+                    if index.name not in existing_indexes:
+                        index.create(connection)
+                        logger.info(f"Added index {index.name} on {table.name}")
+    
+    def close(self):
+        """Write buffered memory entries, stop the database threads and close all pooled database connections"""
+        self._closing = True
+        if self._flush_thread:
+            self._flush_wakeup.set()
+            self._flush_thread.join()
+        self.flush_memory_entries()
+        self.executor.shutdown(wait=True)
+        self.engine.dispose()
+        logger.info("Closed database connections")
+    
     def get_session(self) -> Session:
         """Get a database session"""
         return self.SessionLocal()
@@ -162,11 +371,15 @@ class MemoryManager:
             session.add(agent)
             session.commit()
             session.refresh(agent)
+            self.definition_cache.invalidate("agent")
             logger.info(f"Registered agent: {name}")
             return agent.id
     
     def get_agent(self, name: str) -> Optional[Dict[str, Any]]:
         """Get agent by name"""
+        return self.definition_cache.get("agent", name, lambda: self._load_agent(name))
+    
+    def _load_agent(self, name: str) -> Optional[Dict[str, Any]]:
         with self.get_session() as session:
             agent = session.query(Agent).filter(Agent.name == name).first()
             if agent:
@@ -243,10 +456,12 @@ class MemoryManager:
             
             agent.updated_at = datetime.utcnow()
             session.commit()
+            self.definition_cache.invalidate("agent")
             logger.info(f"Updated agent: {name}")
     
     def delete_agent(self, name: str):
         """Delete an agent and its memory"""
+        self._flush_agent_entries(name)
         with self.get_session() as session:
             agent = session.query(Agent).filter(Agent.name == name).first()
             if not agent:
@@ -256,6 +471,7 @@ class MemoryManager:
             session.query(MemoryEntry).filter(MemoryEntry.agent_name == name).delete()
             session.delete(agent)
             session.commit()
+            self.definition_cache.invalidate("agent")
             logger.info(f"Deleted agent and memory: {name}")
     
     # Tool Management Methods (unchanged)
@@ -287,11 +503,15 @@ class MemoryManager:
             session.add(tool)
             session.commit()
             session.refresh(tool)
+            self.definition_cache.invalidate("tool", "tool_configuration", "tool_availability")
             logger.info(f"Registered tool: {name}")
             return tool.id
     
     def get_tool(self, name: str) -> Optional[Dict[str, Any]]:
         """Get tool by name"""
+        return self.definition_cache.get("tool", name, lambda: self._load_tool(name))
+    
+    def _load_tool(self, name: str) -> Optional[Dict[str, Any]]:
         with self.get_session() as session:
             tool = session.query(Tool).filter(Tool.name == name).first()
             if tool:
@@ -327,6 +547,14 @@ class MemoryManager:
                 for tool in tools
             ]
     
+    def get_tool_availability(self) -> Dict[str, bool]:
+        """Map every registered tool name to whether the tool is enabled"""
+        return self.definition_cache.get("tool_availability", "", self._load_tool_availability)
+    
+    def _load_tool_availability(self) -> Dict[str, bool]:
+        with self.get_session() as session:
+            return {name: enabled for name, enabled in session.query(Tool.name, Tool.enabled)}
+    
     def update_tool(self, name: str, updates: Dict[str, Any]):
         """Update a tool"""
         with self.get_session() as session:
@@ -340,6 +568,7 @@ class MemoryManager:
             
             tool.updated_at = datetime.utcnow()
             session.commit()
+            self.definition_cache.invalidate("tool", "tool_configuration", "tool_availability")
             logger.info(f"Updated tool: {name}")
     
     def delete_tool(self, name: str):
@@ -350,6 +579,7 @@ class MemoryManager:
                 raise ValueError(f"Tool {name} not found")
             session.delete(tool)
             session.commit()
+            self.definition_cache.invalidate("tool", "tool_configuration", "tool_availability")
             logger.info(f"Deleted tool: {name}")
     
     def set_tool_configuration(self, tool_name: str, configuration: Dict[str, Any]):
@@ -362,10 +592,16 @@ class MemoryManager:
             tool.configuration = configuration
             tool.updated_at = datetime.utcnow()
             session.commit()
+            self.definition_cache.invalidate("tool", "tool_configuration", "tool_availability")
             logger.info(f"Updated configuration for tool: {tool_name}")
     
     def get_tool_configuration(self, tool_name: str) -> Optional[Dict[str, Any]]:
         """Get configuration for a specific tool"""
+        return self.definition_cache.get(
+            "tool_configuration", tool_name, lambda: self._load_tool_configuration(tool_name)
+        )
+    
+    def _load_tool_configuration(self, tool_name: str) -> Optional[Dict[str, Any]]:
         with self.get_session() as session:
             tool = session.query(Tool).filter(Tool.name == tool_name).first()
             if tool:
@@ -380,7 +616,9 @@ class MemoryManager:
         steps: List[Dict[str, Any]],
         enabled: bool = True,
         input_schema: Dict[str, Any] = None,
-        output_spec: Dict[str, Any] = None
+        output_spec: Dict[str, Any] = None,
+        execution_mode: str = "sequential",
+        max_concurrency: Optional[int] = None
     ) -> int:
         """Register a new workflow"""
         with self.get_session() as session:
@@ -390,16 +628,22 @@ class MemoryManager:
                 steps=steps,
                 enabled=enabled,
                 input_schema=input_schema,
-                output_spec=output_spec
+                output_spec=output_spec,
+                execution_mode=execution_mode,
+                max_concurrency=max_concurrency
             )
             session.add(workflow)
             session.commit()
             session.refresh(workflow)
+            self.definition_cache.invalidate("workflow")
             logger.info(f"Registered workflow: {name}")
             return workflow.id
     
     def get_workflow(self, name: str) -> Optional[Dict[str, Any]]:
         """Get workflow by name"""
+        return self.definition_cache.get("workflow", name, lambda: self._load_workflow(name))
+    
+    def _load_workflow(self, name: str) -> Optional[Dict[str, Any]]:
         with self.get_session() as session:
             workflow = session.query(Workflow).filter(Workflow.name == name).first()
             if workflow:
@@ -411,6 +655,8 @@ class MemoryManager:
                     "enabled": workflow.enabled,
                     "input_schema": workflow.input_schema,
                     "output_spec": workflow.output_spec,
+                    "execution_mode": workflow.execution_mode or "sequential",
+                    "max_concurrency": workflow.max_concurrency,
                     "created_at": workflow.created_at,
                     "updated_at": workflow.updated_at
                 }
@@ -429,6 +675,8 @@ class MemoryManager:
                     "enabled": workflow.enabled,
                     "input_schema": workflow.input_schema,
                     "output_spec": workflow.output_spec,
+                    "execution_mode": workflow.execution_mode or "sequential",
+                    "max_concurrency": workflow.max_concurrency,
                     "created_at": workflow.created_at,
                     "updated_at": workflow.updated_at
                 }
@@ -448,6 +696,7 @@ class MemoryManager:
         
             workflow.updated_at = datetime.utcnow()
             session.commit()
+            self.definition_cache.invalidate("workflow")
             logger.info(f"Updated workflow: {name}")
     
     def delete_workflow(self, name: str):
@@ -457,9 +706,332 @@ class MemoryManager:
             if not workflow:
                 raise ValueError(f"Workflow {name} not found")
             session.delete(workflow)
+            execution_ids = session.query(WorkflowExecution.id).filter(WorkflowExecution.workflow_name == name)
+            session.query(WorkflowStepCheckpoint).filter(
+                WorkflowStepCheckpoint.execution_id.in_(execution_ids.scalar_subquery())
+            ).delete(synchronize_session=False)
+            session.query(WorkflowExecution).filter(
+                WorkflowExecution.workflow_name == name
+            ).delete(synchronize_session=False)
             session.commit()
+            self.definition_cache.invalidate("workflow")
             logger.info(f"Deleted workflow: {name}")
     
+    # Workflow Execution Checkpoint Methods
+    def create_workflow_execution(
+        self,
+        execution_id: str,
+        workflow_name: str,
+        workflow_version: Optional[str],
+        context: Dict[str, Any],
+        agent_name: Optional[str] = None,
+        execution_mode: Optional[str] = None,
+        max_concurrency: Optional[int] = None
+    ) -> str:
+        """Record the start of a workflow execution"""
+        with self.get_session() as session:
+            execution = WorkflowExecution(
+                id=execution_id,
+                workflow_name=workflow_name,
+                workflow_version=workflow_version,
+                status="running",
+                context=self._to_json_value(context),
+                agent_name=agent_name,
+                execution_mode=execution_mode,
+                max_concurrency=max_concurrency,
+                owner=_process_owner()
+            )
+            session.add(execution)
+            session.commit()
+            return execution_id
+    
+    def get_workflow_execution(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """Get a workflow execution with the step indexes that have checkpoints"""
+        with self.get_session() as session:
+            execution = session.query(WorkflowExecution).filter(WorkflowExecution.id == execution_id).first()
+            if not execution:
+                return None
+            completed_steps = [
+                step_index for (step_index,) in
+                session.query(WorkflowStepCheckpoint.step_index)
+                .filter(WorkflowStepCheckpoint.execution_id == execution_id)
+                .order_by(WorkflowStepCheckpoint.step_index)
+            ]
+            return {
+                "id": execution.id,
+                "workflow_name": execution.workflow_name,
+                "workflow_version": execution.workflow_version,
+                "status": execution.status,
+                "context": execution.context or {},
+                "agent_name": execution.agent_name,
+                "execution_mode": execution.execution_mode,
+                "max_concurrency": execution.max_concurrency,
+                "error_message": execution.error_message,
+                "completed_steps": completed_steps,
+                "created_at": execution.created_at,
+                "updated_at": execution.updated_at
+            }
+    
+    def update_workflow_execution_status(
+        self, execution_id: str, status: str, error_message: Optional[str] = None
+    ):
+        """Update a workflow execution's status, deleting its checkpoints once it completes"""
+        with self.get_session() as session:
+            execution = session.query(WorkflowExecution).filter(WorkflowExecution.id == execution_id).first()
+            if not execution:
+                raise ValueError(f"Workflow execution {execution_id} not found")
+            
+            execution.status = status
+            execution.error_message = error_message
+            if status == "running":
+                execution.owner = _process_owner()  # A resumed run belongs to the resuming process
+            if status == "completed":
+                session.query(WorkflowStepCheckpoint).filter(
+                    WorkflowStepCheckpoint.execution_id == execution_id
+                ).delete(synchronize_session=False)
+            session.commit()
+    
+    def mark_interrupted_workflow_executions(self) -> int:
+        """
+        Mark executions left running by a previous process as interrupted so they can be resumed
+        
+        Only executions started on this host by this process or by a process
+        that no longer exists are marked, so executions of other live workers
+        sharing the database keep running.
+        """
+        host, pid = _process_owner().rsplit(":", 1)
+        with self.get_session() as session:
+            running = session.query(WorkflowExecution.id, WorkflowExecution.owner).filter(
+                WorkflowExecution.status == "running"
+            ).all()
+            
+            interrupted = []
+            for execution_id, owner in running:
+                owner_host, _, owner_pid = (owner or "").rpartition(":")
+                if owner is None or (owner_host == host and (
+                    owner_pid == pid or not owner_pid.isdigit() or not _process_alive(int(owner_pid))
+                )):
+                    interrupted.append(execution_id)
+            
+            count = 0
+            if interrupted:
+                count = session.query(WorkflowExecution).filter(
+                    WorkflowExecution.id.in_(interrupted),
+                    WorkflowExecution.status == "running"
+                ).update({"status": "interrupted"}, synchronize_session=False)
+                session.commit()
+            if count:
+                logger.info(f"Marked {count} workflow executions as interrupted")
+            return count
+    
+    def cleanup_workflow_executions(self, days_to_keep: int = 7) -> int:
+        """
+        Remove finished workflow executions and their checkpoints
+        
+        Completed, failed and interrupted executions not updated for
+        days_to_keep days are deleted; running executions are kept.
+        
+        Returns:
+            Number of deleted executions
+        """
+        cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
+        with self.get_session() as session:
+            expired_ids = [
+                execution_id for (execution_id,) in
+                session.query(WorkflowExecution.id).filter(
+                    WorkflowExecution.status != "running",
+                    WorkflowExecution.updated_at < cutoff_date
+                )
+            ]
+            if not expired_ids:
+                return 0
+            
+            session.query(WorkflowStepCheckpoint).filter(
+                WorkflowStepCheckpoint.execution_id.in_(expired_ids)
+            ).delete(synchronize_session=False)
+            deleted_count = session.query(WorkflowExecution).filter(
+                WorkflowExecution.id.in_(expired_ids)
+            ).delete(synchronize_session=False)
+            session.commit()
+            logger.info(f"Cleaned up {deleted_count} workflow executions older than {days_to_keep} days")
+            return deleted_count
+    
+    def save_workflow_checkpoint(
+        self,
+        execution_id: str,
+        step_index: int,
+        step_type: str,
+        step_name: str,
+        context_key: Optional[str],
+        result: Any
+    ):
+        """Store the output of a completed workflow step"""
+        with self.get_session() as session:
+            session.query(WorkflowStepCheckpoint).filter(
+                WorkflowStepCheckpoint.execution_id == execution_id,
+                WorkflowStepCheckpoint.step_index == step_index
+            ).delete(synchronize_session=False)
+            session.add(WorkflowStepCheckpoint(
+                execution_id=execution_id,
+                step_index=step_index,
+                step_type=step_type,
+                step_name=step_name,
+                context_key=context_key,
+                result=self._to_json_value(result)
+            ))
+            session.commit()
+    
+    def get_workflow_checkpoints(self, execution_id: str) -> Dict[int, Dict[str, Any]]:
+        """Get the stored step outputs of a workflow execution, keyed by step index"""
+        with self.get_session() as session:
+            checkpoints = (
+                session.query(WorkflowStepCheckpoint)
+                .filter(WorkflowStepCheckpoint.execution_id == execution_id)
+                .order_by(WorkflowStepCheckpoint.step_index)
+                .all()
+            )
+            return {
+                checkpoint.step_index: {
+                    "type": checkpoint.step_type,
+                    "name": checkpoint.step_name,
+                    "context_key": checkpoint.context_key,
+                    "result": checkpoint.result
+                }
+                for checkpoint in checkpoints
+            }
+    
+    # Feed State Methods
+    def get_feed_state(self, feed_url: str) -> Optional[Dict[str, Any]]:
+        """Get the validators and parsed content stored for a feed"""
+        with self.get_session() as session:
+            state = session.query(FeedState).filter(FeedState.feed_url == feed_url).first()
+            if not state:
+                return None
+            return {
+                "feed_url": state.feed_url,
+                "etag": state.etag,
+                "last_modified": state.last_modified,
+                "feed_info": state.feed_info,
+                "items": state.items,
+                "fetched_at": state.fetched_at.isoformat() if state.fetched_at else None
+            }
+    
+    def save_feed_state(
+        self,
+        feed_url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        feed_info: Dict[str, Any],
+        items: List[Dict[str, Any]]
+    ):
+        """Store a feed's ETag/Last-Modified validators with its parsed content"""
+        state = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "feed_info": self._to_json_value(feed_info),
+            "items": self._to_json_value(items),
+            "fetched_at": datetime.utcnow()
+        }
+        with self.get_session() as session:
+            # An upsert, so concurrent fetches of a new feed do not both insert it
+            session.execute(
+                sqlite_insert(FeedState)
+                .values(feed_url=feed_url, **state)
+                .on_conflict_do_update(index_elements=["feed_url"], set_=state)
+            )
+            session.commit()
+    
+    def get_seen_feed_items(self, feed_url: str, scope: str, item_hashes: List[str]) -> set:
+        """Get which of the given item hashes were already seen for a feed and scope"""
+        if not item_hashes:
+            return set()
+        with self.get_session() as session:
+            rows = (
+                session.query(FeedSeenItem.item_hash)
+                .filter(
+                    FeedSeenItem.feed_url == feed_url,
+                    FeedSeenItem.scope == scope,
+                    FeedSeenItem.item_hash.in_(item_hashes)
+                )
+                .all()
+            )
+            return {row.item_hash for row in rows}
+    
+    def mark_feed_items_seen(
+        self,
+        feed_url: str,
+        scope: str,
+        item_hashes: List[str],
+        present_hashes: Optional[List[str]] = None,
+        max_items: int = 1000,
+        ttl_days: int = 30
+    ) -> int:
+        """
+        Record item hashes as seen and trim the feed's seen-item index
+        
+        Hashes already recorded, such as by a concurrent call, are left as
+        they are. The last_seen time of present_hashes, the items still in
+        the feed, is refreshed, so hashes only expire ttl_days after their
+        item left the feed. All but the max_items most recently seen hashes
+        of the feed and scope are dropped as well.
+        
+        Args:
+            feed_url: URL of the feed
+            scope: Consumer the items were returned to
+            item_hashes: Hashes of the items returned
+            present_hashes: Hashes of all items currently in the feed
+            max_items: Maximum hashes kept for the feed and scope
+            ttl_days: Days a hash is kept after it was last in the feed
+        
+        Returns:
+            Number of trimmed hashes
+        """
+        now = datetime.utcnow()
+        with self.get_session() as session:
+            feed_filter = and_(FeedSeenItem.feed_url == feed_url, FeedSeenItem.scope == scope)
+            if item_hashes:
+                session.execute(
+                    sqlite_insert(FeedSeenItem)
+                    .values([
+                        {"feed_url": feed_url, "scope": scope, "item_hash": item_hash,
+                         "first_seen": now, "last_seen": now}
+                        for item_hash in dict.fromkeys(item_hashes)
+                    ])
+                    .on_conflict_do_nothing(index_elements=["feed_url", "scope", "item_hash"])
+                )
+            if present_hashes:
+                (
+                    session.query(FeedSeenItem)
+                    .filter(feed_filter, FeedSeenItem.item_hash.in_(set(present_hashes)))
+                    .update({FeedSeenItem.last_seen: now}, synchronize_session=False)
+                )
+
+            # Rows from before last_seen was added fall back to first_seen
+            last_seen = func.coalesce(FeedSeenItem.last_seen, FeedSeenItem.first_seen)
+            trimmed = (
+                session.query(FeedSeenItem)
+                .filter(feed_filter, last_seen < now - timedelta(days=ttl_days))
+                .delete(synchronize_session=False)
+            )
+            excess = (
+                session.query(FeedSeenItem.id)
+                .filter(feed_filter)
+                .order_by(last_seen.desc(), FeedSeenItem.id.desc())
+                .offset(max_items)
+                .limit(-1)
+            )
+            trimmed += (
+                session.query(FeedSeenItem)
+                .filter(FeedSeenItem.id.in_(excess.scalar_subquery()))
+                .delete(synchronize_session=False)
+            )
+            session.commit()
+            return trimmed
+    
+    def _to_json_value(self, value: Any) -> Any:
+        """Convert a value to plain JSON types, stringifying anything JSON cannot represent"""
+        return json.loads(json.dumps(value, default=str))
+    
     # Memory Management Methods (unchanged)
     def add_memory_entry(
         self, 
@@ -468,19 +1040,86 @@ class MemoryManager:
         content: str, 
         metadata: Dict[str, Any] = None
     ):
-        """Add a memory entry"""
-        with self.get_session() as session:
-            memory_entry = MemoryEntry(
-                agent_name=agent_name,
-                role=role,
-                content=content,
-                entry_metadata=metadata or {}
-            )
-            session.add(memory_entry)
-            session.commit()
+        """
+        Add a memory entry
+        
+        With a write batch size set, the entry is buffered and written with
+        others in one transaction once the batch fills or the flush interval
+        passes. Reads of the agent's memory write its buffered entries first.
+        """
+        entry = {
+            "agent_name": agent_name,
+            "role": role,
+            "content": content,
+            "entry_metadata": metadata or {},
+            # Stamped now so buffered entries keep the order they were added in
+            "timestamp": datetime.utcnow()
+        }
+        
+        if self.write_batch_size <= 0 or self._closing:
+            with self.get_session() as session:
+                session.add(MemoryEntry(**entry))
+                session.commit()
+            return
+        
+        with self._pending_lock:
+            self._pending_entries.append(entry)
+            batch_full = len(self._pending_entries) >= self.write_batch_size
+            if self._flush_thread is None:
+                self._flush_thread = threading.Thread(
+                    target=self._flush_periodically, name="memory-writer", daemon=True
+                )
+                self._flush_thread.start()
+        
+        if batch_full:
+            self.flush_memory_entries()
+    
+    def flush_memory_entries(self) -> int:
+        """
+        Write all buffered memory entries in a single transaction
+        
+        Returns:
+            Number of entries written
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                entries, self._pending_entries = self._pending_entries, []
+            if not entries:
+                return 0
+            
+            try:
+                with self.get_session() as session:
+                    session.bulk_insert_mappings(MemoryEntry, entries)
+                    session.commit()
+            except Exception:
+                # Put the batch back in front of entries buffered meanwhile; the next flush retries it
+                with self._pending_lock:
+                    self._pending_entries[:0] = entries
+                raise
+            
+            logger.debug(f"Wrote {len(entries)} buffered memory entries")
+            return len(entries)
+    
+    def _flush_agent_entries(self, agent_name: str):
+        """Write buffered entries before reading or changing an agent's memory"""
+        with self._pending_lock:
+            pending = any(entry["agent_name"] == agent_name for entry in self._pending_entries)
+        # A batch being written holds the flush lock until it is committed and may include the agent's entries
+        if pending or self._flush_lock.locked():
+            self.flush_memory_entries()
+    
+    def _flush_periodically(self):
+        """Background thread writing buffered memory entries every flush interval"""
+        while not self._closing:
+            self._flush_wakeup.wait(self.write_flush_interval)
+            try:
+                self.flush_memory_entries()
+            except Exception as e:
+                logger.error(f"Error writing buffered memory entries: {e}")
     
     def get_agent_memory(self, agent_name: str, limit: int = 5) -> List[Dict[str, Any]]:
         """Get agent's memory/conversation history with limit"""
+        self._flush_agent_entries(agent_name)
         with self.get_session() as session:
             memories = (
                 session.query(MemoryEntry)
@@ -504,6 +1143,7 @@ class MemoryManager:
     # Memory cleanup methods (unchanged)
     def clear_agent_memory(self, agent_name: str):
         """Clear all memory entries for a specific agent"""
+        self._flush_agent_entries(agent_name)
         with self.get_session() as session:
             deleted_count = (
                 session.query(MemoryEntry)
@@ -516,6 +1156,7 @@ class MemoryManager:
     
     def clear_all_agent_memory(self):
         """Clear all memory entries for all agents"""
+        self.flush_memory_entries()
         with self.get_session() as session:
             deleted_count = session.query(MemoryEntry).delete()
             session.commit()
@@ -524,33 +1165,54 @@ class MemoryManager:
     
     def cleanup_agent_memory(self, agent_name: str, keep_last: int = 5):
         """Keep only the last N memory entries for an agent"""
+        self._flush_agent_entries(agent_name)
         with self.get_session() as session:
-            # Get all memory entries for the agent, ordered by timestamp desc
-            all_entries = (
-                session.query(MemoryEntry)
+            # Entries past the newest keep_last, walked newest first on the (agent_name, timestamp) index
+            surplus_ids = (
+                session.query(MemoryEntry.id)
                 .filter(MemoryEntry.agent_name == agent_name)
-                .order_by(MemoryEntry.timestamp.desc())
-                .all()
+                .order_by(MemoryEntry.timestamp.desc(), MemoryEntry.id.desc())
+                .offset(keep_last)
             )
             
-            # If we have more entries than we want to keep
-            if len(all_entries) > keep_last:
-                entries_to_delete = all_entries[keep_last:]
-                
-                # Delete the older entries
-                deleted_count = 0
-                for entry in entries_to_delete:
-                    session.delete(entry)
-                    deleted_count += 1
-                
-                session.commit()
-                logger.info(f"Cleaned up {deleted_count} old memory entries for agent {agent_name}, kept last {keep_last}")
-                return deleted_count
+            # Skip the write transaction when there is nothing to trim
+            if surplus_ids.first() is None:
+                return 0
+            
+            deleted_count = (
+                session.query(MemoryEntry)
+                .filter(MemoryEntry.id.in_(surplus_ids.scalar_subquery()))
+                .delete(synchronize_session=False)
+            )
+            session.commit()
+            logger.info(f"Cleaned up {deleted_count} old memory entries for agent {agent_name}, kept last {keep_last}")
+            return deleted_count
+    
+    def cleanup_all_agents_memory(self, keep_last: int = 5):
+        """Keep only the last N memory entries of every agent in a single statement"""
+        self.flush_memory_entries()
+        with self.get_session() as session:
+            ranked = session.query(
+                MemoryEntry.id,
+                func.row_number().over(
+                    partition_by=MemoryEntry.agent_name,
+                    order_by=(MemoryEntry.timestamp.desc(), MemoryEntry.id.desc())
+                ).label("position")
+            ).subquery()
+            surplus_ids = session.query(ranked.c.id).filter(ranked.c.position > keep_last)
             
-            return 0
+            deleted_count = (
+                session.query(MemoryEntry)
+                .filter(MemoryEntry.id.in_(surplus_ids.scalar_subquery()))
+                .delete(synchronize_session=False)
+            )
+            session.commit()
+            logger.info(f"Cleaned up {deleted_count} old memory entries across all agents, kept last {keep_last} each")
+            return deleted_count
     
     def get_memory_stats(self) -> Dict[str, Any]:
         """Get memory usage statistics"""
+        self.flush_memory_entries()
         with self.get_session() as session:
             total_entries = session.query(MemoryEntry).count()
             
@@ -586,6 +1248,7 @@ class MemoryManager:
         """Remove memory entries older than specified days"""
         cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
         
+        self.flush_memory_entries()
         with self.get_session() as session:
             deleted_count = (
                 session.query(MemoryEntry)
@@ -645,37 +1308,39 @@ class MemoryManager:
             logger.info(log_msg)
             return task.id
     
-    def get_pending_scheduled_tasks(self) -> List[Dict[str, Any]]:
-        """Get tasks scheduled for execution (including recurring)"""
+    def _schedulable_task_filter(self):
+        """SQL condition matching enabled tasks that still have executions left"""
+        one_time = and_(
+            ScheduledTask.is_recurring == False,
+            ScheduledTask.status == "pending"
+        )
+        recurring = and_(
+            ScheduledTask.is_recurring == True,
+            ScheduledTask.next_execution.isnot(None),
+            (ScheduledTask.max_executions.is_(None) | 
+             (ScheduledTask.execution_count < ScheduledTask.max_executions)),
+            ScheduledTask.failure_count < ScheduledTask.max_failures
+        )
+        return and_(ScheduledTask.enabled == True, or_(one_time, recurring))
+    
+    def get_pending_scheduled_tasks(self, task_ids: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+        """
+        Get tasks scheduled for execution (including recurring)
+        
+        Args:
+            task_ids: Only consider these task IDs (optional)
+        """
         current_time = datetime.utcnow()
         with self.get_session() as session:
-            # Get one-time pending tasks
-            one_time_tasks = (
-                session.query(ScheduledTask)
-                .filter(
-                    ScheduledTask.scheduled_time <= current_time,
-                    ScheduledTask.status == "pending",
-                    ScheduledTask.is_recurring == False,
-                    ScheduledTask.enabled == True
+            query = session.query(ScheduledTask).filter(
+                self._schedulable_task_filter(),
+                or_(
+                    and_(ScheduledTask.is_recurring == False, ScheduledTask.scheduled_time <= current_time),
+                    and_(ScheduledTask.is_recurring == True, ScheduledTask.next_execution <= current_time)
                 )
-                .all()
             )
-            
-            # Get recurring tasks ready for execution
-            recurring_tasks = (
-                session.query(ScheduledTask)
-                .filter(
-                    ScheduledTask.next_execution <= current_time,
-                    ScheduledTask.is_recurring == True,
-                    ScheduledTask.enabled == True,
-                    (ScheduledTask.max_executions.is_(None) | 
-                     (ScheduledTask.execution_count < ScheduledTask.max_executions)),
-                    ScheduledTask.failure_count < ScheduledTask.max_failures
-                )
-                .all()
-            )
-            
-            all_tasks = one_time_tasks + recurring_tasks
+            if task_ids is not None:
+                query = query.filter(ScheduledTask.id.in_(task_ids))
             
             return [
                 {
@@ -690,9 +1355,34 @@ class MemoryManager:
                     "recurrence_pattern": task.recurrence_pattern,
                     "execution_count": task.execution_count
                 }
-                for task in all_tasks
+                for task in query.all()
             ]
     
+    def get_scheduled_task_due_times(self, task_ids: Optional[List[int]] = None) -> Dict[int, datetime]:
+        """
+        Get the next due time of every schedulable task
+        
+        Args:
+            task_ids: Only consider these task IDs (optional)
+            
+        Returns:
+            Mapping of task ID to next due time; tasks that will not run again are omitted
+        """
+        with self.get_session() as session:
+            query = session.query(
+                ScheduledTask.id,
+                ScheduledTask.is_recurring,
+                ScheduledTask.scheduled_time,
+                ScheduledTask.next_execution
+            ).filter(self._schedulable_task_filter())
+            if task_ids is not None:
+                query = query.filter(ScheduledTask.id.in_(task_ids))
+            
+            return {
+                task_id: next_execution if is_recurring else scheduled_time
+                for task_id, is_recurring, scheduled_time, next_execution in query.all()
+            }
+    
     def get_all_scheduled_tasks(self) -> List[Dict[str, Any]]:
         """Get all scheduled tasks"""
         with self.get_session() as session:
@@ -723,8 +1413,24 @@ class MemoryManager:
                 for task in tasks
             ]
     
-    def update_scheduled_task_status(self, task_id: int, status: str, result: str = None):
-        """Update scheduled task status and handle recurring logic"""
+    def update_scheduled_task_status(
+        self,
+        task_id: int,
+        status: str,
+        result: str = None,
+        duration_seconds: Optional[float] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Update scheduled task status and handle recurring logic
+        
+        Args:
+            task_id: Scheduled task ID
+            status: Execution status (completed or failed)
+            result: Result text or error message
+            duration_seconds: Wall-clock execution time of this run
+            metadata: Extra execution details (e.g. queue wait time)
+        """
         with self.get_session() as session:
             task = session.query(ScheduledTask).filter(ScheduledTask.id == task_id).first()
             if not task:
@@ -739,7 +1445,9 @@ class MemoryManager:
                 execution_time=execution_time,
                 status=status,
                 result=result,
-                error_message=result if status == "failed" else None
+                error_message=result if status == "failed" else None,
+                duration_seconds=int(round(duration_seconds)) if duration_seconds is not None else None,
+                execution_metadata=metadata or {}
             )
             session.add(execution)
             
@@ -854,7 +1562,8 @@ class MemoryManager:
                     "status": execution.status,
                     "result": execution.result,
                     "error_message": execution.error_message,
-                    "duration_seconds": execution.duration_seconds
+                    "duration_seconds": execution.duration_seconds,
+                    "queue_wait_seconds": (execution.execution_metadata or {}).get("queue_wait_seconds")
                 }
                 for execution in executions
             ]
@@ -963,4 +1672,41 @@ class MemoryManager:
         
             session.commit()
             logger.info(f"Updated scheduled task: {task_id}")
-            return task_id
\ No newline at end of file
+            return task_id
+
+
+class AsyncMemoryManager:
+    """
+    Async facade over a MemoryManager
+    
+    Every method of the wrapped manager is available as a coroutine that runs
+    the synchronous call on the manager's database threads, so database round
+    trips overlap with other work on the event loop instead of blocking it.
+    """
+    
+    def __init__(self, memory_manager):
+        """
+        Initialize the facade
+        
+        Args:
+            memory_manager: Memory manager whose methods are offloaded. Without
+                an executor of its own, calls run on the event loop's default executor.
+        """
+        self.memory_manager = memory_manager
+        executor = getattr(memory_manager, "executor", None)
+        self._executor = executor if isinstance(executor, Executor) else None
+    
+    def __getattr__(self, name: str):
+        if name.startswith("_") or not callable(getattr(self.memory_manager, name)):
+            raise AttributeError(f"{type(self).__name__} has no method {name!r}")
+        
+        async def call(*args, **kwargs):
+            # Look the method up per call so the wrapped manager can be patched
+            method = functools.partial(getattr(self.memory_manager, name), *args, **kwargs)
+            context = contextvars.copy_context()
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, context.run, method)
+        
+        call.__name__ = name
+        setattr(self, name, call)
+        return call
@@ -2,6 +2,7 @@
 managers/tool_manager.py - Tool Discovery and Execution
 """
 
+import asyncio
 import os
 import sys
 import importlib
@@ -9,7 +10,14 @@ import inspect
 import logging
 from typing import Dict, Any, Optional, List
 
+from managers.log_utils import get_payload_logger
+from managers.memory_manager import AsyncMemoryManager
+from managers.tool_result_cache import ToolResultCache, make_cache_key
+from tools.http_pool import HttpClientPool
+from tools.mail_pool import MailConnectionPool
+
 logger = logging.getLogger(__name__)
+payload_logger = get_payload_logger(__name__)
 
 class ToolManager:
     """Manages tool discovery, registration, and execution"""
@@ -24,9 +32,16 @@ class ToolManager:
             config: Configuration object for tools that need it
         """
         self.memory_manager = memory_manager
+        self.async_memory = AsyncMemoryManager(memory_manager)
         self.tools_directory = tools_directory
         self.config = config
         self.loaded_tools = {}
+        self.http_pool = HttpClientPool(getattr(config, "tool_http_pool", None))
+        self.mail_pool = MailConnectionPool(getattr(config, "tool_mail_pool", None))
+        self.result_cache = ToolResultCache(
+            max_entries=getattr(config, "tool_result_cache_max_entries", 1000),
+            max_bytes=getattr(config, "tool_result_cache_max_bytes", 16 * 1024 * 1024)
+        )
         
         # List of deprecated tool names that should not be registered
         self.deprecated_tools = {
@@ -120,7 +135,7 @@ class ToolManager:
         
         # Set dependencies if the tool supports it
         if hasattr(tool_instance, 'set_dependencies'):
-            tool_instance.set_dependencies(self.memory_manager, self.config)
+            tool_instance.set_dependencies(self.memory_manager, self.config, self.http_pool, self.mail_pool)
         
         # Store in memory
         self.loaded_tools[tool_instance.name] = tool_instance
@@ -147,6 +162,10 @@ class ToolManager:
         """
         Execute a tool with given parameters
         
+        Results of tools declaring themselves cacheable are served from the
+        result cache while fresh, and identical concurrent calls share one
+        execution.
+        
         Args:
             tool_name: Name of the tool to execute
             parameters: Parameters for tool execution
@@ -171,14 +190,28 @@ class ToolManager:
         tool_instance = self.loaded_tools[tool_name]
         
         # Get tool configuration if agent is specified
-        config = self._get_tool_config(tool_name, agent_name)
+        config = await self._get_tool_config(tool_name, agent_name)
         
         # Validate parameters against schema
         self._validate_parameters(tool_instance.parameters, parameters)
         
-        # Execute the tool
+        if self.result_cache.enabled and tool_instance.is_cacheable(parameters):
+            key = make_cache_key(
+                tool_name, parameters, tool_instance.parameters, tool_instance.cache_key_fields, config
+            )
+            return await self.result_cache.get_or_execute(
+                key, tool_instance.cache_ttl, lambda: self._run_tool(tool_instance, parameters, config),
+                should_store=tool_instance.is_cacheable_result
+            )
+        
+        return await self._run_tool(tool_instance, parameters, config)
+    
+    async def _run_tool(self, tool_instance, parameters: Dict[str, Any], config: Dict[str, Any]) -> Any:
+        """Configure and execute a tool instance"""
+        tool_name = tool_instance.name
         try:
-            logger.info(f"Executing tool {tool_name} with parameters {parameters}")
+            logger.info(f"Executing tool {tool_name}")
+            payload_logger.debug("Tool parameters", parameters=parameters)
             
             # Pass configuration to tool if it supports it
             if hasattr(tool_instance, 'set_config'):
@@ -192,7 +225,7 @@ class ToolManager:
             logger.error(f"Error executing tool {tool_name}: {e}")
             raise
     
-    def _get_tool_config(self, tool_name: str, agent_name: Optional[str] = None) -> Dict[str, Any]:
+    async def _get_tool_config(self, tool_name: str, agent_name: Optional[str] = None) -> Dict[str, Any]:
         """
         Get tool configuration from multiple sources in order of precedence:
         1. Agent-specific configuration (highest priority)
@@ -208,19 +241,25 @@ class ToolManager:
         """
         config = {}
         
+        # Both database lookups run concurrently
+        if agent_name:
+            tool_config, agent = await asyncio.gather(
+                self.async_memory.get_tool_configuration(tool_name),
+                self.async_memory.get_agent(agent_name)
+            )
+        else:
+            tool_config, agent = await self.async_memory.get_tool_configuration(tool_name), None
+        
         # 1. Get tool-level configuration from database
-        tool_config = self.memory_manager.get_tool_configuration(tool_name)
         if tool_config:
             config.update(tool_config)
             logger.debug(f"Retrieved tool-level config for {tool_name}")
         
         # 2. Get agent-specific configuration (overrides tool-level)
-        if agent_name:
-            agent = self.memory_manager.get_agent(agent_name)
-            if agent and agent.get("tool_configs"):
-                agent_tool_config = agent["tool_configs"].get(tool_name, {})
-                config.update(agent_tool_config)
-                logger.debug(f"Retrieved agent-specific config for tool {tool_name} from agent {agent_name}")
+        if agent and agent.get("tool_configs"):
+            agent_tool_config = agent["tool_configs"].get(tool_name, {})
+            config.update(agent_tool_config)
+            logger.debug(f"Retrieved agent-specific config for tool {tool_name} from agent {agent_name}")
         
         # 3. Get tool instance configuration (if tool instance has been configured)
         tool_instance = self.loaded_tools.get(tool_name)
@@ -329,9 +368,16 @@ class ToolManager:
         """
         logger.info("Reloading all tools...")
         self.loaded_tools.clear()
+        self.result_cache.invalidate()
         self.discover_and_register_tools()
         logger.info("Tools reloaded successfully")
     
+    async def close(self):
+        """Close the shared HTTP and mail connection pools"""
+        await self.http_pool.close()
+        await self.mail_pool.close()
+        logger.info("Tool connection pools closed")
+    
     def get_tools_status(self) -> Dict[str, Any]:
         """Get status of all tools"""
         return {
@@ -0,0 +1,201 @@
+"""
+managers/tool_result_cache.py - Result Cache for Idempotent Tools
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(
+    tool_name: str,
+    parameters: Dict[str, Any],
+    schema: Optional[Dict[str, Any]] = None,
+    key_fields: Optional[List[str]] = None,
+    tool_config: Optional[Dict[str, Any]] = None
+) -> Tuple[str, str]:
+    """
+    Build the cache key of a tool call from its normalized parameters
+
+    Schema defaults are filled in, so a call that omits a parameter matches
+    one passing its default. Only key_fields are used when given. The tool
+    configuration is part of the key, so agents with different credentials
+    never share results.
+
+    Args:
+        tool_name: Name of the tool
+        parameters: Call parameters
+        schema: The tool's JSON schema
+        key_fields: Parameters identifying a result (all parameters when None)
+        tool_config: Configuration the tool runs with
+    """
+    properties = (schema or {}).get("properties", {})
+    normalized = {name: spec["default"] for name, spec in properties.items() if "default" in spec}
+    normalized.update({name: value for name, value in parameters.items() if value is not None})
+    if key_fields is not None:
+        normalized = {name: value for name, value in normalized.items() if name in key_fields}
+
+    digest = hashlib.sha256(json.dumps(
+        {"parameters": normalized, "config": tool_config or {}},
+        sort_keys=True, default=str, separators=(",", ":")
+    ).encode()).hexdigest()
+    return tool_name, digest
+
+
+class ToolResultCache:
+    """
+    LRU cache of tool results with per-entry TTL and request coalescing
+
+    The cache is bounded by entry count and by the approximate size of the
+    results (their JSON length); least recently used entries are evicted
+    first and results larger than the whole budget are not cached. Identical
+    calls arriving while one is running wait for it instead of running the
+    tool again. Errors are never cached, nor are results the caller's
+    should_store check rejects. Every caller gets its own copy of the result.
+    """
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 16 * 1024 * 1024):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Maximum cached results (0 disables caching)
+            max_bytes: Maximum total size of cached results
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (expires at, size, result)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, int, Any]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._bytes = 0
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    async def get_or_execute(
+        self,
+        key: Tuple[str, str],
+        ttl: float,
+        execute: Callable[[], Awaitable[Any]],
+        should_store: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        Return the cached result for key, running execute on a miss
+
+        Args:
+            key: Cache key from make_cache_key
+            ttl: Seconds the result stays valid
+            execute: Coroutine function running the tool
+            should_store: Optional check whether a result may be cached, such
+                as rejecting results that report a failure
+        """
+        if not self.enabled or ttl <= 0:
+            return await execute()
+
+        stats = self._tool_stats(key[0])
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                stats["hits"] += 1
+                return copy.deepcopy(entry[2])
+            self._remove(key)
+
+        task = self._inflight.get(key)
+        if task is not None:
+            stats["coalesced"] += 1
+        else:
+            stats["misses"] += 1
+            task = asyncio.ensure_future(execute())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._store(key, ttl, done, should_store))
+
+        # Shielded so a caller giving up (such as on a timeout) does not cancel
+        # the execution other callers are waiting for
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def invalidate(self, tool_name: Optional[str] = None):
+        """Drop cached results of one tool, or of all tools"""
+        for key in [key for key in self._entries if tool_name is None or key[0] == tool_name]:
+            self._remove(key)
+
+    def get_stats(self, tool_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get hit, miss, coalescing and eviction counts
+
+        Args:
+            tool_name: Tool to report on; all tools and the totals when None
+        """
+        if tool_name is not None:
+            return self._describe(tool_name, self._tool_stats(tool_name))
+
+        return {
+            "enabled": self.enabled,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "tools": {name: self._describe(name, stats) for name, stats in self._stats.items()}
+        }
+
+    def _store(
+        self,
+        key: Tuple[str, str],
+        ttl: float,
+        task: asyncio.Task,
+        should_store: Optional[Callable[[Any], bool]] = None
+    ):
+        """Cache the result of a finished execution"""
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        result = task.result()
+        if should_store is not None and not should_store(result):
+            logger.debug(f"Not caching failed result of {key[0]}")
+            return
+        try:
+            size = len(json.dumps(result, default=str))
+        except (TypeError, ValueError):
+            logger.debug(f"Not caching unserializable result of {key[0]}")
+            return
+        if size > self.max_bytes:
+            logger.debug(f"Not caching {size} byte result of {key[0]}")
+            return
+
+        self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, size, result)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            evicted = next(iter(self._entries))
+            self._remove(evicted)
+            self._tool_stats(evicted[0])["evictions"] += 1
+
+    def _remove(self, key: Tuple[str, str]):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def _describe(self, tool_name: str, stats: Dict[str, int]) -> Dict[str, Any]:
+        entries = [entry for key, entry in self._entries.items() if key[0] == tool_name]
+        lookups = stats["hits"] + stats["misses"] + stats["coalesced"]
+        return {
+            **stats,
+            "entries": len(entries),
+            "bytes": sum(entry[1] for entry in entries),
+            "hit_rate": round((stats["hits"] + stats["coalesced"]) / lookups, 3) if lookups else None
+        }
+
+    def _tool_stats(self, tool_name: str) -> Dict[str, int]:
+        if tool_name not in self._stats:
+            self._stats[tool_name] = {"hits": 0, "misses": 0, "coalesced": 0, "evictions": 0}
+        return self._stats[tool_name]
@@ -2,38 +2,67 @@
 managers/workflow_manager.py - Debug Version with Enhanced Logging
 """
 
+import asyncio
 import re
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import uuid
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from managers.log_utils import get_payload_logger
+from managers.memory_manager import AsyncMemoryManager
+from managers.workflow_templates import CompiledStep, compile_template
 
 logger = logging.getLogger(__name__)
+payload_logger = get_payload_logger(__name__)
 
 class WorkflowManager:
     """Debug workflow manager with enhanced logging"""
     
-    def __init__(self, agent_manager, tool_manager, memory_manager):
+    EXECUTION_MODES = ("sequential", "dag")
+    
+    def __init__(self, agent_manager, tool_manager, memory_manager, config=None):
         self.agent_manager = agent_manager
         self.tool_manager = tool_manager
         self.memory_manager = memory_manager
+        self.async_memory = AsyncMemoryManager(memory_manager)
+        self.default_max_concurrency = getattr(config, "workflow_max_concurrency", 4)
+        # workflow name -> (version, compiled steps)
+        self._compiled_workflows: Dict[str, Tuple[Any, List[CompiledStep]]] = {}
         logger.info("Initialized debug workflow manager")
     
     async def execute_workflow(
         self, 
         workflow_name: str, 
         context: Dict[str, Any] = {},
-        agent_name: Optional[str] = None
+        agent_name: Optional[str] = None,
+        execution_mode: Optional[str] = None,
+        max_concurrency: Optional[int] = None
     ) -> Dict[str, Any]:
-        """Execute workflow with input schema support"""
+        """
+        Execute workflow with input schema support
+        
+        Args:
+            workflow_name: Name of the workflow to run
+            context: Initial workflow context
+            agent_name: Agent whose tool configuration applies to tool steps
+            execution_mode: Override the workflow's mode ("sequential" or "dag")
+            max_concurrency: Override the maximum number of concurrent steps in DAG mode
+        """
     
-        workflow = self.memory_manager.get_workflow(workflow_name)
+        workflow = await self.async_memory.get_workflow(workflow_name)
         if not workflow:
             raise ValueError(f"Workflow {workflow_name} not found")
 
         if not workflow.get("enabled", True):
             raise ValueError(f"Workflow {workflow_name} is disabled")
 
-        logger.info(f"Starting workflow {workflow_name} with initial context: {context}")
+        execution_mode = execution_mode or workflow.get("execution_mode") or "sequential"
+        if execution_mode not in self.EXECUTION_MODES:
+            raise ValueError(f"Invalid execution mode '{execution_mode}'. Must be one of: {list(self.EXECUTION_MODES)}")
+
+        logger.info(f"Starting workflow {workflow_name}")
+        payload_logger.debug("Initial workflow context", context=context)
         if agent_name:
             logger.info(f"Workflow execution associated with agent: {agent_name}")
     
@@ -45,66 +74,97 @@ class WorkflowManager:
                 raise ValueError(f"Input validation failed: {validation_error}")
             logger.info("Input validation passed")
     
-        results = []
+        execution_id = uuid.uuid4().hex
+        await self.async_memory.create_workflow_execution(
+            execution_id, workflow_name, self._workflow_version(workflow), context,
+            agent_name, execution_mode, max_concurrency
+        )
+        logger.info(f"Workflow {workflow_name} execution id: {execution_id}")
+        
+        return await self._run_workflow(
+            workflow, context, agent_name, execution_mode, max_concurrency, execution_id, {}
+        )
+    
+    async def resume_workflow(self, workflow_name: str, execution_id: str) -> Dict[str, Any]:
+        """
+        Resume a failed or interrupted workflow execution
+        
+        Steps whose output was checkpointed are not run again: their stored
+        results are restored into the context and execution continues with
+        the remaining steps.
+        
+        Args:
+            workflow_name: Name of the workflow the execution belongs to
+            execution_id: Id of the execution to resume
+        """
+        execution = await self.async_memory.get_workflow_execution(execution_id)
+        if not execution or execution["workflow_name"] != workflow_name:
+            raise ValueError(f"Execution {execution_id} of workflow {workflow_name} not found")
+        if execution["status"] not in ("failed", "interrupted"):
+            raise ValueError(
+                f"Execution {execution_id} is {execution['status']}; only failed or interrupted executions can be resumed"
+            )
+        
+        workflow = await self.async_memory.get_workflow(workflow_name)
+        if not workflow:
+            raise ValueError(f"Workflow {workflow_name} not found")
+        if not workflow.get("enabled", True):
+            raise ValueError(f"Workflow {workflow_name} is disabled")
+        if execution["workflow_version"] != self._workflow_version(workflow):
+            raise ValueError(f"Workflow {workflow_name} changed since execution {execution_id} started; it cannot be resumed")
+        
+        checkpoints = await self.async_memory.get_workflow_checkpoints(execution_id)
+        logger.info(f"Resuming workflow {workflow_name} execution {execution_id} "
+                   f"with {len(checkpoints)} completed steps")
+        await self.async_memory.update_workflow_execution_status(execution_id, "running")
+        
+        return await self._run_workflow(
+            workflow, execution["context"], execution["agent_name"],
+            execution["execution_mode"] or "sequential", execution["max_concurrency"],
+            execution_id, checkpoints
+        )
+    
+    def _workflow_version(self, workflow: Dict[str, Any]) -> Optional[str]:
+        """Version stamp used to check that a resumed execution runs the same workflow definition"""
+        updated_at = workflow.get("updated_at")
+        return str(updated_at) if updated_at is not None else None
+    
+    async def _run_workflow(
+        self,
+        workflow: Dict[str, Any],
+        context: Dict[str, Any],
+        agent_name: Optional[str],
+        execution_mode: str,
+        max_concurrency: Optional[int],
+        execution_id: str,
+        checkpoints: Dict[int, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Run a workflow's steps, checkpointing each result, and build the workflow result"""
+        workflow_name = workflow["name"]
         workflow_context = context.copy()
-        previous_step_result = None  # NEW: Track previous step result
+        compiled_steps = self._get_compiled_steps(workflow)
+        
+        for i in sorted(checkpoints):
+            self._store_step_result(checkpoints[i], checkpoints[i]["result"], workflow_context)
     
-        for i, step in enumerate(workflow["steps"]):
-            try:
-                logger.info(f"=== STEP {i+1}/{len(workflow['steps'])} ===")
-                logger.info(f"Step definition: {step}")
-                logger.info(f"Current context keys: {list(workflow_context.keys())}")
-            
-                # NEW: Handle input source for this step
-                step_input_context = self._prepare_step_input(
-                    step, workflow_context, previous_step_result, i
+        try:
+            if execution_mode == "dag":
+                concurrency = max_concurrency or workflow.get("max_concurrency") or self.default_max_concurrency
+                results = await self._execute_steps_dag(
+                    workflow_name, compiled_steps, workflow_context, agent_name, concurrency,
+                    execution_id, checkpoints
                 )
-            
-                # Resolve variables in step parameters
-                resolved_step = self._resolve_variables(step, step_input_context)
-                logger.info(f"Resolved step: {resolved_step}")
-            
-                if resolved_step["type"] == "agent":
-                    result = await self._execute_agent_step(resolved_step, step_input_context)
-                    # Try to parse JSON from agent response
-                    result = self._parse_agent_result(result)
-                
-                elif resolved_step["type"] == "tool":
-                    result = await self._execute_tool_step(resolved_step, step_input_context, agent_name)
-                    logger.info(f"Tool result type: {type(result)}")
-                    logger.info(f"Tool result: {result}")
-                else:
-                    raise ValueError(f"Unknown step type: {resolved_step['type']}")
-            
-                # Store result in context if context_key is specified
-                if resolved_step.get("context_key"):
-                    context_key = resolved_step["context_key"]
-                    workflow_context[context_key] = result
-                    logger.info(f"Stored result in context key '{context_key}'")
-            
-                # Update previous step result
-                previous_step_result = result
-            
-                results.append({
-                    "step": i + 1,
-                    "type": resolved_step["type"],
-                    "name": resolved_step["name"],
-                    "result": result,
-                    "context_key": resolved_step.get("context_key")
-                })
-            
-                logger.info(f"Step {i+1} completed successfully")
-            
-            except Exception as e:
-                error_msg = f"Error in workflow step {i+1}: {e}"
-                logger.error(error_msg)
-                results.append({
-                    "step": i + 1,
-                    "type": step["type"],
-                    "name": step["name"],
-                    "error": str(e)
-                })
-                raise Exception(f"Workflow {workflow_name} failed at step {i+1}: {e}")
+            else:
+                results = await self._execute_steps_sequential(
+                    workflow_name, compiled_steps, workflow_context, agent_name,
+                    execution_id, checkpoints
+                )
+        except BaseException as e:
+            status = "failed" if isinstance(e, Exception) else "interrupted"
+            await self.async_memory.update_workflow_execution_status(execution_id, status, str(e))
+            raise
+        
+        await self.async_memory.update_workflow_execution_status(execution_id, "completed")
     
         # --- Output filtering logic ---
         output_spec = workflow.get("output_spec")
@@ -113,20 +173,439 @@ class WorkflowManager:
             extracted_data = self._extract_output_data(workflow_context, output_spec.get("extractions", []))
             return {
                 "workflow_name": workflow_name,
+                "execution_id": execution_id,
                 "status": "completed",
                 "steps_executed": len(results),
+                "steps_resumed": len(checkpoints),
                 "output": extracted_data,
                 "message": f"Extracted {len(extracted_data)} values"
             }
         # ---
         return {
             "workflow_name": workflow_name,
+            "execution_id": execution_id,
             "status": "completed",
             "steps_executed": len(results),
+            "steps_resumed": len(checkpoints),
             "results": results,
             "final_context": workflow_context
         }
     
+    def _get_compiled_steps(self, workflow: Dict[str, Any]) -> List[CompiledStep]:
+        """
+        Get the compiled steps of a workflow, compiling them once per workflow version
+        
+        The version is the stored workflow's id and updated_at, so updating or
+        recreating a workflow recompiles it. Definitions without an updated_at
+        are compiled on every call.
+        """
+        version = (workflow.get("id"), workflow.get("updated_at"))
+        cached = self._compiled_workflows.get(workflow["name"])
+        if cached and cached[0] == version:
+            return cached[1]
+        
+        compiled_steps = [CompiledStep(step) for step in workflow["steps"]]
+        if workflow.get("updated_at") is not None:
+            self._compiled_workflows[workflow["name"]] = (version, compiled_steps)
+            logger.info(f"Compiled {len(compiled_steps)} steps for workflow {workflow['name']}")
+        return compiled_steps
+    
+    async def _execute_steps_sequential(
+        self,
+        workflow_name: str,
+        steps: List[CompiledStep],
+        workflow_context: Dict[str, Any],
+        agent_name: Optional[str],
+        execution_id: str,
+        checkpoints: Dict[int, Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Execute workflow steps one after another, skipping checkpointed steps"""
+        results = []
+        previous_step_result = None  # NEW: Track previous step result
+    
+        for i, step in enumerate(steps):
+            if i in checkpoints:
+                previous_step_result = checkpoints[i]["result"]
+                results.append(self._checkpoint_result_entry(i, checkpoints[i]))
+                continue
+            
+            try:
+                resolved_step, result = await self._execute_step(
+                    step, i, len(steps), workflow_context, previous_step_result, agent_name
+                )
+            except Exception as e:
+                results.append(self._step_error_entry(i, step.step, e))
+                raise Exception(f"Workflow {workflow_name} failed at step {i+1} (execution {execution_id}): {e}")
+            
+            self._store_step_result(resolved_step, result, workflow_context)
+            await self._save_checkpoint(execution_id, i, resolved_step, result)
+            previous_step_result = result
+            results.append(self._step_result_entry(i, resolved_step, result))
+        
+        return results
+    
+    async def _execute_steps_dag(
+        self,
+        workflow_name: str,
+        steps: List[CompiledStep],
+        workflow_context: Dict[str, Any],
+        agent_name: Optional[str],
+        max_concurrency: int,
+        execution_id: str,
+        checkpoints: Dict[int, Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Execute workflow steps as a dependency graph, running independent steps concurrently"""
+        dependencies = self._build_step_dependencies([step.step for step in steps])
+        logger.info(f"Workflow {workflow_name} DAG dependencies: "
+                   f"{ {i + 1: sorted(d + 1 for d in deps) for i, deps in enumerate(dependencies)} } "
+                   f"(max concurrency {max_concurrency})")
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        step_results: Dict[int, Any] = {i: checkpoint["result"] for i, checkpoint in checkpoints.items()}
+        results: Dict[int, Dict[str, Any]] = {
+            i: self._checkpoint_result_entry(i, checkpoint) for i, checkpoint in checkpoints.items()
+        }
+        remaining = set(range(len(steps))) - checkpoints.keys()
+        running: Dict[asyncio.Task, int] = {}
+        
+        async def run_step(index: int):
+            async with semaphore:
+                # Each step sees the context as it was when the step started
+                return await self._execute_step(
+                    steps[index], index, len(steps), dict(workflow_context),
+                    step_results.get(index - 1), agent_name
+                )
+        
+        try:
+            while remaining or running:
+                ready = [i for i in sorted(remaining) if dependencies[i].issubset(step_results.keys())]
+                for i in ready:
+                    remaining.discard(i)
+                    running[asyncio.create_task(run_step(i))] = i
+                
+                done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda t: running[t]):
+                    i = running.pop(task)
+                    try:
+                        resolved_step, result = task.result()
+                    except Exception as e:
+                        results[i] = self._step_error_entry(i, steps[i].step, e)
+                        raise Exception(f"Workflow {workflow_name} failed at step {i+1} (execution {execution_id}): {e}")
+                    
+                    self._store_step_result(resolved_step, result, workflow_context)
+                    await self._save_checkpoint(execution_id, i, resolved_step, result)
+                    step_results[i] = result
+                    results[i] = self._step_result_entry(i, resolved_step, result)
+        finally:
+            # Stop sibling steps still in flight when a step fails
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running.keys(), return_exceptions=True)
+        
+        return [results[i] for i in sorted(results)]
+    
+    async def _execute_step(
+        self,
+        compiled_step: CompiledStep,
+        step_index: int,
+        step_count: int,
+        workflow_context: Dict[str, Any],
+        previous_step_result: Any,
+        agent_name: Optional[str]
+    ) -> Tuple[Dict[str, Any], Any]:
+        """
+        Resolve and execute a single workflow step
+        
+        Returns:
+            Tuple of (resolved step definition, step result)
+        """
+        step = compiled_step.step
+        try:
+            logger.info(f"=== STEP {step_index+1}/{step_count} ===")
+            payload_logger.debug("Step definition", step=step)
+            payload_logger.debug("Current context", keys=workflow_context.keys())
+        
+            # NEW: Handle input source for this step
+            step_input_context = self._prepare_step_input(
+                step, workflow_context, previous_step_result, step_index
+            )
+        
+            resolved_step, result = await self._resolve_and_run_step(
+                compiled_step, step_input_context, agent_name
+            )
+        
+            logger.info(f"Step {step_index+1} completed successfully")
+            return resolved_step, result
+        
+        except Exception as e:
+            logger.error(f"Error in workflow step {step_index+1}: {e}")
+            raise
+    
+    async def _resolve_and_run_step(
+        self,
+        compiled_step: CompiledStep,
+        context: Dict[str, Any],
+        agent_name: Optional[str]
+    ) -> Tuple[Dict[str, Any], Any]:
+        """Resolve variables in a step against a context and run it"""
+        # Resolve variables in step parameters; map sub-steps are resolved per item
+        resolved_step = compiled_step.render(context)
+        
+        if compiled_step.is_map:
+            logger.info(f"Resolved map step: {resolved_step['name']}")
+            return resolved_step, await self._execute_map_step(compiled_step, resolved_step, context, agent_name)
+        
+        payload_logger.debug("Resolved step", step=resolved_step)
+    
+        if resolved_step["type"] == "agent":
+            result = await self._execute_agent_step(resolved_step, context)
+            # Try to parse JSON from agent response
+            result = self._parse_agent_result(result)
+        
+        elif resolved_step["type"] == "tool":
+            result = await self._execute_tool_step(resolved_step, context, agent_name)
+            payload_logger.debug("Tool result", type=type(result).__name__, result=result)
+        else:
+            raise ValueError(f"Unknown step type: {resolved_step['type']}")
+        
+        return resolved_step, result
+    
+    async def _execute_map_step(
+        self,
+        compiled_step: CompiledStep,
+        resolved_step: Dict[str, Any],
+        context: Dict[str, Any],
+        agent_name: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Run a sub-step once per item of a list, then an optional reduce step
+        
+        Each item runs with the item (under item_key, default "item") and its
+        index (under "<item_key>_index") added to the context. Items run
+        concurrently up to max_concurrency and results keep item order. A
+        failing item is recorded in "errors" and leaves None in "results"
+        unless continue_on_error is false. The reduce step sees the successful
+        results under "results" and the failures under "errors".
+        """
+        step = compiled_step.step
+        items = resolved_step.get("items")
+        if isinstance(items, str):
+            try:
+                items = json.loads(items)
+            except json.JSONDecodeError:
+                pass
+        if not isinstance(items, list):
+            raise ValueError(f"Map step '{step['name']}' items must resolve to a list, got {type(items).__name__}")
+        
+        sub_step = compiled_step.sub_step
+        if sub_step is None:
+            raise ValueError(f"Map step '{step['name']}' requires a 'step' definition")
+        
+        item_key = resolved_step.get("item_key") or "item"
+        continue_on_error = resolved_step.get("continue_on_error", True) is not False
+        semaphore = asyncio.Semaphore(int(resolved_step.get("max_concurrency") or self.default_max_concurrency))
+        results: List[Any] = [None] * len(items)
+        errors: List[Dict[str, Any]] = []
+        
+        logger.info(f"Map step '{step['name']}' processing {len(items)} items")
+        
+        async def run_item(index: int, item: Any):
+            item_context = {**context, item_key: item, f"{item_key}_index": index}
+            async with semaphore:
+                try:
+                    _, results[index] = await self._resolve_and_run_step(sub_step, item_context, agent_name)
+                except Exception as e:
+                    if not continue_on_error:
+                        raise Exception(f"item {index} failed: {e}")
+                    logger.warning(f"Map step '{step['name']}' item {index} failed: {e}")
+                    errors.append({"index": index, "error": str(e)})
+        
+        tasks = [asyncio.create_task(run_item(index, item)) for index, item in enumerate(items)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        errors.sort(key=lambda error: error["index"])
+        failed_indexes = {error["index"] for error in errors}
+        map_result = {
+            "results": results,
+            "errors": errors,
+            "total": len(items),
+            "succeeded": len(items) - len(errors),
+            "failed": len(errors)
+        }
+        
+        reduce_step = compiled_step.reduce_step
+        if reduce_step:
+            reduce_context = {
+                **context,
+                "results": [result for index, result in enumerate(results) if index not in failed_indexes],
+                "errors": errors
+            }
+            _, map_result["reduced"] = await self._resolve_and_run_step(reduce_step, reduce_context, agent_name)
+        
+        logger.info(f"Map step '{step['name']}' completed: {map_result['succeeded']} succeeded, "
+                   f"{map_result['failed']} failed")
+        return map_result
+    
+    def _store_step_result(self, resolved_step: Dict[str, Any], result: Any, workflow_context: Dict[str, Any]):
+        """Store a step result in the workflow context if a context_key is specified"""
+        if resolved_step.get("context_key"):
+            context_key = resolved_step["context_key"]
+            workflow_context[context_key] = result
+            logger.info(f"Stored result in context key '{context_key}'")
+    
+    def _step_result_entry(self, step_index: int, resolved_step: Dict[str, Any], result: Any) -> Dict[str, Any]:
+        """Build the results entry for a completed step"""
+        return {
+            "step": step_index + 1,
+            "type": resolved_step["type"],
+            "name": resolved_step["name"],
+            "result": result,
+            "context_key": resolved_step.get("context_key")
+        }
+    
+    def _checkpoint_result_entry(self, step_index: int, checkpoint: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the results entry for a step restored from a checkpoint"""
+        return {
+            "step": step_index + 1,
+            "type": checkpoint["type"],
+            "name": checkpoint["name"],
+            "result": checkpoint["result"],
+            "context_key": checkpoint.get("context_key"),
+            "resumed": True
+        }
+    
+    async def _save_checkpoint(self, execution_id: str, step_index: int, resolved_step: Dict[str, Any], result: Any):
+        """Persist a completed step's output so a failed run can resume after it"""
+        try:
+            await self.async_memory.save_workflow_checkpoint(
+                execution_id, step_index, resolved_step["type"], resolved_step["name"],
+                resolved_step.get("context_key"), result
+            )
+        except Exception as e:
+            logger.warning(f"Failed to checkpoint step {step_index + 1} of execution {execution_id}: {e}")
+    
+    def _step_error_entry(self, step_index: int, step: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        """Build the results entry for a failed step"""
+        return {
+            "step": step_index + 1,
+            "type": step["type"],
+            "name": step["name"],
+            "error": str(error)
+        }
+    
+    def _build_step_dependencies(self, steps: List[Dict[str, Any]]) -> List[Set[int]]:
+        """
+        Work out which earlier steps each step must wait for in DAG mode
+        
+        Dependencies are inferred from {{variable}} references to other steps'
+        context_key outputs and from use_previous_output. Agent steps without an
+        explicit context receive the whole workflow context, so they wait for every
+        earlier step that stores a result. Writes to a context_key stay ordered after
+        earlier reads and writes of the same key. An explicit depends_on list
+        replaces the inferred dependencies of its step.
+        
+        Returns:
+            List of dependency sets (0-based step indices), one per step
+        """
+        dependencies = []
+        producers: Dict[str, int] = {}  # context_key -> latest step storing it
+        readers: Dict[str, Set[int]] = {}  # context_key -> steps reading it since the last write
+        
+        for i, step in enumerate(steps):
+            references = self._get_step_references(step)
+            context_key = step.get("context_key")
+            
+            if step.get("depends_on") is not None:
+                step_dependencies = {
+                    self._resolve_step_dependency(dependency, steps, i)
+                    for dependency in step["depends_on"]
+                }
+            else:
+                step_dependencies = {producers[name] for name in references if name in producers}
+                
+                if step.get("use_previous_output") and i > 0:
+                    step_dependencies.add(i - 1)
+                
+                if self._step_uses_full_context(step):
+                    step_dependencies.update(producers.values())
+                
+                if context_key:
+                    if context_key in producers:
+                        step_dependencies.add(producers[context_key])
+                    step_dependencies.update(readers.get(context_key, set()))
+            
+            step_dependencies.discard(i)
+            dependencies.append(step_dependencies)
+            
+            for name in references:
+                readers.setdefault(name, set()).add(i)
+            if context_key:
+                producers[context_key] = i
+                readers[context_key] = set()
+        
+        self._check_acyclic(dependencies)
+        return dependencies
+    
+    def _step_uses_full_context(self, step: Dict[str, Any]) -> bool:
+        """Check whether a step (or a map step's sub-steps) passes the whole context to an agent"""
+        if step.get("type") == "agent":
+            return "context" not in (step.get("parameters") or {})
+        if step.get("type") == "map":
+            return any(
+                isinstance(sub_step, dict) and self._step_uses_full_context(sub_step)
+                for sub_step in (step.get("step"), step.get("reduce"))
+            )
+        return False
+    
+    def _get_step_references(self, step: Any) -> Set[str]:
+        """Collect the root names of all {{variable}} references in a step definition"""
+        references = set()
+        if isinstance(step, str):
+            references.update(variable.root for variable in compile_template(step).variables)
+        elif isinstance(step, dict):
+            for key, value in step.items():
+                if key not in ("context_key", "depends_on"):
+                    references.update(self._get_step_references(value))
+        elif isinstance(step, list):
+            for item in step:
+                references.update(self._get_step_references(item))
+        return references
+    
+    def _resolve_step_dependency(self, dependency: Any, steps: List[Dict[str, Any]], step_index: int) -> int:
+        """
+        Resolve an explicit depends_on entry (1-based step number or context key) to a step index
+        
+        A context key resolves to the latest earlier step writing it, or to the
+        first later one if no earlier step does.
+        """
+        if isinstance(dependency, int) or (isinstance(dependency, str) and dependency.isdigit()):
+            index = int(dependency) - 1
+            if 0 <= index < len(steps):
+                return index
+        else:
+            candidates = list(range(step_index - 1, -1, -1)) + list(range(step_index + 1, len(steps)))
+            for i in candidates:
+                if steps[i].get("context_key") == dependency:
+                    return i
+        raise ValueError(f"Step {step_index + 1}: unknown dependency '{dependency}'")
+    
+    def _check_acyclic(self, dependencies: List[Set[int]]):
+        """Raise ValueError if explicit dependencies form a cycle"""
+        completed: Set[int] = set()
+        remaining = set(range(len(dependencies)))
+        while remaining:
+            ready = {i for i in remaining if dependencies[i].issubset(completed)}
+            if not ready:
+                cycle_steps = sorted(i + 1 for i in remaining)
+                raise ValueError(f"Workflow steps have circular dependencies: {cycle_steps}")
+            completed.update(ready)
+            remaining -= ready
+    
     def _validate_input_schema(self, input_schema: Dict[str, Any], input_data: Dict[str, Any]) -> Optional[str]:
         """Validate input data against schema"""
         try:
@@ -174,8 +653,7 @@ class WorkflowManager:
     
     def _parse_agent_result(self, result: str) -> Any:
         """Parse agent result, trying to extract JSON if possible"""
-        logger.info(f"Agent result type: {type(result)}")
-        logger.info(f"Agent result (raw): {repr(result)}")
+        payload_logger.debug("Agent result (raw)", type=type(result).__name__, result=result)
     
         original_result = result
         try:
@@ -184,19 +662,19 @@ class WorkflowManager:
                 json_match = re.search(r'\{.*\}', result.strip(), re.DOTALL)
                 if json_match:
                     json_str = json_match.group(0)
-                    logger.info(f"Extracted JSON string: {json_str}")
+                    payload_logger.debug("Extracted JSON string", json=json_str)
                     parsed_result = json.loads(json_str)
-                    logger.info(f"Successfully parsed JSON: {parsed_result}")
+                    payload_logger.debug("Successfully parsed JSON", result=parsed_result)
                     return parsed_result
                 elif result.strip().startswith('{') and result.strip().endswith('}'):
                     parsed_result = json.loads(result.strip())
-                    logger.info(f"Successfully parsed full response as JSON: {parsed_result}")
+                    payload_logger.debug("Successfully parsed full response as JSON", result=parsed_result)
                     return parsed_result
                 else:
                     logger.info("Agent result doesn't look like JSON, keeping as string")
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse agent result as JSON: {e}")
-            logger.warning(f"Original result: {repr(original_result)}")
+            payload_logger.log(logging.WARNING, "Original result", result=original_result)
     
         return original_result
     
@@ -222,7 +700,7 @@ class WorkflowManager:
                 step_context = workflow_context.copy()
                 step_context["previous_result"] = previous_step_result
         
-            logger.info(f"Step input context: {step_context}")
+            payload_logger.debug("Step input context", context=step_context)
             return step_context
         else:
             logger.info(f"Step {step_index + 1} using workflow input context")
@@ -243,7 +721,8 @@ class WorkflowManager:
         # Extract context from parameters if available
         agent_context = parameters.get("context", context)
         
-        logger.info(f"Executing agent {agent_name} with task: {task}")
+        logger.info(f"Executing agent {agent_name}")
+        payload_logger.debug("Agent task", task=task)
         
         return await self.agent_manager.execute_agent(agent_name, task, agent_context)
     
@@ -257,287 +736,31 @@ class WorkflowManager:
         tool_name = step.get("tool") or step["name"]  # Use 'tool' field if available, fallback to 'name'
         parameters = step.get("parameters", {})
         
-        logger.info(f"Tool step parameters before execution: {parameters}")
         
         # Check for None values in parameters
         for param_name, param_value in parameters.items():
             if param_value is None:
                 logger.error(f"Parameter '{param_name}' is None! This will cause the tool to fail.")
-                logger.error(f"Full parameters: {parameters}")
+                payload_logger.log(logging.ERROR, "Full parameters", parameters=parameters)
                 raise ValueError(f"Tool parameter '{param_name}' resolved to None")
         
-        logger.info(f"Executing tool {tool_name} with parameters: {parameters}")
+        logger.info(f"Executing tool {tool_name}")
+        payload_logger.debug("Tool parameters", parameters=parameters)
         
         return await self.tool_manager.execute_tool(tool_name, parameters, agent_name)
     
     def _substitute_variables(self, text: str, context: Dict[str, Any], preserve_objects: bool = False) -> Any:
-        """Enhanced variable substitution with debugging and optional object preservation"""
+        """
+        Substitute {{variable}} references in a string
+        
+        Paths support dotted keys and list indexes (e.g. attachments.vault_files[0].vault_filename).
+        A string that is a single reference returns the object itself when
+        preserve_objects is set; otherwise the result is a string. Unresolved
+        references are left as written.
+        """
         if not isinstance(text, str):
             return text
-        
-        logger.debug(f"Substituting variables in: '{text}'")
-        logger.debug(f"Available context: {context}")
-        logger.debug(f"Preserve objects: {preserve_objects}")
-        
-        # Pattern to match {{variable}} or {{object.property}} or {{array[0].property}}
-        pattern = r'\{\{([^}]+)\}\}'
-        
-        def replace_var(match):
-            var_path = match.group(1).strip()
-            logger.debug(f"Processing variable: {var_path}")
-            
-            try:
-                # Handle nested property access with array indexing (e.g., attachments.vault_files[0].vault_filename)
-                if '.' in var_path or '[' in var_path:
-                    # Split by dots but preserve array indices
-                    parts = []
-                    current_part = ""
-                    in_bracket = False
-                    
-                    for char in var_path:
-                        if char == '[':
-                            if current_part:
-                                parts.append(current_part)
-                                current_part = ""
-                            in_bracket = True
-                            current_part += char
-                        elif char == ']':
-                            current_part += char
-                            parts.append(current_part)
-                            current_part = ""
-                            in_bracket = False
-                        elif char == '.' and not in_bracket:
-                            if current_part:
-                                parts.append(current_part)
-                                current_part = ""
-                        else:
-                            current_part += char
-                    
-                    if current_part:
-                        parts.append(current_part)
-                    
-                    value = context
-                    logger.debug(f"Navigating path: {parts}")
-                    
-                    for i, part in enumerate(parts):
-                        part = str(part)
-                        logger.debug(f"  Step {i}: accessing '{part}' in {type(value)}")
-                        # Handle array indexing
-                        if part.startswith('[') and part.endswith(']'):
-                            try:
-                                index = int(part[1:-1])  # Remove brackets and convert to int
-                                if isinstance(value, list) and 0 <= index < len(value):
-                                    value = value[index]
-                                    logger.debug(f"  Found array element at index {index}: {repr(value)}")
-                                else:
-                                    logger.error(f"Cannot access array index {index} in {type(value)}")
-                                    return match.group(0)  # Return original if not found
-                            except (ValueError, IndexError):
-                                logger.error(f"Invalid array index: {part}")
-                                return match.group(0)
-                            continue  # Always continue to next part after array indexing
-                        # Only use string keys for dicts, skip if part is an array index
-                        if not (part.startswith('[') and part.endswith(']')) and isinstance(value, dict):
-                            key = str(part)
-                            if key in value:
-                                value = value[key]
-                                logger.debug(f"  Found: {repr(value)}")
-                            else:
-                                logger.error(f"Cannot access {var_path}: '{key}' not found in {type(value)}")
-                                logger.error(f"Available keys: {list(value.keys())}")
-                                return match.group(0)  # Return original if not found
-                        elif isinstance(value, list):
-                            # If we hit an array but part is not a digit, try to find by key
-                            found = False
-                            for item in value:
-                                if isinstance(part, str) and not (part.startswith('[') and part.endswith(']')) and isinstance(item, dict) and part in item:
-                                    value = item[part]
-                                    found = True
-                                    break
-                            if not found:
-                                logger.error(f"Cannot access {var_path}: '{part}' not found in {type(value)}")
-                                return match.group(0)  # Return original if not found
-                        else:
-                            logger.error(f"Cannot access {var_path}: '{part}' not found in {type(value)}")
-                            if isinstance(value, dict):
-                                logger.error(f"Available keys: {list(value.keys())}")
-                            elif isinstance(value, list):
-                                logger.error(f"Array length: {len(value)}")
-                            return match.group(0)  # Return original if not found
-                    
-                    # Always return string for re.sub compatibility
-                    result = str(value) if not isinstance(value, str) else value
-                    logger.debug(f"Variable {var_path} resolved to string: {repr(result)}")
-                    return result
-                
-                # Simple variable access
-                elif var_path in context:
-                    value = context[var_path]
-                    # Always return string for re.sub compatibility
-                    result = str(value) if not isinstance(value, str) else value
-                    logger.debug(f"Variable {var_path} resolved to string: {repr(result)}")
-                    return result
-                else:
-                    logger.error(f"Variable {var_path} not found in context")
-                    logger.error(f"Available variables: {list(context.keys())}")
-                    return match.group(0)  # Keep original if not found
-                    
-            except Exception as e:
-                logger.error(f"Error resolving variable {var_path}: {e}")
-                return match.group(0)  # Keep original on error
-        
-        # Check if the entire text is a single variable reference
-        if re.match(pattern, text.strip()):
-            # Single variable reference - return the object directly if preserve_objects is True
-            match = re.match(pattern, text.strip())
-            if match:
-                var_path = match.group(1).strip()
-                
-                # Handle nested property access with array indexing
-                if '.' in var_path or '[' in var_path:
-                    parts = []
-                    current_part = ""
-                    in_bracket = False
-                    
-                    for char in var_path:
-                        if char == '[':
-                            if current_part:
-                                parts.append(current_part)
-                                current_part = ""
-                            in_bracket = True
-                            current_part += char
-                        elif char == ']':
-                            current_part += char
-                            parts.append(current_part)
-                            current_part = ""
-                            in_bracket = False
-                        elif char == '.' and not in_bracket:
-                            if current_part:
-                                parts.append(current_part)
-                                current_part = ""
-                        else:
-                            current_part += char
-                    
-                    if current_part:
-                        parts.append(current_part)
-                    
-                    value = context
-                    for part in parts:
-                        part = str(part)
-                        # Handle array indexing
-                        if part.startswith('[') and part.endswith(']'):
-                            try:
-                                index = int(part[1:-1])
-                                if isinstance(value, list) and 0 <= index < len(value):
-                                    value = value[index]
-                                else:
-                                    return text  # Return original if not found
-                            except (ValueError, IndexError):
-                                return text
-                            continue  # Always continue to next part after array indexing
-                        # Only use string keys for dicts, skip if part is an array index
-                        if not (part.startswith('[') and part.endswith(']')) and isinstance(value, dict):
-                            key = str(part)
-                            if key in value:
-                                value = value[key]
-                            else:
-                                return text  # Return original if not found
-                        elif isinstance(value, list):
-                            found = False
-                            for item in value:
-                                if isinstance(part, str) and not (part.startswith('[') and part.endswith(']')) and isinstance(item, dict) and part in item:
-                                    value = item[part]
-                                    found = True
-                                    break
-                            if not found:
-                                return text  # Return original if not found
-                        else:
-                            return text  # Return original if not found
-                elif var_path in context:
-                    value = context[var_path]
-                else:
-                    return text  # Return original if not found
-                
-                if preserve_objects:
-                    logger.debug(f"Single variable {var_path} resolved to object: {repr(value)}")
-                    return value
-                else:
-                    result = str(value) if not isinstance(value, str) else value
-                    logger.debug(f"Single variable {var_path} resolved to string: {repr(result)}")
-                    return result
-        
-        # Multiple variables or mixed content - use regex substitution (always returns string)
-        result = re.sub(pattern, replace_var, text)
-        logger.debug(f"Final substitution result: '{result}'")
-        return result
-    
-    def _resolve_variables(
-        self, 
-        step: Dict[str, Any], 
-        context: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Resolve variables in step definition with debugging"""
-        logger.debug(f"Resolving variables in step: {step}")
-        resolved_step = {}
-        
-        # Check if this step should preserve objects
-        preserve_objects = step.get("preserve_objects", False)
-        logger.debug(f"Step preserve_objects flag: {preserve_objects}")
-        
-        for key, value in step.items():
-            if isinstance(value, str):
-                resolved_step[key] = self._substitute_variables(value, context, preserve_objects)
-            elif isinstance(value, dict):
-                resolved_step[key] = self._resolve_dict_variables(value, context, preserve_objects)
-            elif isinstance(value, list):
-                resolved_step[key] = self._resolve_list_variables(value, context, preserve_objects)
-            else:
-                resolved_step[key] = value
-        
-        logger.debug(f"Resolved step result: {resolved_step}")
-        return resolved_step
-    
-    def _resolve_dict_variables(
-        self, 
-        data: Dict[str, Any], 
-        context: Dict[str, Any],
-        preserve_objects: bool = False
-    ) -> Dict[str, Any]:
-        """Recursively resolve variables in dictionary"""
-        resolved = {}
-        
-        for key, value in data.items():
-            if isinstance(value, str):
-                resolved[key] = self._substitute_variables(value, context, preserve_objects)
-            elif isinstance(value, dict):
-                resolved[key] = self._resolve_dict_variables(value, context, preserve_objects)
-            elif isinstance(value, list):
-                resolved[key] = self._resolve_list_variables(value, context, preserve_objects)
-            else:
-                resolved[key] = value
-        
-        return resolved
-    
-    def _resolve_list_variables(
-        self, 
-        data: List[Any], 
-        context: Dict[str, Any],
-        preserve_objects: bool = False
-    ) -> List[Any]:
-        """Recursively resolve variables in list"""
-        resolved = []
-        
-        for item in data:
-            if isinstance(item, str):
-                resolved.append(self._substitute_variables(item, context, preserve_objects))
-            elif isinstance(item, dict):
-                resolved.append(self._resolve_dict_variables(item, context, preserve_objects))
-            elif isinstance(item, list):
-                resolved.append(self._resolve_list_variables(item, context, preserve_objects))
-            else:
-                resolved.append(item)
-        
-        return resolved
+        return compile_template(text).render(context, preserve_objects)
     
     def validate_workflow(self, workflow_definition: Dict[str, Any]) -> Dict[str, Any]:
         """Validate a workflow definition"""
@@ -559,13 +782,21 @@ class WorkflowManager:
             step_errors = self._validate_step(step, i + 1)
             errors.extend(step_errors)
         
+        if workflow_definition.get("execution_mode", "sequential") == "dag" or any(
+            isinstance(step, dict) and step.get("depends_on") is not None for step in steps
+        ):
+            try:
+                self._build_step_dependencies(steps)
+            except ValueError as e:
+                errors.append(str(e))
+        
         return {
             "valid": len(errors) == 0,
             "errors": errors,
             "warnings": warnings
         }
     
-    def _validate_step(self, step: Dict[str, Any], step_number: int) -> List[str]:
+    def _validate_step(self, step: Dict[str, Any], step_number: Any) -> List[str]:
         """Validate a single workflow step"""
         errors = []
         
@@ -578,8 +809,8 @@ class WorkflowManager:
             return errors
         
         step_type = step["type"]
-        if step_type not in ["agent", "tool"]:
-            errors.append(f"Step {step_number}: Invalid type '{step_type}'. Must be 'agent' or 'tool'")
+        if step_type not in ["agent", "tool", "map"]:
+            errors.append(f"Step {step_number}: Invalid type '{step_type}'. Must be 'agent', 'tool' or 'map'")
         
         # Validate agent steps
         if step_type == "agent":
@@ -595,6 +826,20 @@ class WorkflowManager:
             if not tool:
                 errors.append(f"Step {step_number}: Tool '{tool_name}' not found")
         
+        # Validate map steps and their sub-steps
+        elif step_type == "map":
+            if step.get("items") is None:
+                errors.append(f"Step {step_number}: Map step requires 'items'")
+            if not isinstance(step.get("step"), dict):
+                errors.append(f"Step {step_number}: Map step requires a 'step' definition")
+            else:
+                errors.extend(self._validate_step(step["step"], f"{step_number} (map step)"))
+            if step.get("reduce") is not None:
+                if isinstance(step["reduce"], dict):
+                    errors.extend(self._validate_step(step["reduce"], f"{step_number} (reduce step)"))
+                else:
+                    errors.append(f"Step {step_number}: Map 'reduce' must be a step definition")
+        
         return errors
     
     def get_workflow_status(self, workflow_name: str) -> Dict[str, Any]:
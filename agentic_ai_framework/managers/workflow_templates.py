@@ -0,0 +1,281 @@
+"""
+managers/workflow_templates.py - Compiled Workflow Variable Templates
+"""
+
+import logging
+import re
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Matches {{variable}} references in step definitions
+VARIABLE_PATTERN = re.compile(r'\{\{([^}]+)\}\}')
+
+# Sentinel for a path that does not resolve against the context
+MISSING = object()
+
+# Step fields that hold nested step definitions in map steps
+MAP_SUB_STEP_FIELDS = ("step", "reduce")
+
+
+def _parse_path(var_path: str) -> Optional[Tuple[Tuple[bool, Union[int, str]], ...]]:
+    """
+    Split a variable path such as "a.b[0].c" into accessor segments
+
+    Returns:
+        Tuple of (is_index, key_or_index) segments, or None if the path
+        contains an index that is not an integer
+    """
+    parts = []
+    current_part = ""
+    in_bracket = False
+
+    for char in var_path:
+        if char == '[':
+            if current_part:
+                parts.append(current_part)
+                current_part = ""
+            in_bracket = True
+            current_part += char
+        elif char == ']':
+            current_part += char
+            parts.append(current_part)
+            current_part = ""
+            in_bracket = False
+        elif char == '.' and not in_bracket:
+            if current_part:
+                parts.append(current_part)
+                current_part = ""
+        else:
+            current_part += char
+
+    if current_part:
+        parts.append(current_part)
+
+    segments = []
+    for part in parts:
+        if part.startswith('[') and part.endswith(']'):
+            try:
+                segments.append((True, int(part[1:-1])))
+            except ValueError:
+                return None
+        else:
+            segments.append((False, part))
+    return tuple(segments)
+
+
+class VariableRef:
+    """A compiled {{variable}} reference"""
+
+    __slots__ = ("path", "placeholder", "segments")
+
+    def __init__(self, path: str, placeholder: str):
+        self.path = path
+        self.placeholder = placeholder
+        self.segments = _parse_path(path)
+
+    @property
+    def root(self) -> str:
+        """Name of the context entry the path starts from"""
+        if self.segments and not self.segments[0][0]:
+            return self.segments[0][1]
+        return self.path
+
+    def resolve(self, context: Dict[str, Any]) -> Any:
+        """
+        Walk the path against the context
+
+        Keys look up dict entries; on a list, a key selects the value from the
+        first dict item that contains it. Indexes only apply to lists.
+
+        Returns:
+            The resolved value, or MISSING if any segment does not resolve
+        """
+        if self.segments is None:
+            return MISSING
+
+        value = context
+        for is_index, part in self.segments:
+            if is_index:
+                if isinstance(value, list) and 0 <= part < len(value):
+                    value = value[part]
+                else:
+                    return MISSING
+            elif isinstance(value, dict):
+                if part not in value:
+                    return MISSING
+                value = value[part]
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, dict) and part in item:
+                        value = item[part]
+                        break
+                else:
+                    return MISSING
+            else:
+                return MISSING
+        return value
+
+
+def _to_text(value: Any) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+class Template:
+    """A string split into literal chunks and variable references"""
+
+    __slots__ = ("source", "chunks", "variable")
+
+    def __init__(self, source: str):
+        self.source = source
+        self.chunks: List[Union[str, VariableRef]] = []
+
+        position = 0
+        for match in VARIABLE_PATTERN.finditer(source):
+            if match.start() > position:
+                self.chunks.append(source[position:match.start()])
+            self.chunks.append(VariableRef(match.group(1).strip(), match.group(0)))
+            position = match.end()
+        if position < len(source):
+            self.chunks.append(source[position:])
+
+        # A template that is exactly one reference (ignoring surrounding
+        # whitespace) can resolve to the referenced object itself
+        stripped = [
+            chunk for chunk in self.chunks
+            if isinstance(chunk, VariableRef) or chunk.strip()
+        ]
+        self.variable = stripped[0] if len(stripped) == 1 and isinstance(stripped[0], VariableRef) else None
+
+    @property
+    def variables(self) -> List[VariableRef]:
+        return [chunk for chunk in self.chunks if isinstance(chunk, VariableRef)]
+
+    def render(self, context: Dict[str, Any], preserve_objects: bool = False) -> Any:
+        """
+        Substitute variables from the context
+
+        A single-reference template returns the referenced object when
+        preserve_objects is set and its string form otherwise; any other
+        template returns a string. Unresolved references are left as written.
+        """
+        if self.variable is not None:
+            value = self.variable.resolve(context)
+            if value is MISSING:
+                return self.source
+            return value if preserve_objects else _to_text(value)
+
+        if len(self.chunks) == 1 and isinstance(self.chunks[0], str):
+            return self.source
+
+        pieces = []
+        for chunk in self.chunks:
+            if isinstance(chunk, str):
+                pieces.append(chunk)
+                continue
+            value = chunk.resolve(context)
+            if value is MISSING:
+                logger.error(f"Variable {chunk.path} not found in context")
+                pieces.append(chunk.placeholder)
+            else:
+                pieces.append(_to_text(value))
+        return "".join(pieces)
+
+
+@lru_cache(maxsize=4096)
+def compile_template(text: str) -> Template:
+    """Compile a string into a Template, reusing earlier compilations of the same text"""
+    return Template(text)
+
+
+class _Constant:
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def render(self, context: Dict[str, Any], preserve_objects: bool) -> Any:
+        return self.value
+
+
+class _DictNode:
+    __slots__ = ("items",)
+
+    def __init__(self, items: List[Tuple[Any, Any]]):
+        self.items = items
+
+    def render(self, context: Dict[str, Any], preserve_objects: bool) -> Dict[Any, Any]:
+        return {key: node.render(context, preserve_objects) for key, node in self.items}
+
+
+class _ListNode:
+    __slots__ = ("items",)
+
+    def __init__(self, items: List[Any]):
+        self.items = items
+
+    def render(self, context: Dict[str, Any], preserve_objects: bool) -> List[Any]:
+        return [node.render(context, preserve_objects) for node in self.items]
+
+
+def compile_value(value: Any):
+    """
+    Compile a step value (string, dict, list or scalar) into a render tree
+
+    Rendering always builds new dicts and lists, so resolved steps never
+    share containers with the definition they were compiled from.
+    """
+    if isinstance(value, str):
+        template = compile_template(value)
+        return template if template.variables else _Constant(value)
+    if isinstance(value, dict):
+        return _DictNode([(key, compile_value(item)) for key, item in value.items()])
+    if isinstance(value, list):
+        return _ListNode([compile_value(item) for item in value])
+    return _Constant(value)
+
+
+class CompiledStep:
+    """
+    A workflow step definition compiled for repeated resolution
+
+    Map steps compile their own fields, with items always resolved to the
+    referenced object, and compile their sub-step and reduce step separately
+    so those can be resolved per item.
+    """
+
+    __slots__ = ("step", "preserve_objects", "body", "items", "sub_step", "reduce_step")
+
+    def __init__(self, step: Dict[str, Any]):
+        self.step = step
+        self.preserve_objects = step.get("preserve_objects", False)
+        self.items = None
+        self.sub_step = None
+        self.reduce_step = None
+
+        if step.get("type") == "map":
+            self.body = compile_value({
+                key: value for key, value in step.items()
+                if key not in MAP_SUB_STEP_FIELDS and key != "items"
+            })
+            self.items = compile_value(step.get("items"))
+            if isinstance(step.get("step"), dict):
+                self.sub_step = CompiledStep(step["step"])
+            if isinstance(step.get("reduce"), dict):
+                self.reduce_step = CompiledStep(step["reduce"])
+        else:
+            self.body = compile_value(step)
+
+    @property
+    def is_map(self) -> bool:
+        return self.items is not None
+
+    def render(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolve the step definition against a context"""
+        resolved_step = self.body.render(context, self.preserve_objects)
+        if self.is_map:
+            resolved_step["items"] = self.items.render(context, True)
+            for key in MAP_SUB_STEP_FIELDS:
+                resolved_step[key] = self.step.get(key)
+        return resolved_step
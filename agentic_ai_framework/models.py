@@ -3,11 +3,36 @@ models.py - Enhanced Pydantic Data Models with Recurring Task Support
 """
 
 from pydantic import BaseModel, Field, validator
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
 from enum import Enum
 from datetime import datetime, timezone
 
+from managers.log_utils import parse_level
+from managers.workflow_manager import WorkflowManager
+
+
+def _check_execution_mode(v: Optional[str]) -> Optional[str]:
+    """Validate a workflow execution mode against the modes the workflow manager runs"""
+    if v is not None and v not in WorkflowManager.EXECUTION_MODES:
+        raise ValueError(f"execution_mode must be one of: {list(WorkflowManager.EXECUTION_MODES)}")
+    return v
+
+
+class LogVerbosityRequest(BaseModel):
+    """Base for execution requests accepting a per-request log verbosity"""
+    log_verbosity: Optional[str] = Field(
+        default=None, description="Log level for this request's step, context and tool payload logs (e.g. 'DEBUG')"
+    )
+    
+    @validator('log_verbosity')
+    def validate_log_verbosity(cls, v):
+        """Validate per-request log verbosity and normalize it to an upper-case level name"""
+        if v is None:
+            return v
+        parse_level(v)
+        return v.upper()
+
 
 # Agent Models (existing, unchanged)
 class AgentDefinition(BaseModel):
@@ -47,7 +72,7 @@ class AgentInfo(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-class AgentExecutionRequest(BaseModel):
+class AgentExecutionRequest(LogVerbosityRequest):
     """Model for agent execution request"""
     task: str = Field(..., description="Task description for the agent")
     context: Optional[Dict[str, Any]] = Field(
@@ -94,8 +119,9 @@ class ToolInfo(BaseModel):
     enabled: bool
     created_at: datetime
     updated_at: datetime
+    cache: Optional[Dict[str, Any]] = None  # Result cache settings and statistics
 
-class ToolExecutionRequest(BaseModel):
+class ToolExecutionRequest(LogVerbosityRequest):
     """Model for tool execution request"""
     parameters: Dict[str, Any] = Field(..., description="Tool execution parameters")
     agent_name: Optional[str] = Field(
@@ -118,8 +144,8 @@ class ToolResponse(BaseModel):
 # Workflow Models (existing, unchanged)
 class WorkflowStep(BaseModel):
     """Model for a single workflow step"""
-    type: str = Field(..., description="Step type: 'agent' or 'tool'")
-    name: str = Field(..., description="Agent or tool name")
+    type: str = Field(..., description="Step type: 'agent', 'tool' or 'map'")
+    name: str = Field(..., description="Agent or tool name (label for map steps)")
     tool: Optional[str] = Field(
         default=None, description="Tool name for tool steps"
     )
@@ -138,6 +164,29 @@ class WorkflowStep(BaseModel):
     preserve_objects: Optional[bool] = Field(
         default=False, description="Whether to preserve objects when resolving template variables"
     )
+    depends_on: Optional[List[Union[int, str]]] = Field(
+        default=None,
+        description="DAG mode: steps this step waits for (1-based step numbers or context keys). "
+                    "Overrides inferred dependencies when set"
+    )
+    items: Optional[Any] = Field(
+        default=None, description="Map steps: list (or {{variable}} resolving to a list) to iterate over"
+    )
+    item_key: Optional[str] = Field(
+        default=None, description="Map steps: context key holding the current item (default 'item')"
+    )
+    step: Optional[Dict[str, Any]] = Field(
+        default=None, description="Map steps: tool or agent step to run for each item"
+    )
+    reduce: Optional[Dict[str, Any]] = Field(
+        default=None, description="Map steps: optional step run once over the collected 'results'"
+    )
+    max_concurrency: Optional[int] = Field(
+        default=None, ge=1, description="Map steps: maximum items processed at once"
+    )
+    continue_on_error: Optional[bool] = Field(
+        default=True, description="Map steps: record failed items instead of failing the workflow"
+    )
 
 class WorkflowDefinition(BaseModel):
     """Model for creating a new workflow"""
@@ -153,6 +202,18 @@ class WorkflowDefinition(BaseModel):
         default=None,
         description="Specification for filtering or extracting workflow output. If None, returns full context."
     )
+    execution_mode: str = Field(
+        default="sequential",
+        description="Step execution mode: 'sequential' or 'dag' (independent steps run concurrently)"
+    )
+    max_concurrency: Optional[int] = Field(
+        default=None, ge=1, description="Maximum steps running at once in DAG mode"
+    )
+
+    @validator('execution_mode')
+    def validate_execution_mode(cls, v):
+        """Validate workflow execution mode"""
+        return _check_execution_mode(v)
 
 class WorkflowUpdate(BaseModel):
     """Model for updating an existing workflow"""
@@ -161,6 +222,13 @@ class WorkflowUpdate(BaseModel):
     enabled: Optional[bool] = None
     input_schema: Optional[Dict[str, Any]] = None
     output_spec: Optional[Dict[str, Any]] = None
+    execution_mode: Optional[str] = None
+    max_concurrency: Optional[int] = Field(default=None, ge=1)
+    
+    @validator('execution_mode')
+    def validate_execution_mode(cls, v):
+        """Validate workflow execution mode"""
+        return _check_execution_mode(v)
 
 class WorkflowInfo(BaseModel):
     """Model for workflow information response"""
@@ -173,8 +241,10 @@ class WorkflowInfo(BaseModel):
     updated_at: datetime
     input_schema: Optional[Dict[str, Any]] = None
     output_spec: Optional[Dict[str, Any]] = None
+    execution_mode: Optional[str] = "sequential"
+    max_concurrency: Optional[int] = None
 
-class WorkflowExecutionRequest(BaseModel):
+class WorkflowExecutionRequest(LogVerbosityRequest):
     """Model for workflow execution request"""
     context: Optional[Dict[str, Any]] = Field(
         default={}, description="Initial workflow context"
@@ -182,6 +252,17 @@ class WorkflowExecutionRequest(BaseModel):
     agent_id: Optional[str] = Field(
         default=None, description="Agent ID for tool configuration context"
     )
+    execution_mode: Optional[str] = Field(
+        default=None, description="Override the workflow execution mode ('sequential' or 'dag')"
+    )
+    max_concurrency: Optional[int] = Field(
+        default=None, ge=1, description="Override the DAG mode concurrency limit"
+    )
+
+    @validator('execution_mode')
+    def validate_execution_mode(cls, v):
+        """Validate the execution mode override"""
+        return _check_execution_mode(v)
 
 class WorkflowExecutionResponse(BaseModel):
     """Model for workflow execution response"""
@@ -190,6 +271,28 @@ class WorkflowExecutionResponse(BaseModel):
     result: Any
     timestamp: datetime
 
+class WorkflowExecutionInfo(BaseModel):
+    """Model for a resumable workflow execution"""
+    id: str
+    workflow_name: str
+    status: str
+    error_message: Optional[str] = None
+    completed_steps: List[int] = Field(default=[], description="0-based indexes of checkpointed steps")
+    created_at: datetime
+    updated_at: datetime
+
+class JobInfo(BaseModel):
+    """Model for an asynchronous agent or workflow job"""
+    id: str
+    job_type: str
+    target: str
+    status: str
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Any = None
+    error: Optional[str] = None
+
 class WorkflowResponse(BaseModel):
     """Model for workflow creation/operation response"""
     id: int
@@ -327,6 +430,7 @@ class TaskExecutionInfo(BaseModel):
     result: Optional[str]
     error_message: Optional[str]
     duration_seconds: Optional[int]
+    queue_wait_seconds: Optional[float] = None
 
 class ScheduleResponse(BaseModel):
     """Model for schedule operation response"""
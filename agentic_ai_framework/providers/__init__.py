@@ -10,6 +10,7 @@ from .base_llm_provider import (
     GenerationConfig,
     Message,
     GenerationResponse,
+    ToolCall,
     LLMProviderError,
     ModelNotFoundError,
     AuthenticationError,
@@ -28,6 +29,7 @@ __all__ = [
     "GenerationConfig", 
     "Message",
     "GenerationResponse",
+    "ToolCall",
     
     # Exceptions
     "LLMProviderError",
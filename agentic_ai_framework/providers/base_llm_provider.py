@@ -6,8 +6,11 @@ from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional, AsyncGenerator
 from dataclasses import dataclass
 from datetime import datetime
+import json
 import logging
 
+import aiohttp
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -34,6 +37,14 @@ class GenerationConfig:
     presence_penalty: float = 0.0
     stop_sequences: Optional[List[str]] = None
     stream: bool = False
+    tools: Optional[List[Dict[str, Any]]] = None  # Function schemas offered for native tool calling
+
+@dataclass
+class ToolCall:
+    """Tool call returned by a provider with native tool calling"""
+    name: str
+    arguments: Dict[str, Any]
+    id: Optional[str] = None
 
 @dataclass
 class Message:
@@ -41,6 +52,8 @@ class Message:
     role: str  # user, assistant, system, tool
     content: str
     metadata: Optional[Dict[str, Any]] = None
+    tool_calls: Optional[List[ToolCall]] = None  # Calls requested by an assistant message
+    tool_call_id: Optional[str] = None  # Call answered by a tool message
 
 @dataclass
 class GenerationResponse:
@@ -51,6 +64,7 @@ class GenerationResponse:
     usage: Optional[Dict[str, Any]] = None
     metadata: Optional[Dict[str, Any]] = None
     finish_reason: Optional[str] = None
+    tool_calls: Optional[List[ToolCall]] = None
 
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers"""
@@ -66,6 +80,7 @@ class BaseLLMProvider(ABC):
         self.provider_name = provider_name
         self.config = config
         self.is_initialized = False
+        self._session: Optional[aiohttp.ClientSession] = None
         logger.info(f"Initializing {provider_name} provider")
     
     @abstractmethod
@@ -185,6 +200,90 @@ class BaseLLMProvider(ABC):
         supported_features = self.config.get("supported_features", [])
         return feature in supported_features
     
+    def supports_tool_calling(self, model: str) -> bool:
+        """
+        Check if a model can receive tool schemas and return structured tool calls
+        
+        Args:
+            model: Model name
+            
+        Returns:
+            True if the provider and the model support native tool calling
+        """
+        if not self.supports_feature("tools"):
+            return False
+        model_info = self.get_model_info(model)
+        return bool(model_info and model_info.supports_tools)
+    
+    def _format_chat_message(self, message: Message) -> Dict[str, Any]:
+        """Convert a message to the OpenAI chat completions format"""
+        formatted = {"role": message.role, "content": message.content}
+        if message.tool_calls:
+            formatted["tool_calls"] = [
+                {
+                    "id": call.id,
+                    "type": "function",
+                    "function": {"name": call.name, "arguments": json.dumps(call.arguments)}
+                }
+                for call in message.tool_calls
+            ]
+        if message.tool_call_id:
+            formatted["tool_call_id"] = message.tool_call_id
+        return formatted
+    
+    def _parse_tool_calls(self, message: Dict[str, Any]) -> Optional[List[ToolCall]]:
+        """
+        Read structured tool calls from a chat response message
+        
+        Arguments may be a JSON string (OpenAI format) or an object (Ollama).
+        
+        Returns:
+            List of ToolCall objects or None if the message has no tool calls
+        """
+        tool_calls = []
+        for call in message.get("tool_calls") or []:
+            function = call.get("function", {})
+            arguments = function.get("arguments") or {}
+            if isinstance(arguments, str):
+                try:
+                    arguments = json.loads(arguments)
+                except json.JSONDecodeError:
+                    logger.warning(f"Invalid arguments for tool call {function.get('name')}: {arguments}")
+                    arguments = {}
+            tool_calls.append(ToolCall(name=function.get("name", ""), arguments=arguments, id=call.get("id")))
+        return tool_calls or None
+    
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the provider's shared HTTP session, creating it on first use
+        
+        The session (and its connection pool) is kept for the lifetime of the
+        provider so keep-alive connections, DNS lookups and TLS sessions are
+        reused across requests. Pool settings come from the optional
+        ``connection_pool`` section of the provider configuration.
+        
+        Returns:
+            Shared aiohttp.ClientSession
+        """
+        if self._session is None or self._session.closed:
+            pool_config = self.config.get("connection_pool", {})
+            connector = aiohttp.TCPConnector(
+                limit=pool_config.get("limit", 100),
+                limit_per_host=pool_config.get("limit_per_host", 10),
+                keepalive_timeout=pool_config.get("keepalive_timeout", 30),
+                ttl_dns_cache=pool_config.get("dns_cache_ttl", 300)
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            logger.debug(f"Created HTTP connection pool for {self.provider_name}")
+        return self._session
+    
+    async def close(self):
+        """Close the shared HTTP session and release pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.debug(f"Closed HTTP connection pool for {self.provider_name}")
+        self._session = None
+    
     def get_config(self) -> Dict[str, Any]:
         """Get provider configuration"""
         return self.config.copy()
@@ -1,16 +1,39 @@
+import asyncio
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Dict, Any, Optional, List, AsyncGenerator
 from .base_llm_provider import BaseLLMProvider, ModelInfo, GenerationConfig, Message, GenerationResponse
 
 logger = logging.getLogger(__name__)
 
+# Marks the end of a streamed response on the bridge queue
+_STREAM_END = object()
+
 class BedrockProvider(BaseLLMProvider):
     """AWS Bedrock LLM Provider"""
     
     def __init__(self, provider_name: str, config: Dict[str, Any]):
         super().__init__(provider_name, config)
         self.client = None
+        # boto3 calls block, so they run on a dedicated bounded pool instead of the event loop
+        self.max_workers = config.get('max_workers', 8)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=f"{provider_name}-worker"
+        )
+    
+    async def _run_blocking(self, func, *args, **kwargs):
+        """Run a blocking boto3 call on the provider executor"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+    
+    async def close(self):
+        """Shut down the Bedrock executor"""
+        await super().close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
     
     async def initialize(self) -> bool:
         """Initialize the Bedrock provider"""
@@ -23,9 +46,10 @@ class BedrockProvider(BaseLLMProvider):
             aws_access_key_id = self.config.get('aws_access_key_id')
             aws_secret_access_key = self.config.get('aws_secret_access_key')
             
-            # Create Bedrock client
+            # Create Bedrock client (credential resolution may hit the network)
             if aws_access_key_id and aws_secret_access_key:
-                self.client = boto3.client(
+                self.client = await self._run_blocking(
+                    boto3.client,
                     'bedrock-runtime',
                     region_name=region_name,
                     aws_access_key_id=aws_access_key_id,
@@ -33,7 +57,9 @@ class BedrockProvider(BaseLLMProvider):
                 )
             else:
                 # Use default AWS credentials (IAM roles, environment variables, etc.)
-                self.client = boto3.client('bedrock-runtime', region_name=region_name)
+                self.client = await self._run_blocking(
+                    boto3.client, 'bedrock-runtime', region_name=region_name
+                )
             
             logger.info(f"Bedrock provider initialized for region: {region_name}")
             self.is_initialized = True
@@ -53,7 +79,7 @@ class BedrockProvider(BaseLLMProvider):
                 return False
             
             # Test with a simple model list request
-            self.client.list_foundation_models()
+            await self._run_blocking(self.client.list_foundation_models)
             return True
             
         except Exception as e:
@@ -148,13 +174,9 @@ class BedrockProvider(BaseLLMProvider):
                 request_body = self._prepare_anthropic_request(prompt, config)
             
             # Make request to Bedrock
-            response = self.client.invoke_model(
-                modelId=model,
-                body=json.dumps(request_body)
+            response_body = await self._run_blocking(
+                self._invoke_model, model, json.dumps(request_body)
             )
-            
-            # Parse response
-            response_body = json.loads(response['body'].read())
             parsed_response = self._parse_response(response_body, model)
             
             return GenerationResponse(
@@ -197,24 +219,79 @@ class BedrockProvider(BaseLLMProvider):
                 # Default to Anthropic format
                 request_body = self._prepare_anthropic_request(prompt, config)
             
-            # Make streaming request to Bedrock
-            response = self.client.invoke_model_with_response_stream(
-                modelId=model,
-                body=json.dumps(request_body)
+            # Stream response chunks from a worker thread through a queue
+            loop = asyncio.get_running_loop()
+            queue: asyncio.Queue = asyncio.Queue()
+            stop_event = threading.Event()
+            loop.run_in_executor(
+                self._executor,
+                self._stream_to_queue,
+                model, json.dumps(request_body), queue, loop, stop_event
             )
             
-            # Stream response chunks
-            for event in response['body']:
-                chunk = json.loads(event['chunk']['bytes'].decode())
-                if 'content' in chunk:
-                    for content_block in chunk['content']:
-                        if 'text' in content_block:
-                            yield content_block['text']
+            try:
+                while True:
+                    item = await queue.get()
+                    if item is _STREAM_END:
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+            finally:
+                # Stop the worker if the consumer went away before the end of the stream
+                stop_event.set()
                             
         except Exception as e:
             logger.error(f"Bedrock streaming API error: {e}")
             raise Exception(f"Bedrock streaming API error: {e}")
     
+    def _invoke_model(self, model: str, body: str) -> Dict[str, Any]:
+        """Invoke a model and read its response body (runs on the executor)"""
+        response = self.client.invoke_model(modelId=model, body=body)
+        return json.loads(response['body'].read())
+    
+    def _stream_to_queue(
+        self,
+        model: str,
+        body: str,
+        queue: asyncio.Queue,
+        loop: asyncio.AbstractEventLoop,
+        stop_event: threading.Event
+    ):
+        """Read a Bedrock event stream and hand text chunks to the event loop (runs on the executor)"""
+        stream = None
+        try:
+            response = self.client.invoke_model_with_response_stream(modelId=model, body=body)
+            stream = response['body']
+            for event in stream:
+                if stop_event.is_set():
+                    break
+                chunk = json.loads(event['chunk']['bytes'].decode())
+                text = self._stream_chunk_text(chunk)
+                if text:
+                    loop.call_soon_threadsafe(queue.put_nowait, text)
+        except Exception as e:
+            loop.call_soon_threadsafe(queue.put_nowait, e)
+        finally:
+            if stream is not None and hasattr(stream, 'close'):
+                stream.close()
+            loop.call_soon_threadsafe(queue.put_nowait, _STREAM_END)
+    
+    def _stream_chunk_text(self, chunk: Dict[str, Any]) -> str:
+        """Extract the text from a streamed response chunk of any supported model family"""
+        # Anthropic messages API: incremental text arrives in content_block_delta events
+        if chunk.get('type') == 'content_block_delta':
+            return chunk.get('delta', {}).get('text', '')
+        if 'content' in chunk:
+            return ''.join(block.get('text', '') for block in chunk['content'] if isinstance(block, dict))
+        # Amazon Titan
+        if 'outputText' in chunk:
+            return chunk['outputText']
+        # Meta Llama
+        if 'generation' in chunk:
+            return chunk['generation']
+        return ''
+    
     def _messages_to_prompt(self, messages: List[Message]) -> str:
         """Convert messages to prompt format"""
         prompt = ""
@@ -27,16 +27,21 @@ class OllamaProvider(BaseLLMProvider):
                 - url: Ollama instance URL
                 - timeout: Request timeout (optional)
                 - default_model: Default model name (optional)
+                - native_tools: Send tool schemas to /api/chat (optional, needs
+                  Ollama 0.3+ and models trained for tool calling)
         """
         super().__init__("ollama", config)
         self.base_url = config.get("url", "http://localhost:11434").rstrip('/')
         self.timeout = config.get("timeout", 300)
         self.default_model = config.get("default_model", "llama3")
+        self.native_tools = config.get("native_tools", False)
         
         # Ollama-specific features
         self.config["supported_features"] = [
             "streaming", "chat", "generate", "embeddings", "model_management"
         ]
+        if self.native_tools:
+            self.config["supported_features"].append("tools")
     
     async def initialize(self) -> bool:
         """Initialize and test connection to Ollama"""
@@ -56,11 +61,11 @@ class OllamaProvider(BaseLLMProvider):
     async def health_check(self) -> bool:
         """Check if Ollama is accessible"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/api/tags") as response:
-                    is_healthy = response.status == 200
-                    logger.debug(f"Ollama health check: {'OK' if is_healthy else 'FAILED'}")
-                    return is_healthy
+            session = await self.get_session()
+            async with session.get(f"{self.base_url}/api/tags") as response:
+                is_healthy = response.status == 200
+                logger.debug(f"Ollama health check: {'OK' if is_healthy else 'FAILED'}")
+                return is_healthy
         except Exception as e:
             logger.warning(f"Ollama health check failed: {e}")
             return False
@@ -68,29 +73,29 @@ class OllamaProvider(BaseLLMProvider):
     async def list_models(self) -> List[ModelInfo]:
         """List available models in Ollama"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/api/tags") as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        models = []
-                        
-                        for model_data in result.get("models", []):
-                            model_info = ModelInfo(
-                                name=model_data["name"],
-                                provider="ollama",
-                                description=f"Ollama model: {model_data['name']}",
-                                context_length=self._estimate_context_length(model_data["name"]),
-                                supports_streaming=True,
-                                supports_tools=False,  # Ollama doesn't have native tool support
-                                model_type="chat"
-                            )
-                            models.append(model_info)
-                        
-                        logger.info(f"Found {len(models)} Ollama models")
-                        return models
-                    else:
-                        logger.error(f"Failed to list models: HTTP {response.status}")
-                        return []
+            session = await self.get_session()
+            async with session.get(f"{self.base_url}/api/tags") as response:
+                if response.status == 200:
+                    result = await response.json()
+                    models = []
+                    
+                    for model_data in result.get("models", []):
+                        model_info = ModelInfo(
+                            name=model_data["name"],
+                            provider="ollama",
+                            description=f"Ollama model: {model_data['name']}",
+                            context_length=self._estimate_context_length(model_data["name"]),
+                            supports_streaming=True,
+                            supports_tools=self.native_tools,
+                            model_type="chat"
+                        )
+                        models.append(model_info)
+                    
+                    logger.info(f"Found {len(models)} Ollama models")
+                    return models
+                else:
+                    logger.error(f"Failed to list models: HTTP {response.status}")
+                    return []
         except Exception as e:
             logger.error(f"Error listing Ollama models: {e}")
             return []
@@ -126,78 +131,78 @@ class OllamaProvider(BaseLLMProvider):
             config = GenerationConfig()
         
         try:
-            async with aiohttp.ClientSession() as session:
-                # Convert messages to Ollama format
-                if len(messages) == 1 and messages[0].role == "user":
-                    # Use generate endpoint for single prompt
-                    payload = {
-                        "model": model,
-                        "prompt": messages[0].content,
-                        "stream": False,
-                        "options": self._build_ollama_options(config)
-                    }
-                    url = f"{self.base_url}/api/generate"
-                else:
-                    # Use chat endpoint for conversation
-                    ollama_messages = []
-                    for msg in messages:
-                        ollama_messages.append({
-                            "role": msg.role,
-                            "content": msg.content
-                        })
-                    
-                    payload = {
-                        "model": model,
-                        "messages": ollama_messages,
-                        "stream": False,
-                        "options": self._build_ollama_options(config)
-                    }
-                    url = f"{self.base_url}/api/chat"
-                
-                logger.debug(f"Sending request to {url} with model {model}")
+            session = await self.get_session()
+            # Convert messages to Ollama format
+            if len(messages) == 1 and messages[0].role == "user" and not config.tools:
+                # Use generate endpoint for single prompt
+                payload = {
+                    "model": model,
+                    "prompt": messages[0].content,
+                    "stream": False,
+                    "options": self._build_ollama_options(config)
+                }
+                url = f"{self.base_url}/api/generate"
+            else:
+                # Use chat endpoint for conversation
+                ollama_messages = [self._format_chat_message(msg) for msg in messages]
                 
-                async with session.post(
-                    url, 
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        
-                        # Extract response content
-                        if "message" in result:
-                            content = result["message"].get("content", "")
-                        else:
-                            content = result.get("response", "")
-                        
-                        # Build usage information if available
-                        usage = {}
-                        if "eval_count" in result:
-                            usage["completion_tokens"] = result["eval_count"]
-                        if "prompt_eval_count" in result:
-                            usage["prompt_tokens"] = result["prompt_eval_count"]
-                        if usage:
-                            usage["total_tokens"] = usage.get("completion_tokens", 0) + usage.get("prompt_tokens", 0)
-                        
-                        return GenerationResponse(
-                            content=content,
-                            model=model,
-                            provider="ollama",
-                            usage=usage if usage else None,
-                            finish_reason=result.get("done_reason"),
-                            metadata={
-                                "total_duration": result.get("total_duration"),
-                                "load_duration": result.get("load_duration"),
-                                "eval_duration": result.get("eval_duration")
-                            }
-                        )
+                payload = {
+                    "model": model,
+                    "messages": ollama_messages,
+                    "stream": False,
+                    "options": self._build_ollama_options(config)
+                }
+                if config.tools:
+                    payload["tools"] = config.tools
+                url = f"{self.base_url}/api/chat"
+            
+            logger.debug(f"Sending request to {url} with model {model}")
+            
+            async with session.post(
+                url, 
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    
+                    # Extract response content
+                    tool_calls = None
+                    if "message" in result:
+                        content = result["message"].get("content", "")
+                        tool_calls = self._parse_tool_calls(result["message"])
                     else:
-                        error_text = await response.text()
-                        raise LLMProviderError(
-                            f"Ollama API error: {response.status} - {error_text}",
-                            provider="ollama"
-                        )
-                        
+                        content = result.get("response", "")
+                    
+                    # Build usage information if available
+                    usage = {}
+                    if "eval_count" in result:
+                        usage["completion_tokens"] = result["eval_count"]
+                    if "prompt_eval_count" in result:
+                        usage["prompt_tokens"] = result["prompt_eval_count"]
+                    if usage:
+                        usage["total_tokens"] = usage.get("completion_tokens", 0) + usage.get("prompt_tokens", 0)
+                    
+                    return GenerationResponse(
+                        content=content,
+                        model=model,
+                        provider="ollama",
+                        usage=usage if usage else None,
+                        finish_reason=result.get("done_reason"),
+                        tool_calls=tool_calls,
+                        metadata={
+                            "total_duration": result.get("total_duration"),
+                            "load_duration": result.get("load_duration"),
+                            "eval_duration": result.get("eval_duration")
+                        }
+                    )
+                else:
+                    error_text = await response.text()
+                    raise LLMProviderError(
+                        f"Ollama API error: {response.status} - {error_text}",
+                        provider="ollama"
+                    )
+                    
         except aiohttp.ClientError as e:
             logger.error(f"Network error communicating with Ollama: {e}")
             raise LLMProviderError(f"Failed to connect to Ollama: {e}", provider="ollama")
@@ -216,79 +221,84 @@ class OllamaProvider(BaseLLMProvider):
             config = GenerationConfig()
         
         try:
-            async with aiohttp.ClientSession() as session:
-                # Convert messages to Ollama format
-                if len(messages) == 1 and messages[0].role == "user":
-                    payload = {
-                        "model": model,
-                        "prompt": messages[0].content,
-                        "stream": True,
-                        "options": self._build_ollama_options(config)
-                    }
-                    url = f"{self.base_url}/api/generate"
-                else:
-                    ollama_messages = []
-                    for msg in messages:
-                        ollama_messages.append({
-                            "role": msg.role,
-                            "content": msg.content
-                        })
-                    
-                    payload = {
-                        "model": model,
-                        "messages": ollama_messages,
-                        "stream": True,
-                        "options": self._build_ollama_options(config)
-                    }
-                    url = f"{self.base_url}/api/chat"
+            session = await self.get_session()
+            # Convert messages to Ollama format
+            if len(messages) == 1 and messages[0].role == "user":
+                payload = {
+                    "model": model,
+                    "prompt": messages[0].content,
+                    "stream": True,
+                    "options": self._build_ollama_options(config)
+                }
+                url = f"{self.base_url}/api/generate"
+            else:
+                ollama_messages = [self._format_chat_message(msg) for msg in messages]
                 
-                async with session.post(
-                    url,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise LLMProviderError(
-                            f"Ollama streaming API error: {response.status} - {error_text}",
-                            provider="ollama"
-                        )
+                payload = {
+                    "model": model,
+                    "messages": ollama_messages,
+                    "stream": True,
+                    "options": self._build_ollama_options(config)
+                }
+                url = f"{self.base_url}/api/chat"
+            
+            async with session.post(
+                url,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise LLMProviderError(
+                        f"Ollama streaming API error: {response.status} - {error_text}",
+                        provider="ollama"
+                    )
+                
+                # Process streaming response
+                async for chunk in response.content.iter_chunked(1024):
+                    if not chunk:
+                        continue
+                    
+                    chunk_text = chunk.decode('utf-8', errors='ignore')
                     
-                    # Process streaming response
-                    async for chunk in response.content.iter_chunked(1024):
-                        if not chunk:
+                    for line in chunk_text.strip().split('\n'):
+                        if not line.strip():
                             continue
                         
-                        chunk_text = chunk.decode('utf-8', errors='ignore')
-                        
-                        for line in chunk_text.strip().split('\n'):
-                            if not line.strip():
-                                continue
+                        try:
+                            data = json.loads(line.strip())
                             
-                            try:
-                                data = json.loads(line.strip())
-                                
-                                # Extract content from response
-                                content = ""
-                                if "message" in data:
-                                    content = data["message"].get("content", "")
-                                elif "response" in data:
-                                    content = data.get("response", "")
-                                
-                                if content:
-                                    yield content
+                            # Extract content from response
+                            content = ""
+                            if "message" in data:
+                                content = data["message"].get("content", "")
+                            elif "response" in data:
+                                content = data.get("response", "")
+                            
+                            if content:
+                                yield content
+                            
+                            # Check if done
+                            if data.get("done", False):
+                                return
                                 
-                                # Check if done
-                                if data.get("done", False):
-                                    return
-                                    
-                            except json.JSONDecodeError:
-                                continue
-                        
+                        except json.JSONDecodeError:
+                            continue
+                    
         except Exception as e:
             logger.error(f"Error in Ollama streaming response: {e}")
             raise LLMProviderError(f"Streaming failed: {e}", provider="ollama")
     
+    def _format_chat_message(self, message: Message) -> Dict[str, Any]:
+        """Convert a message to the Ollama chat format, which takes tool arguments as objects"""
+        formatted = {"role": message.role, "content": message.content}
+        if message.tool_calls:
+            formatted["tool_calls"] = [
+                {"function": {"name": call.name, "arguments": call.arguments}}
+                for call in message.tool_calls
+            ]
+        return formatted
+    
     def _build_ollama_options(self, config: GenerationConfig) -> Dict[str, Any]:
         """Build Ollama-specific options from GenerationConfig"""
         options = {}
@@ -317,24 +327,24 @@ class OllamaProvider(BaseLLMProvider):
             True if successful, False otherwise
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                payload = {"name": model_name, "stream": False}
-                
-                logger.info(f"Starting to pull model: {model_name}")
-                
-                async with session.post(
-                    f"{self.base_url}/api/pull",
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=3600)  # 1 hour timeout
-                ) as response:
-                    if response.status == 200:
-                        logger.info(f"Successfully pulled model: {model_name}")
-                        return True
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Failed to pull model {model_name}: {error_text}")
-                        return False
-                        
+            session = await self.get_session()
+            payload = {"name": model_name, "stream": False}
+            
+            logger.info(f"Starting to pull model: {model_name}")
+            
+            async with session.post(
+                f"{self.base_url}/api/pull",
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=3600)  # 1 hour timeout
+            ) as response:
+                if response.status == 200:
+                    logger.info(f"Successfully pulled model: {model_name}")
+                    return True
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Failed to pull model {model_name}: {error_text}")
+                    return False
+                    
         except Exception as e:
             logger.error(f"Error pulling model {model_name}: {e}")
             return False
@@ -350,21 +360,21 @@ class OllamaProvider(BaseLLMProvider):
             True if successful, False otherwise
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                payload = {"name": model_name}
+            session = await self.get_session()
+            payload = {"name": model_name}
+            
+            async with session.delete(
+                f"{self.base_url}/api/delete",
+                json=payload
+            ) as response:
+                success = response.status == 200
+                if success:
+                    logger.info(f"Successfully deleted model: {model_name}")
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Failed to delete model {model_name}: {error_text}")
+                return success
                 
-                async with session.delete(
-                    f"{self.base_url}/api/delete",
-                    json=payload
-                ) as response:
-                    success = response.status == 200
-                    if success:
-                        logger.info(f"Successfully deleted model: {model_name}")
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Failed to delete model {model_name}: {error_text}")
-                    return success
-                    
         except Exception as e:
             logger.error(f"Error deleting model {model_name}: {e}")
             return False
@@ -377,6 +387,6 @@ class OllamaProvider(BaseLLMProvider):
             description=f"Ollama model: {model}",
             context_length=self._estimate_context_length(model),
             supports_streaming=True,
-            supports_tools=False,
+            supports_tools=self.native_tools,
             model_type="chat"
         )
\ No newline at end of file
@@ -113,19 +113,19 @@ class OpenAIProvider(BaseLLMProvider):
         try:
             headers = self._build_headers()
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/models",
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    is_healthy = response.status == 200
-                    if not is_healthy:
-                        error_text = await response.text()
-                        logger.warning(f"OpenAI health check failed: {response.status} - {error_text}")
-                    else:
-                        logger.debug("OpenAI health check: OK")
-                    return is_healthy
+            session = await self.get_session()
+            async with session.get(
+                f"{self.base_url}/models",
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                is_healthy = response.status == 200
+                if not is_healthy:
+                    error_text = await response.text()
+                    logger.warning(f"OpenAI health check failed: {response.status} - {error_text}")
+                else:
+                    logger.debug("OpenAI health check: OK")
+                return is_healthy
         except Exception as e:
             logger.warning(f"OpenAI health check failed: {e}")
             return False
@@ -135,38 +135,38 @@ class OpenAIProvider(BaseLLMProvider):
         try:
             headers = self._build_headers()
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/models",
-                    headers=headers
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        models = []
-                        
-                        for model_data in result.get("data", []):
-                            model_id = model_data["id"]
-                            
-                            # Use known model info if available, otherwise create basic info
-                            if model_id in self.known_models:
-                                models.append(self.known_models[model_id])
-                            else:
-                                model_info = ModelInfo(
-                                    name=model_id,
-                                    provider="openai",
-                                    description=f"OpenAI model: {model_id}",
-                                    context_length=self._estimate_context_length(model_id),
-                                    supports_streaming=True,
-                                    supports_tools="gpt" in model_id.lower(),
-                                    model_type="chat" if "gpt" in model_id else "text"
-                                )
-                                models.append(model_info)
+            session = await self.get_session()
+            async with session.get(
+                f"{self.base_url}/models",
+                headers=headers
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    models = []
+                    
+                    for model_data in result.get("data", []):
+                        model_id = model_data["id"]
                         
-                        logger.info(f"Found {len(models)} OpenAI models")
-                        return models
-                    else:
-                        await self._handle_api_error(response)
-                        return []
+                        # Use known model info if available, otherwise create basic info
+                        if model_id in self.known_models:
+                            models.append(self.known_models[model_id])
+                        else:
+                            model_info = ModelInfo(
+                                name=model_id,
+                                provider="openai",
+                                description=f"OpenAI model: {model_id}",
+                                context_length=self._estimate_context_length(model_id),
+                                supports_streaming=True,
+                                supports_tools="gpt" in model_id.lower(),
+                                model_type="chat" if "gpt" in model_id else "text"
+                            )
+                            models.append(model_info)
+                    
+                    logger.info(f"Found {len(models)} OpenAI models")
+                    return models
+                else:
+                    await self._handle_api_error(response)
+                    return []
         except Exception as e:
             logger.error(f"Error listing OpenAI models: {e}")
             return []
@@ -200,12 +200,7 @@ class OpenAIProvider(BaseLLMProvider):
             headers = self._build_headers()
             
             # Convert messages to OpenAI format
-            openai_messages = []
-            for msg in messages:
-                openai_messages.append({
-                    "role": msg.role,
-                    "content": msg.content
-                })
+            openai_messages = [self._format_chat_message(msg) for msg in messages]
             
             payload = {
                 "model": model,
@@ -214,40 +209,42 @@ class OpenAIProvider(BaseLLMProvider):
                 **self._build_openai_options(config)
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        
-                        choice = result["choices"][0]
-                        content = choice["message"]["content"]
-                        
-                        usage = result.get("usage", {})
-                        
-                        return GenerationResponse(
-                            content=content,
-                            model=result["model"],
-                            provider="openai",
-                            usage={
-                                "prompt_tokens": usage.get("prompt_tokens", 0),
-                                "completion_tokens": usage.get("completion_tokens", 0),
-                                "total_tokens": usage.get("total_tokens", 0)
-                            },
-                            finish_reason=choice.get("finish_reason"),
-                            metadata={
-                                "id": result.get("id"),
-                                "created": result.get("created"),
-                                "system_fingerprint": result.get("system_fingerprint")
-                            }
-                        )
-                    else:
-                        await self._handle_api_error(response)
-                        
+            session = await self.get_session()
+            async with session.post(
+                f"{self.base_url}/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    
+                    choice = result["choices"][0]
+                    # Content is null when the model only returns tool calls
+                    content = choice["message"].get("content") or ""
+                    
+                    usage = result.get("usage", {})
+                    
+                    return GenerationResponse(
+                        content=content,
+                        model=result["model"],
+                        provider="openai",
+                        usage={
+                            "prompt_tokens": usage.get("prompt_tokens", 0),
+                            "completion_tokens": usage.get("completion_tokens", 0),
+                            "total_tokens": usage.get("total_tokens", 0)
+                        },
+                        finish_reason=choice.get("finish_reason"),
+                        tool_calls=self._parse_tool_calls(choice["message"]),
+                        metadata={
+                            "id": result.get("id"),
+                            "created": result.get("created"),
+                            "system_fingerprint": result.get("system_fingerprint")
+                        }
+                    )
+                else:
+                    await self._handle_api_error(response)
+                    
         except Exception as e:
             logger.error(f"Error generating response with OpenAI: {e}")
             raise LLMProviderError(f"Generation failed: {e}", provider="openai")
@@ -266,12 +263,7 @@ class OpenAIProvider(BaseLLMProvider):
             headers = self._build_headers()
             
             # Convert messages to OpenAI format
-            openai_messages = []
-            for msg in messages:
-                openai_messages.append({
-                    "role": msg.role,
-                    "content": msg.content
-                })
+            openai_messages = [self._format_chat_message(msg) for msg in messages]
             
             payload = {
                 "model": model,
@@ -280,54 +272,54 @@ class OpenAIProvider(BaseLLMProvider):
                 **self._build_openai_options(config)
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    if response.status != 200:
-                        await self._handle_api_error(response)
-                        return
+            session = await self.get_session()
+            async with session.post(
+                f"{self.base_url}/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as response:
+                if response.status != 200:
+                    await self._handle_api_error(response)
+                    return
+                
+                # Process streaming response
+                async for chunk in response.content.iter_chunked(1024):
+                    if not chunk:
+                        continue
+                    
+                    chunk_text = chunk.decode('utf-8', errors='ignore')
                     
-                    # Process streaming response
-                    async for chunk in response.content.iter_chunked(1024):
-                        if not chunk:
+                    for line in chunk_text.strip().split('\n'):
+                        line = line.strip()
+                        if not line or not line.startswith('data: '):
                             continue
                         
-                        chunk_text = chunk.decode('utf-8', errors='ignore')
+                        # Remove 'data: ' prefix
+                        data_str = line[6:]
                         
-                        for line in chunk_text.strip().split('\n'):
-                            line = line.strip()
-                            if not line or not line.startswith('data: '):
-                                continue
-                            
-                            # Remove 'data: ' prefix
-                            data_str = line[6:]
-                            
-                            if data_str == '[DONE]':
-                                return
+                        if data_str == '[DONE]':
+                            return
+                        
+                        try:
+                            data = json.loads(data_str)
                             
-                            try:
-                                data = json.loads(data_str)
+                            if "choices" in data and data["choices"]:
+                                choice = data["choices"][0]
+                                delta = choice.get("delta", {})
                                 
-                                if "choices" in data and data["choices"]:
-                                    choice = data["choices"][0]
-                                    delta = choice.get("delta", {})
-                                    
-                                    if "content" in delta:
-                                        content = delta["content"]
-                                        if content:
-                                            yield content
+                                if "content" in delta:
+                                    content = delta["content"]
+                                    if content:
+                                        yield content
+                                
+                                # Check if done
+                                if choice.get("finish_reason"):
+                                    return
                                     
-                                    # Check if done
-                                    if choice.get("finish_reason"):
-                                        return
-                                        
-                            except json.JSONDecodeError:
-                                continue
-                        
+                        except json.JSONDecodeError:
+                            continue
+                    
         except Exception as e:
             logger.error(f"Error in OpenAI streaming response: {e}")
             raise LLMProviderError(f"Streaming failed: {e}", provider="openai")
@@ -360,6 +352,8 @@ class OpenAIProvider(BaseLLMProvider):
             options["presence_penalty"] = config.presence_penalty
         if config.stop_sequences:
             options["stop"] = config.stop_sequences
+        if config.tools:
+            options["tools"] = config.tools
         
         return options
     
@@ -71,19 +71,19 @@ class OpenRouterProvider(BaseLLMProvider):
         try:
             headers = self._build_headers()
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/models",
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    is_healthy = response.status == 200
-                    if not is_healthy:
-                        error_text = await response.text()
-                        logger.warning(f"OpenRouter health check failed: {response.status} - {error_text}")
-                    else:
-                        logger.debug("OpenRouter health check: OK")
-                    return is_healthy
+            session = await self.get_session()
+            async with session.get(
+                f"{self.base_url}/models",
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                is_healthy = response.status == 200
+                if not is_healthy:
+                    error_text = await response.text()
+                    logger.warning(f"OpenRouter health check failed: {response.status} - {error_text}")
+                else:
+                    logger.debug("OpenRouter health check: OK")
+                return is_healthy
         except Exception as e:
             logger.warning(f"OpenRouter health check failed: {e}")
             return False
@@ -100,39 +100,39 @@ class OpenRouterProvider(BaseLLMProvider):
             
             headers = self._build_headers()
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/models",
-                    headers=headers
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        models = []
-                        
-                        for model_data in result.get("data", []):
-                            model_id = model_data["id"]
-                            
-                            # Extract model information from OpenRouter response
-                            model_info = ModelInfo(
-                                name=model_id,
-                                provider="openrouter",
-                                description=model_data.get("name", model_id),
-                                context_length=model_data.get("context_length"),
-                                max_tokens=model_data.get("max_completion_tokens"),
-                                cost_per_1k_tokens=self._extract_cost(model_data),
-                                supports_streaming=True,  # OpenRouter generally supports streaming
-                                supports_tools=self._supports_tools(model_data),
-                                model_type="chat"
-                            )
-                            models.append(model_info)
-                            self.cached_models[model_id] = model_info
+            session = await self.get_session()
+            async with session.get(
+                f"{self.base_url}/models",
+                headers=headers
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    models = []
+                    
+                    for model_data in result.get("data", []):
+                        model_id = model_data["id"]
                         
-                        self.models_cache_time = current_time
-                        logger.info(f"Found {len(models)} OpenRouter models")
-                        return models
-                    else:
-                        await self._handle_api_error(response)
-                        return []
+                        # Extract model information from OpenRouter response
+                        model_info = ModelInfo(
+                            name=model_id,
+                            provider="openrouter",
+                            description=model_data.get("name", model_id),
+                            context_length=model_data.get("context_length"),
+                            max_tokens=model_data.get("max_completion_tokens"),
+                            cost_per_1k_tokens=self._extract_cost(model_data),
+                            supports_streaming=True,  # OpenRouter generally supports streaming
+                            supports_tools=self._supports_tools(model_data),
+                            model_type="chat"
+                        )
+                        models.append(model_info)
+                        self.cached_models[model_id] = model_info
+                    
+                    self.models_cache_time = current_time
+                    logger.info(f"Found {len(models)} OpenRouter models")
+                    return models
+                else:
+                    await self._handle_api_error(response)
+                    return []
         except Exception as e:
             logger.error(f"Error listing OpenRouter models: {e}")
             return []
@@ -180,12 +180,7 @@ class OpenRouterProvider(BaseLLMProvider):
             headers = self._build_headers()
             
             # Convert messages to OpenRouter format
-            openrouter_messages = []
-            for msg in messages:
-                openrouter_messages.append({
-                    "role": msg.role,
-                    "content": msg.content
-                })
+            openrouter_messages = [self._format_chat_message(msg) for msg in messages]
             
             payload = {
                 "model": model,
@@ -194,41 +189,43 @@ class OpenRouterProvider(BaseLLMProvider):
                 **self._build_openrouter_options(config)
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        
-                        choice = result["choices"][0]
-                        content = choice["message"]["content"]
-                        
-                        usage = result.get("usage", {})
-                        
-                        return GenerationResponse(
-                            content=content,
-                            model=result.get("model", model),
-                            provider="openrouter",
-                            usage={
-                                "prompt_tokens": usage.get("prompt_tokens", 0),
-                                "completion_tokens": usage.get("completion_tokens", 0),
-                                "total_tokens": usage.get("total_tokens", 0)
-                            },
-                            finish_reason=choice.get("finish_reason"),
-                            metadata={
-                                "id": result.get("id"),
-                                "created": result.get("created"),
-                                "provider_name": result.get("provider", {}).get("name"),
-                                "generation_time": result.get("provider", {}).get("generation_time")
-                            }
-                        )
-                    else:
-                        await self._handle_api_error(response)
-                        
+            session = await self.get_session()
+            async with session.post(
+                f"{self.base_url}/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    
+                    choice = result["choices"][0]
+                    # Content is null when the model only returns tool calls
+                    content = choice["message"].get("content") or ""
+                    
+                    usage = result.get("usage", {})
+                    
+                    return GenerationResponse(
+                        content=content,
+                        model=result.get("model", model),
+                        provider="openrouter",
+                        usage={
+                            "prompt_tokens": usage.get("prompt_tokens", 0),
+                            "completion_tokens": usage.get("completion_tokens", 0),
+                            "total_tokens": usage.get("total_tokens", 0)
+                        },
+                        finish_reason=choice.get("finish_reason"),
+                        tool_calls=self._parse_tool_calls(choice["message"]),
+                        metadata={
+                            "id": result.get("id"),
+                            "created": result.get("created"),
+                            "provider_name": result.get("provider", {}).get("name"),
+                            "generation_time": result.get("provider", {}).get("generation_time")
+                        }
+                    )
+                else:
+                    await self._handle_api_error(response)
+                    
         except Exception as e:
             logger.error(f"Error generating response with OpenRouter: {e}")
             raise LLMProviderError(f"Generation failed: {e}", provider="openrouter")
@@ -247,12 +244,7 @@ class OpenRouterProvider(BaseLLMProvider):
             headers = self._build_headers()
             
             # Convert messages to OpenRouter format
-            openrouter_messages = []
-            for msg in messages:
-                openrouter_messages.append({
-                    "role": msg.role,
-                    "content": msg.content
-                })
+            openrouter_messages = [self._format_chat_message(msg) for msg in messages]
             
             payload = {
                 "model": model,
@@ -261,54 +253,54 @@ class OpenRouterProvider(BaseLLMProvider):
                 **self._build_openrouter_options(config)
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    if response.status != 200:
-                        await self._handle_api_error(response)
-                        return
+            session = await self.get_session()
+            async with session.post(
+                f"{self.base_url}/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as response:
+                if response.status != 200:
+                    await self._handle_api_error(response)
+                    return
+                
+                # Process streaming response
+                async for chunk in response.content.iter_chunked(1024):
+                    if not chunk:
+                        continue
                     
-                    # Process streaming response
-                    async for chunk in response.content.iter_chunked(1024):
-                        if not chunk:
+                    chunk_text = chunk.decode('utf-8', errors='ignore')
+                    
+                    for line in chunk_text.strip().split('\n'):
+                        line = line.strip()
+                        if not line or not line.startswith('data: '):
                             continue
                         
-                        chunk_text = chunk.decode('utf-8', errors='ignore')
+                        # Remove 'data: ' prefix
+                        data_str = line[6:]
                         
-                        for line in chunk_text.strip().split('\n'):
-                            line = line.strip()
-                            if not line or not line.startswith('data: '):
-                                continue
-                            
-                            # Remove 'data: ' prefix
-                            data_str = line[6:]
-                            
-                            if data_str == '[DONE]':
-                                return
+                        if data_str == '[DONE]':
+                            return
+                        
+                        try:
+                            data = json.loads(data_str)
                             
-                            try:
-                                data = json.loads(data_str)
+                            if "choices" in data and data["choices"]:
+                                choice = data["choices"][0]
+                                delta = choice.get("delta", {})
                                 
-                                if "choices" in data and data["choices"]:
-                                    choice = data["choices"][0]
-                                    delta = choice.get("delta", {})
-                                    
-                                    if "content" in delta:
-                                        content = delta["content"]
-                                        if content:
-                                            yield content
+                                if "content" in delta:
+                                    content = delta["content"]
+                                    if content:
+                                        yield content
+                                
+                                # Check if done
+                                if choice.get("finish_reason"):
+                                    return
                                     
-                                    # Check if done
-                                    if choice.get("finish_reason"):
-                                        return
-                                        
-                            except json.JSONDecodeError:
-                                continue
-                        
+                        except json.JSONDecodeError:
+                            continue
+                    
         except Exception as e:
             logger.error(f"Error in OpenRouter streaming response: {e}")
             raise LLMProviderError(f"Streaming failed: {e}", provider="openrouter")
@@ -340,6 +332,8 @@ class OpenRouterProvider(BaseLLMProvider):
             options["presence_penalty"] = config.presence_penalty
         if config.stop_sequences:
             options["stop"] = config.stop_sequences
+        if config.tools:
+            options["tools"] = config.tools
         
         return options
     
@@ -457,15 +451,15 @@ class OpenRouterProvider(BaseLLMProvider):
         try:
             headers = self._build_headers()
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/models/{model}",
-                    headers=headers
-                ) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        return None
+            session = await self.get_session()
+            async with session.get(
+                f"{self.base_url}/models/{model}",
+                headers=headers
+            ) as response:
+                if response.status == 200:
+                    return await response.json()
+                else:
+                    return None
         except Exception as e:
             logger.error(f"Error getting model pricing for {model}: {e}")
             return None
\ No newline at end of file
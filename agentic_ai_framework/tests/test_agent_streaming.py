@@ -0,0 +1,87 @@
+"""
+Tests for streamed agent execution
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from managers.agent_manager import AgentManager
+
+
+async def chunks(*parts):
+    for part in parts:
+        yield part
+
+
+class FakeProvider:
+    """Provider stub streaming the final answer"""
+
+    def generate_response_stream(self, messages, model, config):
+        return chunks("The answer ", "is 2.")
+
+
+class FakeLLMManager:
+    """LLM manager stub streaming a tool call on the first request"""
+
+    def __init__(self):
+        self.provider = FakeProvider()
+
+    async def generate_response(self, prompt, model=None, chat_history=None, stream=False, **kwargs):
+        assert stream
+        return chunks("TOOL_CALL: ", "calculator(expression=1+1)")
+
+    def _resolve_model(self, model):
+        return "fake", model
+
+    def get_provider(self, name):
+        return self.provider
+
+    def supports_tool_calling(self, model):
+        return False
+
+
+class FakeToolManager:
+    async def execute_tool(self, tool_name, parameters, agent_name=None):
+        return 2
+
+    def get_tool_instance(self, tool_name):
+        return None
+
+
+@pytest.fixture
+def agent_manager():
+    memory_manager = Mock()
+    memory_manager.get_agent.return_value = {
+        "name": "math", "role": "Calculator", "goals": "Compute", "backstory": "",
+        "tools": ["calculator"], "ollama_model": "fake-model", "enabled": True,
+    }
+    memory_manager.get_agent_memory.return_value = []
+    memory_manager.get_tool_availability.return_value = {"calculator": True}
+    config = SimpleNamespace(max_agent_memory_entries=5, max_agent_iterations=3, default_model="fake-model")
+    return AgentManager(FakeLLMManager(), memory_manager, FakeToolManager(), config)
+
+
+class TestAgentStreaming:
+    """Test agent progress events"""
+
+    @pytest.mark.asyncio
+    async def test_events_in_order(self, agent_manager):
+        """Test that tokens, tool events and the final result are emitted in order"""
+        events = [event async for event in agent_manager.stream_agent_events("math", "What is 1+1?")]
+
+        names = [event["event"] for event in events]
+        assert names == ["token", "token", "tool_call", "tool_result", "token", "token", "final"]
+        assert events[2]["data"]["tool"] == "calculator"
+        assert events[3]["data"]["result"] == 2
+        assert events[-1]["data"]["result"] == "The answer is 2."
+
+    @pytest.mark.asyncio
+    async def test_error_event(self, agent_manager):
+        """Test that a failed execution ends the stream with an error event"""
+        agent_manager.memory_manager.get_agent.return_value = None
+
+        events = [event async for event in agent_manager.stream_agent_events("missing", "task")]
+
+        assert events == [{"event": "error", "data": {"error": "Agent missing not found"}}]
@@ -0,0 +1,130 @@
+"""
+Tests for executing the tool calls of an agent response
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from managers.agent_manager import AgentManager
+
+
+class SleepyTool:
+    def __init__(self, parallel_safe=True, timeout=None):
+        self.parallel_safe = parallel_safe
+        self.timeout = timeout
+
+
+class SleepyToolManager:
+    """Tool manager stub whose calls sleep for the requested delay"""
+
+    def __init__(self, tools):
+        self.tools = tools
+        self.active = 0
+        self.max_active = 0
+        self.finished = []
+
+    def get_tool_instance(self, tool_name):
+        return self.tools.get(tool_name)
+
+    async def execute_tool(self, tool_name, parameters, agent_name=None):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(parameters["delay"])
+            if parameters.get("fail"):
+                raise RuntimeError("boom")
+            self.finished.append(parameters["id"])
+            return parameters["id"]
+        finally:
+            self.active -= 1
+
+
+def make_agent_manager(tool_manager, concurrency=4, timeout=0):
+    config = SimpleNamespace(
+        max_agent_memory_entries=5, max_agent_iterations=3, default_model="fake-model",
+        agent_tool_concurrency=concurrency, tool_call_timeout=timeout
+    )
+    return AgentManager(Mock(), Mock(), tool_manager, config)
+
+
+def call(tool_name, id, delay, **extra):
+    return {"tool_name": tool_name, "parameters": {"id": id, "delay": delay, **extra}}
+
+
+class TestConcurrentToolCalls:
+    """Test concurrent tool call execution"""
+
+    @pytest.mark.asyncio
+    async def test_calls_overlap_and_keep_order(self):
+        """Test that independent calls run together and results keep call order"""
+        tool_manager = SleepyToolManager({"monitor": SleepyTool()})
+        agent_manager = make_agent_manager(tool_manager)
+
+        start = time.monotonic()
+        results = await agent_manager._execute_tool_calls(
+            [call("monitor", "a", 0.15), call("monitor", "b", 0.05), call("monitor", "c", 0.1)], "agent", 1
+        )
+
+        assert time.monotonic() - start < 0.3
+        assert tool_manager.finished == ["b", "c", "a"]
+        assert [result["result"] for result in results] == ["a", "b", "c"]
+        logged = [c.args[2] for c in agent_manager.memory_manager.add_memory_entry.call_args_list]
+        assert logged == [f"Tool: monitor\nResult: {id}" for id in "abc"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """Test that an agent runs at most agent_tool_concurrency calls at once"""
+        tool_manager = SleepyToolManager({"monitor": SleepyTool()})
+        agent_manager = make_agent_manager(tool_manager, concurrency=2)
+
+        await agent_manager._execute_tool_calls([call("monitor", i, 0.02) for i in range(5)], "agent", 1)
+
+        assert tool_manager.max_active == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_batches_share_limit(self):
+        """Test that overlapping tool call batches of one agent share its limit, which is dropped afterwards"""
+        tool_manager = SleepyToolManager({"monitor": SleepyTool()})
+        agent_manager = make_agent_manager(tool_manager, concurrency=2)
+
+        await asyncio.gather(*(
+            agent_manager._execute_tool_calls([call("monitor", i, 0.02) for i in range(3)], "agent", 1)
+            for _ in range(2)
+        ))
+
+        assert tool_manager.max_active == 2
+        assert agent_manager._tool_semaphores == {}
+        assert agent_manager._tool_semaphore_users == {}
+
+    @pytest.mark.asyncio
+    async def test_unsafe_tool_runs_alone(self):
+        """Test that a call to a tool that is not parallel safe runs after the calls before it"""
+        tool_manager = SleepyToolManager({"monitor": SleepyTool(), "vault": SleepyTool(parallel_safe=False)})
+        agent_manager = make_agent_manager(tool_manager)
+
+        await agent_manager._execute_tool_calls(
+            [call("monitor", "a", 0.05), call("vault", "b", 0.01), call("monitor", "c", 0.01)], "agent", 1
+        )
+
+        assert tool_manager.finished == ["a", "b", "c"]
+        assert tool_manager.max_active == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_errors_isolated(self):
+        """Test that a slow or failing call reports an error without affecting the others"""
+        tool_manager = SleepyToolManager({"monitor": SleepyTool(), "slow": SleepyTool(timeout=0.05)})
+        agent_manager = make_agent_manager(tool_manager, timeout=5)
+
+        results = await agent_manager._execute_tool_calls(
+            [call("slow", "a", 1), call("monitor", "b", 0.01, fail=True), call("monitor", "c", 0.01)], "agent", 1
+        )
+
+        assert results == [
+            {"tool": "slow", "error": "Timed out after 0.05s"},
+            {"tool": "monitor", "error": "boom"},
+            {"tool": "monitor", "result": "c"},
+        ]
@@ -0,0 +1,67 @@
+"""
+Tests for the async memory manager facade
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from managers.memory_manager import AsyncMemoryManager, MemoryManager
+
+
+@pytest.fixture
+def memory_manager(tmp_path):
+    manager = MemoryManager(str(tmp_path / "test.db"))
+    manager.initialize_database()
+    yield manager
+    manager.close()
+
+
+class TestAsyncMemoryManager:
+    """Test offloading memory manager calls to database threads"""
+
+    @pytest.mark.asyncio
+    async def test_calls_run_on_database_threads(self, memory_manager):
+        """Test that calls return the manager's results from a database thread"""
+        async_memory = AsyncMemoryManager(memory_manager)
+
+        await async_memory.add_memory_entry("agent", "user", "hello")
+        entries = await async_memory.get_agent_memory("agent", limit=5)
+
+        assert [entry["content"] for entry in entries] == ["hello"]
+
+        thread_name = await asyncio.get_running_loop().run_in_executor(
+            memory_manager.executor, lambda: threading.current_thread().name
+        )
+        assert thread_name.startswith("memory-db")
+
+    @pytest.mark.asyncio
+    async def test_slow_calls_do_not_block_event_loop(self):
+        """Test that other coroutines keep running during a database call"""
+        manager = Mock()
+        manager.get_agent.side_effect = lambda name: time.sleep(0.2) or {"name": name}
+        async_memory = AsyncMemoryManager(manager)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        agent = await async_memory.get_agent("agent")
+        ticking.cancel()
+
+        assert agent == {"name": "agent"}
+        assert ticks >= 10
+
+    def test_attributes_are_not_offloaded(self, memory_manager):
+        """Test that only methods are exposed as coroutines"""
+        async_memory = AsyncMemoryManager(memory_manager)
+
+        with pytest.raises(AttributeError):
+            async_memory.database_path
@@ -26,6 +26,7 @@ class TestConfig:
             assert config.clear_memory_on_startup is False
             assert config.memory_cleanup_interval == 3600
             assert config.memory_retention_days == 7
+            assert config.tool_call_timeout == 0
     
     def test_environment_override(self):
         """Test environment variable overrides"""
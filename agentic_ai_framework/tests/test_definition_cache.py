@@ -0,0 +1,102 @@
+"""
+Tests for the definition cache
+"""
+
+import time
+
+import pytest
+
+from managers.definition_cache import DefinitionCache
+from managers.memory_manager import MemoryManager
+
+
+@pytest.fixture
+def memory_manager(tmp_path):
+    manager = MemoryManager(str(tmp_path / "test.db"), definition_cache_ttl=300)
+    manager.initialize_database()
+    manager.register_agent("agent", "Role", "Goals", "Backstory", tools=["http_client"])
+    manager.register_tool("http_client", "HTTP client", {}, "HttpClientTool", configuration={"timeout": 5})
+    yield manager
+    manager.close()
+
+
+class TestDefinitionCache:
+    """Test caching agent, tool and workflow definitions"""
+
+    def test_repeated_reads_hit_cache(self, memory_manager):
+        """Test that only the first read of a definition goes to the database"""
+        for _ in range(3):
+            assert memory_manager.get_agent("agent")["role"] == "Role"
+
+        stats = memory_manager.definition_cache.get_stats()["kinds"]["agent"]
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+
+    def test_missing_definitions_cached(self, memory_manager):
+        """Test that lookups of unknown names are cached too"""
+        assert memory_manager.get_tool("unknown") is None
+        assert memory_manager.get_tool("unknown") is None
+
+        assert memory_manager.definition_cache.get_stats()["kinds"]["tool"]["hits"] == 1
+
+    def test_updates_invalidate(self, memory_manager):
+        """Test that writes are visible to the next read"""
+        memory_manager.get_agent("agent")
+        memory_manager.get_tool_configuration("http_client")
+
+        memory_manager.update_agent("agent", {"role": "New role"})
+        memory_manager.set_tool_configuration("http_client", {"timeout": 30})
+
+        assert memory_manager.get_agent("agent")["role"] == "New role"
+        assert memory_manager.get_tool_configuration("http_client") == {"timeout": 30}
+
+        memory_manager.delete_agent("agent")
+        assert memory_manager.get_agent("agent") is None
+
+    def test_reads_return_copies(self, memory_manager):
+        """Test that modifying a returned definition does not change the cached one"""
+        memory_manager.get_agent("agent")["tools"].append("other")
+
+        assert memory_manager.get_agent("agent")["tools"] == ["http_client"]
+
+    def test_load_racing_invalidation_not_cached(self):
+        """Test that a value loaded while its kind was invalidated is not cached"""
+        cache = DefinitionCache(ttl=300)
+
+        def load():
+            cache.invalidate("agent")
+            return "stale"
+
+        assert cache.get("agent", "agent", load) == "stale"
+        assert cache.get("agent", "agent", lambda: "fresh") == "fresh"
+
+    def test_disabled(self):
+        """Test that a zero TTL always loads"""
+        cache = DefinitionCache(ttl=0)
+        calls = []
+
+        for _ in range(2):
+            cache.get("agent", "agent", lambda: calls.append(1))
+
+        assert len(calls) == 2
+
+    def test_least_recently_used_evicted(self):
+        """Test that lookups of many names keep at most max_entries cached"""
+        cache = DefinitionCache(ttl=300, max_entries=2)
+        cache.get("tool", "first", lambda: None)
+        cache.get("tool", "second", lambda: None)
+        cache.get("tool", "first", lambda: None)
+        cache.get("tool", "missing", lambda: None)
+
+        assert list(cache._entries) == [("tool", "first"), ("tool", "missing")]
+
+    def test_expired_entry_dropped(self, monkeypatch):
+        """Test that an expired entry is removed and reloaded"""
+        cache = DefinitionCache(ttl=10)
+        cache.get("tool", "gone", lambda: None)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 60)
+
+        assert cache.get("tool", "gone", lambda: "back") == "back"
+        assert cache.get_stats()["kinds"]["tool"]["misses"] == 2
+        assert cache._entries[("tool", "gone")][1] == "back"
@@ -0,0 +1,84 @@
+"""
+Tests for batched IMAP email listing
+"""
+
+import imaplib
+
+import pytest
+
+from tools.email_checker import EmailCheckerTool
+
+
+def headers(subject: str) -> bytes:
+    return f"Subject: {subject}\r\nFrom: sender@example.com\r\nTo: me@example.com\r\n\r\n".encode()
+
+
+class FakeIMAP:
+    """IMAP connection answering UID SEARCH and UID FETCH from canned responses"""
+
+    commands = []
+
+    def __init__(self, host, port):
+        pass
+
+    def login(self, username, password):
+        return "OK", [b"Logged in"]
+
+    def select(self, folder):
+        return "OK", [b"3"]
+
+    def uid(self, command, *args):
+        FakeIMAP.commands.append((command, args))
+        if command == "SEARCH":
+            return "OK", [b"7 8 9"]
+        if "BODY.PEEK[]" in args[1]:
+            return "OK", [(b"3 (UID 9 BODY[] {10}", headers("Third") + b"Body text"), b")"]
+        return "OK", [
+            (b"2 (UID 8 FLAGS (\\Seen) RFC822.SIZE 2048 BODY[HEADER.FIELDS (SUBJECT FROM TO DATE)] {60}",
+             headers("Second")),
+            b")",
+            # Some servers send FLAGS after the header literal
+            (b"3 (UID 9 RFC822.SIZE 512 BODY[HEADER.FIELDS (SUBJECT FROM TO DATE)] {59}", headers("Third")),
+            b" FLAGS ())",
+        ]
+
+    def logout(self):
+        pass
+
+
+@pytest.fixture
+def tool(monkeypatch):
+    FakeIMAP.commands = []
+    monkeypatch.setattr(imaplib, "IMAP4", FakeIMAP)
+    tool = EmailCheckerTool()
+    tool.set_config({
+        "imap_host": "localhost", "imap_username": "me", "imap_password": "secret", "imap_use_ssl": False
+    })
+    return tool
+
+
+class TestEmailChecker:
+    """Test IMAP listing and reading by UID"""
+
+    @pytest.mark.asyncio
+    async def test_listing_fetches_headers_in_one_command(self, tool):
+        """Test that listing fetches only headers of the whole range in a single FETCH"""
+        result = await tool.execute({"action": "check_emails", "limit": 2})
+
+        fetches = [args for command, args in FakeIMAP.commands if command == "FETCH"]
+        assert len(fetches) == 1
+        assert fetches[0][0] == "8,9"
+        assert "BODY.PEEK[HEADER.FIELDS (SUBJECT FROM TO DATE)]" in fetches[0][1]
+        assert [(email["id"], email["subject"], email["read"], email["size"]) for email in result["emails"]] == [
+            ("8", "Second", True, 2048),
+            ("9", "Third", False, 512),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_read_fetches_full_message_by_uid(self, tool):
+        """Test that reading an email fetches its full body by the UID from the listing"""
+        result = await tool.execute({"action": "read_email", "email_id": "9"})
+
+        assert FakeIMAP.commands == [("FETCH", ("9", "(BODY.PEEK[] FLAGS)"))]
+        assert result["email"]["subject"] == "Third"
+        assert result["email"]["body_text"] == "Body text"
@@ -0,0 +1,146 @@
+"""
+Tests for job manager
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from managers.job_manager import JobManager, JobManagerNotRunningError, JobQueueFullError
+
+
+class FakeAgentManager:
+    """Agent manager stub whose executions wait until released"""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+
+    async def execute_agent(self, agent_name, task, context):
+        await self.release.wait()
+        if task == "fail":
+            raise RuntimeError("agent failed")
+        return f"{agent_name} did {task}"
+
+
+def make_manager(agent_manager, workers=1, queue_size=10):
+    config = SimpleNamespace(job_workers=workers, job_queue_max_size=queue_size, job_result_ttl=3600)
+    return JobManager(agent_manager, None, config)
+
+
+async def wait_for_status(manager, job_id, status):
+    for _ in range(100):
+        if manager.get_job(job_id)["status"] == status:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"job {job_id} never reached {status}")
+
+
+class TestJobManager:
+    """Test job queueing, results and cancellation"""
+
+    @pytest.mark.asyncio
+    async def test_job_result(self):
+        """Test that a submitted job runs and stores its result"""
+        agent_manager = FakeAgentManager()
+        manager = make_manager(agent_manager)
+        await manager.start()
+
+        job = manager.submit_agent_job("writer", "a summary")
+        assert job["status"] == "queued"
+
+        agent_manager.release.set()
+        await wait_for_status(manager, job["id"], "completed")
+        assert manager.get_job(job["id"])["result"] == "writer did a summary"
+
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_job(self):
+        """Test that a failing job records its error"""
+        agent_manager = FakeAgentManager()
+        agent_manager.release.set()
+        manager = make_manager(agent_manager)
+        await manager.start()
+
+        job = manager.submit_agent_job("writer", "fail")
+
+        await wait_for_status(manager, job["id"], "failed")
+        assert manager.get_job(job["id"])["error"] == "agent failed"
+
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_queue_full(self):
+        """Test that submissions beyond the queue size are rejected"""
+        manager = make_manager(FakeAgentManager(), workers=1, queue_size=1)
+        await manager.start()
+
+        running = manager.submit_agent_job("writer", "first")
+        await wait_for_status(manager, running["id"], "running")
+        manager.submit_agent_job("writer", "second")
+
+        with pytest.raises(JobQueueFullError):
+            manager.submit_agent_job("writer", "third")
+
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_jobs_free_queue_capacity(self):
+        """Test that cancelled queued jobs do not count toward the queue size"""
+        agent_manager = FakeAgentManager()
+        manager = make_manager(agent_manager, workers=1, queue_size=1)
+        await manager.start()
+
+        running = manager.submit_agent_job("writer", "first")
+        await wait_for_status(manager, running["id"], "running")
+        for task in ("second", "third"):
+            queued = manager.submit_agent_job("writer", task)
+            manager.cancel_job(queued["id"])
+        last = manager.submit_agent_job("writer", "fourth")
+
+        assert manager.get_stats()["queue_size"] == 1
+        agent_manager.release.set()
+        await wait_for_status(manager, last["id"], "completed")
+        assert manager.get_stats()["queue_size"] == 0
+
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_and_queued_jobs(self):
+        """Test that cancellation stops a running job and skips a queued one"""
+        agent_manager = FakeAgentManager()
+        manager = make_manager(agent_manager, workers=1)
+        await manager.start()
+
+        running = manager.submit_agent_job("writer", "first")
+        queued = manager.submit_agent_job("writer", "second")
+        await wait_for_status(manager, running["id"], "running")
+
+        manager.cancel_job(running["id"])
+        manager.cancel_job(queued["id"])
+        await wait_for_status(manager, running["id"], "cancelled")
+
+        assert manager.get_job(queued["id"])["status"] == "cancelled"
+        assert manager.get_job(queued["id"])["started_at"] is None
+
+        # The worker is still available for new jobs
+        agent_manager.release.set()
+        job = manager.submit_agent_job("writer", "third")
+        await wait_for_status(manager, job["id"], "completed")
+
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_submit_when_not_running(self):
+        """Test that submitting before start or after stop raises a not running error"""
+        manager = make_manager(FakeAgentManager())
+
+        with pytest.raises(JobManagerNotRunningError):
+            manager.submit_agent_job("writer", "early")
+
+        await manager.start()
+        await manager.stop()
+
+        with pytest.raises(JobManagerNotRunningError):
+            manager.submit_agent_job("writer", "late")
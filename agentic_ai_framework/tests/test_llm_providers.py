@@ -0,0 +1,139 @@
+"""
+Tests for LLM provider connection handling
+"""
+
+import io
+import json
+import threading
+
+import pytest
+
+from providers.base_llm_provider import Message
+from providers.bedrock_provider import BedrockProvider
+from providers.ollama_provider import OllamaProvider
+from providers.openai_provider import OpenAIProvider
+
+
+class TestProviderSessions:
+    """Test shared HTTP session lifecycle"""
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused(self):
+        """Test that the provider reuses one session across calls"""
+        provider = OllamaProvider({"url": "http://localhost:11434"})
+
+        session = await provider.get_session()
+        assert await provider.get_session() is session
+
+        await provider.close()
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_pool_settings_applied(self):
+        """Test that connection pool settings are passed to the connector"""
+        provider = OpenAIProvider({
+            "api_key": "test-key",
+            "connection_pool": {"limit": 20, "limit_per_host": 5}
+        })
+
+        session = await provider.get_session()
+        assert session.connector.limit == 20
+        assert session.connector.limit_per_host == 5
+
+        await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_session_recreated_after_close(self):
+        """Test that a closed session is replaced on next use"""
+        provider = OllamaProvider({"url": "http://localhost:11434"})
+
+        first = await provider.get_session()
+        await provider.close()
+        second = await provider.get_session()
+
+        assert second is not first
+        assert not second.closed
+
+        await provider.close()
+
+
+class FakeBedrockClient:
+    """Minimal stand-in for the boto3 bedrock-runtime client"""
+
+    def __init__(self):
+        self.call_threads = []
+
+    def invoke_model(self, modelId, body):
+        self.call_threads.append(threading.current_thread().name)
+        payload = {"content": [{"text": "hello"}], "usage": {"input_tokens": 3, "output_tokens": 1}}
+        return {"body": io.BytesIO(json.dumps(payload).encode())}
+
+    def invoke_model_with_response_stream(self, modelId, body):
+        self.call_threads.append(threading.current_thread().name)
+        events = [
+            {"chunk": {"bytes": json.dumps({"content": [{"text": part}]}).encode()}}
+            for part in ("one ", "two ", "three")
+        ]
+        return {"body": iter(events)}
+
+
+class TestBedrockExecutor:
+    """Test that Bedrock calls run off the event loop"""
+
+    @pytest.mark.asyncio
+    async def test_generate_runs_on_executor(self):
+        """Test that invoke_model runs on the provider worker pool"""
+        provider = BedrockProvider("bedrock", {"max_workers": 2})
+        provider.client = FakeBedrockClient()
+
+        response = await provider.generate_response(
+            [Message(role="user", content="hi")], "anthropic.claude-3-haiku-20240307-v1:0"
+        )
+
+        assert response.content == "hello"
+        assert response.usage["total_tokens"] == 4
+        assert provider.client.call_threads[0].startswith("bedrock-worker")
+
+        await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_stream_bridged_through_queue(self):
+        """Test that streamed chunks arrive in order through the async generator"""
+        provider = BedrockProvider("bedrock", {})
+        provider.client = FakeBedrockClient()
+
+        chunks = [
+            chunk async for chunk in provider.generate_response_stream(
+                [Message(role="user", content="hi")], "anthropic.claude-3-haiku-20240307-v1:0"
+            )
+        ]
+
+        assert chunks == ["one ", "two ", "three"]
+        assert provider.client.call_threads[0].startswith("bedrock-worker")
+
+        await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_stream_parses_message_deltas(self):
+        """Test that Anthropic messages API stream deltas are yielded as text"""
+        provider = BedrockProvider("bedrock", {})
+        provider.client = FakeBedrockClient()
+        events = [
+            {"type": "message_start", "message": {"role": "assistant"}},
+            {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "Hel"}},
+            {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "lo"}},
+            {"type": "message_stop"},
+        ]
+        provider.client.invoke_model_with_response_stream = lambda modelId, body: {
+            "body": iter({"chunk": {"bytes": json.dumps(event).encode()}} for event in events)
+        }
+
+        chunks = [
+            chunk async for chunk in provider.generate_response_stream(
+                [Message(role="user", content="hi")], "anthropic.claude-3-haiku-20240307-v1:0"
+            )
+        ]
+
+        assert chunks == ["Hel", "lo"]
+
+        await provider.close()
@@ -0,0 +1,98 @@
+"""
+Tests for payload logging utilities
+"""
+
+import logging
+
+import pytest
+
+from managers.log_utils import PayloadLogger, Preview, log_verbosity, parse_level, summarize
+from models import AgentExecutionRequest, ToolExecutionRequest, WorkflowExecutionRequest
+
+
+class ExplodingStr:
+    """Value that fails the test if it is ever stringified"""
+
+    def __str__(self):
+        raise AssertionError("payload rendered while logging was disabled")
+
+
+@pytest.fixture
+def payload_logger():
+    logger = logging.getLogger("tests.payload")
+    logger.setLevel(logging.INFO)
+    return PayloadLogger(logger)
+
+
+class TestSummarize:
+    """Test size-bounded payload rendering"""
+
+    def test_long_string_truncated(self):
+        """Test that long strings are cut and annotated with their length"""
+        assert summarize("x" * 50, 10) == "x" * 10 + "... [50 chars]"
+
+    def test_large_collections_summarized(self):
+        """Test that rendering stops once the budget is spent"""
+        text = summarize({"items": list(range(10000)), "other": 1}, 50)
+
+        assert len(text) < 150
+        assert "more items" in text
+        assert "(+1 more keys)" in text
+
+    def test_no_limit(self):
+        """Test that a zero limit renders the full value"""
+        assert summarize({"a": "x" * 50}, 0) == str({"a": "x" * 50})
+
+
+class TestPayloadLogger:
+    """Test lazy payload logging"""
+
+    def test_payload_not_rendered_when_disabled(self, payload_logger, caplog):
+        """Test that debug payloads are never stringified at INFO"""
+        with caplog.at_level(logging.INFO, logger="tests.payload"):
+            payload_logger.debug("Step", step=ExplodingStr())
+
+        assert caplog.records == []
+
+    def test_payload_kept_on_record(self, payload_logger, caplog):
+        """Test that emitted records carry the raw payload and a bounded message"""
+        with caplog.at_level(logging.INFO, logger="tests.payload"):
+            payload_logger.info("Tool result", result="y" * 5000)
+
+        record = caplog.records[0]
+        assert record.payload == {"result": "y" * 5000}
+        assert len(record.getMessage()) < 1100
+        assert record.funcName == "test_payload_kept_on_record"
+
+    def test_request_verbosity_override(self, payload_logger, caplog):
+        """Test that a per-request verbosity lowers and raises the threshold"""
+        caplog.handler.setLevel(logging.NOTSET)
+        with log_verbosity("debug"):
+            payload_logger.debug("shown", value=1)
+        with log_verbosity("WARNING"):
+            payload_logger.info("hidden", value=ExplodingStr())
+
+        assert [record.getMessage() for record in caplog.records] == ["shown: value=1"]
+
+    def test_invalid_verbosity(self):
+        """Test that unknown verbosity names are rejected"""
+        with pytest.raises(ValueError):
+            with log_verbosity("loud"):
+                pass
+        with pytest.raises(ValueError):
+            parse_level("loud")
+        assert parse_level("debug") == logging.DEBUG
+
+    def test_request_models_validate_verbosity(self):
+        """Test that execution requests normalize and validate log_verbosity"""
+        assert AgentExecutionRequest(task="t", log_verbosity="debug").log_verbosity == "DEBUG"
+        assert WorkflowExecutionRequest().log_verbosity is None
+        with pytest.raises(ValueError, match="log verbosity"):
+            ToolExecutionRequest(parameters={}, log_verbosity="loud")
+
+    def test_preview_is_lazy(self):
+        """Test that a preview only renders when formatted"""
+        preview = Preview(ExplodingStr())
+
+        with pytest.raises(AssertionError):
+            str(preview)
@@ -0,0 +1,202 @@
+"""
+Tests for the shared IMAP/SMTP connection pool
+"""
+
+import asyncio
+import imaplib
+import threading
+
+import pytest
+
+from tools.mail_pool import MailConnectionPool
+
+ACCOUNT = {"host": "localhost", "port": 143, "username": "me", "password": "secret", "use_ssl": False}
+
+
+class FakeIMAP:
+    """IMAP connection recording logins, NOOPs and logouts"""
+
+    error = imaplib.IMAP4.error
+    abort = imaplib.IMAP4.abort
+    instances = []
+
+    def __init__(self, host, port):
+        self.alive = True
+        self.logins = 0
+        self.noops = 0
+        self.logged_out = False
+        self.noop_started = threading.Event()
+        self.noop_release = None
+        FakeIMAP.instances.append(self)
+
+    def login(self, username, password):
+        self.logins += 1
+        return "OK", [b"Logged in"]
+
+    def noop(self):
+        self.noops += 1
+        self.noop_started.set()
+        if self.noop_release is not None:
+            self.noop_release.wait(5)
+        if not self.alive:
+            raise imaplib.IMAP4.abort("socket error: EOF")
+        return "OK", [b"NOOP completed"]
+
+    def logout(self):
+        self.logged_out = True
+
+    def shutdown(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def fake_imap(monkeypatch):
+    FakeIMAP.instances = []
+    monkeypatch.setattr(imaplib, "IMAP4", FakeIMAP)
+
+
+class TestMailConnectionPool:
+    """Test connection reuse, keepalive checks and reconnection"""
+
+    @pytest.mark.asyncio
+    async def test_connection_reused_off_event_loop(self):
+        """Test that calls share one logged in connection and run on worker threads"""
+        pool = MailConnectionPool()
+        threads = []
+
+        for _ in range(3):
+            await pool.run("imap", ACCOUNT, lambda server: threads.append(threading.current_thread()))
+
+        assert len(FakeIMAP.instances) == 1
+        assert FakeIMAP.instances[0].logins == 1
+        assert threading.main_thread() not in threads
+        await pool.close()
+        assert FakeIMAP.instances[0].logged_out
+
+    @pytest.mark.asyncio
+    async def test_idle_connection_checked_with_noop(self):
+        """Test that a connection idle past the keepalive interval is checked and replaced if dead"""
+        pool = MailConnectionPool({"keepalive_interval": 0})
+        await pool.run("imap", ACCOUNT, lambda server: None)
+        FakeIMAP.instances[0].alive = False
+
+        server = await pool.run("imap", ACCOUNT, lambda server: server)
+
+        assert FakeIMAP.instances[0].noops == 1
+        assert FakeIMAP.instances[0].logged_out
+        assert server is FakeIMAP.instances[1]
+
+    @pytest.mark.asyncio
+    async def test_dropped_connection_retried_once(self):
+        """Test that an operation failing on a dropped pooled connection runs again on a new one"""
+        pool = MailConnectionPool()
+        await pool.run("imap", ACCOUNT, lambda server: None)
+        calls = []
+
+        def operation(server):
+            calls.append(server)
+            if server is FakeIMAP.instances[0]:
+                raise imaplib.IMAP4.abort("socket error: EOF")
+            return "ok"
+
+        assert await pool.run("imap", ACCOUNT, operation) == "ok"
+        assert calls == FakeIMAP.instances
+
+    @pytest.mark.asyncio
+    async def test_no_retry_when_disabled(self):
+        """Test that operations that must not repeat fail instead of reconnecting"""
+        pool = MailConnectionPool()
+        await pool.run("imap", ACCOUNT, lambda server: None)
+
+        def drop(server):
+            raise imaplib.IMAP4.abort("socket error: EOF")
+
+        with pytest.raises(imaplib.IMAP4.abort):
+            await pool.run("imap", ACCOUNT, drop, retry=False)
+        assert len(FakeIMAP.instances) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_operation_closes_connection(self):
+        """Test that a connection is not returned to the pool after an error"""
+        pool = MailConnectionPool()
+
+        def fail(server):
+            raise imaplib.IMAP4.error("SELECT failed")
+
+        with pytest.raises(imaplib.IMAP4.error):
+            await pool.run("imap", ACCOUNT, fail)
+        await pool.run("imap", ACCOUNT, lambda server: None)
+
+        assert FakeIMAP.instances[0].logged_out
+        assert len(FakeIMAP.instances) == 2
+
+    @pytest.mark.asyncio
+    async def test_connections_per_account_bounded(self):
+        """Test that concurrent calls open at most max_per_account connections"""
+        pool = MailConnectionPool({"max_per_account": 2})
+        release = threading.Event()
+
+        tasks = [asyncio.create_task(pool.run("imap", ACCOUNT, lambda server: release.wait(5))) for _ in range(4)]
+        await asyncio.sleep(0.1)
+        assert len(FakeIMAP.instances) == 2
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert len(FakeIMAP.instances) == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_expired_connections_of_other_accounts_closed(self):
+        """Test that using any account closes connections other accounts left idle too long"""
+        pool = MailConnectionPool({"idle_timeout": 0.05})
+        await pool.run("imap", ACCOUNT, lambda server: None)
+        await asyncio.sleep(0.1)
+
+        await pool.run("imap", {**ACCOUNT, "username": "other"}, lambda server: None)
+
+        assert FakeIMAP.instances[0].logged_out
+        assert len(pool._idle) == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_closes_connection(self):
+        """Test that a connection still used by a cancelled caller's thread is closed, not pooled"""
+        pool = MailConnectionPool()
+        started, release = threading.Event(), threading.Event()
+
+        def operation(server):
+            started.set()
+            release.wait(5)
+
+        task = asyncio.create_task(pool.run("imap", ACCOUNT, operation))
+        await asyncio.to_thread(started.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not FakeIMAP.instances[0].logged_out
+
+        release.set()
+        await pool.close()
+
+        assert FakeIMAP.instances[0].logged_out
+        assert pool._idle == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_during_keepalive_check_closes_connection(self):
+        """Test that a connection whose NOOP outlives a cancelled caller is closed, not leaked"""
+        pool = MailConnectionPool({"keepalive_interval": 0})
+        await pool.run("imap", ACCOUNT, lambda server: None)
+        connection = FakeIMAP.instances[0]
+        connection.noop_release = threading.Event()
+
+        task = asyncio.create_task(pool.run("imap", ACCOUNT, lambda server: None))
+        await asyncio.to_thread(connection.noop_started.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        connection.noop_release.set()
+        await pool.close()
+
+        assert connection.logged_out
+        assert pool._idle == {}
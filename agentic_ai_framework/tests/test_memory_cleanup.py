@@ -0,0 +1,84 @@
+"""
+Tests for agent memory trimming and SQLite connection settings
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from managers.memory_manager import MemoryEntry, MemoryManager
+
+
+@pytest.fixture
+def memory_manager(tmp_path):
+    manager = MemoryManager(str(tmp_path / "test.db"))
+    manager.initialize_database()
+    # Entries 0..29 spread over three agents; pairs of entries share a timestamp
+    start = datetime(2024, 1, 1)
+    with manager.get_session() as session:
+        session.add_all([
+            MemoryEntry(agent_name=f"agent_{i % 3}", role="user", content=str(i),
+                        timestamp=start + timedelta(seconds=i // 2))
+            for i in range(30)
+        ])
+        session.commit()
+    yield manager
+    manager.close()
+
+
+def contents(manager, agent_name):
+    return sorted(int(entry["content"]) for entry in manager.get_agent_memory(agent_name, limit=100))
+
+
+class TestMemoryCleanup:
+    """Test trimming agent memory to the newest entries"""
+
+    def test_cleanup_keeps_newest_entries(self, memory_manager):
+        """Test that only the agent's newest entries are kept"""
+        deleted = memory_manager.cleanup_agent_memory("agent_0", keep_last=3)
+
+        assert deleted == 7
+        assert contents(memory_manager, "agent_0") == [21, 24, 27]
+        assert len(contents(memory_manager, "agent_1")) == 10
+
+    def test_cleanup_without_surplus(self, memory_manager):
+        """Test that an agent within its limit is left untouched"""
+        assert memory_manager.cleanup_agent_memory("agent_0", keep_last=10) == 0
+        assert len(contents(memory_manager, "agent_0")) == 10
+
+    def test_cleanup_all_agents(self, memory_manager):
+        """Test that the batched cleanup trims every agent at once"""
+        deleted = memory_manager.cleanup_all_agents_memory(keep_last=2)
+
+        assert deleted == 24
+        assert contents(memory_manager, "agent_0") == [24, 27]
+        assert contents(memory_manager, "agent_1") == [25, 28]
+        assert contents(memory_manager, "agent_2") == [26, 29]
+
+    def test_upgrade_adds_missing_index(self, memory_manager):
+        """Test that databases created before the composite index get it on startup"""
+        with memory_manager.engine.begin() as connection:
+            connection.execute(text("DROP INDEX ix_memory_entries_agent_name_timestamp"))
+
+        memory_manager.initialize_database()
+
+        with memory_manager.engine.connect() as connection:
+            plan = connection.execute(text(
+                "EXPLAIN QUERY PLAN SELECT id FROM memory_entries WHERE agent_name = 'agent_0' "
+                "ORDER BY timestamp DESC"
+            )).fetchall()
+        assert "ix_memory_entries_agent_name_timestamp" in str(plan)
+
+
+class TestSqliteSettings:
+    """Test the SQLite pragmas applied to every connection"""
+
+    def test_sqlite_pragmas_applied(self, tmp_path):
+        """Test that engine options are applied to every connection"""
+        manager = MemoryManager(str(tmp_path / "pragmas.db"), {"busy_timeout_ms": 1234, "synchronous": "NORMAL"})
+        with manager.engine.connect() as connection:
+            assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+            assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+        manager.close()
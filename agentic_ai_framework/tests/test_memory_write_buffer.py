@@ -0,0 +1,85 @@
+"""
+Tests for buffered memory entry writes
+"""
+
+import threading
+import time
+
+import pytest
+
+from managers.memory_manager import MemoryEntry, MemoryManager
+
+
+@pytest.fixture
+def memory_manager(tmp_path):
+    manager = MemoryManager(str(tmp_path / "test.db"), write_batch_size=5, write_flush_interval=60)
+    manager.initialize_database()
+    yield manager
+    manager.close()
+
+
+class TestMemoryWriteBuffer:
+    """Test the write-behind buffer for memory entries"""
+
+    def stored_contents(self, manager):
+        with manager.get_session() as session:
+            return [entry.content for entry in session.query(MemoryEntry).order_by(MemoryEntry.id)]
+
+    def test_entries_buffered_until_batch_fills(self, memory_manager):
+        """Test that entries are written together once the batch is full"""
+        for i in range(4):
+            memory_manager.add_memory_entry("agent", "user", str(i))
+        assert self.stored_contents(memory_manager) == []
+
+        memory_manager.add_memory_entry("agent", "user", "4")
+
+        assert self.stored_contents(memory_manager) == ["0", "1", "2", "3", "4"]
+
+    def test_reads_see_buffered_entries(self, memory_manager):
+        """Test that an agent's buffered entries are visible to its memory reads"""
+        memory_manager.add_memory_entry("agent", "user", "question")
+        memory_manager.add_memory_entry("agent", "assistant", "answer")
+
+        entries = memory_manager.get_agent_memory("agent", limit=5)
+
+        assert [entry["content"] for entry in entries] == ["question", "answer"]
+
+    def test_flush_interval(self, tmp_path):
+        """Test that a partial batch is written after the flush interval"""
+        manager = MemoryManager(str(tmp_path / "test.db"), write_batch_size=100, write_flush_interval=0.05)
+        manager.initialize_database()
+        manager.add_memory_entry("agent", "user", "hello")
+
+        time.sleep(0.3)
+
+        assert self.stored_contents(manager) == ["hello"]
+        manager.close()
+
+    def test_close_writes_buffered_entries(self, tmp_path):
+        """Test that shutting down writes entries still in the buffer"""
+        path = str(tmp_path / "test.db")
+        manager = MemoryManager(path, write_batch_size=100, write_flush_interval=60)
+        manager.initialize_database()
+        manager.add_memory_entry("agent", "user", "hello")
+
+        manager.close()
+
+        reopened = MemoryManager(path)
+        assert [entry["content"] for entry in reopened.get_agent_memory("agent")] == ["hello"]
+        reopened.close()
+
+    def test_concurrent_writers_keep_all_entries(self, memory_manager):
+        """Test that entries from concurrent threads are all written in order per thread"""
+        def writer(agent):
+            for i in range(20):
+                memory_manager.add_memory_entry(agent, "user", str(i))
+
+        threads = [threading.Thread(target=writer, args=(f"agent_{t}",)) for t in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for t in range(4):
+            entries = memory_manager.get_agent_memory(f"agent_{t}", limit=100)
+            assert [entry["content"] for entry in entries] == [str(i) for i in range(20)]
@@ -0,0 +1,187 @@
+"""
+Tests for native (structured) tool calling
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from managers.agent_manager import AgentManager
+from providers.base_llm_provider import GenerationConfig, GenerationResponse, Message, ToolCall
+from providers.ollama_provider import OllamaProvider
+from providers.openai_provider import OpenAIProvider
+
+CALCULATOR_SCHEMA = {
+    "type": "object",
+    "properties": {"expression": {"type": "string"}},
+    "required": ["expression"]
+}
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.status = 200
+        self.payload = payload
+
+    async def json(self):
+        return self.payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+    """aiohttp session stub recording posted payloads"""
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.requests = []
+
+    def post(self, url, json=None, **kwargs):
+        self.requests.append(json)
+        return FakeResponse(self.payload)
+
+
+def use_session(provider, session):
+    async def get_session():
+        return session
+    provider.get_session = get_session
+
+
+class TestProviderToolCalls:
+    """Test sending tool schemas and reading structured tool calls"""
+
+    @pytest.mark.asyncio
+    async def test_openai_tool_calls(self):
+        """Test that OpenAI receives the schemas and its tool calls are parsed"""
+        provider = OpenAIProvider({"api_key": "test-key"})
+        session = FakeSession({
+            "model": "gpt-4o",
+            "choices": [{
+                "finish_reason": "tool_calls",
+                "message": {"role": "assistant", "content": None, "tool_calls": [{
+                    "id": "call_1", "type": "function",
+                    "function": {"name": "calculator", "arguments": '{"expression": "1+1"}'}
+                }]}
+            }]
+        })
+        use_session(provider, session)
+        tools = [{"type": "function", "function": {"name": "calculator", "parameters": CALCULATOR_SCHEMA}}]
+
+        response = await provider.generate_response(
+            [Message(role="user", content="What is 1+1?")], "gpt-4o", GenerationConfig(tools=tools)
+        )
+
+        assert session.requests[0]["tools"] == tools
+        assert response.content == ""
+        assert response.tool_calls == [ToolCall(name="calculator", arguments={"expression": "1+1"}, id="call_1")]
+
+    def test_openai_formats_tool_messages(self):
+        """Test that tool calls and results are sent back in the OpenAI format"""
+        provider = OpenAIProvider({"api_key": "test-key"})
+        call = ToolCall(name="calculator", arguments={"expression": "1+1"}, id="call_1")
+
+        assistant = provider._format_chat_message(Message(role="assistant", content="", tool_calls=[call]))
+        result = provider._format_chat_message(Message(role="tool", content="2", tool_call_id="call_1"))
+
+        assert assistant["tool_calls"][0]["function"]["arguments"] == '{"expression": "1+1"}'
+        assert result == {"role": "tool", "content": "2", "tool_call_id": "call_1"}
+
+    @pytest.mark.asyncio
+    async def test_ollama_native_tools_opt_in(self):
+        """Test that Ollama uses tools only when enabled and uses the chat endpoint for them"""
+        assert not OllamaProvider({}).supports_tool_calling("llama3.1")
+
+        provider = OllamaProvider({"native_tools": True})
+        session = FakeSession({"message": {"role": "assistant", "content": "", "tool_calls": [
+            {"function": {"name": "calculator", "arguments": {"expression": "1+1"}}}
+        ]}})
+        use_session(provider, session)
+
+        response = await provider.generate_response(
+            [Message(role="user", content="What is 1+1?")], "llama3.1", GenerationConfig(tools=[{"type": "function"}])
+        )
+
+        assert provider.supports_tool_calling("llama3.1")
+        assert session.requests[0]["tools"] == [{"type": "function"}]
+        assert "messages" in session.requests[0]
+        assert response.tool_calls == [ToolCall(name="calculator", arguments={"expression": "1+1"})]
+
+
+class ScriptedProvider:
+    """Provider stub returning a tool call, then an answer"""
+
+    def __init__(self):
+        self.requests = []
+
+    async def generate_response(self, messages, model, config):
+        self.requests.append((list(messages), config))
+        if len(self.requests) == 1:
+            call = ToolCall(name="calculator", arguments={"expression": "1+1"}, id="call_1")
+            return GenerationResponse(content="", model=model, provider="fake", tool_calls=[call])
+        return GenerationResponse(content="The answer is 2.", model=model, provider="fake")
+
+
+class NativeLLMManager:
+    def __init__(self):
+        self.provider = ScriptedProvider()
+
+    def supports_tool_calling(self, model):
+        return True
+
+    def _resolve_model(self, model):
+        return "fake", model
+
+    def get_provider(self, name):
+        return self.provider
+
+
+class CalculatorToolManager:
+    def __init__(self):
+        self.tool = SimpleNamespace(
+            name="calculator", description="Evaluate math", parameters=CALCULATOR_SCHEMA,
+            parallel_safe=True, timeout=None
+        )
+
+    def get_tool_instance(self, tool_name):
+        return self.tool if tool_name == "calculator" else None
+
+    async def execute_tool(self, tool_name, parameters, agent_name=None):
+        return {"value": 2}
+
+
+class TestAgentNativeToolCalling:
+    """Test the agent loop with structured tool calls"""
+
+    @pytest.mark.asyncio
+    async def test_tool_round_trip(self):
+        """Test that a task with one tool call takes two LLM requests"""
+        memory_manager = Mock()
+        memory_manager.get_agent.return_value = {
+            "name": "math", "role": "Calculator", "goals": "", "backstory": "",
+            "tools": ["calculator"], "ollama_model": "fake-model", "enabled": True,
+        }
+        memory_manager.get_agent_memory.return_value = []
+        memory_manager.get_tool_availability.return_value = {"calculator": True}
+        config = SimpleNamespace(max_agent_memory_entries=5, max_agent_iterations=3, default_model="fake-model")
+        llm_manager = NativeLLMManager()
+        agent_manager = AgentManager(llm_manager, memory_manager, CalculatorToolManager(), config)
+
+        result = await agent_manager.execute_agent("math", "What is 1+1?")
+
+        assert result == "The answer is 2."
+        requests = llm_manager.provider.requests
+        assert len(requests) == 2
+        messages, config = requests[0]
+        assert config.tools[0]["function"]["name"] == "calculator"
+        assert "TOOL_CALL:" not in messages[0].content
+        assert messages[-1].content == "What is 1+1?"
+        tool_message = requests[1][0][-1]
+        assert tool_message.role == "tool"
+        assert tool_message.tool_call_id == "call_1"
+        assert json.loads(tool_message.content) == {"value": 2}
@@ -0,0 +1,208 @@
+"""
+Tests for concurrent and conditional RSS feed fetching
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from managers.memory_manager import FeedSeenItem, MemoryManager
+from tools.rss_feed_parser import RSSFeedParserTool
+
+FEED = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test feed</title>
+<item><title>First</title><link>http://example.com/1</link><description>One</description></item>
+<item><title>Second</title><link>http://example.com/2</link><description>Two</description></item>
+</channel></rss>"""
+
+
+@pytest_asyncio.fixture
+async def feed_server():
+    """Local feed server supporting ETag validation, with a slow feed for concurrency checks"""
+    requests = []
+
+    async def feed(request):
+        requests.append((request.path, time.monotonic(), request.headers.get("If-None-Match")))
+        if request.path == "/slow":
+            await asyncio.sleep(0.2)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text=FEED, content_type="application/rss+xml", headers={"ETag": '"v1"'})
+
+    app = web.Application()
+    app.router.add_get("/{name}", feed)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", requests
+    await runner.cleanup()
+
+
+class TestRSSFeedParser:
+    """Test feed fetching on the async HTTP stack"""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_feed_served_from_validator_cache(self, feed_server):
+        """Test that a second fetch sends the ETag and reuses the parsed items on 304"""
+        base_url, requests = feed_server
+        tool = RSSFeedParserTool()
+
+        first = await tool.execute({"feed_urls": [f"{base_url}/feed"], "rate_limit": 0})
+        second = await tool.execute({"feed_urls": [f"{base_url}/feed"], "max_items": 1, "rate_limit": 0})
+
+        assert [request[2] for request in requests] == [None, '"v1"']
+        assert first["results"][0]["not_modified"] is False
+        assert second["results"][0]["not_modified"] is True
+        assert [item["title"] for item in second["results"][0]["items"]] == ["First"]
+        assert "full_content" not in second["results"][0]["items"][0]
+        await tool.http_pool.close()
+
+    @pytest.mark.asyncio
+    async def test_validators_persisted(self, feed_server, tmp_path):
+        """Test that validators stored in the database are used by a new tool instance"""
+        base_url, requests = feed_server
+        memory_manager = MemoryManager(str(tmp_path / "test.db"))
+        memory_manager.initialize_database()
+
+        for _ in range(2):
+            tool = RSSFeedParserTool()
+            tool.set_dependencies(memory_manager, None)
+            result = await tool.execute({"feed_urls": [f"{base_url}/feed"], "rate_limit": 0})
+            await tool.http_pool.close()
+
+        assert result["results"][0]["not_modified"] is True
+        assert len(result["results"][0]["items"]) == 2
+        memory_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_overlapping_fetches_of_new_feed(self, feed_server, tmp_path):
+        """Test that fetching a feed twice at once stores its validators without a conflict"""
+        base_url, requests = feed_server
+        memory_manager = MemoryManager(str(tmp_path / "test.db"))
+        memory_manager.initialize_database()
+        tool = RSSFeedParserTool()
+        tool.set_dependencies(memory_manager, None)
+        params = {"feed_urls": [f"{base_url}/feed"], "rate_limit": 0}
+
+        results = await asyncio.gather(*(tool.execute(params) for _ in range(4)))
+
+        assert all(result["successful_feeds"] == 1 for result in results)
+        assert memory_manager.get_feed_state(f"{base_url}/feed")["etag"] == '"v1"'
+        await tool.http_pool.close()
+        memory_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_feeds_fetched_concurrently_with_host_delay(self, feed_server):
+        """Test that slow feeds overlap and that requests to one host keep the delay"""
+        base_url, requests = feed_server
+        tool = RSSFeedParserTool()
+
+        start = time.monotonic()
+        result = await tool.execute({"feed_urls": [f"{base_url}/slow"] * 3, "rate_limit": 0.05})
+        elapsed = time.monotonic() - start
+
+        assert result["successful_feeds"] == 3
+        assert elapsed < 0.5
+        times = sorted(request[1] for request in requests)
+        assert all(later - earlier >= 0.04 for earlier, later in zip(times, times[1:]))
+        await tool.http_pool.close()
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_host_does_not_block_other_hosts(self, feed_server):
+        """Test that feeds waiting on one host's rate limit leave fetch slots to other hosts"""
+        base_url, requests = feed_server
+        other_url = base_url.replace("127.0.0.1", "localhost")
+        tool = RSSFeedParserTool()
+
+        start = time.monotonic()
+        result = await tool.execute({
+            "feed_urls": [f"{base_url}/a", f"{base_url}/b", f"{base_url}/c", f"{other_url}/other"],
+            "rate_limit": 0.3, "max_concurrent": 2
+        })
+
+        assert result["successful_feeds"] == 4
+        other_started = next(request[1] for request in requests if request[0] == "/other")
+        assert other_started - start < 0.2
+        await tool.http_pool.close()
+
+    @pytest.mark.asyncio
+    async def test_only_new_returns_unseen_items(self, feed_server):
+        """Test that only_new returns each item once per scope"""
+        base_url, requests = feed_server
+        tool = RSSFeedParserTool()
+        params = {"feed_urls": [f"{base_url}/feed"], "rate_limit": 0, "only_new": True, "max_items": 1}
+
+        first = await tool.execute(params)
+        second = await tool.execute(params)
+        third = await tool.execute(params)
+        other_scope = await tool.execute({**params, "seen_scope": "other"})
+
+        assert [item["title"] for item in first["results"][0]["items"]] == ["First"]
+        assert [item["title"] for item in second["results"][0]["items"]] == ["Second"]
+        assert third["results"][0]["items"] == []
+        assert [item["title"] for item in other_scope["results"][0]["items"]] == ["First"]
+        assert tool.is_cacheable(params) is False
+        await tool.http_pool.close()
+
+    @pytest.mark.asyncio
+    async def test_seen_items_persisted_and_bounded(self, feed_server, tmp_path):
+        """Test that seen items survive a new tool instance and are trimmed per feed"""
+        base_url, requests = feed_server
+        memory_manager = MemoryManager(str(tmp_path / "test.db"))
+        memory_manager.initialize_database()
+        params = {"feed_urls": [f"{base_url}/feed"], "rate_limit": 0, "only_new": True}
+
+        for _ in range(2):
+            tool = RSSFeedParserTool()
+            tool.set_dependencies(memory_manager, None)
+            result = await tool.execute(params)
+            await tool.http_pool.close()
+
+        assert result["results"][0]["items"] == []
+
+        feed_url = f"{base_url}/feed"
+        memory_manager.mark_feed_items_seen(feed_url, "", ["a", "b", "c"], max_items=2)
+        assert memory_manager.get_seen_feed_items(feed_url, "", ["a", "b", "c"]) == {"b", "c"}
+        memory_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_overlapping_only_new_calls_split_items(self, feed_server, tmp_path):
+        """Test that concurrent only_new calls for one feed and scope never return the same item"""
+        base_url, requests = feed_server
+        memory_manager = MemoryManager(str(tmp_path / "test.db"))
+        memory_manager.initialize_database()
+        tool = RSSFeedParserTool()
+        tool.set_dependencies(memory_manager, None)
+        params = {"feed_urls": [f"{base_url}/feed"], "rate_limit": 0, "only_new": True, "max_items": 1}
+
+        results = await asyncio.gather(tool.execute(params), tool.execute(params))
+
+        titles = sorted(result["results"][0]["items"][0]["title"] for result in results)
+        assert titles == ["First", "Second"]
+        assert tool._seen_locks == {}
+        await tool.http_pool.close()
+        memory_manager.close()
+
+    def test_seen_items_expire_after_leaving_feed(self, tmp_path):
+        """Test that hashes still in the feed are kept past the TTL while others expire"""
+        memory_manager = MemoryManager(str(tmp_path / "test.db"))
+        memory_manager.initialize_database()
+        feed_url = "http://example.com/feed"
+        memory_manager.mark_feed_items_seen(feed_url, "", ["kept", "gone"])
+        with memory_manager.get_session() as session:
+            long_ago = datetime.utcnow() - timedelta(days=40)
+            session.query(FeedSeenItem).update({FeedSeenItem.first_seen: long_ago, FeedSeenItem.last_seen: long_ago})
+            session.commit()
+
+        # Marking a hash again, as a concurrent call might, is not an error
+        trimmed = memory_manager.mark_feed_items_seen(feed_url, "", ["kept"], ["kept"], ttl_days=30)
+
+        assert trimmed == 1
+        assert memory_manager.get_seen_feed_items(feed_url, "", ["kept", "gone"]) == {"kept"}
+        memory_manager.close()
@@ -0,0 +1,191 @@
+"""
+Tests for the background scheduler
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from main import BackgroundScheduler
+from managers.memory_manager import MemoryManager, TaskExecution
+
+
+class FakeAgentManager:
+    """Agent manager stub recording how many executions overlap"""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.running = {}
+        self.peak = {}
+
+    async def execute_agent(self, agent_name, task, context):
+        self.running[agent_name] = self.running.get(agent_name, 0) + 1
+        self.peak[agent_name] = max(self.peak.get(agent_name, 0), self.running[agent_name])
+        self.peak["total"] = max(self.peak.get("total", 0), sum(self.running.values()))
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running[agent_name] -= 1
+        return f"{agent_name} did {task}"
+
+
+@pytest.fixture
+def memory_manager(tmp_path):
+    manager = MemoryManager(str(tmp_path / "test.db"))
+    manager.initialize_database()
+    yield manager
+    manager.close()
+
+
+def make_scheduler(memory_manager, agent_manager, max_tasks=4, per_agent=0, timeout=0, interval=60):
+    config = SimpleNamespace(
+        scheduler_max_concurrent_tasks=max_tasks,
+        scheduler_max_tasks_per_agent=per_agent,
+        scheduler_max_tasks_per_workflow=0,
+        scheduler_task_timeout=timeout,
+        memory_cleanup_interval=3600,
+        max_agent_memory_entries=5
+    )
+    return BackgroundScheduler(memory_manager, agent_manager, None, config, interval)
+
+
+def schedule(memory_manager, agent_names):
+    task_ids = [
+        memory_manager.schedule_task("agent", datetime.utcnow(), agent_name=name, task_description="work")
+        for name in agent_names
+    ]
+    return memory_manager.get_pending_scheduled_tasks(task_ids=task_ids)
+
+
+async def run_all(scheduler, tasks):
+    await asyncio.gather(*(scheduler._run_task(task, time.monotonic()) for task in tasks))
+
+
+def executions(memory_manager):
+    with memory_manager.get_session() as session:
+        return [
+            (execution.status, execution.duration_seconds, execution.execution_metadata)
+            for execution in session.query(TaskExecution).order_by(TaskExecution.id)
+        ]
+
+
+class TestSchedulerConcurrency:
+    """Test concurrency limits, timeouts and execution recording"""
+
+    @pytest.mark.asyncio
+    async def test_global_cap(self, memory_manager):
+        """Test that no more than max_concurrent_tasks tasks run at once"""
+        agent_manager = FakeAgentManager()
+        scheduler = make_scheduler(memory_manager, agent_manager, max_tasks=2)
+
+        await run_all(scheduler, schedule(memory_manager, ["a", "b", "c", "d"]))
+
+        assert agent_manager.peak["total"] == 2
+        assert [execution[0] for execution in executions(memory_manager)] == ["completed"] * 4
+
+    @pytest.mark.asyncio
+    async def test_per_agent_cap(self, memory_manager):
+        """Test that a capped agent runs one task at a time while other agents proceed"""
+        agent_manager = FakeAgentManager()
+        scheduler = make_scheduler(memory_manager, agent_manager, max_tasks=4, per_agent=1)
+
+        await run_all(scheduler, schedule(memory_manager, ["a", "a", "a", "b"]))
+
+        assert agent_manager.peak["a"] == 1
+        assert agent_manager.peak["total"] == 2
+        assert scheduler._target_semaphores == {}
+
+    @pytest.mark.asyncio
+    async def test_timed_out_task(self, memory_manager):
+        """Test that a task running past the timeout is recorded as failed and timed out"""
+        scheduler = make_scheduler(memory_manager, FakeAgentManager(delay=5), timeout=0.05)
+
+        await run_all(scheduler, schedule(memory_manager, ["a"]))
+
+        status, duration, metadata = executions(memory_manager)[0]
+        assert status == "failed"
+        assert metadata["timed_out"] is True
+
+    @pytest.mark.asyncio
+    async def test_duration_and_queue_wait_recorded(self, memory_manager):
+        """Test that executions record their duration and the time spent queued"""
+        scheduler = make_scheduler(memory_manager, FakeAgentManager(delay=0.6), max_tasks=1)
+
+        await run_all(scheduler, schedule(memory_manager, ["a", "b"]))
+
+        recorded = executions(memory_manager)
+        # The column keeps whole seconds; the metadata keeps the exact duration
+        assert all(duration == 1 for _, duration, _ in recorded)
+        assert all(metadata["duration_seconds"] >= 0.6 for _, _, metadata in recorded)
+        assert max(metadata["queue_wait_seconds"] for _, _, metadata in recorded) >= 0.6
+        assert all(metadata["timed_out"] is False for _, _, metadata in recorded)
+
+
+class TestSchedulerDueTimes:
+    """Test waking up and rescheduling with the due-time heap"""
+
+    @pytest.mark.asyncio
+    async def test_wakes_when_task_added(self, memory_manager):
+        """Test that an idle scheduler wakes as soon as a due task is added"""
+        scheduler = make_scheduler(memory_manager, FakeAgentManager())
+        scheduler.reload_schedule()
+        waiter = asyncio.create_task(scheduler._wait_for_next_event())
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        task_id = memory_manager.schedule_task("agent", datetime.utcnow(), agent_name="a", task_description="work")
+        scheduler.notify_task_changed(task_id)
+
+        await asyncio.wait_for(waiter, timeout=1)
+        assert scheduler._pop_due_task_ids() == [task_id]
+
+    @pytest.mark.asyncio
+    async def test_future_task_not_due(self, memory_manager):
+        """Test that only tasks whose due time has passed are popped, earliest first"""
+        now = datetime.utcnow()
+        later = memory_manager.schedule_task("agent", now + timedelta(hours=1), agent_name="a", task_description="work")
+        first = memory_manager.schedule_task("agent", now - timedelta(minutes=2), agent_name="a", task_description="work")
+        second = memory_manager.schedule_task("agent", now - timedelta(minutes=1), agent_name="a", task_description="work")
+        scheduler = make_scheduler(memory_manager, FakeAgentManager())
+        scheduler.reload_schedule()
+
+        assert scheduler._pop_due_task_ids() == [first, second]
+        assert scheduler._next_due_time() == now + timedelta(hours=1)
+        assert later in scheduler._due_times
+
+    @pytest.mark.asyncio
+    async def test_recurring_task_rescheduled(self, memory_manager):
+        """Test that a recurring task gets its next due time after it runs"""
+        task_id = memory_manager.schedule_task(
+            "agent", datetime.utcnow() - timedelta(minutes=10), agent_name="a", task_description="work",
+            is_recurring=True, recurrence_pattern="5m"
+        )
+        scheduler = make_scheduler(memory_manager, FakeAgentManager())
+        scheduler.reload_schedule()
+        scheduler.running = True
+
+        assert scheduler._pop_due_task_ids() == [task_id]
+        await run_all(scheduler, memory_manager.get_pending_scheduled_tasks(task_ids=[task_id]))
+
+        assert scheduler._due_times[task_id] > datetime.utcnow() + timedelta(minutes=4)
+
+    @pytest.mark.asyncio
+    async def test_failed_status_update_retries_after_interval(self, memory_manager, monkeypatch):
+        """Test that a task whose run could not be recorded waits the interval instead of rerunning at once"""
+        task_id = memory_manager.schedule_task("agent", datetime.utcnow(), agent_name="a", task_description="work")
+        scheduler = make_scheduler(memory_manager, FakeAgentManager(), interval=60)
+        scheduler.reload_schedule()
+        scheduler.running = True
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(memory_manager, "update_scheduled_task_status", fail)
+        assert scheduler._pop_due_task_ids() == [task_id]
+        await run_all(scheduler, memory_manager.get_pending_scheduled_tasks(task_ids=[task_id]))
+
+        assert scheduler._pop_due_task_ids() == []
+        assert scheduler._due_times[task_id] > datetime.utcnow() + timedelta(seconds=55)
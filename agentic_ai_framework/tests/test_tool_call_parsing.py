@@ -0,0 +1,63 @@
+"""
+Tests for tool call parsing in agent responses
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from managers.agent_manager import AgentManager
+
+
+@pytest.fixture
+def agent_manager():
+    memory_manager = Mock()
+    memory_manager.get_tool_availability.return_value = {"http_client": True, "website_monitor": False}
+    config = SimpleNamespace(max_agent_memory_entries=5, max_agent_iterations=3, default_model="fake-model")
+    return AgentManager(Mock(), memory_manager, Mock(), config)
+
+
+class TestToolCallParsing:
+    """Test parsing TOOL_CALL lines against the registered tools"""
+
+    def test_unknown_and_duplicate_calls_skipped(self, agent_manager):
+        """Test that calls to unregistered tools and repeated calls are dropped"""
+        response = "\n".join([
+            "TOOL_CALL: http_client(url=https://a.example, method=GET)",
+            "TOOL_CALL: made_up_tool(x=1)",
+            "TOOL_CALL: tool_name(parameter=value)",
+            "TOOL_CALL: http_client(method=GET, url=https://a.example)",
+            "TOOL_CALL: website_monitor(url=www.b.example)",
+        ])
+
+        tool_calls = agent_manager._parse_tool_calls_aggressive(response, {"http_client", "website_monitor"})
+
+        assert tool_calls == [
+            {"tool_name": "http_client", "parameters": {"url": "https://a.example", "method": "GET"}},
+            {"tool_name": "website_monitor", "parameters": {"url": "https://www.b.example"}},
+        ]
+
+    def test_registered_tools_read_once(self, agent_manager):
+        """Test that tool names are resolved once per parse instead of per match"""
+        response = "\n".join(f"TOOL_CALL: http_client(url=https://{i}.example)" for i in range(20))
+
+        tool_calls = agent_manager._parse_tool_calls_aggressive(response)
+
+        assert len(tool_calls) == 20
+        agent_manager.memory_manager.get_tool_availability.assert_called_once()
+        agent_manager.memory_manager.get_tool.assert_not_called()
+
+    def test_fallback_pattern(self, agent_manager):
+        """Test the fallback format when no primary call is valid"""
+        tool_calls = agent_manager._parse_tool_calls_aggressive(
+            "TOOL_CALL http_client(url=https://a.example)", {"http_client"}
+        )
+
+        assert tool_calls == [{"tool_name": "http_client", "parameters": {"url": "https://a.example"}}]
+
+    def test_tool_list_only_enabled_tools(self, agent_manager):
+        """Test that the prompt tool list leaves out disabled and unregistered tools"""
+        tool_list = agent_manager._get_simple_tool_list(["http_client", "website_monitor", "missing"])
+
+        assert tool_list == "http_client"
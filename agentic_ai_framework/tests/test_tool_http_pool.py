@@ -0,0 +1,112 @@
+"""
+Tests for the HTTP connection pool shared by tools
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from managers.tool_manager import ToolManager
+from tools.http_pool import HttpClientPool
+from tools.http_client import HttpClientTool
+from tools.website_monitor import WebsiteMonitorTool
+
+
+@pytest_asyncio.fixture
+async def server():
+    """Local HTTP server recording the client port and cookies of every request"""
+    client_ports = []
+    cookies = []
+
+    async def handle(request):
+        client_ports.append(request.transport.get_extra_info("peername")[1])
+        cookies.append(dict(request.cookies))
+        response = web.json_response({"ok": True})
+        if "login" in request.query:
+            response.set_cookie("session", "secret")
+        return response
+
+    app = web.Application()
+    app.router.add_get("/", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}/", client_ports, cookies
+    await runner.cleanup()
+
+
+class TestToolHttpPool:
+    """Test connection reuse across tool calls"""
+
+    @pytest.mark.asyncio
+    async def test_tools_share_pooled_connections(self, server):
+        """Test that calls from different tools reuse one keep-alive connection"""
+        url, client_ports, _ = server
+        tool_manager = ToolManager(Mock(), config=None)
+        monitor, client = WebsiteMonitorTool(), HttpClientTool()
+        for tool in (monitor, client):
+            tool_manager._register_tool_instance(tool, type(tool).__name__)
+
+        for _ in range(3):
+            assert (await monitor.execute({"url": url}))["status"] == "online"
+            assert (await client.execute({"url": url}))["content"] == {"ok": True}
+
+        assert monitor.http_pool is client.http_pool is tool_manager.http_pool
+        assert len(client_ports) == 6
+        assert len(set(client_ports)) == 1
+
+        await tool_manager.close()
+        assert tool_manager.http_pool._session is None
+
+    @pytest.mark.asyncio
+    async def test_standalone_tool_gets_own_pool(self, server):
+        """Test that a tool used without a tool manager still pools its connections"""
+        url, client_ports, _ = server
+        monitor = WebsiteMonitorTool()
+
+        await monitor.execute({"url": url})
+        await monitor.execute({"url": url})
+
+        assert len(set(client_ports)) == 1
+        await monitor.http_pool.close()
+
+    @pytest.mark.asyncio
+    async def test_cookies_not_shared_between_calls(self, server):
+        """Test that a cookie set in one call's response is not sent by later calls"""
+        # The default cookie jar ignores cookies from IP addresses
+        url, _, cookies = server
+        url = url.replace("127.0.0.1", "localhost")
+        tool_manager = ToolManager(Mock(), config=None)
+        client = HttpClientTool()
+        tool_manager._register_tool_instance(client, "HttpClientTool")
+
+        await client.execute({"url": f"{url}?login=1"})
+        await client.execute({"url": url})
+
+        assert cookies == [{}, {}]
+        await tool_manager.close()
+
+
+def test_pool_rejects_second_loop_until_closed():
+    """Test that an open session is never silently replaced when the event loop changes"""
+    pool = HttpClientPool()
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(pool.get_session())
+        with pytest.raises(RuntimeError, match="another event loop"):
+            asyncio.run(pool.get_session())
+        loop.run_until_complete(pool.close())
+    finally:
+        loop.close()
+
+    async def reopen():
+        session = await pool.get_session()
+        await pool.close()
+        return session
+
+    assert asyncio.run(reopen()).closed
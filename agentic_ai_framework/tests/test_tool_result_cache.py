@@ -0,0 +1,206 @@
+"""
+Tests for the tool result cache
+"""
+
+import asyncio
+from typing import Any, Dict
+from unittest.mock import Mock
+
+import pytest
+
+from managers.tool_manager import ToolManager
+from managers.tool_result_cache import ToolResultCache, make_cache_key
+from tools.base_tool import BaseTool
+
+
+class Counter:
+    """Coroutine function counting its executions"""
+
+    def __init__(self, result=None, delay=0, error=None):
+        self.calls = 0
+        self.result = result
+        self.delay = delay
+        self.error = error
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.result if self.result is not None else {"call": self.calls}
+
+
+class TestCacheKey:
+    """Test normalizing call parameters into cache keys"""
+
+    SCHEMA = {"properties": {"url": {"type": "string"}, "timeout": {"type": "integer", "default": 10}}}
+
+    def test_defaults_and_order_normalized(self):
+        """Test that omitted defaults and parameter order do not change the key"""
+        assert make_cache_key("tool", {"url": "a"}, self.SCHEMA) == \
+            make_cache_key("tool", {"timeout": 10, "url": "a"}, self.SCHEMA)
+        assert make_cache_key("tool", {"url": "a"}, self.SCHEMA) != \
+            make_cache_key("tool", {"url": "a", "timeout": 5}, self.SCHEMA)
+
+    def test_key_fields_and_config(self):
+        """Test that only key fields count and that the tool configuration does"""
+        assert make_cache_key("tool", {"url": "a", "timeout": 5}, self.SCHEMA, ["url"]) == \
+            make_cache_key("tool", {"url": "a", "timeout": 1}, self.SCHEMA, ["url"])
+        assert make_cache_key("tool", {"url": "a"}, tool_config={"api_key": "one"}) != \
+            make_cache_key("tool", {"url": "a"}, tool_config={"api_key": "two"})
+
+
+class TestToolResultCache:
+    """Test caching, expiry, coalescing and eviction"""
+
+    @pytest.mark.asyncio
+    async def test_hit_within_ttl(self):
+        """Test that a fresh result is reused and returned as a copy"""
+        cache = ToolResultCache()
+        execute = Counter()
+        key = make_cache_key("tool", {"url": "a"})
+
+        first = await cache.get_or_execute(key, 60, execute)
+        first["call"] = 99
+        second = await cache.get_or_execute(key, 60, execute)
+
+        assert execute.calls == 1
+        assert second == {"call": 1}
+        assert cache.get_stats("tool")["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_result_reexecuted(self):
+        """Test that a result is not served after its TTL"""
+        cache = ToolResultCache()
+        execute = Counter()
+        key = make_cache_key("tool", {})
+
+        await cache.get_or_execute(key, 0.01, execute)
+        await asyncio.sleep(0.02)
+        await cache.get_or_execute(key, 0.01, execute)
+
+        assert execute.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_coalesced(self):
+        """Test that identical concurrent calls share one execution"""
+        cache = ToolResultCache()
+        execute = Counter(delay=0.05)
+        key = make_cache_key("tool", {})
+
+        results = await asyncio.gather(*(cache.get_or_execute(key, 60, execute) for _ in range(5)))
+
+        assert execute.calls == 1
+        assert results == [{"call": 1}] * 5
+        assert cache.get_stats("tool")["coalesced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self):
+        """Test that a failed execution is retried on the next call"""
+        cache = ToolResultCache()
+        execute = Counter(error=RuntimeError("down"))
+        key = make_cache_key("tool", {})
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await cache.get_or_execute(key, 60, execute)
+
+        assert execute.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_rejected_results_not_cached(self):
+        """Test that results the should_store check rejects are returned but not stored"""
+        cache = ToolResultCache()
+        execute = Counter({"status": "timeout"})
+        key = make_cache_key("tool", {})
+
+        for _ in range(2):
+            result = await cache.get_or_execute(key, 60, execute, should_store=lambda r: r["status"] != "timeout")
+            assert result == {"status": "timeout"}
+
+        assert execute.calls == 2
+        assert cache.get_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_count_and_size(self):
+        """Test that least recently used results are evicted beyond either limit"""
+        cache = ToolResultCache(max_entries=2, max_bytes=94)
+        keys = [make_cache_key("tool", {"n": n}) for n in range(3)]
+
+        await cache.get_or_execute(keys[0], 60, Counter("a"))
+        await cache.get_or_execute(keys[1], 60, Counter("b"))
+        await cache.get_or_execute(keys[0], 60, Counter("a"))
+        await cache.get_or_execute(keys[2], 60, Counter("c"))
+
+        assert set(cache._entries) == {keys[0], keys[2]}
+
+        await cache.get_or_execute(keys[1], 60, Counter("x" * 90))
+
+        assert set(cache._entries) == {keys[1]}
+        assert cache.get_stats()["bytes"] == 92
+        assert cache.get_stats("tool")["evictions"] == 3
+
+
+class EchoTool(BaseTool):
+    cacheable = True
+    cache_ttl = 60
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return "echo"
+
+    @property
+    def description(self) -> str:
+        return "Echo the message"
+
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        return {"type": "object", "properties": {"message": {"type": "string"}}, "required": ["message"]}
+
+    def is_cacheable(self, parameters: Dict[str, Any]) -> bool:
+        return self.cacheable and parameters["message"] != "live"
+
+    async def execute(self, parameters: Dict[str, Any]) -> Any:
+        self.calls += 1
+        if parameters["message"] == "down":
+            return {"success": False, "error": "service unavailable"}
+        return parameters["message"]
+
+
+class TestToolManagerCaching:
+    """Test result caching in ToolManager.execute_tool"""
+
+    @pytest.mark.asyncio
+    async def test_cacheable_calls_reuse_results(self):
+        """Test that only calls the tool marks cacheable are served from the cache"""
+        memory_manager = Mock()
+        memory_manager.get_tool_configuration.return_value = None
+        tool_manager = ToolManager(memory_manager)
+        tool = EchoTool()
+        tool_manager.loaded_tools["echo"] = tool
+
+        for message in ("hello", "hello", "live", "live"):
+            assert await tool_manager.execute_tool("echo", {"message": message}) == message
+
+        assert tool.calls == 3
+        assert tool_manager.result_cache.get_stats("echo")["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_results_not_cached(self):
+        """Test that results reporting a failure are not served from the cache"""
+        memory_manager = Mock()
+        memory_manager.get_tool_configuration.return_value = None
+        tool_manager = ToolManager(memory_manager)
+        tool = EchoTool()
+        tool_manager.loaded_tools["echo"] = tool
+
+        for _ in range(2):
+            assert (await tool_manager.execute_tool("echo", {"message": "down"}))["success"] is False
+
+        assert tool.calls == 2
+        assert tool.is_cacheable_result({"status": "error"}) is False
+        assert tool.is_cacheable_result({"status": "online", "success": True}) is True
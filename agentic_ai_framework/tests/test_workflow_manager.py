@@ -0,0 +1,381 @@
+"""
+Tests for workflow manager
+"""
+
+import asyncio
+import re
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from managers.workflow_manager import WorkflowManager
+from models import WorkflowExecutionRequest, WorkflowUpdate
+
+
+def make_workflow(steps, **overrides):
+    """Build a stored workflow definition"""
+    workflow = {
+        "name": "test_workflow",
+        "description": "Test workflow",
+        "steps": steps,
+        "enabled": True,
+        "input_schema": None,
+        "output_spec": None,
+        "execution_mode": "sequential",
+        "max_concurrency": None,
+    }
+    workflow.update(overrides)
+    return workflow
+
+
+class SlowToolManager:
+    """Tool manager stub that records call order and sleeps per call"""
+
+    def __init__(self, delay=0.1):
+        self.delay = delay
+        self.calls = []
+
+    async def execute_tool(self, tool_name, parameters, agent_name=None):
+        self.calls.append(parameters.get("url"))
+        await asyncio.sleep(self.delay)
+        return {"url": parameters.get("url"), "status": 200}
+
+
+@pytest.fixture
+def memory_manager():
+    """Mock memory manager"""
+    return Mock()
+
+
+class TestDagExecution:
+    """Test DAG execution mode"""
+
+    def fan_out_steps(self):
+        return [
+            {"type": "tool", "name": "http_client", "parameters": {"url": "a"}, "context_key": "a"},
+            {"type": "tool", "name": "http_client", "parameters": {"url": "b"}, "context_key": "b"},
+            {"type": "tool", "name": "http_client", "parameters": {"url": "c"}, "context_key": "c"},
+            {
+                "type": "tool",
+                "name": "http_client",
+                "parameters": {"url": "all:{{a.url}}-{{b.url}}-{{c.url}}"},
+                "context_key": "combined",
+            },
+        ]
+
+    def test_dependencies_inferred_from_references(self, memory_manager):
+        """Test that dependencies follow variable references"""
+        manager = WorkflowManager(Mock(), Mock(), memory_manager)
+
+        dependencies = manager._build_step_dependencies(self.fan_out_steps())
+
+        assert dependencies == [set(), set(), set(), {0, 1, 2}]
+
+    def test_context_key_writes_stay_ordered(self, memory_manager):
+        """Test that overwriting a context key waits for earlier readers"""
+        manager = WorkflowManager(Mock(), Mock(), memory_manager)
+        steps = [
+            {"type": "tool", "name": "t", "parameters": {}, "context_key": "data"},
+            {"type": "tool", "name": "t", "parameters": {"x": "{{data}}"}, "context_key": "first"},
+            {"type": "tool", "name": "t", "parameters": {}, "context_key": "data"},
+        ]
+
+        dependencies = manager._build_step_dependencies(steps)
+
+        assert dependencies[2] == {0, 1}
+
+    def test_explicit_depends_on(self, memory_manager):
+        """Test explicit dependencies by step number and context key"""
+        manager = WorkflowManager(Mock(), Mock(), memory_manager)
+        steps = self.fan_out_steps()
+        steps[1]["depends_on"] = [1]
+        steps[3]["depends_on"] = ["b"]
+
+        dependencies = manager._build_step_dependencies(steps)
+
+        assert dependencies[1] == {0}
+        assert dependencies[3] == {1}
+
+    def test_depends_on_context_key_uses_latest_writer(self, memory_manager):
+        """Test that a context key dependency resolves to the latest earlier step writing it"""
+        manager = WorkflowManager(Mock(), Mock(), memory_manager)
+        steps = [
+            {"type": "tool", "name": "t", "parameters": {}, "context_key": "data"},
+            {"type": "tool", "name": "t", "parameters": {}, "context_key": "data"},
+            {"type": "tool", "name": "t", "parameters": {}, "context_key": "out", "depends_on": ["data"]},
+            {"type": "tool", "name": "t", "parameters": {}, "context_key": "data"},
+        ]
+
+        dependencies = manager._build_step_dependencies(steps)
+
+        assert dependencies[2] == {1}
+
+    def test_update_rejects_invalid_execution_mode(self):
+        """Test that workflow updates validate the execution mode like new workflows"""
+        assert WorkflowUpdate(execution_mode="dag").execution_mode == "dag"
+        with pytest.raises(ValueError, match="execution_mode"):
+            WorkflowUpdate(execution_mode="parallel")
+
+    def test_execution_request_rejects_invalid_execution_mode(self):
+        """Test that execution requests validate the execution mode override before anything runs"""
+        assert WorkflowExecutionRequest().execution_mode is None
+        with pytest.raises(ValueError, match="execution_mode"):
+            WorkflowExecutionRequest(execution_mode="bogus")
+
+    def test_circular_dependencies_rejected(self, memory_manager):
+        """Test that dependency cycles are reported"""
+        manager = WorkflowManager(Mock(), Mock(), memory_manager)
+        steps = self.fan_out_steps()
+        steps[0]["depends_on"] = [2]
+        steps[1]["depends_on"] = [1]
+
+        with pytest.raises(ValueError, match="circular"):
+            manager._build_step_dependencies(steps)
+
+    @pytest.mark.asyncio
+    async def test_independent_steps_run_concurrently(self, memory_manager):
+        """Test that fan-out steps overlap and results keep step order"""
+        tool_manager = SlowToolManager(delay=0.1)
+        memory_manager.get_workflow.return_value = make_workflow(
+            self.fan_out_steps(), execution_mode="dag"
+        )
+        manager = WorkflowManager(Mock(), tool_manager, memory_manager)
+
+        start = time.monotonic()
+        result = await manager.execute_workflow("test_workflow", {})
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.35
+        assert [r["step"] for r in result["results"]] == [1, 2, 3, 4]
+        assert result["final_context"]["combined"]["url"] == "all:a-b-c"
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self, memory_manager):
+        """Test that max_concurrency bounds running steps"""
+        tool_manager = SlowToolManager(delay=0.1)
+        memory_manager.get_workflow.return_value = make_workflow(self.fan_out_steps())
+        manager = WorkflowManager(Mock(), tool_manager, memory_manager)
+
+        start = time.monotonic()
+        await manager.execute_workflow("test_workflow", {}, execution_mode="dag", max_concurrency=1)
+        elapsed = time.monotonic() - start
+
+        assert elapsed >= 0.4
+        assert tool_manager.calls == ["a", "b", "c", "all:a-b-c"]
+
+    @pytest.mark.asyncio
+    async def test_failed_step_stops_workflow(self, memory_manager):
+        """Test that a failing step fails the workflow with its step number"""
+        steps = self.fan_out_steps()
+        steps[1]["parameters"]["url"] = None
+        memory_manager.get_workflow.return_value = make_workflow(steps, execution_mode="dag")
+        manager = WorkflowManager(Mock(), SlowToolManager(delay=0.01), memory_manager)
+
+        with pytest.raises(Exception, match="failed at step 2"):
+            await manager.execute_workflow("test_workflow", {})
+
+
+class FlakyToolManager:
+    """Tool manager stub that fails for selected items"""
+
+    def __init__(self, fail_on=()):
+        self.fail_on = set(fail_on)
+        self.active = 0
+        self.max_active = 0
+
+    async def execute_tool(self, tool_name, parameters, agent_name=None):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.02)
+            if parameters.get("value") in self.fail_on:
+                raise RuntimeError(f"cannot process {parameters['value']}")
+            if tool_name == "joiner":
+                return ",".join(str(v) for v in parameters["values"])
+            return parameters["value"] * 10
+        finally:
+            self.active -= 1
+
+
+class TestMapStep:
+    """Test map step execution"""
+
+    def map_step(self, **overrides):
+        step = {
+            "type": "map",
+            "name": "process_numbers",
+            "items": "{{numbers}}",
+            "step": {"type": "tool", "name": "multiplier", "parameters": {"value": "{{item}}"},
+                     "preserve_objects": True},
+            "max_concurrency": 2,
+            "context_key": "processed",
+        }
+        step.update(overrides)
+        return step
+
+    @pytest.mark.asyncio
+    async def test_results_ordered_with_bounded_concurrency(self, memory_manager):
+        """Test that item results keep input order and concurrency is bounded"""
+        tool_manager = FlakyToolManager()
+        memory_manager.get_workflow.return_value = make_workflow([self.map_step()])
+        manager = WorkflowManager(Mock(), tool_manager, memory_manager)
+
+        result = await manager.execute_workflow("test_workflow", {"numbers": [1, 2, 3, 4, 5]})
+
+        processed = result["final_context"]["processed"]
+        assert processed["results"] == [10, 20, 30, 40, 50]
+        assert processed["succeeded"] == 5
+        assert tool_manager.max_active == 2
+
+    @pytest.mark.asyncio
+    async def test_item_errors_isolated(self, memory_manager):
+        """Test that a failing item does not fail the others"""
+        memory_manager.get_workflow.return_value = make_workflow([self.map_step()])
+        manager = WorkflowManager(Mock(), FlakyToolManager(fail_on={2}), memory_manager)
+
+        result = await manager.execute_workflow("test_workflow", {"numbers": [1, 2, 3]})
+
+        processed = result["final_context"]["processed"]
+        assert processed["results"] == [10, None, 30]
+        assert processed["failed"] == 1
+        assert processed["errors"][0]["index"] == 1
+
+    @pytest.mark.asyncio
+    async def test_continue_on_error_disabled(self, memory_manager):
+        """Test that continue_on_error false fails the workflow"""
+        memory_manager.get_workflow.return_value = make_workflow([self.map_step(continue_on_error=False)])
+        manager = WorkflowManager(Mock(), FlakyToolManager(fail_on={2}), memory_manager)
+
+        with pytest.raises(Exception, match="failed at step 1"):
+            await manager.execute_workflow("test_workflow", {"numbers": [1, 2, 3]})
+
+    @pytest.mark.asyncio
+    async def test_reduce_step(self, memory_manager):
+        """Test that the reduce step receives the successful results"""
+        step = self.map_step(reduce={
+            "type": "tool", "name": "joiner", "parameters": {"values": "{{results}}"}, "preserve_objects": True
+        })
+        memory_manager.get_workflow.return_value = make_workflow([step])
+        manager = WorkflowManager(Mock(), FlakyToolManager(fail_on={2}), memory_manager)
+
+        result = await manager.execute_workflow("test_workflow", {"numbers": [1, 2, 3]})
+
+        assert result["final_context"]["processed"]["reduced"] == "10,30"
+
+
+class FailOnceToolManager:
+    """Tool manager stub that fails the first call for one URL"""
+
+    def __init__(self, fail_url):
+        self.fail_url = fail_url
+        self.calls = []
+
+    async def execute_tool(self, tool_name, parameters, agent_name=None):
+        self.calls.append(parameters["url"])
+        if parameters["url"] == self.fail_url:
+            self.fail_url = None
+            raise RuntimeError("temporary failure")
+        return {"url": parameters["url"]}
+
+
+class TestCheckpointResume:
+    """Test checkpointing and resuming workflow executions"""
+
+    @pytest.fixture
+    def stored_memory_manager(self, tmp_path):
+        from managers.memory_manager import MemoryManager
+
+        manager = MemoryManager(str(tmp_path / "test.db"))
+        manager.initialize_database()
+        manager.register_workflow("test_workflow", "Test workflow", [
+            {"type": "tool", "name": "http_client", "parameters": {"url": "a"}, "context_key": "a"},
+            {"type": "tool", "name": "http_client", "parameters": {"url": "b:{{a.url}}"}, "context_key": "b"},
+            {"type": "tool", "name": "http_client", "parameters": {"url": "c:{{b.url}}"}, "context_key": "c"},
+        ])
+        return manager
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("execution_mode", ["sequential", "dag"])
+    async def test_resume_skips_completed_steps(self, stored_memory_manager, execution_mode):
+        """Test that a resumed run reuses checkpointed results and only runs the rest"""
+        tool_manager = FailOnceToolManager(fail_url="c:b:a")
+        manager = WorkflowManager(Mock(), tool_manager, stored_memory_manager)
+
+        with pytest.raises(Exception, match=r"failed at step 3 \(execution (\w+)\)") as error:
+            await manager.execute_workflow("test_workflow", {}, execution_mode=execution_mode)
+        execution_id = re.search(r"execution (\w+)", str(error.value)).group(1)
+
+        execution = stored_memory_manager.get_workflow_execution(execution_id)
+        assert execution["status"] == "failed"
+        assert execution["completed_steps"] == [0, 1]
+
+        result = await manager.resume_workflow("test_workflow", execution_id)
+
+        assert tool_manager.calls == ["a", "b:a", "c:b:a", "c:b:a"]
+        assert result["steps_resumed"] == 2
+        assert result["final_context"]["c"] == {"url": "c:b:a"}
+        assert stored_memory_manager.get_workflow_execution(execution_id)["completed_steps"] == []
+
+    @pytest.mark.asyncio
+    async def test_completed_execution_cannot_resume(self, stored_memory_manager):
+        """Test that only failed or interrupted executions can be resumed"""
+        manager = WorkflowManager(Mock(), FailOnceToolManager(fail_url=None), stored_memory_manager)
+
+        result = await manager.execute_workflow("test_workflow", {})
+
+        with pytest.raises(ValueError, match="completed"):
+            await manager.resume_workflow("test_workflow", result["execution_id"])
+
+    def test_old_finished_executions_cleaned_up(self, stored_memory_manager):
+        """Test that finished executions past retention are deleted with their checkpoints"""
+        from datetime import datetime, timedelta
+        from managers.memory_manager import WorkflowExecution
+
+        manager = stored_memory_manager
+        for execution_id, status in [("old_failed", "failed"), ("old_running", "running"), ("new_failed", "failed")]:
+            manager.create_workflow_execution(execution_id, "test_workflow", None, {})
+            manager.save_workflow_checkpoint(execution_id, 0, "tool", "http_client", "a", {"url": "a"})
+            if status != "running":
+                manager.update_workflow_execution_status(execution_id, status, "error")
+        with manager.get_session() as session:
+            session.query(WorkflowExecution).filter(WorkflowExecution.id.in_(["old_failed", "old_running"])).update(
+                {"updated_at": datetime.utcnow() - timedelta(days=30)}, synchronize_session=False
+            )
+            session.commit()
+
+        assert manager.cleanup_workflow_executions(days_to_keep=7) == 1
+
+        assert manager.get_workflow_execution("old_failed") is None
+        assert manager.get_workflow_checkpoints("old_failed") == {}
+        assert manager.get_workflow_execution("old_running")["status"] == "running"
+        assert manager.get_workflow_execution("new_failed")["completed_steps"] == [0]
+
+    def test_only_own_or_dead_executions_marked_interrupted(self, stored_memory_manager):
+        """Test that startup leaves running executions of other live processes alone"""
+        import os
+        import socket
+        from managers.memory_manager import WorkflowExecution
+
+        manager = stored_memory_manager
+        host = socket.gethostname()
+        owners = {
+            "own": f"{host}:{os.getpid()}",
+            "live_worker": f"{host}:{os.getppid()}",
+            "dead_worker": f"{host}:999999999",
+            "other_host": "another-host:1",
+        }
+        for execution_id, owner in owners.items():
+            manager.create_workflow_execution(execution_id, "test_workflow", None, {})
+            with manager.get_session() as session:
+                session.query(WorkflowExecution).filter(WorkflowExecution.id == execution_id).update(
+                    {"owner": owner}, synchronize_session=False
+                )
+                session.commit()
+
+        assert manager.mark_interrupted_workflow_executions() == 2
+
+        statuses = {execution_id: manager.get_workflow_execution(execution_id)["status"] for execution_id in owners}
+        assert statuses == {
+            "own": "interrupted", "live_worker": "running", "dead_worker": "interrupted", "other_host": "running"
+        }
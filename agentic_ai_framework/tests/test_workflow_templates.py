@@ -0,0 +1,78 @@
+"""
+Tests for compiled workflow templates
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from managers.workflow_manager import WorkflowManager
+from managers.workflow_templates import CompiledStep, compile_template
+
+
+@pytest.fixture
+def context():
+    return {
+        "name": "report",
+        "count": 3,
+        "attachments": {"vault_files": [{"vault_filename": "a.pdf"}, {"vault_filename": "b.pdf"}]},
+        "users": [{"id": 1}, {"email": "x@example.com"}],
+    }
+
+
+class TestTemplate:
+    """Test template compilation and rendering"""
+
+    def test_nested_path_with_index(self, context):
+        """Test dotted keys combined with list indexes"""
+        template = compile_template("{{attachments.vault_files[1].vault_filename}}")
+
+        assert template.render(context) == "b.pdf"
+
+    def test_key_lookup_on_list(self, context):
+        """Test that a key on a list selects the first dict containing it"""
+        assert compile_template("{{users.email}}").render(context) == "x@example.com"
+
+    def test_single_reference_preserves_objects(self, context):
+        """Test that a lone reference returns the object when requested"""
+        template = compile_template(" {{attachments.vault_files}} ")
+
+        assert template.render(context, preserve_objects=True) == context["attachments"]["vault_files"]
+        assert template.render(context) == str(context["attachments"]["vault_files"])
+
+    def test_multiple_references(self, context):
+        """Test that text starting and ending with references renders all of them"""
+        assert compile_template("{{name}}-{{count}}").render(context, preserve_objects=True) == "report-3"
+
+    def test_unresolved_references_kept(self, context):
+        """Test that missing paths and invalid indexes stay as written"""
+        assert compile_template("{{missing}}").render(context) == "{{missing}}"
+        assert compile_template("{{users[5].id}}").render(context) == "{{users[5].id}}"
+        assert compile_template("x {{users[a]}} {{count}}").render(context) == "x {{users[a]}} 3"
+
+    def test_render_builds_new_containers(self, context):
+        """Test that resolved steps do not share containers with the definition"""
+        step = {"type": "tool", "name": "t", "parameters": {"tags": ["a"], "title": "{{name}}"}}
+        compiled = CompiledStep(step)
+
+        resolved = compiled.render(context)
+        resolved["parameters"]["tags"].append("b")
+
+        assert resolved["parameters"]["title"] == "report"
+        assert step["parameters"]["tags"] == ["a"]
+
+
+class TestCompiledStepCache:
+    """Test per-version caching of compiled workflow steps"""
+
+    def workflow(self, updated_at):
+        return {"id": 1, "name": "wf", "updated_at": updated_at,
+                "steps": [{"type": "tool", "name": "t", "parameters": {"x": "{{name}}"}}]}
+
+    def test_compiled_once_per_version(self):
+        """Test that compiled steps are reused until the workflow changes"""
+        manager = WorkflowManager(Mock(), Mock(), Mock())
+
+        first = manager._get_compiled_steps(self.workflow("v1"))
+
+        assert manager._get_compiled_steps(self.workflow("v1")) is first
+        assert manager._get_compiled_steps(self.workflow("v2")) is not first
@@ -6,11 +6,36 @@ All custom tools should inherit from this class.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+
+import aiohttp
+
+from .http_pool import HttpClientPool
+from .mail_pool import MailConnectionPool
 
 class BaseTool(ABC):
     """Abstract base class for all tools in the framework"""
     
+    # Whether several calls of this tool from one agent response may run at
+    # the same time; tools with shared per-instance state should set False
+    parallel_safe: bool = True
+    
+    # Seconds an agent tool call may take, overriding TOOL_CALL_TIMEOUT
+    timeout: Optional[float] = None
+    
+    # Opt-in result caching for idempotent tools: a result is reused for
+    # cache_ttl seconds by calls with the same cache_key_fields parameters
+    # (all parameters when None) and the same tool configuration
+    cacheable: bool = False
+    cache_ttl: float = 60
+    cache_key_fields: Optional[List[str]] = None
+    
+    # Shared HTTP connection pool, injected by the tool manager
+    http_pool: Optional[HttpClientPool] = None
+    
+    # Shared IMAP/SMTP connection pool, injected by the tool manager
+    mail_pool: Optional[MailConnectionPool] = None
+    
     def __init__(self):
         """Initialize the tool with empty configuration"""
         self.config = {}
@@ -64,6 +89,87 @@ class BaseTool(ABC):
         """
         pass
     
+    def set_dependencies(
+        self,
+        memory_manager,
+        config,
+        http_pool: Optional[HttpClientPool] = None,
+        mail_pool: Optional[MailConnectionPool] = None
+    ):
+        """
+        Receive shared services from the tool manager
+        
+        Tools needing the memory manager or the application configuration
+        override this and call the base implementation.
+        
+        Args:
+            memory_manager: Memory manager for persistence
+            config: Application configuration
+            http_pool: Shared HTTP connection pool
+            mail_pool: Shared IMAP/SMTP connection pool
+        """
+        if http_pool is not None:
+            self.http_pool = http_pool
+        if mail_pool is not None:
+            self.mail_pool = mail_pool
+    
+    async def http_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session for making requests
+        
+        Tools used without a tool manager get a pool of their own.
+        
+        Returns:
+            Pooled aiohttp.ClientSession; do not close it
+        """
+        if self.http_pool is None:
+            self.http_pool = HttpClientPool()
+        return await self.http_pool.get_session()
+    
+    def get_mail_pool(self) -> MailConnectionPool:
+        """
+        Get the shared IMAP/SMTP connection pool
+        
+        Tools used without a tool manager get a pool of their own.
+        """
+        if self.mail_pool is None:
+            self.mail_pool = MailConnectionPool()
+        return self.mail_pool
+    
+    def is_cacheable(self, parameters: Dict[str, Any]) -> bool:
+        """
+        Check if the result of a call may be cached
+        
+        Override to exclude calls with side effects, such as non-GET requests.
+        
+        Args:
+            parameters: Call parameters
+            
+        Returns:
+            True if the result may be served from and stored in the cache
+        """
+        return self.cacheable
+    
+    def is_cacheable_result(self, result: Any) -> bool:
+        """
+        Check if a call's result may be stored in the cache
+        
+        Results reporting a failure, with success set to False or a
+        "timeout" or "error" status, are not cached so the next call retries.
+        
+        Args:
+            result: Result returned by execute
+            
+        Returns:
+            True if the result may be stored in the cache
+        """
+        if isinstance(result, dict):
+            if result.get("success") is False:
+                return False
+            if result.get("status") in ("timeout", "error"):
+                return False
+        return True
+    
     def set_config(self, config: Dict[str, Any]):
         """
         Set tool-specific configuration
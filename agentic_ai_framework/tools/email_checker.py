@@ -18,6 +18,9 @@ from .base_tool import BaseTool
 
 logger = logging.getLogger(__name__)
 
+# Headers fetched for email listings; full messages are only fetched when read
+LISTING_HEADERS = ["SUBJECT", "FROM", "TO", "DATE"]
+
 class EmailCheckerTool(BaseTool):
     """Tool for checking emails using POP3 or IMAP protocols"""
     
@@ -179,24 +182,7 @@ class EmailCheckerTool(BaseTool):
     
     async def _list_imap_folders(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """List IMAP folders"""
-        try:
-            import imaplib
-            
-            # Create SSL context
-            ssl_context = ssl.create_default_context()
-            if not config["use_ssl"]:
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-            
-            # Connect to IMAP server
-            if config["use_ssl"]:
-                server = imaplib.IMAP4_SSL(config["host"], config["port"], ssl_context=ssl_context)
-            else:
-                server = imaplib.IMAP4(config["host"], config["port"])
-            
-            # Login
-            server.login(config["username"], config["password"])
-            
+        def list_folders(server) -> Dict[str, Any]:
             # List folders
             status, folders = server.list()
             if status != "OK":
@@ -227,14 +213,14 @@ class EmailCheckerTool(BaseTool):
                         "delimiter": delimiter
                     })
             
-            server.logout()
-            
             return {
                 "protocol": "imap",
                 "folders": folder_list,
                 "message": f"Found {len(folder_list)} folders"
             }
-            
+        
+        try:
+            return await self.get_mail_pool().run("imap", config, list_folders)
         except Exception as e:
             error_msg = f"Failed to list IMAP folders: {e}"
             logger.error(error_msg)
@@ -242,6 +228,11 @@ class EmailCheckerTool(BaseTool):
     
     async def _check_pop3_emails(self, config: Dict[str, Any], folder: str, limit: int, unread_only: bool) -> Dict[str, Any]:
         """Check POP3 emails"""
+        # POP3 sessions only see the mailbox as it was at login, so they are not pooled
+        return await asyncio.to_thread(self._check_pop3_emails_sync, config, folder, limit, unread_only)
+    
+    def _check_pop3_emails_sync(self, config: Dict[str, Any], folder: str, limit: int, unread_only: bool) -> Dict[str, Any]:
+        """Check POP3 emails on a worker thread"""
         try:
             import poplib
             
@@ -313,34 +304,17 @@ class EmailCheckerTool(BaseTool):
     
     async def _check_imap_emails(self, config: Dict[str, Any], folder: str, limit: int, unread_only: bool) -> Dict[str, Any]:
         """Check IMAP emails"""
-        try:
-            import imaplib
-            
-            # Create SSL context
-            ssl_context = ssl.create_default_context()
-            if not config["use_ssl"]:
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-            
-            # Connect to IMAP server
-            if config["use_ssl"]:
-                server = imaplib.IMAP4_SSL(config["host"], config["port"], ssl_context=ssl_context)
-            else:
-                server = imaplib.IMAP4(config["host"], config["port"])
-            
-            # Login
-            server.login(config["username"], config["password"])
-            
+        def check_emails(server) -> Dict[str, Any]:
             # Select folder
             status, messages = server.select(folder)
             if status != "OK":
                 raise Exception(f"Failed to select folder {folder}: {messages}")
             
-            # Search for emails
+            # Search for emails by UID, which stays valid across connections
             if unread_only:
-                status, message_ids = server.search(None, "UNSEEN")
+                status, message_ids = server.uid("SEARCH", None, "UNSEEN")
             else:
-                status, message_ids = server.search(None, "ALL")
+                status, message_ids = server.uid("SEARCH", None, "ALL")
             
             if status != "OK":
                 raise Exception(f"Failed to search emails: {message_ids}")
@@ -348,7 +322,6 @@ class EmailCheckerTool(BaseTool):
             # Get email IDs
             email_ids = message_ids[0].decode().split()
             if not email_ids:
-                server.logout()
                 return {
                     "protocol": "imap",
                     "folder": folder,
@@ -361,62 +334,8 @@ class EmailCheckerTool(BaseTool):
             # Limit the number of emails
             email_ids = email_ids[-limit:]  # Get the most recent emails
             
-            emails = []
-            for email_id in email_ids:
-                try:
-                    # Fetch email headers and flags (using PEEK to avoid marking as read)
-                    status, msg_data = server.fetch(email_id, "(BODY.PEEK[] FLAGS)")
-                    if status != "OK" or not msg_data:
-                        continue
-                    
-                    # Parse the response - msg_data is a list of tuples
-                    email_content = None
-                    for item in msg_data:
-                        if isinstance(item, tuple) and len(item) >= 2:
-                            if item[1] is not None and isinstance(item[1], bytes):
-                                email_content = item[1]
-                                break
-                    
-                    if not email_content:
-                        continue
-                    
-                    # Parse email headers
-                    email_message = message_from_bytes(email_content)
-                    
-                    # Extract basic info
-                    subject = self._decode_header(email_message.get("Subject", ""))
-                    from_addr = self._decode_header(email_message.get("From", ""))
-                    to_addr = self._decode_header(email_message.get("To", ""))
-                    date = email_message.get("Date", "")
-                    
-                    # Check if email is read by parsing flags
-                    is_read = False
-                    # Look for flags in the response data
-                    for item in msg_data:
-                        if isinstance(item, tuple) and len(item) >= 2:
-                            item_data = item[1]
-                            if isinstance(item_data, str) and item_data.startswith('FLAGS'):
-                                # Parse flags string like "FLAGS (\\Seen \\Answered)"
-                                flags_match = re.search(r'FLAGS \(([^)]*)\)', item_data)
-                                if flags_match:
-                                    flags = flags_match.group(1).split()
-                                    is_read = "\\Seen" in flags or "SEEN" in flags
-                                break
-                    
-                    emails.append({
-                        "id": email_id,
-                        "subject": subject,
-                        "from": from_addr,
-                        "to": to_addr,
-                        "date": date,
-                        "read": is_read
-                    })
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to read email {email_id}: {e}")
-                    continue
-            
-            server.logout()
+            # Listing needs headers only; bodies are fetched by read_email
+            emails = self._fetch_imap_headers(server, email_ids)
             
             return {
                 "protocol": "imap",
@@ -426,14 +345,78 @@ class EmailCheckerTool(BaseTool):
                 "emails": emails,
                 "message": f"Retrieved {len(emails)} {'unread ' if unread_only else ''}emails from {folder}"
             }
-            
+        
+        try:
+            return await self.get_mail_pool().run("imap", config, check_emails)
         except Exception as e:
             error_msg = f"Failed to check IMAP emails: {e}"
             logger.error(error_msg)
             raise Exception(error_msg)
     
+    def _fetch_imap_headers(self, server, email_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch the listing headers, flags and sizes of many emails in one round trip
+        
+        Args:
+            server: Logged in IMAP connection with the folder selected
+            email_ids: UIDs of the emails
+            
+        Returns:
+            Email summaries in the order of email_ids
+        """
+        status, msg_data = server.uid(
+            "FETCH", ",".join(email_ids),
+            f"(UID FLAGS RFC822.SIZE BODY.PEEK[HEADER.FIELDS ({' '.join(LISTING_HEADERS)})])"
+        )
+        if status != "OK":
+            raise Exception(f"Failed to fetch emails: {msg_data}")
+        
+        # Each message arrives as a (metadata, headers) tuple, possibly followed
+        # by more metadata such as FLAGS when the server sends it after the literal
+        messages: Dict[str, Dict[str, Any]] = {}
+        current = None
+        for item in msg_data or []:
+            if isinstance(item, tuple) and len(item) >= 2:
+                metadata = item[0].decode(errors="ignore") if isinstance(item[0], bytes) else str(item[0])
+                current = {"metadata": metadata, "headers": item[1] or b""}
+            elif isinstance(item, bytes) and current is not None:
+                current["metadata"] += " " + item.decode(errors="ignore")
+            else:
+                continue
+            uid_match = re.search(r"UID (\d+)", current["metadata"])
+            if uid_match:
+                messages[uid_match.group(1)] = current
+        
+        emails = []
+        for email_id in email_ids:
+            message = messages.get(email_id)
+            if message is None:
+                logger.warning(f"Failed to read email {email_id}: not returned by server")
+                continue
+            
+            email_message = message_from_bytes(message["headers"])
+            flags_match = re.search(r"FLAGS \(([^)]*)\)", message["metadata"])
+            flags = flags_match.group(1).split() if flags_match else []
+            size_match = re.search(r"RFC822\.SIZE (\d+)", message["metadata"])
+            
+            emails.append({
+                "id": email_id,
+                "subject": self._decode_header(email_message.get("Subject", "")),
+                "from": self._decode_header(email_message.get("From", "")),
+                "to": self._decode_header(email_message.get("To", "")),
+                "date": email_message.get("Date", ""),
+                "size": int(size_match.group(1)) if size_match else None,
+                "read": "\\Seen" in flags
+            })
+        
+        return emails
+    
     async def _read_pop3_email(self, config: Dict[str, Any], email_id: str, include_attachments: bool) -> Dict[str, Any]:
         """Read a specific POP3 email"""
+        return await asyncio.to_thread(self._read_pop3_email_sync, config, email_id, include_attachments)
+    
+    def _read_pop3_email_sync(self, config: Dict[str, Any], email_id: str, include_attachments: bool) -> Dict[str, Any]:
+        """Read a specific POP3 email on a worker thread"""
         try:
             import poplib
             ssl_context = ssl.create_default_context()
@@ -466,31 +449,14 @@ class EmailCheckerTool(BaseTool):
     
     async def _read_imap_email(self, config: Dict[str, Any], email_id: str, include_attachments: bool, folder: str) -> Dict[str, Any]:
         """Read a specific IMAP email"""
-        try:
-            import imaplib
-            
-            # Create SSL context
-            ssl_context = ssl.create_default_context()
-            if not config["use_ssl"]:
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-            
-            # Connect to IMAP server
-            if config["use_ssl"]:
-                server = imaplib.IMAP4_SSL(config["host"], config["port"], ssl_context=ssl_context)
-            else:
-                server = imaplib.IMAP4(config["host"], config["port"])
-            
-            # Login
-            server.login(config["username"], config["password"])
-            
+        def read_email(server) -> Dict[str, Any]:
             # Select folder
             status, messages = server.select(folder)
             if status != "OK":
                 raise Exception(f"Failed to select folder {folder}: {messages}")
             
-            # Fetch email content (using PEEK to avoid marking as read)
-            status, msg_data = server.fetch(email_id, "(BODY.PEEK[] FLAGS)")
+            # Fetch email content by the UID from check_emails (using PEEK to avoid marking as read)
+            status, msg_data = server.uid("FETCH", email_id, "(BODY.PEEK[] FLAGS)")
             if status != "OK" or not msg_data:
                 raise Exception(f"Failed to fetch email: {msg_data}")
             
@@ -511,14 +477,14 @@ class EmailCheckerTool(BaseTool):
             email_data["id"] = email_id
             email_data["raw_content"] = email_content
             
-            server.logout()
-            
             return {
                 "protocol": "imap",
                 "email": email_data,
                 "message": f"Successfully read IMAP email {email_id} from {folder}"
             }
-            
+        
+        try:
+            return await self.get_mail_pool().run("imap", config, read_email)
         except Exception as e:
             error_msg = f"Failed to read IMAP email {email_id}: {e}"
             logger.error(error_msg)
@@ -6,7 +6,6 @@ Supports HTML and plain text emails with attachments support.
 """
 
 import smtplib
-import ssl
 import logging
 import base64
 from email.mime.text import MIMEText
@@ -214,38 +213,22 @@ class EmailSenderTool(BaseTool):
             if bcc_emails:
                 recipients.extend([email.strip() for email in bcc_emails.split(",")])
             
-            # Connect to SMTP server and send
-            logger.info(f"Connecting to SMTP server {smtp_host}:{smtp_port}")
-            
-            # Create SSL context if needed
-            ssl_context = None
-            if smtp_use_ssl or smtp_use_tls:
-                ssl_context = ssl.create_default_context()
-                if not smtp_verify_ssl:
-                    ssl_context.check_hostname = False
-                    ssl_context.verify_mode = ssl.CERT_NONE
-            
-            # Connect using appropriate method
-            if smtp_use_ssl:
-                # SSL connection from the start
-                server = smtplib.SMTP_SSL(smtp_host, smtp_port, context=ssl_context)
-                logger.debug("Established SSL connection")
-            else:
-                # Regular connection with optional STARTTLS
-                server = smtplib.SMTP(smtp_host, smtp_port)
-                if smtp_use_tls:
-                    server.starttls(context=ssl_context)
-                    logger.debug("Started TLS connection")
-            
-            # Login and send
-            server.login(smtp_username, smtp_password)
-            logger.debug("SMTP login successful")
-            
-            server.send_message(msg, to_addrs=recipients)
+            # Send over a pooled, logged in SMTP session (SSL from the start or STARTTLS)
+            account = {
+                "host": smtp_host,
+                "port": smtp_port,
+                "username": smtp_username,
+                "password": smtp_password,
+                "use_ssl": smtp_use_ssl,
+                "use_tls": smtp_use_tls,
+                "verify_ssl": smtp_verify_ssl
+            }
+            # Not retried: a connection dropped mid-send may have delivered the message
+            await self.get_mail_pool().run(
+                "smtp", account, lambda server: server.send_message(msg, to_addrs=recipients), retry=False
+            )
             logger.info(f"Email sent successfully to {len(recipients)} recipients with {attachment_count} attachments")
             
-            server.quit()
-            
             return {
                 "status": "sent",
                 "to": to_email,
@@ -23,6 +23,9 @@ logger = logging.getLogger(__name__)
 class FileVaultTool(BaseTool):
     """Secure file vault for temporary file storage and retrieval"""
     
+    # Calls switch the active vault and often depend on each other (write, then read)
+    parallel_safe = False
+    
     def __init__(self, vault_id: str = ""):
         """Initialize the file vault with a secure temporary directory, optionally using a provided vault_id"""
         super().__init__()
@@ -18,6 +18,11 @@ logger = logging.getLogger(__name__)
 class HttpClientTool(BaseTool):
     """Tool for performing HTTP requests"""
     
+    # Only GET requests are cached, see is_cacheable
+    cacheable = True
+    cache_ttl = 60
+    cache_key_fields = ["url", "method", "headers", "params", "follow_redirects", "verify_ssl"]
+    
     @property
     def name(self) -> str:
         return "http_client"
@@ -74,6 +79,10 @@ class HttpClientTool(BaseTool):
             "required": ["url"]
         }
     
+    def is_cacheable(self, parameters: Dict[str, Any]) -> bool:
+        """Cache GET requests only; other methods may change server state"""
+        return self.cacheable and parameters.get("method", "GET").upper() == "GET"
+    
     async def execute(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute HTTP request
@@ -103,81 +112,74 @@ class HttpClientTool(BaseTool):
         logger.info(f"Making {method} request to {url}")
         
         try:
-            # Configure aiohttp session
-            connector = aiohttp.TCPConnector(
-                verify_ssl=verify_ssl,
-                limit=10
-            )
+            # Shared pooled session; timeout and certificate checks are per request
+            session = await self.http_session()
             
-            timeout_config = aiohttp.ClientTimeout(total=timeout)
+            # Prepare request kwargs
+            request_kwargs = {
+                "headers": headers,
+                "params": params,
+                "allow_redirects": follow_redirects,
+                "timeout": aiohttp.ClientTimeout(total=timeout)
+            }
+            if not verify_ssl:
+                request_kwargs["ssl"] = False
             
-            async with aiohttp.ClientSession(
-                connector=connector,
-                timeout=timeout_config
-            ) as session:
+            # Add data for POST/PUT requests
+            if method in ["POST", "PUT", "PATCH"] and data:
+                if isinstance(data, dict):
+                    request_kwargs["json"] = data
+                else:
+                    request_kwargs["data"] = data
+            
+            # Make the request
+            async with session.request(method, url, **request_kwargs) as response:
+                # Get response content
+                try:
+                    # Try to parse as JSON first
+                    content = await response.json()
+                    content_type = "json"
+                except:
+                    # Fall back to text
+                    content = await response.text()
+                    content_type = "text"
                 
-                # Prepare request kwargs
-                request_kwargs = {
-                    "headers": headers,
-                    "params": params,
-                    "allow_redirects": follow_redirects
+                # Build result
+                result = {
+                    "url": str(response.url),
+                    "method": method,
+                    "status_code": response.status,
+                    "status_text": response.reason,
+                    "headers": dict(response.headers),
+                    "content": content,
+                    "content_type": content_type,
+                    "content_length": len(str(content)),
+                    "success": 200 <= response.status < 300,
+                    "redirected": str(response.url) != url,
+                    "encoding": response.get_encoding()
                 }
                 
-                # Add data for POST/PUT requests
-                if method in ["POST", "PUT", "PATCH"] and data:
-                    if isinstance(data, dict):
-                        request_kwargs["json"] = data
-                    else:
-                        request_kwargs["data"] = data
+                # Add request details for debugging
+                result["request"] = {
+                    "url": url,
+                    "method": method,
+                    "headers": {k: v for k, v in headers.items() if k.lower() not in ["authorization", "api-key"]},  # Don't log sensitive headers
+                    "params": params
+                }
+                
+                if method in ["POST", "PUT", "PATCH"]:
+                    result["request"]["data_sent"] = bool(data)
+                
+                # Add success message
+                if result["success"]:
+                    result["message"] = f"HTTP {method} to {url} successful (status {response.status})"
+                    logger.info(result["message"])
+                else:
+                    result["message"] = f"HTTP {method} to {url} failed (status {response.status})"
+                    logger.warning(result["message"])
+                
+                return result
                 
-                # Make the request
-                async with session.request(method, url, **request_kwargs) as response:
-                    # Get response content
-                    try:
-                        # Try to parse as JSON first
-                        content = await response.json()
-                        content_type = "json"
-                    except:
-                        # Fall back to text
-                        content = await response.text()
-                        content_type = "text"
-                    
-                    # Build result
-                    result = {
-                        "url": str(response.url),
-                        "method": method,
-                        "status_code": response.status,
-                        "status_text": response.reason,
-                        "headers": dict(response.headers),
-                        "content": content,
-                        "content_type": content_type,
-                        "content_length": len(str(content)),
-                        "success": 200 <= response.status < 300,
-                        "redirected": str(response.url) != url,
-                        "encoding": response.get_encoding()
-                    }
-                    
-                    # Add request details for debugging
-                    result["request"] = {
-                        "url": url,
-                        "method": method,
-                        "headers": {k: v for k, v in headers.items() if k.lower() not in ["authorization", "api-key"]},  # Don't log sensitive headers
-                        "params": params
-                    }
-                    
-                    if method in ["POST", "PUT", "PATCH"]:
-                        result["request"]["data_sent"] = bool(data)
-                    
-                    # Add success message
-                    if result["success"]:
-                        result["message"] = f"HTTP {method} to {url} successful (status {response.status})"
-                        logger.info(result["message"])
-                    else:
-                        result["message"] = f"HTTP {method} to {url} failed (status {response.status})"
-                        logger.warning(result["message"])
-                    
-                    return result
-                    
         except asyncio.TimeoutError:
             error_msg = f"HTTP request to {url} timed out after {timeout} seconds"
             logger.error(error_msg)
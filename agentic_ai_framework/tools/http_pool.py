@@ -0,0 +1,72 @@
+"""
+tools/http_pool.py - Shared HTTP Connection Pool for Tools
+
+Provides one aiohttp session, and so one connection pool, shared by every
+HTTP-based tool. Keep-alive connections, cached DNS lookups and TLS sessions
+are reused across tool calls instead of being set up again for every request.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+class HttpClientPool:
+    """Lazily created aiohttp session shared by HTTP-based tools"""
+
+    def __init__(self, pool_config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the pool
+
+        Args:
+            pool_config: Optional settings with keys:
+                - limit: Maximum open connections (default 100)
+                - limit_per_host: Maximum open connections per host (default 10)
+                - keepalive_timeout: Seconds idle connections are kept (default 30)
+                - dns_cache_ttl: Seconds DNS lookups are cached (default 300)
+        """
+        self.pool_config = pool_config or {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared session, creating it on first use
+
+        Requests set their own timeout; certificate checks can be turned off
+        per request with ssl=False, so all tools can use the same session.
+        Cookies are never stored, so one call's cookies are not sent with
+        another's.
+
+        Returns:
+            Shared aiohttp.ClientSession
+
+        Raises:
+            RuntimeError: If the open session belongs to another event loop;
+                close the pool there before using it from a new loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._loop is not loop:
+            raise RuntimeError("HTTP connection pool is in use by another event loop; close it before switching loops")
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_config.get("limit", 100),
+                limit_per_host=self.pool_config.get("limit_per_host", 10),
+                keepalive_timeout=self.pool_config.get("keepalive_timeout", 30),
+                ttl_dns_cache=self.pool_config.get("dns_cache_ttl", 300)
+            )
+            self._session = aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+            self._loop = loop
+            logger.debug("Created shared HTTP connection pool for tools")
+        return self._session
+
+    async def close(self):
+        """Close the shared session and release pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.debug("Closed shared HTTP connection pool for tools")
+        self._session = None
+        self._loop = None
@@ -0,0 +1,249 @@
+"""
+tools/mail_pool.py - Shared Mail Connection Pool for Tools
+
+Keeps logged in IMAP and SMTP sessions per account so email tools skip the
+TCP, TLS and login handshakes on every call. The blocking imaplib and smtplib
+work runs on worker threads instead of the event loop.
+"""
+
+import asyncio
+import hashlib
+import imaplib
+import logging
+import smtplib
+import ssl
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Errors meaning the connection is gone, so a fresh one may succeed
+CONNECTION_ERRORS = (imaplib.IMAP4.abort, smtplib.SMTPServerDisconnected, ConnectionError, EOFError)
+
+class MailConnectionPool:
+    """Per-account pool of authenticated IMAP and SMTP connections"""
+
+    def __init__(self, pool_config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the pool
+
+        Args:
+            pool_config: Optional settings with keys:
+                - max_per_account: Maximum connections open to one account (default 4)
+                - idle_timeout: Seconds an unused connection is kept (default 300)
+                - keepalive_interval: Seconds of idleness after which a connection
+                  is checked with NOOP before reuse (default 30)
+        """
+        pool_config = pool_config or {}
+        self.max_per_account = max(1, pool_config.get("max_per_account", 4))
+        self.idle_timeout = pool_config.get("idle_timeout", 300)
+        self.keepalive_interval = pool_config.get("keepalive_interval", 30)
+        # Account key -> idle (last used, connection), most recently used last
+        self._idle: Dict[Tuple, List[Tuple[float, Any]]] = {}
+        self._limits: Dict[Tuple, asyncio.Semaphore] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Logouts of connections abandoned by cancelled callers
+        self._closing: Set[asyncio.Task] = set()
+
+    async def run(
+        self,
+        protocol: str,
+        account: Dict[str, Any],
+        operation: Callable[[Any], T],
+        retry: bool = True
+    ) -> T:
+        """
+        Run a blocking operation on a pooled connection in a worker thread
+
+        The connection is returned to the pool when the operation succeeds and
+        closed when it fails. If a reused connection turns out to be dropped,
+        the operation is run once more on a new connection unless retry is False.
+        When the caller is cancelled, the worker thread cannot be stopped, so
+        the connection is closed once the thread is done with it.
+
+        Args:
+            protocol: "imap" or "smtp"
+            account: Server settings with host, port, username, password and
+                use_ssl; SMTP also uses use_tls and verify_ssl
+            operation: Callable receiving the logged in connection
+            retry: Whether the operation may run again after a dropped connection
+
+        Returns:
+            Result of the operation
+        """
+        key = self._account_key(protocol, account)
+        async with self._limit(key):
+            connection, reused = await self._acquire(protocol, key, account)
+            try:
+                result = await self._call(protocol, connection, operation)
+            except Exception as e:
+                await asyncio.to_thread(self._disconnect, protocol, connection)
+                if not (retry and reused and isinstance(e, CONNECTION_ERRORS)):
+                    raise
+                logger.info(f"Pooled {protocol.upper()} connection to {account['host']} was dropped, reconnecting")
+                connection = await self._open(protocol, account)
+                try:
+                    result = await self._call(protocol, connection, operation)
+                except Exception:
+                    await asyncio.to_thread(self._disconnect, protocol, connection)
+                    raise
+            self._idle.setdefault(key, []).append((time.monotonic(), connection))
+            return result
+
+    async def close(self):
+        """Log out of all idle connections and wait for abandoned ones to close"""
+        idle, self._idle = self._idle, {}
+        for key, entries in idle.items():
+            for _, connection in entries:
+                await asyncio.to_thread(self._disconnect, key[0], connection)
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+        if idle:
+            logger.debug("Closed shared mail connection pool for tools")
+
+    def _limit(self, key: Tuple) -> asyncio.Semaphore:
+        """Get the semaphore bounding the open connections of an account"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._limits = {}
+            self._loop = loop
+        if key not in self._limits:
+            self._limits[key] = asyncio.Semaphore(self.max_per_account)
+        return self._limits[key]
+
+    async def _acquire(self, protocol: str, key: Tuple, account: Dict[str, Any]) -> Tuple[Any, bool]:
+        """Get a live idle connection of the account, or open a new one"""
+        await self._close_expired()
+        entries = self._idle.get(key, [])
+        while entries:
+            last_used, connection = entries.pop()
+            idle_for = time.monotonic() - last_used
+            if idle_for <= self.idle_timeout and (
+                idle_for <= self.keepalive_interval
+                or await self._call(protocol, connection, lambda connection: self._is_alive(protocol, connection))
+            ):
+                return connection, True
+            await asyncio.to_thread(self._disconnect, protocol, connection)
+
+        logger.debug(f"Opening {protocol.upper()} connection to {account['host']}:{account['port']}")
+        return await self._open(protocol, account), False
+
+    async def _close_expired(self):
+        """Log out of idle connections of all accounts unused past idle_timeout"""
+        expired_before = time.monotonic() - self.idle_timeout
+        expired = []
+        for key in list(self._idle):
+            entries = self._idle[key]
+            expired.extend((key[0], connection) for last_used, connection in entries if last_used < expired_before)
+            entries[:] = [entry for entry in entries if entry[0] >= expired_before]
+            if not entries:
+                del self._idle[key]
+        for protocol, connection in expired:
+            await asyncio.to_thread(self._disconnect, protocol, connection)
+
+    async def _open(self, protocol: str, account: Dict[str, Any]):
+        """Connect in a worker thread, closing the connection if the caller is cancelled meanwhile"""
+        future = asyncio.ensure_future(asyncio.to_thread(self._connect, protocol, account))
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            self._close_when_done(protocol, None, future)
+            raise
+
+    async def _call(self, protocol: str, connection, operation: Callable[[Any], T]) -> T:
+        """Run an operation or check in a worker thread, closing the connection if the caller is cancelled meanwhile"""
+        future = asyncio.ensure_future(asyncio.to_thread(operation, connection))
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            self._close_when_done(protocol, connection, future)
+            raise
+
+    def _close_when_done(self, protocol: str, connection, future: asyncio.Future):
+        """Log out of a connection once the worker thread of a cancelled caller is done with it"""
+        async def close():
+            try:
+                result = await future
+            except Exception:
+                result = None
+            # Without a connection, the caller was connecting and the result is the new one
+            abandoned = connection if connection is not None else result
+            if abandoned is not None:
+                await asyncio.to_thread(self._disconnect, protocol, abandoned)
+
+        task = asyncio.ensure_future(close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    def _account_key(protocol: str, account: Dict[str, Any]) -> Tuple:
+        # Hashed so changed credentials get their own connections without
+        # keeping the password in the key
+        password = hashlib.sha256(str(account.get("password", "")).encode()).hexdigest()
+        return (
+            protocol, account["host"], account["port"], account["username"], password,
+            account.get("use_ssl"), account.get("use_tls"), account.get("verify_ssl")
+        )
+
+    @staticmethod
+    def _connect(protocol: str, account: Dict[str, Any]):
+        """Open and log in a connection"""
+        if protocol == "imap":
+            if account.get("use_ssl", True):
+                connection = imaplib.IMAP4_SSL(
+                    account["host"], account["port"], ssl_context=ssl.create_default_context()
+                )
+            else:
+                connection = imaplib.IMAP4(account["host"], account["port"])
+            try:
+                connection.login(account["username"], account["password"])
+            except Exception:
+                connection.shutdown()
+                raise
+            return connection
+
+        if protocol == "smtp":
+            ssl_context = None
+            if account.get("use_ssl") or account.get("use_tls", True):
+                ssl_context = ssl.create_default_context()
+                if not account.get("verify_ssl", True):
+                    ssl_context.check_hostname = False
+                    ssl_context.verify_mode = ssl.CERT_NONE
+            if account.get("use_ssl"):
+                connection = smtplib.SMTP_SSL(account["host"], account["port"], context=ssl_context)
+            else:
+                connection = smtplib.SMTP(account["host"], account["port"])
+                if account.get("use_tls", True):
+                    connection.starttls(context=ssl_context)
+            try:
+                connection.login(account["username"], account["password"])
+            except Exception:
+                connection.close()
+                raise
+            return connection
+
+        raise ValueError(f"Unsupported mail protocol: {protocol}")
+
+    @staticmethod
+    def _is_alive(protocol: str, connection) -> bool:
+        """Check an idle connection with NOOP"""
+        try:
+            if protocol == "imap":
+                return connection.noop()[0] == "OK"
+            return connection.noop()[0] == 250
+        except Exception:
+            return False
+
+    @staticmethod
+    def _disconnect(protocol: str, connection):
+        """Log out, ignoring errors from connections that are already gone"""
+        try:
+            if protocol == "imap":
+                connection.logout()
+            else:
+                connection.quit()
+        except Exception:
+            if protocol == "smtp":
+                connection.close()
@@ -1,9 +1,18 @@
+import asyncio
+import contextlib
 import feedparser
-import requests
+import hashlib
+import time
+import aiohttp
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Optional, Any
+from urllib.parse import urlparse
+
+from managers.memory_manager import AsyncMemoryManager
 from .base_tool import BaseTool
+from .rate_limiter import RateLimiter, rate_limit_manager
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,6 +23,31 @@ class RSSFeedParserTool(BaseTool):
     Supports Hacker News feeds and general RSS/Atom formats.
     """
     
+    cacheable = True
+    cache_ttl = 300
+    cache_key_fields = ["feed_urls", "max_items", "include_content"]
+    
+    def __init__(self):
+        super().__init__()
+        self.async_memory = None
+        # Feed URL -> last full fetch, used when no memory manager persists it
+        self._feed_states: Dict[str, Dict[str, Any]] = {}
+        # (feed URL, scope) -> hash of each item returned with only_new and the
+        # time it was last in the feed, least recently seen first
+        self._seen_items: Dict[tuple, "OrderedDict[str, float]"] = {}
+        # (feed URL, scope) -> lock and number of users, so overlapping only_new
+        # calls do not return the same items
+        self._seen_locks: Dict[tuple, List[Any]] = {}
+        self.seen_items_max_per_feed = 1000
+        self.seen_items_ttl_days = 30
+    
+    def set_dependencies(self, memory_manager, config, http_pool=None, mail_pool=None):
+        """Keep feed validators and seen items in the database so they survive restarts"""
+        super().set_dependencies(memory_manager, config, http_pool, mail_pool)
+        self.async_memory = AsyncMemoryManager(memory_manager)
+        self.seen_items_max_per_feed = getattr(config, "feed_seen_items_max_per_feed", 1000)
+        self.seen_items_ttl_days = getattr(config, "feed_seen_items_ttl_days", 30)
+    
     @property
     def name(self) -> str:
         return "rss_feed_parser"
@@ -45,12 +79,31 @@ class RSSFeedParserTool(BaseTool):
                 "rate_limit": {
                     "type": "number",
                     "default": 1,
-                    "description": "Delay between requests in seconds"
+                    "description": "Minimum delay between requests to the same host in seconds"
+                },
+                "max_concurrent": {
+                    "type": "integer",
+                    "default": 5,
+                    "description": "Maximum number of feeds fetched at the same time"
+                },
+                "only_new": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Return only items not returned by an earlier only_new call"
+                },
+                "seen_scope": {
+                    "type": "string",
+                    "default": "",
+                    "description": "Name keeping the seen items of one consumer apart from others reading the same feed"
                 }
             },
             "required": ["feed_urls"]
         }
         
+    def is_cacheable(self, parameters: Dict[str, Any]) -> bool:
+        """Never cache only_new calls; each one consumes the items it returns"""
+        return self.cacheable and not parameters.get("only_new", False)
+    
     async def execute(self, parameters: Dict[str, Any]) -> Any:
         """
         Parse RSS/Atom feeds and extract structured data.
@@ -60,7 +113,10 @@ class RSSFeedParserTool(BaseTool):
                 - feed_urls: List of RSS feed URLs to parse
                 - max_items: Maximum number of items to extract per feed (default: 10)
                 - include_content: Whether to fetch full content (default: False)
-                - rate_limit: Delay between requests in seconds (default: 1)
+                - rate_limit: Minimum delay between requests to the same host in seconds (default: 1)
+                - max_concurrent: Maximum number of feeds fetched at once (default: 5)
+                - only_new: Return only items not returned before (default: False)
+                - seen_scope: Consumer name for only_new (default: "")
         
         Returns:
             Dictionary containing parsed feed data
@@ -70,6 +126,9 @@ class RSSFeedParserTool(BaseTool):
             max_items = parameters.get("max_items", 10)
             include_content = parameters.get("include_content", False)
             rate_limit = parameters.get("rate_limit", 1)
+            max_concurrent = parameters.get("max_concurrent", 5)
+            only_new = parameters.get("only_new", False)
+            seen_scope = parameters.get("seen_scope", "") or ""
             
             if not feed_urls:
                 return {
@@ -83,38 +142,39 @@ class RSSFeedParserTool(BaseTool):
             successful_feeds = 0
             failed_feeds = 0
             
-            for feed_url in feed_urls:
-                try:
+            # Feeds are fetched concurrently; requests to one host stay rate_limit apart
+            semaphore = asyncio.Semaphore(max(1, max_concurrent))
+            
+            async def fetch(feed_url: str) -> Dict[str, Any]:
+                # Waiting for the host comes first, so feeds sleeping on a busy
+                # host do not hold fetch slots other hosts could use
+                if rate_limit > 0:
+                    await self._host_limiter(feed_url, rate_limit).wait_for_slot()
+                async with semaphore:
                     logger.info(f"Parsing feed: {feed_url}")
-                    
-                    # Parse the RSS feed
-                    feed_result = self._parse_feed(
-                        feed_url, 
-                        max_items, 
-                        include_content
+                    return await self._parse_feed(
+                        feed_url, max_items, include_content,
+                        seen_scope if only_new else None
                     )
-                    
-                    if feed_result["success"]:
-                        all_results.append(feed_result)
-                        successful_feeds += 1
-                    else:
-                        failed_feeds += 1
-                        logger.warning(f"Failed to parse feed {feed_url}: {feed_result.get('error')}")
-                    
-                    # Rate limiting
-                    if rate_limit > 0:
-                        import time
-                        time.sleep(rate_limit)
-                        
-                except Exception as e:
+            
+            feed_results = await asyncio.gather(*(fetch(url) for url in feed_urls), return_exceptions=True)
+            
+            for feed_url, feed_result in zip(feed_urls, feed_results):
+                if isinstance(feed_result, Exception):
                     failed_feeds += 1
-                    logger.error(f"Error parsing feed {feed_url}: {str(e)}")
+                    logger.error(f"Error parsing feed {feed_url}: {str(feed_result)}")
                     all_results.append({
                         "feed_url": feed_url,
                         "success": False,
-                        "error": str(e),
+                        "error": str(feed_result),
                         "items": []
                     })
+                elif feed_result["success"]:
+                    all_results.append(feed_result)
+                    successful_feeds += 1
+                else:
+                    failed_feeds += 1
+                    logger.warning(f"Failed to parse feed {feed_url}: {feed_result.get('error')}")
             
             return {
                 "success": successful_feeds > 0,
@@ -133,48 +193,176 @@ class RSSFeedParserTool(BaseTool):
                 "results": []
             }
     
-    def _parse_feed(self, feed_url: str, max_items: int, include_content: bool) -> Dict[str, Any]:
+    def _host_limiter(self, feed_url: str, rate_limit: float) -> RateLimiter:
+        """Get the limiter allowing one request per rate_limit seconds to the feed's host"""
+        name = f"{self.name}:{urlparse(feed_url).netloc}"
+        limiter = rate_limit_manager.get_limiter(name)
+        if limiter is None or limiter.time_window != rate_limit:
+            limiter = rate_limit_manager.add_limiter(name, 1, rate_limit)
+        return limiter
+    
+    async def _get_feed_state(self, feed_url: str) -> Optional[Dict[str, Any]]:
+        if self.async_memory is not None:
+            return await self.async_memory.get_feed_state(feed_url)
+        return self._feed_states.get(feed_url)
+    
+    async def _save_feed_state(self, feed_url: str, state: Dict[str, Any]):
+        if self.async_memory is not None:
+            await self.async_memory.save_feed_state(feed_url, **state)
+        else:
+            self._feed_states[feed_url] = state
+    
+    @staticmethod
+    def _item_hash(item: Dict[str, Any]) -> str:
+        """Short hash identifying an item by its GUID, falling back to its link or title"""
+        key = item.get("id") or item.get("link") or item.get("title") or ""
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    
+    async def _filter_seen_items(self, feed_url: str, scope: str, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop items already returned for the feed and scope"""
+        hashes = [self._item_hash(item) for item in items]
+        if self.async_memory is not None:
+            seen = await self.async_memory.get_seen_feed_items(feed_url, scope, hashes)
+        else:
+            seen = self._seen_items.get((feed_url, scope), {})
+        return [item for item, item_hash in zip(items, hashes) if item_hash not in seen]
+    
+    async def _mark_items_seen(
+        self,
+        feed_url: str,
+        scope: str,
+        items: List[Dict[str, Any]],
+        feed_items: List[Dict[str, Any]]
+    ):
+        """
+        Remember returned items and refresh the items still in the feed
+        
+        Hashes expire seen_items_ttl_days after their item was last in the
+        feed, and at most seen_items_max_per_feed are kept per feed and scope.
+        """
+        hashes = [self._item_hash(item) for item in items]
+        present = [self._item_hash(item) for item in feed_items]
+        if self.async_memory is not None:
+            await self.async_memory.mark_feed_items_seen(
+                feed_url, scope, hashes, present,
+                max_items=self.seen_items_max_per_feed, ttl_days=self.seen_items_ttl_days
+            )
+            return
+        
+        now = time.time()
+        seen = self._seen_items.setdefault((feed_url, scope), OrderedDict())
+        for item_hash in hashes + [item_hash for item_hash in present if item_hash in seen]:
+            seen[item_hash] = now
+            seen.move_to_end(item_hash)
+        expired_before = now - self.seen_items_ttl_days * 86400
+        while seen and (len(seen) > self.seen_items_max_per_feed or next(iter(seen.values())) < expired_before):
+            seen.popitem(last=False)
+    
+    @contextlib.asynccontextmanager
+    async def _seen_lock(self, feed_url: str, scope: str):
+        """Serialize only_new calls for one feed and scope, dropping the lock when unused"""
+        key = (feed_url, scope)
+        entry = self._seen_locks.setdefault(key, [asyncio.Lock(), 0])
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._seen_locks[key]
+    
+    async def _parse_feed(
+        self,
+        feed_url: str,
+        max_items: int,
+        include_content: bool,
+        seen_scope: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Parse a single RSS/Atom feed.
         
+        The request carries the ETag and Last-Modified validators of the last
+        full fetch; when the server answers 304 Not Modified, the items parsed
+        then are returned without downloading or parsing the feed again.
+        
+        With a seen_scope, only items not returned before for that scope are
+        included, and the returned items are recorded as seen.
+        
         Args:
             feed_url: URL of the RSS feed
             max_items: Maximum number of items to extract
             include_content: Whether to fetch full content
+            seen_scope: Scope of seen items for "new items only" mode, or None
             
         Returns:
             Dictionary containing parsed feed data
         """
         try:
-            # Fetch and parse the feed
-            response = requests.get(feed_url, timeout=30)
-            response.raise_for_status()
+            state = await self._get_feed_state(feed_url)
+            headers = {}
+            if state and state.get("etag"):
+                headers["If-None-Match"] = state["etag"]
+            if state and state.get("last_modified"):
+                headers["If-Modified-Since"] = state["last_modified"]
             
-            # Parse with feedparser
-            feed = feedparser.parse(response.content)
+            # Fetch the feed
+            session = await self.http_session()
+            async with session.get(
+                feed_url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                not_modified = response.status == 304 and state is not None
+                if not not_modified:
+                    response.raise_for_status()
+                    content = await response.read()
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
             
-            if feed.bozo:
-                logger.warning(f"Feed parsing warnings for {feed_url}: {feed.bozo_exception}")
-            
-            # Extract feed metadata
-            feed_info = {
-                "title": feed.feed.get("title", ""),
-                "description": feed.feed.get("description", ""),
-                "link": feed.feed.get("link", ""),
-                "language": feed.feed.get("language", ""),
-                "updated": feed.feed.get("updated", ""),
-                "generator": feed.feed.get("generator", "")
-            }
+            if not_modified:
+                logger.info(f"Feed {feed_url} not modified since last fetch")
+                feed_info, all_items = state["feed_info"], state["items"]
+            else:
+                # Parse with feedparser off the event loop
+                feed = await asyncio.to_thread(feedparser.parse, content)
+                
+                if feed.bozo:
+                    logger.warning(f"Feed parsing warnings for {feed_url}: {feed.bozo_exception}")
+                
+                # Extract feed metadata
+                feed_info = {
+                    "title": feed.feed.get("title", ""),
+                    "description": feed.feed.get("description", ""),
+                    "link": feed.feed.get("link", ""),
+                    "language": feed.feed.get("language", ""),
+                    "updated": feed.feed.get("updated", ""),
+                    "generator": feed.feed.get("generator", "")
+                }
+                
+                # Extract all items with content, so a later 304 can serve any request
+                all_items = []
+                for i, entry in enumerate(feed.entries):
+                    try:
+                        all_items.append(self._extract_item_data(entry, True))
+                    except Exception as e:
+                        logger.warning(f"Error extracting item {i} from {feed_url}: {str(e)}")
+                        continue
+                
+                if etag or last_modified:
+                    await self._save_feed_state(feed_url, {
+                        "etag": etag,
+                        "last_modified": last_modified,
+                        "feed_info": feed_info,
+                        "items": all_items
+                    })
             
-            # Extract items
-            items = []
-            for i, entry in enumerate(feed.entries[:max_items]):
-                try:
-                    item = self._extract_item_data(entry, include_content)
-                    items.append(item)
-                except Exception as e:
-                    logger.warning(f"Error extracting item {i} from {feed_url}: {str(e)}")
-                    continue
+            if seen_scope is not None:
+                async with self._seen_lock(feed_url, seen_scope):
+                    items = (await self._filter_seen_items(feed_url, seen_scope, all_items))[:max_items]
+                    await self._mark_items_seen(feed_url, seen_scope, items, all_items)
+            else:
+                items = all_items[:max_items]
+            if not include_content:
+                items = [{k: v for k, v in item.items() if k != "full_content"} for item in items]
             
             return {
                 "feed_url": feed_url,
@@ -182,10 +370,11 @@ class RSSFeedParserTool(BaseTool):
                 "feed_info": feed_info,
                 "items": items,
                 "total_items": len(items),
+                "not_modified": not_modified,
                 "parsed_at": datetime.utcnow().isoformat()
             }
             
-        except requests.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             return {
                 "feed_url": feed_url,
                 "success": False,
@@ -24,6 +24,9 @@ logger = logging.getLogger(__name__)
 class WebScraperTool(BaseTool):
     """Advanced web scraping tool with HTML parsing and multi-threading"""
     
+    cacheable = True
+    cache_ttl = 300
+    
     @property
     def name(self) -> str:
         return "web_scraper"
@@ -238,83 +241,83 @@ class WebScraperTool(BaseTool):
         try:
             logger.info(f"Scraping URL: {url}")
             
-            # Make HTTP request
-            async with aiohttp.ClientSession() as session:
-                timeout_config = aiohttp.ClientTimeout(total=timeout)
+            # Make HTTP request through the shared connection pool
+            session = await self.http_session()
+            timeout_config = aiohttp.ClientTimeout(total=timeout)
+            
+            async with session.get(
+                url, 
+                headers=headers, 
+                timeout=timeout_config,
+                allow_redirects=follow_redirects
+            ) as response:
                 
-                async with session.get(
-                    url, 
-                    headers=headers, 
-                    timeout=timeout_config,
-                    allow_redirects=follow_redirects
-                ) as response:
-                    
-                    if response.status != 200:
-                        return {
-                            "url": url,
-                            "success": False,
-                            "status_code": response.status,
-                            "error": f"HTTP {response.status}"
-                        }
-                    
-                    # Get HTML content
-                    html_content = await response.text()
-                    
-                    # Parse HTML
-                    soup = BeautifulSoup(html_content, 'lxml')
-                    
-                    # Extract data using selectors
-                    extracted_data = {}
-                    
-                    # CSS selectors
-                    if "css" in selectors:
-                        for key, selector in selectors["css"].items():
-                            elements = soup.select(selector)
-                            if elements:
-                                extracted_data[key] = [elem.get_text(strip=True) for elem in elements]
-                            else:
-                                extracted_data[key] = []
-                    
-                    # XPath selectors
-                    if "xpath" in selectors:
-                        tree = lxml.html.fromstring(html_content)
-                        for key, xpath_expr in selectors["xpath"].items():
-                            try:
-                                elements = tree.xpath(xpath_expr)
-                                if elements:
-                                    extracted_data[key] = [str(elem) for elem in elements]
-                                else:
-                                    extracted_data[key] = []
-                            except Exception as e:
-                                logger.warning(f"XPath error for {key}: {e}")
-                                extracted_data[key] = []
-                    
-                    # Regex patterns
-                    for key, pattern in patterns.items():
-                        matches = re.findall(pattern, html_content)
-                        extracted_data[key] = matches
-                    
-                    # Extract metadata
-                    metadata = {}
-                    if extract_metadata:
-                        metadata = self._extract_metadata(soup)
-                    
-                    # Extract links
-                    links = []
-                    if extract_links:
-                        links = self._extract_links(soup, url, link_filters)
-                    
+                if response.status != 200:
                     return {
                         "url": url,
-                        "success": True,
+                        "success": False,
                         "status_code": response.status,
-                        "extracted_data": extracted_data,
-                        "metadata": metadata,
-                        "links": links,
-                        "content_length": len(html_content),
-                        "content_type": response.headers.get("content-type", "text/html")
+                        "error": f"HTTP {response.status}"
                     }
-                    
+                
+                # Get HTML content
+                html_content = await response.text()
+                
+                # Parse HTML
+                soup = BeautifulSoup(html_content, 'lxml')
+                
+                # Extract data using selectors
+                extracted_data = {}
+                
+                # CSS selectors
+                if "css" in selectors:
+                    for key, selector in selectors["css"].items():
+                        elements = soup.select(selector)
+                        if elements:
+                            extracted_data[key] = [elem.get_text(strip=True) for elem in elements]
+                        else:
+                            extracted_data[key] = []
+                
+                # XPath selectors
+                if "xpath" in selectors:
+                    tree = lxml.html.fromstring(html_content)
+                    for key, xpath_expr in selectors["xpath"].items():
+                        try:
+                            elements = tree.xpath(xpath_expr)
+                            if elements:
+                                extracted_data[key] = [str(elem) for elem in elements]
+                            else:
+                                extracted_data[key] = []
+                        except Exception as e:
+                            logger.warning(f"XPath error for {key}: {e}")
+                            extracted_data[key] = []
+                
+                # Regex patterns
+                for key, pattern in patterns.items():
+                    matches = re.findall(pattern, html_content)
+                    extracted_data[key] = matches
+                
+                # Extract metadata
+                metadata = {}
+                if extract_metadata:
+                    metadata = self._extract_metadata(soup)
+                
+                # Extract links
+                links = []
+                if extract_links:
+                    links = self._extract_links(soup, url, link_filters)
+                
+                return {
+                    "url": url,
+                    "success": True,
+                    "status_code": response.status,
+                    "extracted_data": extracted_data,
+                    "metadata": metadata,
+                    "links": links,
+                    "content_length": len(html_content),
+                    "content_type": response.headers.get("content-type", "text/html")
+                }
+                
         except asyncio.TimeoutError:
             return {
                 "url": url,
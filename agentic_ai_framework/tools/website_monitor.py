@@ -18,6 +18,11 @@ logger = logging.getLogger(__name__)
 class WebsiteMonitorTool(BaseTool):
     """Tool for monitoring website availability and response time"""
     
+    # Repeated checks of the same URL within half a minute share one request
+    cacheable = True
+    cache_ttl = 30
+    cache_key_fields = ["url", "timeout", "expected_status", "check_content"]
+    
     @property
     def name(self) -> str:
         return "website_monitor"
@@ -74,58 +79,56 @@ class WebsiteMonitorTool(BaseTool):
         start_time = time.time()
         
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=timeout)
-            ) as session:
-                async with session.get(url) as response:
-                    end_time = time.time()
-                    response_time = round((end_time - start_time) * 1000, 2)  # milliseconds
-                    
-                    # Get response details
-                    status_code = response.status
-                    content = await response.text()
-                    
-                    # Check if status code matches expected
-                    status_ok = status_code == expected_status
-                    
-                    # Check content if specified
-                    content_ok = True
-                    if check_content:
-                        content_ok = check_content in content
-                    
-                    # Determine overall status
-                    is_online = status_ok and content_ok
-                    
-                    result = {
-                        "url": url,
-                        "status": "online" if is_online else "offline",
-                        "status_code": status_code,
-                        "response_time_ms": response_time,
-                        "expected_status": expected_status,
-                        "status_ok": status_ok,
-                        "content_ok": content_ok,
-                        "timestamp": time.time(),
-                        "error": None
-                    }
-                    
-                    if check_content:
-                        result["content_check"] = check_content
-                        result["content_found"] = content_ok
-                    
-                    # Add summary message
-                    if is_online:
-                        result["message"] = f"Website {url} is online (HTTP {status_code}, {response_time}ms)"
-                    else:
-                        issues = []
-                        if not status_ok:
-                            issues.append(f"HTTP {status_code} (expected {expected_status})")
-                        if not content_ok:
-                            issues.append(f"Content check failed")
-                        result["message"] = f"Website {url} has issues: {', '.join(issues)}"
-                    
-                    logger.info(result["message"])
-                    return result
-                    
+            session = await self.http_session()
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                end_time = time.time()
+                response_time = round((end_time - start_time) * 1000, 2)  # milliseconds
+                
+                # Get response details
+                status_code = response.status
+                content = await response.text()
+                
+                # Check if status code matches expected
+                status_ok = status_code == expected_status
+                
+                # Check content if specified
+                content_ok = True
+                if check_content:
+                    content_ok = check_content in content
+                
+                # Determine overall status
+                is_online = status_ok and content_ok
+                
+                result = {
+                    "url": url,
+                    "status": "online" if is_online else "offline",
+                    "status_code": status_code,
+                    "response_time_ms": response_time,
+                    "expected_status": expected_status,
+                    "status_ok": status_ok,
+                    "content_ok": content_ok,
+                    "timestamp": time.time(),
+                    "error": None
+                }
+                
+                if check_content:
+                    result["content_check"] = check_content
+                    result["content_found"] = content_ok
+                
+                # Add summary message
+                if is_online:
+                    result["message"] = f"Website {url} is online (HTTP {status_code}, {response_time}ms)"
+                else:
+                    issues = []
+                    if not status_ok:
+                        issues.append(f"HTTP {status_code} (expected {expected_status})")
+                    if not content_ok:
+                        issues.append(f"Content check failed")
+                    result["message"] = f"Website {url} has issues: {', '.join(issues)}"
+                
+                logger.info(result["message"])
+                return result
+                
         except aiohttp.ClientTimeout:
             error_msg = f"Website {url} timed out after {timeout} seconds"
             logger.warning(error_msg)